@@ -8,7 +8,7 @@ OCR, and object detection.
 import logging
 import time
 from pathlib import Path
-from typing import Any, Callable
+from typing import Any, Callable, Iterator
 
 import numpy as np
 from pydantic import BaseModel
@@ -18,6 +18,7 @@ from deep_brief.analysis.visual_analyzer import (
     FrameExtractor,
     SceneFrameAnalysis,
     VisualAnalysisResult,
+    VisualAnalysisStats,
 )
 from deep_brief.core.exceptions import ErrorCode, VideoProcessingError
 from deep_brief.core.progress_tracker import ProgressTracker, ProgressUpdate
@@ -124,6 +125,8 @@ class FrameAnalysisPipeline:
         scene_result: SceneDetectionResult,
         output_dir: Path | None = None,
         progress_callback: Callable[[float, str], None] | None = None,
+        scene_callback: Callable[[SceneFrameAnalysis, VisualAnalysisStats], None]
+        | None = None,
     ) -> tuple[VisualAnalysisResult, PipelineMetrics]:
         """
         Analyze frames from video scenes through the complete pipeline.
@@ -133,6 +136,8 @@ class FrameAnalysisPipeline:
             scene_result: Scene detection results
             output_dir: Optional directory to save extracted frames
             progress_callback: Optional callback for progress updates
+            scene_callback: Optional callback called with each scene's analysis
+                and the running totals as soon as the scene completes
             
         Returns:
             Tuple of (VisualAnalysisResult, PipelineMetrics)
@@ -165,11 +170,26 @@ class FrameAnalysisPipeline:
                 total_steps=len(scene_result.scenes),
             )
             
+            total_scenes = len(scene_result.scenes)
+
+            def on_scene(
+                scene_analysis: SceneFrameAnalysis, stats: VisualAnalysisStats
+            ) -> None:
+                progress_tracker.update_progress(
+                    operation_id="frame_analysis",
+                    progress=stats.scenes_completed / total_scenes,
+                    current_step=f"Analyzed scene {scene_analysis.scene_number}",
+                    current_step_number=stats.scenes_completed,
+                )
+                if scene_callback:
+                    scene_callback(scene_analysis, stats)
+
             # Use frame extractor which already includes all analysis
             visual_result = self.frame_extractor.extract_frames_from_scenes(
                 video_path=video_path,
                 scene_result=scene_result,
                 output_dir=output_dir,
+                scene_callback=on_scene,
             )
             
             # Collect metrics from the results
@@ -198,6 +218,39 @@ class FrameAnalysisPipeline:
                 cause=e,
             ) from e
     
+    def iter_video_frames(
+        self,
+        video_path: Path,
+        scene_result: SceneDetectionResult,
+        output_dir: Path | None = None,
+        stats: VisualAnalysisStats | None = None,
+    ) -> Iterator[SceneFrameAnalysis]:
+        """
+        Analyze frames scene by scene, yielding each scene as soon as it completes.
+        
+        Unlike analyze_video_frames, earlier scenes are not kept, so the first
+        results are available after one scene and memory stays flat for long
+        videos.
+        
+        Args:
+            video_path: Path to the video file
+            scene_result: Scene detection results
+            output_dir: Optional directory to save extracted frames
+            stats: Optional running totals, updated before each scene is yielded
+            
+        Yields:
+            SceneFrameAnalysis of each scene
+            
+        Raises:
+            VideoProcessingError: If analysis fails
+        """
+        yield from self.frame_extractor.iter_frames_from_scenes(
+            video_path=video_path,
+            scene_result=scene_result,
+            output_dir=output_dir,
+            stats=stats,
+        )
+    
     def analyze_single_frame(
         self,
         frame: np.ndarray,
@@ -0,0 +1,325 @@
+"""Forward-only frame sampling for OpenCV video captures.
+
+Seeking with ``CAP_PROP_POS_FRAMES`` makes the decoder jump back to the
+previous keyframe and re-decode the whole GOP for every sampled frame. When
+the sample positions are known up front it is much cheaper to walk the stream
+once, calling ``grab()`` for frames we skip and ``retrieve()`` only for the
+frames we actually need.
+
+``RawFramePipeSampler`` goes one step further and lets ffmpeg do the frame
+selection, streaming the selected frames as raw RGB24 over stdout so they can
+be handed to the analyzers without any JPEG encode/decode or filesystem hop.
+"""
+
+import logging
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any
+
+import cv2
+import ffmpeg
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+class SequentialFrameSampler:
+    """Read a sorted set of frames from a capture in a single forward pass."""
+
+    def __init__(
+        self,
+        cap: cv2.VideoCapture,
+        fps: float,
+        frame_numbers: Iterable[int],
+        max_gap_seconds: float = 10.0,
+    ):
+        """
+        Initialize the sampler.
+
+        Args:
+            cap: Opened OpenCV video capture positioned at the first frame
+            fps: Frame rate used to convert the gap limit into frames
+            frame_numbers: All frame numbers that will be requested
+            max_gap_seconds: Largest gap to decode through before seeking instead
+        """
+        self.cap = cap
+        self.fps = fps
+        self.frame_numbers = sorted(set(frame_numbers))
+        self.max_gap_frames = max(0, int(max_gap_seconds * fps))
+
+        # Index of the next frame the decoder will produce
+        self.position = 0
+
+        # Last retrieved frame, reused when the same frame is requested twice
+        self._last_frame_number: int | None = None
+        self._last_frame: np.ndarray | None = None
+
+        # Statistics
+        self.seeks = 0
+        self.frames_grabbed = 0
+        self.frames_retrieved = 0
+
+    def read(self, frame_number: int) -> tuple[bool, np.ndarray | None]:
+        """
+        Read a single frame, decoding forward from the current position.
+
+        Falls back to a seek when the requested frame lies behind the current
+        position or further ahead than the configured gap.
+
+        Args:
+            frame_number: Zero-based frame index to read
+
+        Returns:
+            Tuple of (success, frame) mirroring ``cv2.VideoCapture.read``
+        """
+        if frame_number == self._last_frame_number and self._last_frame is not None:
+            return True, self._last_frame.copy()
+
+        gap = frame_number - self.position
+        if gap < 0 or gap > self.max_gap_frames:
+            self.cap.set(cv2.CAP_PROP_POS_FRAMES, frame_number)
+            self.position = frame_number
+            self.seeks += 1
+        else:
+            while self.position < frame_number:
+                if not self.cap.grab():
+                    logger.debug(
+                        f"Stream ended at frame {self.position} before reaching {frame_number}"
+                    )
+                    return False, None
+                self.position += 1
+                self.frames_grabbed += 1
+
+        if not self.cap.grab():
+            return False, None
+        self.position += 1
+        self.frames_grabbed += 1
+
+        ret, frame = self.cap.retrieve()
+        if not ret or frame is None:
+            return False, None
+
+        self.frames_retrieved += 1
+        self._last_frame_number = frame_number
+        self._last_frame = frame
+        return True, frame.copy()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get decoding statistics for the pass so far."""
+        return {
+            "planned_frames": len(self.frame_numbers),
+            "frames_retrieved": self.frames_retrieved,
+            "frames_grabbed": self.frames_grabbed,
+            "seeks": self.seeks,
+        }
+
+
+class RawFramePipeSampler:
+    """Stream a sorted set of frames from ffmpeg as raw RGB24 arrays.
+
+    ffmpeg selects exactly the planned frames with a ``select`` filter,
+    optionally scales them, and writes them to stdout with
+    ``-f rawvideo -pix_fmt rgb24``. Each frame is a fixed number of bytes, so
+    it is read straight into one of a small pool of preallocated NumPy
+    buffers.
+
+    Frames are returned in RGB order. A returned array is a view of a pooled
+    buffer and stays valid until ``buffer_count`` further frames have been
+    read; copy it if it must outlive that.
+    """
+
+    # Frames are produced in RGB order rather than OpenCV's BGR
+    outputs_rgb = True
+
+    # Returned frames are views of pooled buffers that later reads overwrite
+    reuses_buffers = True
+
+    def __init__(
+        self,
+        video_path: Path,
+        frame_numbers: Iterable[int],
+        source_width: int,
+        source_height: int,
+        max_width: int | None = None,
+        max_height: int | None = None,
+        buffer_count: int = 2,
+    ):
+        """
+        Initialize the sampler. ffmpeg is started lazily on the first read.
+
+        Args:
+            video_path: Path to the video file
+            frame_numbers: All frame numbers that will be requested
+            source_width: Width of the video stream in pixels
+            source_height: Height of the video stream in pixels
+            max_width: Scale frames down in ffmpeg to fit this width (optional)
+            max_height: Scale frames down in ffmpeg to fit this height (optional)
+            buffer_count: Number of preallocated frame buffers to rotate through
+        """
+        if source_width <= 0 or source_height <= 0:
+            raise ValueError(
+                f"Invalid source dimensions: {source_width}x{source_height}"
+            )
+
+        self.video_path = video_path
+        self.frame_numbers = sorted(set(frame_numbers))
+        self.source_width = source_width
+        self.source_height = source_height
+        self.width, self.height = self._output_size(
+            source_width, source_height, max_width, max_height
+        )
+        self.frame_bytes = self.width * self.height * 3
+
+        self._buffers = [
+            np.empty((self.height, self.width, 3), dtype=np.uint8)
+            for _ in range(max(1, buffer_count))
+        ]
+        self._next_buffer = 0
+
+        # Index into frame_numbers of the next frame ffmpeg will emit
+        self._index = 0
+        self._process: Any = None
+
+        self._last_frame_number: int | None = None
+        self._last_frame: np.ndarray | None = None
+
+        # Statistics
+        self.frames_piped = 0
+        self.frames_returned = 0
+
+    @staticmethod
+    def _output_size(
+        width: int,
+        height: int,
+        max_width: int | None,
+        max_height: int | None,
+    ) -> tuple[int, int]:
+        """Calculate the output frame size, keeping aspect ratio and even sides."""
+        scale = 1.0
+        if max_width and width > max_width:
+            scale = min(scale, max_width / width)
+        if max_height and height > max_height:
+            scale = min(scale, max_height / height)
+
+        if scale >= 1.0:
+            return width, height
+
+        # Even dimensions keep ffmpeg's scaler happy for subsampled sources
+        new_width = max(2, int(width * scale) // 2 * 2)
+        new_height = max(2, int(height * scale) // 2 * 2)
+        return new_width, new_height
+
+    def _build_stream(self) -> Any:
+        """Build the ffmpeg stream that selects and scales the planned frames."""
+        select_expr = "+".join(f"eq(n,{n})" for n in self.frame_numbers)
+
+        stream = ffmpeg.input(str(self.video_path))
+        stream = ffmpeg.filter(stream, "select", select_expr)
+        if (self.width, self.height) != (self.source_width, self.source_height):
+            stream = ffmpeg.filter(stream, "scale", self.width, self.height)
+
+        return ffmpeg.output(
+            stream,
+            "pipe:",
+            format="rawvideo",
+            pix_fmt="rgb24",
+            vsync="vfr",
+        ).global_args("-loglevel", "error", "-nostdin")
+
+    def _start(self) -> None:
+        """Start the ffmpeg process."""
+        logger.debug(
+            f"Piping {len(self.frame_numbers)} raw frames at "
+            f"{self.width}x{self.height} from {self.video_path.name}"
+        )
+        self._process = ffmpeg.run_async(self._build_stream(), pipe_stdout=True)
+
+    def _read_next_frame(self) -> np.ndarray | None:
+        """Read the next frame from ffmpeg into a pooled buffer."""
+        buffer = self._buffers[self._next_buffer]
+        view = memoryview(buffer).cast("B")
+
+        filled = 0
+        while filled < self.frame_bytes:
+            count = self._process.stdout.readinto(view[filled:])
+            if not count:
+                if filled:
+                    logger.warning(
+                        f"Truncated raw frame from ffmpeg ({filled}/{self.frame_bytes} bytes)"
+                    )
+                return None
+            filled += count
+
+        self._next_buffer = (self._next_buffer + 1) % len(self._buffers)
+        self.frames_piped += 1
+        return buffer
+
+    def read(self, frame_number: int) -> tuple[bool, np.ndarray | None]:
+        """
+        Read a single planned frame.
+
+        Frames must be requested in ascending order; frames that were not
+        planned, or that ffmpeg has already streamed past, cannot be read.
+
+        Args:
+            frame_number: Zero-based frame index to read
+
+        Returns:
+            Tuple of (success, frame) mirroring ``cv2.VideoCapture.read``
+        """
+        if frame_number == self._last_frame_number and self._last_frame is not None:
+            self.frames_returned += 1
+            return True, self._last_frame
+
+        if self._process is None:
+            if not self.frame_numbers:
+                return False, None
+            self._start()
+
+        while self._index < len(self.frame_numbers):
+            current = self.frame_numbers[self._index]
+            if current > frame_number:
+                break
+
+            frame = self._read_next_frame()
+            self._index += 1
+            if frame is None:
+                # ffmpeg finished early, so none of the remaining frames exist
+                self._index = len(self.frame_numbers)
+                break
+
+            if current == frame_number:
+                self._last_frame_number = frame_number
+                self._last_frame = frame
+                self.frames_returned += 1
+                return True, frame
+
+        logger.debug(f"Frame {frame_number} not available from raw frame pipe")
+        return False, None
+
+    def close(self) -> None:
+        """Stop ffmpeg and release the pipe."""
+        if self._process is None:
+            return
+
+        if self._process.poll() is None:
+            self._process.kill()
+        if self._process.stdout is not None:
+            self._process.stdout.close()
+        self._process.wait()
+        self._process = None
+
+    def __enter__(self) -> "RawFramePipeSampler":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get piping statistics for the pass so far."""
+        return {
+            "planned_frames": len(self.frame_numbers),
+            "frames_piped": self.frames_piped,
+            "frames_returned": self.frames_returned,
+            "frame_size": f"{self.width}x{self.height}",
+        }
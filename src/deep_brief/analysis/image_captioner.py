@@ -4,12 +4,14 @@ This module provides image captioning capabilities for extracted frames
 to generate descriptive text about visual content.
 """
 
+import copy
 import logging
 import warnings
 from pathlib import Path
 from typing import Any
 
 import torch
+import transformers
 from PIL import Image
 from pydantic import BaseModel
 from transformers import (
@@ -26,6 +28,21 @@ from deep_brief.analysis.error_handling import (
     with_retry,
 )
 from deep_brief.core.exceptions import ErrorCode, VideoProcessingError
+from deep_brief.core.memory_budget import (
+    CAPTION_MODEL_MEMORY_MB,
+    DEFAULT_MODEL_MEMORY_MB,
+    get_memory_budget,
+)
+from deep_brief.core.model_registry import ModelHandle, ModelKey, get_model_registry
+from deep_brief.core.quantization import (
+    QUANTIZED_DTYPE,
+    QUANTIZED_MEMORY_FACTOR,
+    QuantizationBenchmark,
+    benchmark_quantization,
+    get_quantized_model_cache,
+    quantize_linear_layers,
+    word_agreement,
+)
 from deep_brief.utils.config import get_config
 
 logger = logging.getLogger(__name__)
@@ -54,8 +71,13 @@ class ImageCaptioner:
         self.model = None
         self.processor = None
         self.device = self._determine_device()
+        self._model_handle: ModelHandle | None = None
 
         logger.info(f"ImageCaptioner initialized with device: {self.device}")
+        if self.config.visual_analysis.captioning_quantize and self.device != "cpu":
+            logger.warning(
+                f"Int8 quantization only runs on the CPU, not on {self.device}"
+            )
 
     def _determine_device(self) -> str:
         """Determine the best device for inference."""
@@ -79,56 +101,123 @@ class ImageCaptioner:
 
         return device
 
-    @with_retry(max_attempts=3, delay=2.0)
-    def _load_model(self) -> tuple[Any, Any]:
-        """Load captioning model and processor if not already loaded."""
-        if self.model is None or self.processor is None:
-            model_name = self.config.visual_analysis.captioning_model
-            logger.info(f"Loading image captioning model: {model_name}")
-
-            try:
-                # Determine model type and load appropriate classes
-                if "blip2" in model_name.lower():
-                    # BLIP-2 models
-                    self.processor = Blip2Processor.from_pretrained(model_name)
-                    self.model = Blip2ForConditionalGeneration.from_pretrained(
-                        model_name,
-                        torch_dtype=torch.float16
-                        if self.device == "cuda"
-                        else torch.float32,
-                    )
-                elif "blip" in model_name.lower():
-                    # Original BLIP models
-                    self.processor = BlipProcessor.from_pretrained(model_name)
-                    self.model = BlipForConditionalGeneration.from_pretrained(
-                        model_name
-                    )
-                else:
-                    # Try generic auto loading
-                    self.processor = AutoProcessor.from_pretrained(model_name)
-                    self.model = BlipForConditionalGeneration.from_pretrained(
-                        model_name
-                    )
+    @property
+    def _quantize(self) -> bool:
+        """Whether the model is quantized to int8, which only runs on the CPU."""
+        return self.config.visual_analysis.captioning_quantize and self.device == "cpu"
+
+    @property
+    def _model_key(self) -> ModelKey:
+        """Key of this captioner's model in the shared model registry."""
+        model_name = self.config.visual_analysis.captioning_model
+        if self._quantize:
+            return ModelKey(model_name, self.device, QUANTIZED_DTYPE)
+        # BLIP-2 models are loaded in half precision on CUDA
+        half = "blip2" in model_name.lower() and self.device == "cuda"
+        return ModelKey(model_name, self.device, "float16" if half else "float32")
+
+    @property
+    def _memory_key(self) -> str:
+        """Key of this captioner's model in the memory budget."""
+        return str(self._model_key)
 
-                # Move model to device
-                self.model = self.model.to(self.device)
-                self.model.eval()  # Set to evaluation mode
+    def _load_model(self) -> tuple[Any, Any]:
+        """Get the shared captioning model and processor, loading them if needed."""
+        model, processor = self.model, self.processor
+        if model is None or processor is None:
+            if self._model_handle is None:
+                model_name = self.config.visual_analysis.captioning_model
+                size_mb = CAPTION_MODEL_MEMORY_MB.get(
+                    model_name, DEFAULT_MODEL_MEMORY_MB
+                )
+                if self._quantize:
+                    size_mb *= QUANTIZED_MEMORY_FACTOR
+                self._model_handle = get_model_registry().acquire(
+                    self._model_key,
+                    size_mb,
+                    self._load_captioning_model,
+                    self._drop_model,
+                )
+            model, processor = self._model_handle.get()
+            self.model, self.processor = model, processor
+        else:
+            get_memory_budget().touch(self._memory_key)
+        return model, processor
 
-                logger.info(f"Successfully loaded {model_name} on {self.device}")
+    @with_retry(max_attempts=3, delay=2.0)
+    def _load_captioning_model(self) -> tuple[Any, Any]:
+        """Load the configured model and processor; loads are serialized by the budget."""
+        model_name = self.config.visual_analysis.captioning_model
+        logger.info(f"Loading image captioning model: {model_name}")
 
-            except Exception as e:
-                error_msg = (
-                    f"Failed to load image captioning model {model_name}: {str(e)}"
+        try:
+            processor = self._load_processor(model_name)
+            if self._quantize:
+                # Quantized once, then loaded from the cache on disk
+                model_class = self._model_class(model_name)
+                model = get_quantized_model_cache(self.config).load_or_quantize(
+                    str(self._model_key),
+                    f"transformers{transformers.__version__}",
+                    lambda: self._load_pretrained_model(model_name, "cpu"),
+                    lambda model: model.config.to_dict(),
+                    lambda architecture: model_class(
+                        model_class.config_class.from_dict(architecture)
+                    ),
                 )
-                logger.error(error_msg)
-                raise ModelInitializationError(
-                    message=error_msg,
-                    model_name=model_name,
-                    details={"device": self.device},
-                    cause=e,
-                ) from e
+            else:
+                model = self._load_pretrained_model(model_name, self.device)
 
-        return self.model, self.processor
+            logger.info(f"Successfully loaded {model_name} on {self.device}")
+
+        except Exception as e:
+            error_msg = f"Failed to load image captioning model {model_name}: {str(e)}"
+            logger.error(error_msg)
+            raise ModelInitializationError(
+                message=error_msg,
+                model_name=model_name,
+                details={"device": self.device},
+                cause=e,
+            ) from e
+
+        return model, processor
+
+    def _load_processor(self, model_name: str) -> Any:
+        """Load the processor matching a captioning model."""
+        if "blip2" in model_name.lower():
+            return Blip2Processor.from_pretrained(model_name)
+        if "blip" in model_name.lower():
+            return BlipProcessor.from_pretrained(model_name)
+        # Try generic auto loading
+        return AutoProcessor.from_pretrained(model_name)
+
+    def _model_class(self, model_name: str) -> Any:
+        """Model class of a captioning model."""
+        if "blip2" in model_name.lower():
+            return Blip2ForConditionalGeneration
+        # Original BLIP models
+        return BlipForConditionalGeneration
+
+    def _load_pretrained_model(self, model_name: str, device: str) -> Any:
+        """Load the weights of a captioning model onto a device for inference."""
+        model_class = self._model_class(model_name)
+        if model_class is Blip2ForConditionalGeneration:
+            # BLIP-2 models
+            model = model_class.from_pretrained(
+                model_name,
+                torch_dtype=torch.float16 if device == "cuda" else torch.float32,
+            )
+        else:
+            model = model_class.from_pretrained(model_name)
+
+        # Move model to device
+        model = model.to(device)
+        model.eval()  # Set to evaluation mode
+        return model
+
+    def _drop_model(self) -> None:
+        """Drop the references to a shared model the registry unloaded."""
+        self.model = None
+        self.processor = None
 
     def caption_image(
         self,
@@ -245,7 +334,8 @@ class ImageCaptioner:
                     k: v for k, v in generation_kwargs.items() if v is not None
                 }
 
-                outputs = model.generate(**inputs, **generation_kwargs)
+                with get_memory_budget().using(self._memory_key):
+                    outputs = model.generate(**inputs, **generation_kwargs)
 
             # Decode captions
             generated_texts = processor.batch_decode(outputs, skip_special_tokens=True)
@@ -426,6 +516,41 @@ class ImageCaptioner:
 
         return results
 
+    def benchmark_quantization(
+        self, images: list[Image.Image], max_length: int | None = None
+    ) -> QuantizationBenchmark:
+        """
+        Compare the int8 quantized captioner with the fp32 model on images.
+
+        Both models run on the CPU with greedy decoding, and the fp32 captions
+        are the reference the accuracy delta (word error rate) is measured
+        against. The fp32 model and its quantized copy are both held in memory
+        while it runs.
+
+        Args:
+            images: Images to caption
+            max_length: Maximum caption length (defaults to config)
+
+        Returns:
+            Speed, size and accuracy of the quantized model
+        """
+        model_name = self.config.visual_analysis.captioning_model
+        max_length = max_length or self.config.visual_analysis.max_caption_length
+        logger.info(f"Benchmarking int8 quantization of {model_name}")
+        processor = self._load_processor(model_name)
+        float_model = self._load_pretrained_model(model_name, "cpu")
+        quantized_model = quantize_linear_layers(copy.deepcopy(float_model))
+
+        def caption(model: Any, image: Image.Image) -> str:
+            inputs = processor(image, return_tensors="pt")
+            with torch.no_grad():
+                outputs = model.generate(**inputs, max_length=max_length, num_beams=1)
+            return processor.batch_decode(outputs, skip_special_tokens=True)[0].strip()
+
+        return benchmark_quantization(
+            float_model, quantized_model, images, caption, word_agreement
+        )
+
     def get_supported_models(self) -> list[str]:
         """Get list of supported captioning models."""
         return [
@@ -438,6 +563,10 @@ class ImageCaptioner:
 
     def cleanup(self):
         """Clean up model resources."""
+        if self._model_handle is not None:
+            # The model stays loaded for other captioners while it fits
+            self._model_handle.release()
+            self._model_handle = None
         if self.model is not None:
             del self.model
             self.model = None
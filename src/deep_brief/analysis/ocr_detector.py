@@ -37,6 +37,8 @@ from deep_brief.analysis.error_handling import (
     with_retry,
 )
 from deep_brief.core.exceptions import ErrorCode, VideoProcessingError
+from deep_brief.core.memory_budget import EASYOCR_MODEL_MEMORY_MB, get_memory_budget
+from deep_brief.core.model_registry import ModelHandle, ModelKey, get_model_registry
 from deep_brief.utils.config import get_config
 
 logger = logging.getLogger(__name__)
@@ -84,6 +86,7 @@ class OCRDetector:
         # Initialize engine-specific components
         self.tesseract_config = None
         self.easyocr_reader = None
+        self._reader_handle: ModelHandle | None = None  # Shared EasyOCR reader
 
         self._validate_dependencies()
         self._initialize_engine()
@@ -158,7 +161,14 @@ class OCRDetector:
                 mapped_lang = lang_mapping.get(lang, lang)
                 easyocr_languages.append(mapped_lang)
 
-            self.easyocr_reader = easyocr.Reader(easyocr_languages, gpu=False)
+            if self._reader_handle is None:
+                self._reader_handle = get_model_registry().acquire(
+                    ModelKey(f"easyocr:{'+'.join(easyocr_languages)}", "cpu"),
+                    EASYOCR_MODEL_MEMORY_MB,
+                    lambda: easyocr.Reader(easyocr_languages, gpu=False),
+                    self._drop_reader,
+                )
+            self.easyocr_reader = self._reader_handle.get()
             logger.info(f"EasyOCR initialized with languages: {easyocr_languages}")
 
         except Exception as e:
@@ -379,8 +389,11 @@ class OCRDetector:
             # Convert PIL to numpy array for EasyOCR
             image_array = np.array(image)
 
-            # Perform OCR
-            results = self.easyocr_reader.readtext(image_array)
+            # Perform OCR, reloading the shared reader if it was unloaded
+            if self.easyocr_reader is None and self._reader_handle is not None:
+                self.easyocr_reader = self._reader_handle.get()
+            with get_memory_budget().using(self._reader_memory_key):
+                results = self.easyocr_reader.readtext(image_array)
 
             for result in results:
                 bbox_points, text, confidence = result
@@ -543,8 +556,21 @@ class OCRDetector:
 
         return []
 
+    @property
+    def _reader_memory_key(self) -> str:
+        """Key of the EasyOCR reader in the memory budget."""
+        return str(self._reader_handle.key) if self._reader_handle else "easyocr"
+
+    def _drop_reader(self) -> None:
+        """Drop the reference to a shared reader the registry unloaded."""
+        self.easyocr_reader = None
+
     def cleanup(self):
         """Clean up OCR resources."""
+        if self._reader_handle is not None:
+            # The reader stays loaded for other detectors while it fits
+            self._reader_handle.release()
+            self._reader_handle = None
         if self.easyocr_reader is not None:
             # EasyOCR doesn't have explicit cleanup, but we can clear the reference
             self.easyocr_reader = None
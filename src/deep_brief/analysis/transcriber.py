@@ -4,20 +4,51 @@ This module provides speech-to-text functionality with detailed timing informati
 for video analysis applications.
 """
 
+import asyncio
+import copy
+import dataclasses
 import logging
+import multiprocessing
+import os
 import warnings
+from collections.abc import Callable
 from typing import Any
 
+import numpy as np
 import torch
 import whisper
 from pydantic import BaseModel
 
-from deep_brief.core.audio_extractor import AudioInfo
+from deep_brief.analysis.voice_activity import (
+    SAMPLE_RATE,
+    SpeechTimeline,
+    detect_speech_intervals,
+    plan_silence_chunks,
+)
+from deep_brief.core.audio_extractor import AudioInfo, decode_pcm
+from deep_brief.core.cancellation import raise_if_cancelled
 from deep_brief.core.exceptions import (
     AudioProcessingError,
     ErrorCode,
+    OperationCancelledError,
     VideoProcessingError,
 )
+from deep_brief.core.memory_budget import (
+    DEFAULT_MODEL_MEMORY_MB,
+    WHISPER_MODEL_MEMORY_MB,
+    get_memory_budget,
+)
+from deep_brief.core.model_registry import ModelHandle, ModelKey, get_model_registry
+from deep_brief.core.quantization import (
+    QUANTIZED_DTYPE,
+    QUANTIZED_MEMORY_FACTOR,
+    QuantizationBenchmark,
+    QuantizedModelCache,
+    benchmark_quantization,
+    get_quantized_model_cache,
+    quantize_linear_layers,
+    word_agreement,
+)
 from deep_brief.utils.config import get_config
 
 logger = logging.getLogger(__name__)
@@ -69,6 +100,8 @@ class TranscriptionResult(BaseModel):
     word_count: int
     processing_time: float
     language_detection: LanguageDetectionResult | None = None
+    speech_seconds: float | None = None  # Speech found by the voice activity pass
+    skipped_seconds: float = 0.0  # Silence left out of transcription
 
     def get_words_at_time(
         self, timestamp: float, tolerance: float = 0.5
@@ -151,6 +184,8 @@ class TranscriptionResult(BaseModel):
             "model_used": self.model_used,
             "word_count": self.word_count,
             "processing_time": self.processing_time,
+            "speech_seconds": self.speech_seconds,
+            "skipped_seconds": self.skipped_seconds,
         }
 
 
@@ -162,8 +197,16 @@ class WhisperTranscriber:
         self.config = config or get_config()
         self.model = None
         self.device = self._determine_device()
+        self._model_handle: ModelHandle | None = None
+        # Worker processes for parallel chunks, kept for the next recording
+        self._chunk_pool: Any = None
+        self._chunk_pool_args: tuple[str, str, int, str] | None = None
 
         logger.info(f"WhisperTranscriber initialized with device: {self.device}")
+        if self.config.transcription.quantize and self.device != "cpu":
+            logger.warning(
+                f"Int8 quantization only runs on the CPU, not on {self.device}"
+            )
 
     def _determine_device(self) -> str:
         """Determine the best device for inference."""
@@ -185,28 +228,104 @@ class WhisperTranscriber:
 
         return device
 
+    @property
+    def _quantize(self) -> bool:
+        """Whether the model is quantized to int8, which only runs on the CPU."""
+        return self.config.transcription.quantize and self.device == "cpu"
+
+    @property
+    def _model_key(self) -> ModelKey:
+        """Key of this transcriber's model in the shared model registry."""
+        model_name = self.config.transcription.model
+        if self._quantize:
+            return ModelKey(model_name, self.device, QUANTIZED_DTYPE)
+        return ModelKey(model_name, self.device)
+
+    @property
+    def _memory_key(self) -> str:
+        """Key of this transcriber's model in the memory budget."""
+        return str(self._model_key)
+
+    @property
+    def _chunk_pool_memory_key(self) -> str:
+        """Key of this transcriber's chunk worker models in the memory budget."""
+        return f"{self._memory_key}:chunk-workers:{id(self):x}"
+
+    @property
+    def _model_size_mb(self) -> float:
+        """Estimated resident size of one copy of the model."""
+        size_mb = WHISPER_MODEL_MEMORY_MB.get(
+            self.config.transcription.model, DEFAULT_MODEL_MEMORY_MB
+        )
+        if self._quantize:
+            size_mb *= QUANTIZED_MEMORY_FACTOR
+        return size_mb
+
     def _load_model(self) -> whisper.Whisper:
-        """Load Whisper model if not already loaded."""
-        if self.model is None:
-            model_name = self.config.transcription.model
-            logger.info(f"Loading Whisper model: {model_name}")
+        """Get the shared Whisper model, loading it within the memory budget."""
+        model = self.model
+        if model is None:
+            if self._model_handle is None:
+                self._model_handle = get_model_registry().acquire(
+                    self._model_key,
+                    self._model_size_mb,
+                    self._load_whisper_model,
+                    self._drop_model,
+                )
+            model = self.model = self._model_handle.get()
+        else:
+            get_memory_budget().touch(self._memory_key)
+        return model
 
-            try:
-                # Remove 'whisper-' prefix if present
-                whisper_model_name = model_name.replace("whisper-", "")
-                self.model = whisper.load_model(whisper_model_name, device=self.device)
-                logger.info(f"Successfully loaded {model_name} on {self.device}")
-            except Exception as e:
-                error_msg = f"Failed to load Whisper model {model_name}: {str(e)}"
-                logger.error(error_msg)
-                raise VideoProcessingError(
-                    message=error_msg,
-                    error_code=ErrorCode.MISSING_DEPENDENCY,
-                    details={"model": model_name, "device": self.device},
-                    cause=e,
-                ) from e
+    def _load_whisper_model(self) -> whisper.Whisper:
+        """Load the configured Whisper model; loads are serialized by the budget."""
+        model_name = self.config.transcription.model
+        logger.info(f"Loading Whisper model: {model_name}")
+
+        try:
+            # Remove 'whisper-' prefix if present
+            whisper_model_name = model_name.replace("whisper-", "")
+            if self._quantize:
+                # Quantized once, then loaded from the cache on disk
+                model = _load_quantized_whisper(
+                    get_quantized_model_cache(self.config),
+                    whisper_model_name,
+                    str(self._model_key),
+                )
+            else:
+                model = whisper.load_model(whisper_model_name, device=self.device)
+            logger.info(f"Successfully loaded {model_name} on {self.device}")
+            return model
+        except Exception as e:
+            error_msg = f"Failed to load Whisper model {model_name}: {str(e)}"
+            logger.error(error_msg)
+            raise VideoProcessingError(
+                message=error_msg,
+                error_code=ErrorCode.MISSING_DEPENDENCY,
+                details={"model": model_name, "device": self.device},
+                cause=e,
+            ) from e
 
-        return self.model
+    def _drop_model(self) -> None:
+        """Drop the reference to a shared model the registry unloaded."""
+        self.model = None
+
+    def _whisper_audio_input(self, audio_info: AudioInfo) -> np.ndarray | str:
+        """
+        Get the audio to hand to Whisper.
+
+        Samples decoded in memory are passed directly, so Whisper does not
+        spawn ffmpeg to decode the audio again.
+
+        Args:
+            audio_info: AudioInfo object with audio file details
+
+        Returns:
+            16 kHz mono float32 samples, or the audio file path
+        """
+        if audio_info.samples is not None:
+            return audio_info.samples
+        return str(audio_info.file_path)
 
     def transcribe_audio(
         self,
@@ -242,8 +361,8 @@ class WhisperTranscriber:
 
         start_time = time.time()
 
-        # Validate audio file
-        if not audio_info.file_path.exists():
+        # Validate audio file (in-memory audio has no file to check)
+        if audio_info.samples is None and not audio_info.file_path.exists():
             raise AudioProcessingError(
                 message=f"Audio file not found: {audio_info.file_path}",
                 error_code=ErrorCode.FILE_NOT_FOUND,
@@ -329,18 +448,34 @@ class WhisperTranscriber:
             f"Parameters: language={final_language}, temperature={temperature}, word_timestamps={word_timestamps}"
         )
 
+        options = {
+            "language": final_language,
+            "temperature": temperature,
+            "word_timestamps": word_timestamps,
+            "verbose": False,  # Reduce logging noise
+        }
+
         try:
-            # Load model
-            model = self._load_model()
+            speech_audio, speech_timeline = self._skip_silence(audio_info)
+            chunk_plan = self._plan_parallel_chunks(speech_audio)
+            if speech_timeline is not None and not speech_timeline.intervals:
+                result = {"text": "", "segments": [], "language": final_language}
+            elif chunk_plan is not None:
+                result = self._transcribe_chunks_in_parallel(*chunk_plan, options)
+            else:
+                # Load model
+                model = self._load_model()
+
+                # A Whisper call cannot be interrupted, so check on either side
+                raise_if_cancelled("transcription")
+                with get_memory_budget().using(self._memory_key):
+                    result = model.transcribe(
+                        self._whisper_audio_input(speech_audio), **options
+                    )
+            raise_if_cancelled("transcription")
 
-            # Transcribe with Whisper
-            result = model.transcribe(
-                str(audio_info.file_path),
-                language=final_language,
-                temperature=temperature,
-                word_timestamps=word_timestamps,
-                verbose=False,  # Reduce logging noise
-            )
+            if speech_timeline is not None:
+                result = _map_result_times(result, speech_timeline.to_source_time)
 
             # Process result
             segments = []
@@ -382,7 +517,7 @@ class WhisperTranscriber:
             processing_time = time.time() - start_time
 
             # Update language detection result if Whisper detected different language
-            transcription_language = result.get("language", "unknown")
+            transcription_language = result.get("language") or "unknown"
             transcription_prob = float(result.get("language_probability", 0.0))
 
             # If we didn't have pre-detection, create one with Whisper's detection
@@ -417,6 +552,12 @@ class WhisperTranscriber:
                 word_count=total_words,
                 processing_time=processing_time,
                 language_detection=language_detection_result,
+                speech_seconds=speech_timeline.speech_seconds
+                if speech_timeline is not None
+                else None,
+                skipped_seconds=speech_timeline.skipped_seconds
+                if speech_timeline is not None
+                else 0.0,
             )
 
             logger.info(
@@ -426,6 +567,8 @@ class WhisperTranscriber:
 
             return transcription_result
 
+        except OperationCancelledError:
+            raise
         except Exception as e:
             processing_time = time.time() - start_time
             error_msg = f"Transcription failed after {processing_time:.1f}s: {str(e)}"
@@ -452,12 +595,229 @@ class WhisperTranscriber:
                 cause=e,
             ) from e
 
+    def _skip_silence(
+        self, audio_info: AudioInfo
+    ) -> tuple[AudioInfo, SpeechTimeline | None]:
+        """
+        Cut the silence out of the audio before transcription, if enabled.
+
+        Args:
+            audio_info: AudioInfo object with audio file details
+
+        Returns:
+            Audio of the speech only and the timeline mapping its times back
+            to the original audio, or the audio unchanged and None
+        """
+        transcription_config = self.config.transcription
+        if not transcription_config.skip_silence:
+            return audio_info, None
+
+        samples = self._whisper_audio_input(audio_info)
+        if isinstance(samples, str):
+            samples = whisper.load_audio(samples)
+
+        timeline = SpeechTimeline(
+            detect_speech_intervals(
+                samples,
+                transcription_config.min_skipped_silence_seconds,
+                transcription_config.speech_pad_seconds,
+            ),
+            len(samples) / SAMPLE_RATE,
+        )
+        logger.info(
+            f"Voice activity: {timeline.speech_seconds:.1f}s of speech in "
+            f"{len(timeline.intervals)} intervals, skipping "
+            f"{timeline.skipped_seconds:.1f}s of silence"
+        )
+
+        speech_audio = audio_info.model_copy(
+            update={
+                "samples": timeline.join(samples),
+                "duration": timeline.speech_seconds,
+            }
+        )
+        return speech_audio, timeline
+
+    def _plan_parallel_chunks(
+        self, audio_info: AudioInfo
+    ) -> tuple[np.ndarray, list[tuple[float, float]]] | None:
+        """
+        Split audio into chunks for parallel transcription, if enabled.
+
+        Args:
+            audio_info: AudioInfo object with audio file details
+
+        Returns:
+            The 16 kHz samples and the (start, end) times of the chunks, or
+            None to transcribe the audio in one piece
+        """
+        transcription_config = self.config.transcription
+        if transcription_config.parallel_workers <= 1:
+            return None
+        if self.device != "cpu":
+            # Worker processes would each need their own GPU context
+            logger.debug(f"Parallel chunk transcription is CPU only, not {self.device}")
+            return None
+        # Nothing to split, so skip decoding the file just to find pauses
+        if audio_info.duration <= transcription_config.chunk_seconds:
+            return None
+
+        samples = self._whisper_audio_input(audio_info)
+        if isinstance(samples, str):
+            samples = whisper.load_audio(samples)
+
+        chunks = plan_silence_chunks(
+            samples,
+            transcription_config.chunk_seconds,
+            transcription_config.min_silence_seconds,
+        )
+        if len(chunks) < 2:
+            return None
+        return samples, chunks
+
+    def _transcribe_chunks_in_parallel(
+        self,
+        samples: np.ndarray,
+        chunks: list[tuple[float, float]],
+        options: dict[str, Any],
+    ) -> dict[str, Any]:
+        """
+        Transcribe audio chunks on a pool of worker processes.
+
+        Each worker loads its own Whisper model once and transcribes one chunk
+        at a time; the pool is kept for the next recording. The chunk results
+        are stitched back onto the timeline of the whole recording.
+
+        The workers' models are accounted in the memory budget as one entry,
+        which is pinned while chunks run; when idle, the budget may stop the
+        pool to make room for other models.
+
+        Args:
+            samples: 16 kHz mono float32 samples of the whole recording
+            chunks: (start, end) times of the chunks, in order
+            options: Keyword arguments for Whisper's transcribe
+
+        Returns:
+            Whisper-style result dict covering the whole recording
+        """
+        with get_memory_budget().using(self._chunk_pool_memory_key):
+            pool = self._get_chunk_pool()
+            logger.info(f"Transcribing {len(chunks)} chunks on worker processes")
+
+            finished = False
+            try:
+                pending = [
+                    pool.apply_async(
+                        _transcribe_in_chunk_worker,
+                        (
+                            samples[int(start * SAMPLE_RATE) : int(end * SAMPLE_RATE)],
+                            options,
+                        ),
+                    )
+                    for start, end in chunks
+                ]
+                results = []
+                for chunk_result in pending:
+                    # Whisper calls cannot be interrupted, so poll for
+                    # cancellation and terminate the workers if it comes
+                    while not chunk_result.ready():
+                        raise_if_cancelled("transcription")
+                        chunk_result.wait(0.5)
+                    results.append(chunk_result.get())
+                finished = True
+            finally:
+                if not finished:
+                    # Stop chunks still running; the next call starts a new pool
+                    self._close_chunk_pool(terminate=True)
+
+        return _stitch_chunk_results(results, [start for start, _ in chunks])
+
+    def _get_chunk_pool(self) -> Any:
+        """Get the pool of chunk workers, starting it on first use."""
+        workers = self.config.transcription.parallel_workers
+        # Split the cores between the workers rather than oversubscribing them
+        threads = max(1, (os.cpu_count() or 1) // workers)
+        model_name = self.config.transcription.model.replace("whisper-", "")
+        pool_args = (model_name, self.device, workers, str(self._model_key))
+        if self._chunk_pool is not None and self._chunk_pool_args == pool_args:
+            return self._chunk_pool
+
+        self._close_chunk_pool()
+        logger.info(
+            f"Starting {workers} chunk transcription workers ({threads} threads each)"
+        )
+        quantized_cache = (
+            get_quantized_model_cache(self.config) if self._quantize else None
+        )
+
+        def start_pool() -> Any:
+            # Spawned rather than forked, so workers do not inherit this
+            # process's loaded model or its GPU context
+            return multiprocessing.get_context("spawn").Pool(
+                processes=workers,
+                initializer=_init_chunk_worker,
+                initargs=(
+                    model_name,
+                    self.device,
+                    threads,
+                    quantized_cache,
+                    str(self._model_key),
+                ),
+            )
+
+        # Every worker holds its own copy of the model
+        self._chunk_pool = get_memory_budget().load_model(
+            self._chunk_pool_memory_key,
+            workers * self._model_size_mb,
+            start_pool,
+            self._close_chunk_pool,
+        )
+        self._chunk_pool_args = pool_args
+        return self._chunk_pool
+
+    def _close_chunk_pool(self, terminate: bool = False) -> None:
+        """Stop the chunk workers, letting running chunks finish unless terminating."""
+        pool, self._chunk_pool = self._chunk_pool, None
+        self._chunk_pool_args = None
+        if pool is None:
+            return
+        get_memory_budget().release_model(self._chunk_pool_memory_key)
+        if terminate:
+            pool.terminate()
+        else:
+            pool.close()
+        pool.join()
+
+    async def transcribe_audio_async(
+        self, audio_info: AudioInfo, **kwargs: Any
+    ) -> TranscriptionResult:
+        """
+        Transcribe audio on the loop's default executor.
+
+        Model loading and inference block, so they run off the event loop;
+        the arguments are those of transcribe_audio.
+
+        Args:
+            audio_info: AudioInfo object with audio file details
+            **kwargs: Other transcribe_audio arguments
+
+        Returns:
+            TranscriptionResult with detailed transcription
+
+        Raises:
+            AudioProcessingError: If transcription fails
+        """
+        return await asyncio.to_thread(self.transcribe_audio, audio_info, **kwargs)
+
     def transcribe_audio_segment(
         self, audio_info: AudioInfo, start_time: float, end_time: float, **kwargs
     ) -> TranscriptionResult:
         """
         Transcribe a specific segment of audio.
 
+        Only the segment, plus segment_context_seconds either side so words
+        at its edges are heard in full, is decoded and transcribed.
+
         Args:
             audio_info: AudioInfo object with audio file details
             start_time: Start time in seconds
@@ -465,43 +825,60 @@ class WhisperTranscriber:
             **kwargs: Additional parameters for transcribe_audio
 
         Returns:
-            TranscriptionResult for the audio segment
-        """
-        # Note: This is a simplified implementation
-        # In practice, you might want to extract the audio segment first
-        # For now, we'll transcribe the full audio and filter results
+            TranscriptionResult for the audio segment, with times relative to
+            start_time
 
-        full_result = self.transcribe_audio(audio_info, **kwargs)
+        Raises:
+            ValueError: If the segment is empty
+            AudioProcessingError: If transcription fails
+            FFmpegError: If the segment cannot be decoded from the file
+        """
+        if end_time <= start_time:
+            raise ValueError("Segment end time must be after its start time")
+
+        context = self.config.transcription.segment_context_seconds
+        window_start = max(start_time - context, 0.0)
+        window_end = min(end_time + context, audio_info.duration)
+        full_result = self.transcribe_audio(
+            self._audio_window(audio_info, window_start, window_end), **kwargs
+        )
+        # Window times are relative to the window; move them to the segment's
+        offset = window_start - start_time
 
         # Filter segments to the requested time range
         filtered_segments = []
         segment_id = 0
 
+        segment_duration = end_time - start_time
         for segment in full_result.segments:
             # Check if segment overlaps with requested time range
-            if segment.end >= start_time and segment.start <= end_time:
+            if (
+                segment.end + offset >= 0.0
+                and segment.start + offset <= segment_duration
+            ):
                 # Create filtered segment
                 filtered_words = []
                 if segment.words:
                     filtered_words = [
                         word
                         for word in segment.words
-                        if word.end >= start_time and word.start <= end_time
+                        if word.end + offset >= 0.0
+                        and word.start + offset <= segment_duration
                     ]
 
                 # Adjust segment timing relative to the start_time
                 adjusted_segment = Segment(
                     id=segment_id,
                     text=segment.text,
-                    start=max(segment.start - start_time, 0.0),
-                    end=min(segment.end - start_time, end_time - start_time),
+                    start=max(segment.start + offset, 0.0),
+                    end=min(segment.end + offset, segment_duration),
                     avg_logprob=segment.avg_logprob,
                     no_speech_prob=segment.no_speech_prob,
                     words=[
                         WordTimestamp(
                             word=word.word,
-                            start=word.start - start_time,
-                            end=word.end - start_time,
+                            start=word.start + offset,
+                            end=word.end + offset,
                             confidence=word.confidence,
                         )
                         for word in filtered_words
@@ -520,12 +897,45 @@ class WhisperTranscriber:
             segments=filtered_segments,
             language=full_result.language,
             language_probability=full_result.language_probability,
-            duration=end_time - start_time,
+            duration=segment_duration,
             model_used=full_result.model_used,
             word_count=word_count,
             processing_time=full_result.processing_time,
         )
 
+    def _audio_window(
+        self, audio_info: AudioInfo, start_time: float, end_time: float
+    ) -> AudioInfo:
+        """
+        Get the audio between two times, decoding no more than that.
+
+        Args:
+            audio_info: AudioInfo object with audio file details
+            start_time: Start of the window in seconds
+            end_time: End of the window in seconds
+
+        Returns:
+            AudioInfo carrying the window's samples
+        """
+        if audio_info.samples is not None:
+            samples = audio_info.samples[
+                int(start_time * SAMPLE_RATE) : int(end_time * SAMPLE_RATE)
+            ]
+        else:
+            if not audio_info.file_path.exists():
+                raise AudioProcessingError(
+                    message=f"Audio file not found: {audio_info.file_path}",
+                    error_code=ErrorCode.FILE_NOT_FOUND,
+                    file_path=audio_info.file_path,
+                )
+            samples = decode_pcm(
+                audio_info.file_path, start_time, end_time - start_time
+            )
+
+        return audio_info.model_copy(
+            update={"samples": samples, "duration": len(samples) / SAMPLE_RATE}
+        )
+
     def detect_language(
         self,
         audio_info: AudioInfo,
@@ -546,7 +956,7 @@ class WhisperTranscriber:
         """
         logger.info(f"Detecting language for audio: {audio_info.file_path.name}")
 
-        if not audio_info.file_path.exists():
+        if audio_info.samples is None and not audio_info.file_path.exists():
             raise AudioProcessingError(
                 message=f"Audio file not found: {audio_info.file_path}",
                 error_code=ErrorCode.FILE_NOT_FOUND,
@@ -557,7 +967,9 @@ class WhisperTranscriber:
             model = self._load_model()
 
             # Load audio and prepare for detection
-            audio = whisper.load_audio(str(audio_info.file_path))
+            audio = self._whisper_audio_input(audio_info)
+            if isinstance(audio, str):
+                audio = whisper.load_audio(audio)
 
             # Limit to sample_duration for faster detection
             sample_duration = min(sample_duration, 30.0)  # Whisper limit
@@ -571,7 +983,8 @@ class WhisperTranscriber:
             mel = whisper.log_mel_spectrogram(audio).to(model.device)
 
             # Detect language
-            _, probs = model.detect_language(mel)
+            with get_memory_budget().using(self._memory_key):
+                _, probs = model.detect_language(mel)
 
             # Get the most probable language
             detected_language = max(probs, key=probs.get)
@@ -608,6 +1021,26 @@ class WhisperTranscriber:
                 cause=e,
             ) from e
 
+    async def detect_language_async(
+        self, audio_info: AudioInfo, sample_duration: float = 30.0
+    ) -> LanguageDetectionResult:
+        """
+        Detect the language of the audio on the loop's default executor.
+
+        Args:
+            audio_info: AudioInfo object with audio file details
+            sample_duration: Duration in seconds to sample for detection (max 30s)
+
+        Returns:
+            LanguageDetectionResult with detected language and confidence
+
+        Raises:
+            AudioProcessingError: If language detection fails
+        """
+        return await asyncio.to_thread(
+            self.detect_language, audio_info, sample_duration
+        )
+
     def validate_language_override(self, language: str) -> str:
         """
         Validate and normalize a manually specified language code.
@@ -974,8 +1407,48 @@ class WhisperTranscriber:
 
         return language_names.get(language_code, language_code.upper())
 
+    def benchmark_quantization(self, audio_info: AudioInfo) -> QuantizationBenchmark:
+        """
+        Compare int8 quantized Whisper with the fp32 model on a recording.
+
+        Both models run on the CPU, and the fp32 transcript is the reference
+        the accuracy delta (word error rate) is measured against. The fp32
+        model and its quantized copy are both held in memory while it runs.
+
+        Args:
+            audio_info: AudioInfo object with audio file details
+
+        Returns:
+            Speed, size and accuracy of the quantized model
+        """
+        model_name = self.config.transcription.model
+        logger.info(f"Benchmarking int8 quantization of {model_name}")
+        whisper_model_name = model_name.replace("whisper-", "")
+        float_model = whisper.load_model(whisper_model_name, device="cpu")
+        quantized_model = quantize_linear_layers(copy.deepcopy(float_model))
+
+        language = self.config.transcription.language
+        options = {
+            "language": None if language == "auto" else language,
+            "temperature": self.config.transcription.temperature,
+            "fp16": False,
+            "verbose": False,
+        }
+        return benchmark_quantization(
+            float_model,
+            quantized_model,
+            [self._whisper_audio_input(audio_info)],
+            lambda model, audio: model.transcribe(audio, **options)["text"],
+            word_agreement,
+        )
+
     def cleanup(self):
         """Clean up model resources."""
+        self._close_chunk_pool()
+        if self._model_handle is not None:
+            # The model stays loaded for other transcribers while it fits
+            self._model_handle.release()
+            self._model_handle = None
         if self.model is not None:
             del self.model
             self.model = None
@@ -987,6 +1460,135 @@ class WhisperTranscriber:
             logger.info("Whisper model resources cleaned up")
 
 
+# Whisper model of a chunk worker process, loaded once by its initializer
+_chunk_worker_model: Any = None
+
+
+def _load_quantized_whisper(
+    quantized_cache: QuantizedModelCache, model_name: str, model_key: str
+) -> whisper.Whisper:
+    """
+    Load int8 quantized Whisper from the cache, quantizing it on a miss.
+
+    Args:
+        quantized_cache: Cache of quantized models
+        model_name: Whisper model name without the "whisper-" prefix
+        model_key: Model registry key of the quantized model
+
+    Returns:
+        Quantized Whisper model on the CPU
+    """
+
+    def build(architecture: dict[str, Any]) -> whisper.Whisper:
+        model = whisper.Whisper(whisper.ModelDimensions(**architecture))
+        # Alignment heads for word timestamps are not saved with the weights;
+        # whisper keeps them in a private table, so tolerate it going away
+        alignment_heads = getattr(whisper, "_ALIGNMENT_HEADS", {}).get(model_name)
+        if alignment_heads:
+            model.set_alignment_heads(alignment_heads)
+        return model
+
+    return quantized_cache.load_or_quantize(
+        model_key,
+        f"whisper{whisper.__version__}",
+        lambda: whisper.load_model(model_name, device="cpu"),
+        lambda model: dataclasses.asdict(model.dims),
+        build,
+    )
+
+
+def _init_chunk_worker(
+    model_name: str,
+    device: str,
+    threads: int,
+    quantized_cache: QuantizedModelCache | None = None,
+    model_key: str = "",
+) -> None:
+    """Load the Whisper model of a chunk worker process."""
+    global _chunk_worker_model
+    torch.set_num_threads(threads)
+    if quantized_cache is not None:
+        _chunk_worker_model = _load_quantized_whisper(
+            quantized_cache, model_name, model_key
+        )
+    else:
+        _chunk_worker_model = whisper.load_model(model_name, device=device)
+
+
+def _transcribe_in_chunk_worker(
+    samples: np.ndarray, options: dict[str, Any]
+) -> dict[str, Any]:
+    """Transcribe one audio chunk in a chunk worker process."""
+    if _chunk_worker_model is None:
+        raise RuntimeError("Chunk worker was not initialized")
+    return _chunk_worker_model.transcribe(samples, **options)
+
+
+def _map_result_times(
+    result: dict[str, Any], to_time: Callable[[float], float]
+) -> dict[str, Any]:
+    """
+    Move the segment and word times of a Whisper result to another timeline.
+
+    Args:
+        result: Whisper result dict
+        to_time: Maps a time in the result to the new timeline
+
+    Returns:
+        Copy of the result with mapped times
+    """
+    segments = []
+    for segment in result.get("segments", []):
+        mapped = dict(
+            segment, start=to_time(segment["start"]), end=to_time(segment["end"])
+        )
+        if "words" in segment:
+            mapped["words"] = [
+                dict(word, start=to_time(word["start"]), end=to_time(word["end"]))
+                for word in segment["words"]
+            ]
+        segments.append(mapped)
+    return dict(result, segments=segments)
+
+
+def _stitch_chunk_results(
+    results: list[dict[str, Any]], offsets: list[float]
+) -> dict[str, Any]:
+    """
+    Join Whisper results of consecutive chunks into one result.
+
+    Segment and word times are shifted by the start of their chunk and
+    segment ids are renumbered across the whole recording.
+
+    Args:
+        results: Whisper result dict of each chunk, in order
+        offsets: Start time of each chunk in seconds
+
+    Returns:
+        Whisper-style result dict covering all chunks
+    """
+    segments: list[dict[str, Any]] = []
+    texts = []
+    language = None
+    for result, offset in zip(results, offsets, strict=True):
+        chunk_segments = result.get("segments", [])
+        text = result.get("text", "").strip()
+        if text:
+            texts.append(text)
+        # Chunks auto-detect their language; take the first with speech
+        if language is None and chunk_segments:
+            language = result.get("language")
+
+        shifted = _map_result_times(result, lambda time, offset=offset: time + offset)
+        for segment in shifted["segments"]:
+            segments.append(dict(segment, id=len(segments)))
+
+    if language is None and results:
+        language = results[0].get("language")
+
+    return {"text": " ".join(texts), "segments": segments, "language": language}
+
+
 def create_transcriber(config: Any = None) -> WhisperTranscriber:
     """Create a new WhisperTranscriber instance.
 
@@ -4,7 +4,11 @@ This module provides frame extraction capabilities with quality assessment
 including blur detection, contrast analysis, and lighting evaluation.
 """
 
+import hashlib
+import json
 import logging
+import threading
+from collections.abc import Callable, Iterator
 from pathlib import Path
 from typing import Any
 
@@ -18,10 +22,20 @@ from deep_brief.analysis.error_handling import (
     safe_model_inference,
     validate_image,
 )
+from deep_brief.analysis.frame_sampler import (
+    RawFramePipeSampler,
+    SequentialFrameSampler,
+)
 from deep_brief.analysis.image_captioner import CaptionResult, ImageCaptioner
 from deep_brief.analysis.object_detector import ObjectDetectionResult, ObjectDetector
 from deep_brief.analysis.ocr_detector import OCRDetector, OCRResult
-from deep_brief.core.exceptions import ErrorCode, VideoProcessingError
+from deep_brief.core.cancellation import raise_if_cancelled
+from deep_brief.core.exceptions import (
+    ErrorCode,
+    OperationCancelledError,
+    VideoProcessingError,
+)
+from deep_brief.core.memory_budget import FrameBuffer, get_memory_budget
 from deep_brief.core.scene_detector import SceneDetectionResult
 from deep_brief.utils.config import get_config
 
@@ -357,6 +371,131 @@ class VisualAnalysisResult(BaseModel):
             return "poor"
 
 
+
+class VisualAnalysisStats:
+    """
+    Running totals over the scene analyses of one video.
+
+    Updated one scene at a time while frames are extracted, so aggregate
+    figures are available as results stream in without keeping every
+    SceneFrameAnalysis in memory.
+    """
+
+    def __init__(self) -> None:
+        """Initialize empty totals."""
+        self.scenes_completed = 0
+        self.total_frames_extracted = 0
+        self.total_frames_processed = 0
+        self.frames_filtered_by_quality = 0
+        self.quality_distribution = {"excellent": 0, "good": 0, "fair": 0, "poor": 0}
+        self._total_quality_score = 0.0
+        self._scored_frames = 0
+
+    def add(self, scene_analysis: SceneFrameAnalysis) -> None:
+        """Fold a completed scene into the totals."""
+        self.scenes_completed += 1
+        self.total_frames_extracted += scene_analysis.total_frames_extracted
+        self.total_frames_processed += scene_analysis.total_frames_processed
+        self.frames_filtered_by_quality += scene_analysis.frames_filtered_by_quality
+        for category, count in scene_analysis.quality_distribution.items():
+            self.quality_distribution[category] = (
+                self.quality_distribution.get(category, 0) + count
+            )
+        for frame in scene_analysis.frames:
+            self._total_quality_score += frame.quality_metrics.overall_quality_score
+            self._scored_frames += 1
+
+    @property
+    def overall_success_rate(self) -> float:
+        """Fraction of sampled frames that were kept so far."""
+        if self.total_frames_processed == 0:
+            return 0.0
+        return self.total_frames_extracted / self.total_frames_processed
+
+    @property
+    def average_quality_score(self) -> float:
+        """Mean quality score of the frames kept so far."""
+        if self._scored_frames == 0:
+            return 0.0
+        return self._total_quality_score / self._scored_frames
+
+    def to_result(
+        self,
+        scene_analyses: list[SceneFrameAnalysis],
+        total_scenes: int,
+        video_duration: float,
+        processing_time: float,
+    ) -> VisualAnalysisResult:
+        """
+        Build the visual analysis result from the totals.
+
+        Args:
+            scene_analyses: Scene analyses to include; the totals may also
+                count frames these no longer hold
+            total_scenes: Number of scenes frames were extracted from
+            video_duration: Duration of the video
+            processing_time: Time spent extracting and analyzing frames
+
+        Returns:
+            VisualAnalysisResult with the totals and scene analyses
+        """
+        return VisualAnalysisResult(
+            total_scenes=total_scenes,
+            total_frames_extracted=self.total_frames_extracted,
+            total_frames_processed=self.total_frames_processed,
+            overall_success_rate=self.overall_success_rate,
+            scene_analyses=scene_analyses,
+            overall_quality_distribution=dict(self.quality_distribution),
+            average_quality_score=self.average_quality_score,
+            best_frames_per_scene=[
+                analysis.best_frame
+                for analysis in scene_analyses
+                if analysis.best_frame
+            ],
+            video_duration=video_duration,
+            extraction_method="scene_based",
+            processing_time=processing_time,
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary format for serialization."""
+        return {
+            "scenes_completed": self.scenes_completed,
+            "total_frames_extracted": self.total_frames_extracted,
+            "total_frames_processed": self.total_frames_processed,
+            "frames_filtered_by_quality": self.frames_filtered_by_quality,
+            "overall_success_rate": self.overall_success_rate,
+            "quality_distribution": dict(self.quality_distribution),
+            "average_quality_score": self.average_quality_score,
+        }
+
+
+# Content analysis name -> (frame method, ExtractedFrame attribute, log label)
+CONTENT_ANALYSES = {
+    "caption": ("_caption_frame", "caption_result", "caption generation"),
+    "ocr": ("_extract_text_from_frame", "ocr_result", "OCR"),
+    "objects": ("_detect_objects_in_frame", "object_detection_result", "object detection"),
+}
+
+# visual_analysis settings that change each content analysis' per-frame results
+CONTENT_ANALYSIS_SETTINGS = {
+    "caption": (
+        "captioning_model",
+        "captioning_device",
+        "captioning_quantize",
+        "max_caption_length",
+        "caption_temperature",
+    ),
+    "ocr": (
+        "ocr_engine",
+        "ocr_languages",
+        "ocr_confidence_threshold",
+        "ocr_text_min_length",
+    ),
+    "objects": ("object_detection_model", "object_detection_confidence"),
+}
+
+
 class FrameExtractor:
     """Frame extraction and quality assessment for video analysis."""
 
@@ -373,6 +512,10 @@ class FrameExtractor:
         video_path: Path,
         scene_result: SceneDetectionResult,
         output_dir: Path | None = None,
+        analyze_content: bool = True,
+        frame_images: dict[tuple[int, int], np.ndarray] | None = None,
+        scene_callback: Callable[[SceneFrameAnalysis, VisualAnalysisStats], None]
+        | None = None,
     ) -> VisualAnalysisResult:
         """
         Extract representative frames from each scene with quality assessment.
@@ -381,6 +524,12 @@ class FrameExtractor:
             video_path: Path to the video file
             scene_result: Scene detection results
             output_dir: Directory to save extracted frames (optional)
+            analyze_content: Whether to caption, OCR and detect objects in the
+                frames now; when False, run analyze_frame_content later
+            frame_images: Optional dict filled with the RGB image of each kept
+                frame, keyed by (scene_number, frame_number)
+            scene_callback: Optional callback called with each scene's
+                analysis and the running totals as soon as the scene completes
 
         Returns:
             VisualAnalysisResult with extracted frames and quality metrics
@@ -392,6 +541,68 @@ class FrameExtractor:
 
         start_time = time.time()
 
+        stats = VisualAnalysisStats()
+        scene_analyses = []
+        for scene_analysis in self.iter_frames_from_scenes(
+            video_path,
+            scene_result,
+            output_dir=output_dir,
+            analyze_content=analyze_content,
+            frame_images=frame_images,
+            stats=stats,
+        ):
+            scene_analyses.append(scene_analysis)
+            if scene_callback is not None:
+                scene_callback(scene_analysis, stats)
+
+        processing_time = time.time() - start_time
+
+        result = stats.to_result(
+            scene_analyses,
+            total_scenes=len(scene_result.scenes),
+            video_duration=scene_result.video_duration,
+            processing_time=processing_time,
+        )
+
+        logger.info(
+            f"Frame extraction complete: {stats.total_frames_extracted} frames from {len(scene_result.scenes)} scenes "
+            f"(avg quality: {stats.average_quality_score:.3f}, processing time: {processing_time:.1f}s)"
+        )
+
+        return result
+
+    def iter_frames_from_scenes(
+        self,
+        video_path: Path,
+        scene_result: SceneDetectionResult,
+        output_dir: Path | None = None,
+        analyze_content: bool = True,
+        frame_images: dict[tuple[int, int], np.ndarray] | None = None,
+        stats: VisualAnalysisStats | None = None,
+    ) -> Iterator[SceneFrameAnalysis]:
+        """
+        Extract and analyze frames scene by scene, yielding each as it completes.
+
+        Nothing is kept from scenes already yielded, so memory does not grow
+        with the number of scenes. Pass a VisualAnalysisStats to keep running
+        totals. Closing the generator early releases the video.
+
+        Args:
+            video_path: Path to the video file
+            scene_result: Scene detection results
+            output_dir: Directory to save extracted frames (optional)
+            analyze_content: Whether to caption, OCR and detect objects in the
+                frames now; when False, run analyze_frame_content later
+            frame_images: Optional dict filled with the RGB image of each kept
+                frame, keyed by (scene_number, frame_number)
+            stats: Optional running totals, updated before each scene is yielded
+
+        Yields:
+            SceneFrameAnalysis of each scene, in processing order
+
+        Raises:
+            VideoProcessingError: If frame extraction fails
+        """
         # Validate input
         if not video_path.exists():
             raise VideoProcessingError(
@@ -404,6 +615,10 @@ class FrameExtractor:
             f"Extracting frames from {len(scene_result.scenes)} scenes: {video_path.name}"
         )
 
+        cap = None
+        sampler = None
+        frame_buffer = None
+        decoder = None
         try:
             # Open video capture
             cap = cv2.VideoCapture(str(video_path))
@@ -420,88 +635,72 @@ class FrameExtractor:
                 fps = 30.0  # Default fallback
                 logger.warning(f"Invalid FPS detected, using fallback: {fps}")
 
-            scene_analyses = []
-            total_frames_extracted = 0
-            total_frames_processed = 0
-            best_frames_per_scene = []
+            # Optionally decode the stream once, front to back, instead of
+            # seeking for every sample position
+            scenes = scene_result.scenes
+            sampling_method = self.config.visual_analysis.frame_sampling_method
+            if sampling_method in ("sequential", "pipe"):
+                scenes = sorted(scenes, key=lambda s: s.start_time)
+            # Frames in the order they are read
+            frame_numbers = [
+                int(timestamp * fps)
+                for scene in scenes
+                for timestamp in self._calculate_frame_positions(scene)
+            ]
+            if sampling_method == "pipe":
+                sampler = self._create_pipe_sampler(cap, video_path, frame_numbers)
+            elif sampling_method == "sequential":
+                sampler = SequentialFrameSampler(
+                    cap,
+                    fps,
+                    frame_numbers=frame_numbers,
+                    max_gap_seconds=self.config.visual_analysis.sequential_max_gap_seconds,
+                )
+
+            # Decode frames on a separate thread while earlier ones are
+            # analyzed; the producer blocks once the buffer is full
+            buffer_mb = self.config.processing.frame_buffer_mb
+            if buffer_mb > 0:
+                frame_buffer = FrameBuffer(buffer_mb * 1024 * 1024, get_memory_budget())
+                decoder = threading.Thread(
+                    target=self._decode_ahead,
+                    args=(cap, sampler, frame_numbers, frame_buffer),
+                    name=f"frame-decoder-{video_path.stem}",
+                    daemon=True,
+                )
+                decoder.start()
 
             # Process each scene
-            for scene in scene_result.scenes:
+            for scene in scenes:
                 logger.debug(
                     f"Processing scene {scene.scene_number}: {scene.start_time:.1f}s - {scene.end_time:.1f}s"
                 )
 
                 scene_analysis = self._extract_frames_from_scene(
-                    cap, scene, fps, output_dir, video_path.stem
+                    cap,
+                    scene,
+                    fps,
+                    output_dir,
+                    video_path.stem,
+                    sampler,
+                    analyze_content,
+                    frame_images,
+                    frame_buffer,
                 )
+                if stats is not None:
+                    stats.add(scene_analysis)
 
-                scene_analyses.append(scene_analysis)
-                total_frames_extracted += scene_analysis.total_frames_extracted
-                total_frames_processed += scene_analysis.total_frames_processed
+                yield scene_analysis
 
-                if scene_analysis.best_frame:
-                    best_frames_per_scene.append(scene_analysis.best_frame)
+            if sampler is not None:
+                logger.debug(f"Frame sampling ({sampling_method}): {sampler.get_stats()}")
+            if frame_buffer is not None:
+                logger.debug(f"Frame decode-ahead: {frame_buffer.get_stats()}")
 
-            cap.release()
-
-            # Calculate overall statistics
-            overall_success_rate = (
-                total_frames_extracted / total_frames_processed
-                if total_frames_processed > 0
-                else 0.0
-            )
-
-            # Aggregate quality distribution
-            overall_quality_distribution = {
-                "excellent": 0,
-                "good": 0,
-                "fair": 0,
-                "poor": 0,
-            }
-            total_quality_score = 0.0
-            total_frames_for_avg = 0
-
-            for scene_analysis in scene_analyses:
-                for category, count in scene_analysis.quality_distribution.items():
-                    overall_quality_distribution[category] += count
-
-                for frame in scene_analysis.frames:
-                    total_quality_score += frame.quality_metrics.overall_quality_score
-                    total_frames_for_avg += 1
-
-            average_quality_score = (
-                total_quality_score / total_frames_for_avg
-                if total_frames_for_avg > 0
-                else 0.0
-            )
-
-            processing_time = time.time() - start_time
-
-            result = VisualAnalysisResult(
-                total_scenes=len(scene_result.scenes),
-                total_frames_extracted=total_frames_extracted,
-                total_frames_processed=total_frames_processed,
-                overall_success_rate=overall_success_rate,
-                scene_analyses=scene_analyses,
-                overall_quality_distribution=overall_quality_distribution,
-                average_quality_score=average_quality_score,
-                best_frames_per_scene=best_frames_per_scene,
-                video_duration=scene_result.video_duration,
-                extraction_method="scene_based",
-                processing_time=processing_time,
-            )
-
-            logger.info(
-                f"Frame extraction complete: {total_frames_extracted} frames from {len(scene_result.scenes)} scenes "
-                f"(avg quality: {average_quality_score:.3f}, processing time: {processing_time:.1f}s)"
-            )
-
-            return result
+        except OperationCancelledError:
+            raise
 
         except Exception as e:
-            if hasattr(locals(), "cap"):
-                cap.release()
-
             error_msg = f"Frame extraction failed: {str(e)}"
             logger.error(error_msg)
 
@@ -512,6 +711,17 @@ class FrameExtractor:
                 cause=e,
             ) from e
 
+        finally:
+            # Stop the decoder before releasing what it reads from
+            if frame_buffer is not None:
+                frame_buffer.close()
+            if decoder is not None:
+                decoder.join()
+            if cap is not None:
+                cap.release()
+            if isinstance(sampler, RawFramePipeSampler):
+                sampler.close()
+
     def _extract_frames_from_scene(
         self,
         cap: cv2.VideoCapture,
@@ -519,40 +729,37 @@ class FrameExtractor:
         fps: float,
         output_dir: Path | None,
         video_name: str,
+        sampler: SequentialFrameSampler | RawFramePipeSampler | None = None,
+        analyze_content: bool = True,
+        frame_images: dict[tuple[int, int], np.ndarray] | None = None,
+        frame_buffer: FrameBuffer | None = None,
     ) -> SceneFrameAnalysis:
         """Extract frames from a single scene with quality assessment."""
-        frames_per_scene = self.config.visual_analysis.frames_per_scene
         min_quality_score = self.config.visual_analysis.min_quality_score
         enable_quality_filtering = self.config.visual_analysis.enable_quality_filtering
 
         # Calculate frame positions within the scene
         scene_duration = scene.end_time - scene.start_time
-        frame_positions = []
-
-        if frames_per_scene == 1:
-            # Extract middle frame
-            frame_positions = [scene.start_time + scene_duration / 2]
-        else:
-            # Extract evenly spaced frames
-            for i in range(frames_per_scene):
-                position = scene.start_time + (
-                    scene_duration * (i + 1) / (frames_per_scene + 1)
-                )
-                frame_positions.append(position)
+        frame_positions = self._calculate_frame_positions(scene)
 
         extracted_frames = []
         total_frames_processed = 0
         frames_filtered_by_quality = 0
 
         for i, timestamp in enumerate(frame_positions):
+            raise_if_cancelled("frame extraction")
             total_frames_processed += 1
 
-            # Seek to frame position
             frame_number = int(timestamp * fps)
-            cap.set(cv2.CAP_PROP_POS_FRAMES, frame_number)
 
-            # Read frame
-            ret, frame = cap.read()
+            if frame_buffer is not None:
+                # Already decoded by the decode-ahead thread
+                decoded = frame_buffer.get()
+                if isinstance(decoded, Exception):
+                    raise decoded
+                ret, frame = decoded
+            else:
+                ret, frame = self._read_frame(cap, sampler, frame_number)
             if not ret:
                 logger.warning(
                     f"Failed to read frame at {timestamp:.1f}s in scene {scene.scene_number}"
@@ -576,6 +783,13 @@ class FrameExtractor:
                 logger.error(f"Frame validation failed at {timestamp:.1f}s: {e}")
                 continue
 
+            # Raw piped frames arrive as RGB, which is what the models want;
+            # the OpenCV-based quality checks and JPEG writer expect BGR
+            rgb_frame = None
+            if getattr(sampler, "outputs_rgb", False):
+                rgb_frame = frame
+                frame = cv2.cvtColor(rgb_frame, cv2.COLOR_RGB2BGR)
+
             # Assess frame quality with error recovery
             with ErrorRecoveryContext(
                 f"quality assessment for frame at {timestamp:.1f}s",
@@ -598,35 +812,28 @@ class FrameExtractor:
                 )
                 continue
 
-            # Generate caption for frame with error recovery
-            with ErrorRecoveryContext(
-                f"caption generation for frame at {timestamp:.1f}s",
-                suppress_errors=True
-            ) as ctx:
-                caption_result = self._caption_frame(frame)
-                if ctx.error:
-                    logger.warning(f"Caption generation failed: {ctx.error}")
-                    caption_result = None
+            # Keep the full-size image for content analysis run later; piped
+            # frames live in the sampler's reused buffers, so keep a copy
+            if frame_images is not None:
+                frame_images[(scene.scene_number, frame_number)] = (
+                    rgb_frame.copy()
+                    if rgb_frame is not None
+                    else cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+                )
 
-            # Perform OCR on frame with error recovery
-            with ErrorRecoveryContext(
-                f"OCR for frame at {timestamp:.1f}s",
-                suppress_errors=True
-            ) as ctx:
-                ocr_result = self._extract_text_from_frame(frame)
-                if ctx.error:
-                    logger.warning(f"OCR failed: {ctx.error}")
-                    ocr_result = None
-            
-            # Perform object detection on frame with error recovery
-            with ErrorRecoveryContext(
-                f"object detection for frame at {timestamp:.1f}s",
-                suppress_errors=True
-            ) as ctx:
-                object_detection_result = self._detect_objects_in_frame(frame)
-                if ctx.error:
-                    logger.warning(f"Object detection failed: {ctx.error}")
-                    object_detection_result = None
+            caption_result = None
+            ocr_result = None
+            object_detection_result = None
+            if analyze_content:
+                caption_result = self._run_content_analysis(
+                    "caption", frame, rgb_frame, timestamp
+                )
+                ocr_result = self._run_content_analysis(
+                    "ocr", frame, rgb_frame, timestamp
+                )
+                object_detection_result = self._run_content_analysis(
+                    "objects", frame, rgb_frame, timestamp
+                )
 
             # Save frame if output directory specified
             file_path = None
@@ -712,6 +919,179 @@ class FrameExtractor:
             extraction_success_rate=extraction_success_rate,
         )
 
+    def _read_frame(
+        self,
+        cap: cv2.VideoCapture,
+        sampler: SequentialFrameSampler | RawFramePipeSampler | None,
+        frame_number: int,
+    ) -> tuple[bool, np.ndarray | None]:
+        """Read one planned frame from the sampler or by seeking."""
+        if sampler is not None:
+            # Decode forward from the previous sample
+            return sampler.read(frame_number)
+        # Seek to frame position and read frame
+        cap.set(cv2.CAP_PROP_POS_FRAMES, frame_number)
+        return cap.read()
+
+    def _decode_ahead(
+        self,
+        cap: cv2.VideoCapture,
+        sampler: SequentialFrameSampler | RawFramePipeSampler | None,
+        frame_numbers: list[int],
+        frame_buffer: FrameBuffer,
+    ) -> None:
+        """Decode planned frames into a buffer ahead of analysis (decoder thread)."""
+        # Queued frames outlive the sampler's reused buffers, so copy them
+        copy_frames = getattr(sampler, "reuses_buffers", False)
+        try:
+            for frame_number in frame_numbers:
+                ret, frame = self._read_frame(cap, sampler, frame_number)
+                if ret and copy_frames:
+                    frame = frame.copy()
+                nbytes = frame.nbytes if ret and isinstance(frame, np.ndarray) else 0
+                if not frame_buffer.put((ret, frame), nbytes):
+                    return  # Consumer stopped
+        except Exception as e:
+            # Hand the failure to the consumer at the frame it was reading
+            frame_buffer.put(e, 0)
+
+    def analyze_frame_content(
+        self,
+        visual_result: VisualAnalysisResult,
+        frame_images: dict[tuple[int, int], np.ndarray],
+        analysis: str,
+        cache: Any = None,
+    ) -> int:
+        """
+        Run one kind of content analysis over frames that were already extracted.
+
+        Used when frames were extracted with ``analyze_content=False`` so that
+        captioning, OCR and object detection can be scheduled independently.
+        With a cache, results are stored per frame under a key derived from
+        the image pixels and the analysis' settings, so frames seen before
+        (for example after only the quality filter changed) skip the model.
+
+        Args:
+            visual_result: Result whose frames are updated in place
+            frame_images: RGB images keyed by (scene_number, frame_number)
+            analysis: One of "caption", "ocr" or "objects"
+            cache: Optional cache with get(key) and put(key, value), such
+                as an ArtifactCache
+
+        Returns:
+            Number of frames that were analyzed
+        """
+        if analysis not in CONTENT_ANALYSES:
+            raise ValueError(
+                f"Unknown content analysis '{analysis}', "
+                f"expected one of {sorted(CONTENT_ANALYSES)}"
+            )
+
+        attribute = CONTENT_ANALYSES[analysis][1]
+        analyzed = 0
+        cached = 0
+        for frame in visual_result.get_all_frames():
+            raise_if_cancelled(f"frame {analysis} analysis")
+            image = frame_images.get((frame.scene_number, frame.frame_number))
+            if image is None:
+                continue
+
+            cache_key = (
+                self._content_cache_key(analysis, image) if cache is not None else None
+            )
+            result = cache.get(cache_key) if cache_key is not None else None
+            if result is not None:
+                cached += 1
+            else:
+                result = self._run_content_analysis(
+                    analysis, image, image, frame.timestamp
+                )
+                # Placeholders for failed frames report no processing time;
+                # leave those to be retried next run
+                if cache_key is not None and getattr(result, "processing_time", 0) > 0:
+                    cache.put(cache_key, result)
+
+            setattr(frame, attribute, result)
+            analyzed += 1
+
+        logger.info(
+            f"Frame {analysis} analysis complete: {analyzed} frames "
+            f"({cached} from cache)"
+        )
+        return analyzed
+
+    def _content_cache_key(self, analysis: str, image: np.ndarray) -> str:
+        """Cache key of one content analysis result for a frame image."""
+        visual_config = self.config.visual_analysis
+        settings = {
+            name: getattr(visual_config, name)
+            for name in CONTENT_ANALYSIS_SETTINGS[analysis]
+        }
+        digest = hashlib.sha256(str(image.shape).encode())
+        digest.update(np.ascontiguousarray(image).data)
+        digest.update(json.dumps(settings, sort_keys=True, default=str).encode())
+        digest.update(analysis.encode())
+        return digest.hexdigest()
+
+    def _run_content_analysis(
+        self,
+        analysis: str,
+        frame: np.ndarray,
+        rgb_frame: np.ndarray | None,
+        timestamp: float,
+    ) -> Any:
+        """Run one content analysis on a frame, returning None on failure."""
+        method_name, _, label = CONTENT_ANALYSES[analysis]
+        with ErrorRecoveryContext(
+            f"{label} for frame at {timestamp:.1f}s", suppress_errors=True
+        ) as ctx:
+            result = getattr(self, method_name)(frame, rgb_frame)
+        if ctx.error:
+            logger.warning(f"{label[:1].upper()}{label[1:]} failed: {ctx.error}")
+            return None
+        return result
+
+    def _create_pipe_sampler(
+        self,
+        cap: cv2.VideoCapture,
+        video_path: Path,
+        frame_numbers: list[int],
+    ) -> RawFramePipeSampler:
+        """Create a raw RGB24 frame pipe for the planned frames."""
+        visual_config = self.config.visual_analysis
+        max_width = max_height = None
+        if visual_config.pipe_scale_frames:
+            max_width = visual_config.max_frame_width
+            max_height = visual_config.max_frame_height
+
+        return RawFramePipeSampler(
+            video_path,
+            frame_numbers,
+            source_width=int(cap.get(cv2.CAP_PROP_FRAME_WIDTH)),
+            source_height=int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT)),
+            max_width=max_width,
+            max_height=max_height,
+            # Each frame is analyzed before the next one is read, so two
+            # buffers are enough; frames held any longer must be copied
+            # (the sampler's reuses_buffers flag)
+            buffer_count=2,
+        )
+
+    def _calculate_frame_positions(self, scene: Any) -> list[float]:
+        """Calculate sample timestamps within a scene."""
+        frames_per_scene = self.config.visual_analysis.frames_per_scene
+        scene_duration = scene.end_time - scene.start_time
+
+        if frames_per_scene == 1:
+            # Extract middle frame
+            return [scene.start_time + scene_duration / 2]
+
+        # Extract evenly spaced frames
+        return [
+            scene.start_time + (scene_duration * (i + 1) / (frames_per_scene + 1))
+            for i in range(frames_per_scene)
+        ]
+
     def _assess_frame_quality(self, frame: np.ndarray) -> FrameQualityMetrics:
         """Assess the quality of a single frame."""
         # Convert to grayscale for analysis
@@ -1207,7 +1587,9 @@ class FrameExtractor:
             },
         }
 
-    def _caption_frame(self, frame: np.ndarray) -> CaptionResult | None:
+    def _caption_frame(
+        self, frame: np.ndarray, rgb_frame: np.ndarray | None = None
+    ) -> CaptionResult | None:
         """Generate caption for a frame using image captioning model."""
         if not self.config.visual_analysis.enable_captioning:
             return None
@@ -1217,8 +1599,9 @@ class FrameExtractor:
             if self.captioner is None:
                 self.captioner = ImageCaptioner(config=self.config)
 
-            # Convert BGR frame to RGB PIL Image for captioning
-            rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+            # Convert BGR frame to RGB for captioning unless it already arrived as RGB
+            if rgb_frame is None:
+                rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
 
             # Generate caption
             caption_result = self.captioner.caption_image(image_array=rgb_frame)
@@ -1237,7 +1620,9 @@ class FrameExtractor:
                 alternative_captions=[],
             )
 
-    def _extract_text_from_frame(self, frame: np.ndarray) -> OCRResult | None:
+    def _extract_text_from_frame(
+        self, frame: np.ndarray, rgb_frame: np.ndarray | None = None
+    ) -> OCRResult | None:
         """Extract text from a frame using OCR."""
         if not self.config.visual_analysis.enable_ocr:
             return None
@@ -1247,8 +1632,9 @@ class FrameExtractor:
             if self.ocr_detector is None:
                 self.ocr_detector = OCRDetector(config=self.config)
 
-            # Convert BGR frame to RGB for OCR
-            rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+            # Convert BGR frame to RGB for OCR unless it already arrived as RGB
+            if rgb_frame is None:
+                rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
 
             # Perform OCR
             ocr_result = self.ocr_detector.detect_text(image_array=rgb_frame)
@@ -1269,7 +1655,9 @@ class FrameExtractor:
                 average_confidence=0.0,
             )
     
-    def _detect_objects_in_frame(self, frame: np.ndarray) -> ObjectDetectionResult | None:
+    def _detect_objects_in_frame(
+        self, frame: np.ndarray, rgb_frame: np.ndarray | None = None
+    ) -> ObjectDetectionResult | None:
         """Detect presentation elements in a frame using object detection."""
         if not self.config.visual_analysis.enable_object_detection:
             return None
@@ -1279,8 +1667,9 @@ class FrameExtractor:
             if self.object_detector is None:
                 self.object_detector = ObjectDetector(config=self.config)
             
-            # Convert BGR frame to RGB for object detection
-            rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+            # Convert BGR frame to RGB for object detection unless it already arrived as RGB
+            if rgb_frame is None:
+                rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
             
             # Perform object detection
             detection_result = self.object_detector.detect_objects(image=rgb_frame)
@@ -0,0 +1,278 @@
+"""Lightweight energy-based voice activity detection on 16 kHz PCM.
+
+Frames of audio are classed as speech or silence by their loudness relative
+to the recording's own noise floor. This is far cheaper than running a model
+and good enough to find pauses to cut audio at, or silence to skip.
+"""
+
+import bisect
+import logging
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+SAMPLE_RATE = 16000  # Whisper's input rate
+FRAME_SECONDS = 0.03  # Length of the frames energy is measured over
+
+# A frame is speech when it is this much louder than the noise floor (the
+# 10th percentile of frame energies) or within the speech range of the loud
+# level (the 90th percentile), so recordings without pauses are all speech.
+# Frames quieter than the absolute floor are never speech.
+SPEECH_MARGIN_DB = 10.0
+SPEECH_RANGE_DB = 20.0
+ABSOLUTE_FLOOR_DB = -50.0
+
+
+def frame_energy_db(
+    samples: np.ndarray,
+    sample_rate: int = SAMPLE_RATE,
+    frame_seconds: float = FRAME_SECONDS,
+) -> np.ndarray:
+    """
+    Measure the RMS energy of consecutive frames.
+
+    Args:
+        samples: Mono float32 samples in [-1, 1]
+        sample_rate: Sample rate of the samples
+        frame_seconds: Frame length in seconds
+
+    Returns:
+        Energy of each whole frame in dBFS
+    """
+    frame_length = max(1, int(sample_rate * frame_seconds))
+    frame_count = len(samples) // frame_length
+    if frame_count == 0:
+        return np.empty(0)
+
+    frames = samples[: frame_count * frame_length].reshape(frame_count, frame_length)
+    rms = np.sqrt(np.mean(np.square(frames, dtype=np.float64), axis=1))
+    return 20.0 * np.log10(np.maximum(rms, 1e-10))
+
+
+def speech_frames(
+    samples: np.ndarray,
+    sample_rate: int = SAMPLE_RATE,
+    frame_seconds: float = FRAME_SECONDS,
+) -> np.ndarray:
+    """
+    Class each frame as speech or silence.
+
+    Args:
+        samples: Mono float32 samples in [-1, 1]
+        sample_rate: Sample rate of the samples
+        frame_seconds: Frame length in seconds
+
+    Returns:
+        Boolean array, True for frames with speech
+    """
+    energy = frame_energy_db(samples, sample_rate, frame_seconds)
+    if energy.size == 0:
+        return np.zeros(0, dtype=bool)
+
+    noise_floor, loud_level = np.percentile(energy, [10, 90])
+    threshold = max(
+        min(noise_floor + SPEECH_MARGIN_DB, loud_level - SPEECH_RANGE_DB),
+        ABSOLUTE_FLOOR_DB,
+    )
+    return energy > threshold
+
+
+def find_silences(
+    samples: np.ndarray,
+    min_silence_seconds: float,
+    sample_rate: int = SAMPLE_RATE,
+    frame_seconds: float = FRAME_SECONDS,
+) -> list[tuple[float, float]]:
+    """
+    Find the pauses in a recording.
+
+    Args:
+        samples: Mono float32 samples in [-1, 1]
+        min_silence_seconds: Shorter pauses are ignored
+        sample_rate: Sample rate of the samples
+        frame_seconds: Frame length in seconds
+
+    Returns:
+        (start, end) times of each pause in seconds, in order
+    """
+    speech = speech_frames(samples, sample_rate, frame_seconds)
+    frame_time = max(1, int(sample_rate * frame_seconds)) / sample_rate
+
+    # Edges of runs of silent frames: +1 where one starts, -1 after one ends
+    edges = np.diff(np.concatenate(([0], (~speech).astype(np.int8), [0])))
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1)
+
+    return [
+        (start * frame_time, end * frame_time)
+        for start, end in zip(starts, ends, strict=True)
+        if (end - start) * frame_time >= min_silence_seconds
+    ]
+
+
+def plan_silence_chunks(
+    samples: np.ndarray,
+    chunk_seconds: float,
+    min_silence_seconds: float,
+    sample_rate: int = SAMPLE_RATE,
+) -> list[tuple[float, float]]:
+    """
+    Split a recording into chunks of about chunk_seconds, cut at pauses.
+
+    Each cut is made in the middle of the pause closest to the target chunk
+    length, looking between half and one and a half chunk lengths on. Where
+    there is no pause in that range the chunk is cut at the target length.
+
+    Args:
+        samples: Mono float32 samples in [-1, 1]
+        chunk_seconds: Target chunk length in seconds
+        min_silence_seconds: Shortest pause a chunk may be cut at
+        sample_rate: Sample rate of the samples
+
+    Returns:
+        (start, end) times of the chunks, covering the whole recording
+    """
+    duration = len(samples) / sample_rate
+    if duration <= chunk_seconds:
+        return [(0.0, duration)]
+
+    cut_points = [
+        (start + end) / 2
+        for start, end in find_silences(samples, min_silence_seconds, sample_rate)
+    ]
+
+    chunks = []
+    chunk_start = 0.0
+    while duration - chunk_start > chunk_seconds:
+        target = chunk_start + chunk_seconds
+        candidates = [
+            cut
+            for cut in cut_points
+            if chunk_start + chunk_seconds / 2 <= cut <= target + chunk_seconds / 2
+        ]
+        if candidates:
+            cut = min(candidates, key=lambda point: abs(point - target))
+        else:
+            logger.debug(f"No pause near {target:.1f}s, cutting chunk mid-speech")
+            cut = target
+        chunks.append((chunk_start, cut))
+        chunk_start = cut
+
+    chunks.append((chunk_start, duration))
+    return chunks
+
+
+def detect_speech_intervals(
+    samples: np.ndarray,
+    min_silence_seconds: float,
+    pad_seconds: float,
+    sample_rate: int = SAMPLE_RATE,
+) -> list[tuple[float, float]]:
+    """
+    Find the stretches of a recording with speech in them.
+
+    Pauses of at least min_silence_seconds separate the intervals. Each
+    interval keeps pad_seconds of the pause on either side, so soft word
+    onsets and endings are not clipped.
+
+    Args:
+        samples: Mono float32 samples in [-1, 1]
+        min_silence_seconds: Shorter pauses are kept inside an interval
+        pad_seconds: Silence kept either side of each interval
+        sample_rate: Sample rate of the samples
+
+    Returns:
+        (start, end) times of the speech intervals in seconds, in order
+    """
+    duration = len(samples) / sample_rate
+    intervals = []
+    speech_start = 0.0
+    for silence_start, silence_end in find_silences(
+        samples, min_silence_seconds, sample_rate
+    ):
+        # Leading and trailing silence has no speech to pad
+        gap_start = 0.0 if silence_start <= 0.0 else silence_start + pad_seconds
+        gap_end = (
+            duration
+            if silence_end >= duration - FRAME_SECONDS
+            else silence_end - pad_seconds
+        )
+        if gap_end <= gap_start:
+            continue  # The padding covers the whole pause
+        if gap_start > speech_start:
+            intervals.append((speech_start, gap_start))
+        speech_start = gap_end
+
+    if speech_start < duration:
+        intervals.append((speech_start, duration))
+    return intervals
+
+
+class SpeechTimeline:
+    """
+    The speech intervals of a recording, joined into one shorter recording.
+
+    Transcribing only the speech skips the cost of the silence between it.
+    Times in the joined audio are mapped back to the original recording with
+    to_source_time().
+    """
+
+    def __init__(self, intervals: list[tuple[float, float]], duration: float):
+        """
+        Initialize the timeline.
+
+        Args:
+            intervals: (start, end) times of the speech, in order
+            duration: Duration of the whole recording
+        """
+        self.intervals = intervals
+        self.duration = duration
+        # Start of each interval in the joined audio
+        self._joined_starts = []
+        joined = 0.0
+        for start, end in intervals:
+            self._joined_starts.append(joined)
+            joined += end - start
+        self.speech_seconds = joined
+
+    @property
+    def skipped_seconds(self) -> float:
+        """Seconds of silence left out of the joined audio."""
+        return max(self.duration - self.speech_seconds, 0.0)
+
+    def join(self, samples: np.ndarray, sample_rate: int = SAMPLE_RATE) -> np.ndarray:
+        """
+        Cut the speech intervals out of a recording and join them.
+
+        Args:
+            samples: Samples of the whole recording
+            sample_rate: Sample rate of the samples
+
+        Returns:
+            Samples of the speech only
+        """
+        if not self.intervals:
+            return samples[:0]
+        return np.concatenate(
+            [
+                samples[int(start * sample_rate) : int(end * sample_rate)]
+                for start, end in self.intervals
+            ]
+        )
+
+    def to_source_time(self, time: float) -> float:
+        """
+        Map a time in the joined audio to the original recording.
+
+        Args:
+            time: Seconds into the joined audio
+
+        Returns:
+            Seconds into the original recording
+        """
+        if not self.intervals:
+            return time
+        index = max(bisect.bisect_right(self._joined_starts, time) - 1, 0)
+        start, end = self.intervals[index]
+        return min(start + time - self._joined_starts[index], end)
@@ -27,6 +27,9 @@ def analyze(
     _verbose: bool = typer.Option(
         False, "--verbose", "-v", help="Enable verbose output"
     ),
+    no_cache: bool = typer.Option(
+        False, "--no-cache", help="Re-run the analysis instead of using cached results"
+    ),
 ) -> None:
     """
     Analyze a video file for presentation feedback.
@@ -35,6 +38,8 @@ def analyze(
     """
     # Load configuration
     config = load_config(config_file) if config_file else get_config()
+    if no_cache:
+        config.processing.result_cache = False
 
     # Set up logging
     logger = logging.getLogger("deep_brief")
@@ -64,6 +69,10 @@ def analyze(
             console.print(f"[blue]Config file:[/blue] {config_file}")
             logger.debug(f"Using config file: {config_file}")
 
+        if no_cache:
+            console.print("[dim]Result cache disabled[/dim]")
+            logger.debug("Result cache disabled")
+
         # Show relevant config info in debug mode
         if config.debug:
             console.print(
@@ -89,6 +98,44 @@ def analyze(
         console.print("[dim]Run with --help for available options.[/dim]")
 
 
+@app.command()
+def resume(
+    job_dir: Path = typer.Argument(..., help="Directory of the batch job to resume"),
+    workers: int | None = typer.Option(
+        None, "--workers", "-w", help="Worker processes to analyze videos on"
+    ),
+    skip_failed: bool = typer.Option(
+        False, "--skip-failed", help="Do not retry videos that failed"
+    ),
+) -> None:
+    """Resume an interrupted batch analysis job."""
+    from deep_brief.core.batch_manifest import BatchManifest
+    from deep_brief.core.pipeline_coordinator import PipelineCoordinator
+
+    logger = logging.getLogger("deep_brief")
+
+    if not BatchManifest.exists(job_dir):
+        console.print(f"[red]No batch job found in {job_dir}[/red]")
+        raise typer.Exit(code=1)
+
+    summary = BatchManifest.load(job_dir).get_summary()
+    console.print(
+        f"[green]Resuming batch job:[/green] {summary['job_id']} "
+        f"({summary['completed']}/{summary['total_videos']} videos completed)"
+    )
+    logger.info(f"Resuming batch job in {job_dir}")
+
+    results = PipelineCoordinator().resume_batch(
+        job_dir, max_workers=workers, retry_failed=not skip_failed
+    )
+
+    successful = sum(1 for result in results if result.success)
+    console.print(
+        f"[green]Batch job finished:[/green] {successful}/{summary['total_videos']} "
+        "videos analyzed successfully"
+    )
+
+
 @app.command()
 def version() -> None:
     """Show version information."""
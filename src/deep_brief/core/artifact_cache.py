@@ -0,0 +1,258 @@
+"""On-disk cache of individual pipeline stage outputs for DeepBrief."""
+
+import logging
+import os
+import pickle
+import shutil
+import threading
+import uuid
+from pathlib import Path
+from typing import Any
+
+from pydantic import BaseModel
+
+logger = logging.getLogger(__name__)
+
+# Bump when the entry layout changes so old entries are ignored
+ARTIFACT_CACHE_FORMAT = 1
+
+OUTPUTS_FILE = "outputs.pkl"
+FILES_FILE = "files.pkl"
+
+# Model fields pointing at files produced by a stage (AudioInfo, FrameInfo)
+FILE_FIELDS = ("file_path", "frame_path")
+
+# Attribute of other outputs (WindowOutputs) listing the files they wrote
+FILE_LIST_FIELD = "files"
+
+# Model fields holding decoded data kept only in memory (AudioInfo.samples).
+# While one is set, the file fields point at the stage's input (the source
+# video), which must never be copied into the cache or over the original.
+IN_MEMORY_FIELDS = ("samples",)
+
+
+def _holds_in_memory_data(value: BaseModel) -> bool:
+    """Whether an artifact model carries decoded data instead of a file."""
+    return any(getattr(value, name, None) is not None for name in IN_MEMORY_FIELDS)
+
+
+def _referenced_files(value: Any) -> list[Path]:
+    """Find the files that artifact models (or lists of them) point to."""
+    if isinstance(value, (list, tuple)):
+        return [path for item in value for path in _referenced_files(item)]
+    if isinstance(value, BaseModel):
+        if _holds_in_memory_data(value):
+            return []
+        return [
+            path
+            for path in (getattr(value, name, None) for name in FILE_FIELDS)
+            if isinstance(path, Path) and path.is_file()
+        ]
+    files = getattr(value, FILE_LIST_FIELD, None)
+    if isinstance(files, list):
+        return [path for path in files if isinstance(path, Path) and path.is_file()]
+    return []
+
+
+def _without_in_memory_data(value: Any) -> Any:
+    """
+    Copy artifact models (or lists of them) without their in-memory data.
+
+    Decoded PCM is far larger than the file it came from, so it is not
+    stored; stages reading a restored AudioInfo decode its file_path again.
+    """
+    if isinstance(value, list):
+        return [_without_in_memory_data(item) for item in value]
+    if isinstance(value, tuple):
+        return tuple(_without_in_memory_data(item) for item in value)
+    if isinstance(value, BaseModel) and _holds_in_memory_data(value):
+        return value.model_copy(
+            update={
+                name: None
+                for name in IN_MEMORY_FIELDS
+                if name in type(value).model_fields
+            }
+        )
+    return value
+
+
+class ArtifactCache:
+    """
+    Size-bounded LRU cache of stage outputs on disk.
+
+    Each entry is a directory holding the pickled outputs of one stage run
+    plus copies of the files those outputs point to (such as an extracted
+    WAV or saved frame images). Loading an entry copies the files back to
+    their original paths, so a cached stage leaves the same files behind as
+    running it would. Entries are replaced atomically, and when the cache
+    grows past ``max_size_mb`` the least recently used entries are removed.
+    """
+
+    def __init__(self, cache_dir: Path | str, max_size_mb: float = 8192):
+        """
+        Initialize the artifact cache.
+
+        Args:
+            cache_dir: Directory to store entries in
+            max_size_mb: Maximum total size of all entries
+        """
+        self.cache_dir = Path(cache_dir)
+        self.max_size_bytes = int(max_size_mb * 1024 * 1024)
+        self._lock = threading.Lock()
+
+        # Statistics
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _entry_dir(self, key: str) -> Path:
+        """Directory storing an entry."""
+        return self.cache_dir / f"v{ARTIFACT_CACHE_FORMAT}-{key}"
+
+    def contains(self, key: str) -> bool:
+        """Whether an entry is stored for a key."""
+        return (self._entry_dir(key) / OUTPUTS_FILE).is_file()
+
+    def get(self, key: str) -> Any | None:
+        """
+        Load cached outputs, restoring the files they reference.
+
+        Args:
+            key: Stage or artifact cache key
+
+        Returns:
+            The stored outputs, or None on a miss or unreadable entry
+        """
+        entry_dir = self._entry_dir(key)
+        try:
+            with open(entry_dir / OUTPUTS_FILE, "rb") as f:
+                outputs = pickle.load(f)
+
+            files_path = entry_dir / FILES_FILE
+            if files_path.is_file():
+                with open(files_path, "rb") as f:
+                    files: dict[str, Path] = pickle.load(f)
+                for stored_name, original_path in files.items():
+                    original_path.parent.mkdir(parents=True, exist_ok=True)
+                    shutil.copyfile(entry_dir / stored_name, original_path)
+
+            os.utime(entry_dir)  # Mark as recently used
+        except FileNotFoundError:
+            if entry_dir.exists():
+                # Part of the entry was removed; drop the rest
+                shutil.rmtree(entry_dir, ignore_errors=True)
+            with self._lock:
+                self.misses += 1
+            return None
+        except Exception as e:
+            logger.warning(f"Discarding unreadable artifact cache entry {entry_dir}: {e}")
+            shutil.rmtree(entry_dir, ignore_errors=True)
+            with self._lock:
+                self.misses += 1
+            return None
+
+        with self._lock:
+            self.hits += 1
+        logger.debug(f"Artifact cache hit: {key[:12]}")
+        return outputs
+
+    def put(self, key: str, outputs: Any) -> None:
+        """
+        Store outputs and copies of the files they reference.
+
+        Args:
+            key: Stage or artifact cache key
+            outputs: Picklable outputs; a dict of artifacts for stages
+        """
+        entry_dir = self._entry_dir(key)
+        temp_dir = self.cache_dir / f".{entry_dir.name}.{uuid.uuid4().hex[:8]}.tmp"
+
+        values = outputs.values() if isinstance(outputs, dict) else [outputs]
+        if isinstance(outputs, dict):
+            stored = {
+                name: _without_in_memory_data(value) for name, value in outputs.items()
+            }
+        else:
+            stored = _without_in_memory_data(outputs)
+        try:
+            temp_dir.mkdir(parents=True)
+            files = {}
+            for index, file_path in enumerate(
+                path for value in values for path in _referenced_files(value)
+            ):
+                stored_name = f"file{index:04d}{file_path.suffix}"
+                shutil.copyfile(file_path, temp_dir / stored_name)
+                files[stored_name] = file_path
+
+            with open(temp_dir / OUTPUTS_FILE, "wb") as f:
+                pickle.dump(stored, f, protocol=pickle.HIGHEST_PROTOCOL)
+            if files:
+                with open(temp_dir / FILES_FILE, "wb") as f:
+                    pickle.dump(files, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+            # Swap the complete entry in so readers never see a partial one
+            shutil.rmtree(entry_dir, ignore_errors=True)
+            os.replace(temp_dir, entry_dir)
+        except Exception as e:
+            logger.warning(f"Failed to store artifact cache entry {entry_dir}: {e}")
+            shutil.rmtree(temp_dir, ignore_errors=True)
+            return
+
+        self._evict()
+
+    def _entry_size(self, entry_dir: Path) -> int:
+        """Total size of the files in an entry."""
+        return sum(
+            path.stat().st_size for path in entry_dir.iterdir() if path.is_file()
+        )
+
+    def _evict(self) -> None:
+        """Remove least recently used entries until the cache fits."""
+        entries = []
+        for entry_dir in self.cache_dir.glob("v*-*"):
+            try:
+                entries.append(
+                    (entry_dir.stat().st_mtime_ns, self._entry_size(entry_dir), entry_dir)
+                )
+            except OSError:
+                continue
+
+        total_size = sum(size for _, size, _ in entries)
+        for _, size, entry_dir in sorted(entries):
+            if total_size <= self.max_size_bytes:
+                break
+            shutil.rmtree(entry_dir, ignore_errors=True)
+            total_size -= size
+            with self._lock:
+                self.evictions += 1
+            logger.debug(f"Evicted artifact cache entry: {entry_dir.name}")
+
+    def clear(self) -> None:
+        """Remove all entries and reset statistics."""
+        for entry_dir in self.cache_dir.glob("v*-*"):
+            shutil.rmtree(entry_dir, ignore_errors=True)
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get cache statistics."""
+        size = 0
+        entries = 0
+        if self.cache_dir.exists():
+            for entry_dir in self.cache_dir.glob("v*-*"):
+                try:
+                    size += self._entry_size(entry_dir)
+                    entries += 1
+                except OSError:
+                    continue
+        with self._lock:
+            return {
+                "entries": entries,
+                "size_mb": size / (1024 * 1024),
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "cache_dir": str(self.cache_dir),
+            }
@@ -4,35 +4,54 @@
 # See: https://github.com/kkroening/ffmpeg-python/issues/247
 # pyright: reportUnknownMemberType=false, reportUnknownVariableType=false, reportUnknownArgumentType=false
 
+import asyncio
 import logging
 import subprocess
+import wave
 from collections.abc import Callable
 from pathlib import Path
 from typing import Any
 
 import ffmpeg
-from pydantic import BaseModel
+import numpy as np
+from pydantic import BaseModel, ConfigDict, Field
 
 from deep_brief.core.exceptions import (
     AudioProcessingError,
     ErrorCode,
+    OperationCancelledError,
     handle_ffmpeg_error,
 )
+from deep_brief.core.ffmpeg_runner import (
+    async_run_and_collect_output,
+    run_and_collect_output,
+    run_ffmpeg,
+    terminate_on_cancel,
+)
+from deep_brief.core.probe_cache import probe_media
 from deep_brief.core.video_processor import VideoInfo
 from deep_brief.utils.config import get_config
 
 logger = logging.getLogger(__name__)
 
+# Whisper consumes 16 kHz mono float32 samples
+PCM_SAMPLE_RATE = 16000
+
 
 class AudioInfo(BaseModel):
     """Audio metadata information."""
 
-    file_path: Path
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    file_path: Path  # WAV file, or the source video when audio is only in memory
     duration: float
     sample_rate: int
     channels: int
     size_mb: float
     format: str
+    samples: np.ndarray | None = Field(
+        default=None, exclude=True, repr=False
+    )  # Decoded float32 PCM when extracted in memory
 
 
 class AudioExtractor:
@@ -68,21 +87,12 @@ class AudioExtractor:
         Raises:
             AudioProcessingError: If audio extraction fails or no audio stream found
         """
-        # Set up output path
-        if output_path is None:
-            output_path = self.temp_dir / f"{video_info.file_path.stem}_audio.wav"
-        else:
-            output_path = Path(output_path)
+        if self.in_memory:
+            return self._extract_audio_to_memory(
+                video_info, output_path, progress_callback
+            )
 
-        # Ensure output directory exists
-        try:
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-        except OSError as e:
-            raise AudioProcessingError(
-                message=f"Cannot create output directory: {output_path.parent}",
-                file_path=video_info.file_path,
-                cause=e,
-            ) from e
+        output_path = self._prepare_output_path(video_info, output_path)
 
         logger.info(
             f"Extracting audio from {video_info.file_path.name} to {output_path.name}"
@@ -90,76 +100,14 @@ class AudioExtractor:
 
         try:
             # First, probe the video to check for audio streams
-            try:
-                probe = ffmpeg.probe(str(video_info.file_path))  # type: ignore[reportUnknownMemberType]
-            except ffmpeg.Error as e:
-                raise handle_ffmpeg_error(e, "audio probe", video_info.file_path) from e
-
-            # Check if video has audio stream
-            audio_streams = [s for s in probe["streams"] if s["codec_type"] == "audio"]
-            if not audio_streams:
-                raise AudioProcessingError(
-                    message="Video file contains no audio stream",
-                    error_code=ErrorCode.NO_AUDIO_STREAM,
-                    file_path=video_info.file_path,
-                )
-
-            # Get original audio info and validate
-            original_audio = audio_streams[0]
-            try:
-                original_sample_rate = int(original_audio.get("sample_rate", 0))
-                original_channels = int(original_audio.get("channels", 0))
-                original_codec = original_audio.get("codec_name", "unknown")
-            except (ValueError, TypeError) as e:
-                raise AudioProcessingError(
-                    message="Invalid audio stream metadata",
-                    error_code=ErrorCode.AUDIO_CODEC_ERROR,
-                    file_path=video_info.file_path,
-                    details={"audio_stream": original_audio},
-                    cause=e,
-                ) from e
-
-            if original_sample_rate <= 0 or original_channels <= 0:
-                raise AudioProcessingError(
-                    message=f"Invalid audio parameters: {original_sample_rate}Hz, {original_channels} channels",
-                    error_code=ErrorCode.AUDIO_CODEC_ERROR,
-                    file_path=video_info.file_path,
-                    details={
-                        "sample_rate": original_sample_rate,
-                        "channels": original_channels,
-                        "codec": original_codec,
-                    },
-                )
-
-            logger.debug(
-                f"Original audio: {original_sample_rate}Hz, {original_channels} channels, codec: {original_codec}"
-            )
+            self._probe_audio_stream(video_info)
 
             # Build ffmpeg pipeline for audio extraction
             stream = ffmpeg.input(str(video_info.file_path))  # type: ignore[reportUnknownMemberType,reportUnknownVariableType]
-
-            # Configure audio processing
-            audio_args = {
-                "acodec": "pcm_s16le",  # 16-bit PCM for compatibility
-                "ar": self.config.audio.sample_rate,  # Sample rate
-                "ac": self.config.audio.channels,  # Channel count
-                "f": "wav",  # Output format
-            }
-
-            # Add audio normalization if enabled
-            if self.config.audio.normalize_audio:
-                stream = ffmpeg.filter(stream, "loudnorm")  # type: ignore[reportUnknownMemberType,reportUnknownArgumentType]
-                logger.debug("Audio normalization enabled")
-
-            # Add noise reduction if enabled (simple high-pass filter)
-            if self.config.audio.noise_reduction:
-                stream = ffmpeg.filter(  # type: ignore[reportUnknownMemberType,reportUnknownArgumentType]
-                    stream, "highpass", f=200
-                )  # Remove low-frequency noise
-                logger.debug("Noise reduction enabled")
+            stream = self._apply_audio_filters(stream)
 
             # Configure output
-            stream = ffmpeg.output(stream, str(output_path), **audio_args)  # type: ignore[reportUnknownMemberType,reportUnknownArgumentType]
+            stream = ffmpeg.output(stream, str(output_path), **self._audio_output_args())  # type: ignore[reportUnknownMemberType,reportUnknownArgumentType]
             stream = ffmpeg.overwrite_output(stream)  # type: ignore[reportUnknownMemberType,reportUnknownArgumentType]
 
             # Execute extraction with progress tracking and timeout
@@ -170,7 +118,7 @@ class AudioExtractor:
                     )
                 else:
                     # Run with timeout to prevent hanging
-                    ffmpeg.run(
+                    run_ffmpeg(
                         stream,
                         quiet=True,
                         capture_stdout=True,
@@ -185,37 +133,7 @@ class AudioExtractor:
                     cause=e,
                 ) from e
 
-            # Verify output file was created
-            if not output_path.exists():
-                raise AudioProcessingError(
-                    message="Audio extraction completed but output file not found",
-                    file_path=video_info.file_path,
-                )
-
-            # Verify file has content
-            try:
-                file_size = output_path.stat().st_size
-                if file_size == 0:
-                    raise AudioProcessingError(
-                        message="Audio extraction produced empty file",
-                        file_path=video_info.file_path,
-                    )
-            except OSError as e:
-                raise AudioProcessingError(
-                    message="Cannot access extracted audio file",
-                    file_path=video_info.file_path,
-                    cause=e,
-                ) from e
-
-            # Get extracted audio info
-            try:
-                audio_info = self._get_audio_info(output_path)
-            except Exception as e:
-                raise AudioProcessingError(
-                    message="Failed to validate extracted audio file",
-                    file_path=video_info.file_path,
-                    cause=e,
-                ) from e
+            audio_info = self._verify_extracted_audio(video_info, output_path)
 
             logger.info(
                 f"Audio extracted successfully: {audio_info.duration:.1f}s, "
@@ -227,6 +145,10 @@ class AudioExtractor:
         except AudioProcessingError:
             # Re-raise our custom exceptions
             raise
+        except OperationCancelledError:
+            # Don't leave a partially written file behind
+            output_path.unlink(missing_ok=True)
+            raise
         except ffmpeg.Error as e:
             # Handle ffmpeg-specific errors
             raise handle_ffmpeg_error(e, "audio extraction", video_info.file_path)
@@ -238,6 +160,462 @@ class AudioExtractor:
                 cause=e,
             )
 
+    def _extract_audio_to_memory(
+        self,
+        video_info: VideoInfo,
+        output_path: Path | str | None = None,
+        progress_callback: Callable[[float], None] | None = None,
+    ) -> AudioInfo:
+        """
+        Decode audio straight into a float32 array instead of a WAV file.
+
+        ffmpeg writes raw 16 kHz mono float32 PCM to stdout, which is the
+        format Whisper works on, so the transcriber can use the samples
+        without decoding the audio again. A WAV copy is written only when
+        an output path is given.
+
+        Args:
+            video_info: VideoInfo object from validated video file
+            output_path: Optional path to also save the audio as a WAV file
+            progress_callback: Optional callback function for progress updates (0.0 to 1.0)
+
+        Returns:
+            AudioInfo object carrying the decoded samples
+
+        Raises:
+            AudioProcessingError: If audio extraction fails or no audio stream found
+        """
+        logger.info(f"Extracting audio from {video_info.file_path.name} into memory")
+
+        timeout = video_info.duration * 2 + 60
+        try:
+            self._probe_audio_stream(video_info)
+
+            stream = ffmpeg.input(str(video_info.file_path))
+            stream = self._apply_audio_filters(stream)
+            stream = ffmpeg.output(stream, "pipe:", **self._pcm_output_args())
+
+            pcm, _ = run_and_collect_output(
+                stream, video_info.duration, timeout, progress_callback
+            )
+            audio_info = self._audio_info_from_pcm(video_info, pcm, output_path)
+
+        except (AudioProcessingError, OperationCancelledError):
+            raise
+        except subprocess.TimeoutExpired as e:
+            raise AudioProcessingError(
+                message=f"Audio extraction timed out after {timeout:.0f} seconds",
+                file_path=video_info.file_path,
+                cause=e,
+            ) from e
+        except ffmpeg.Error as e:
+            raise handle_ffmpeg_error(e, "audio extraction", video_info.file_path) from e
+        except Exception as e:
+            raise AudioProcessingError(
+                message=f"Unexpected error during audio extraction: {str(e)}",
+                file_path=video_info.file_path,
+                cause=e,
+            ) from e
+
+        logger.info(
+            f"Audio decoded into memory: {audio_info.duration:.1f}s, "
+            f"{audio_info.sample_rate}Hz, {audio_info.size_mb:.1f}MB"
+        )
+
+        return audio_info
+
+    async def extract_audio_async(
+        self,
+        video_info: VideoInfo,
+        output_path: Path | str | None = None,
+        progress_callback: Callable[[float], None] | None = None,
+    ) -> AudioInfo:
+        """
+        Extract audio from a video without blocking the event loop.
+
+        Runs the same extraction as extract_audio, with ffmpeg started through
+        asyncio and its progress read as it arrives. Probing the video and
+        reading back the output run on the loop's default executor.
+
+        Args:
+            video_info: VideoInfo object from validated video file
+            output_path: Optional custom output path for audio file
+            progress_callback: Optional callback function for progress updates (0.0 to 1.0)
+
+        Returns:
+            AudioInfo object with extracted audio metadata
+
+        Raises:
+            AudioProcessingError: If audio extraction fails or no audio stream found
+        """
+        logger.info(
+            f"Extracting audio from {video_info.file_path.name}"
+            f"{' into memory' if self.in_memory else ''}"
+        )
+
+        timeout = video_info.duration * 2 + 60
+        wav_path: Path | None = None
+        try:
+            await asyncio.to_thread(self._probe_audio_stream, video_info)
+
+            stream = ffmpeg.input(str(video_info.file_path))
+            stream = self._apply_audio_filters(stream)
+            if self.in_memory:
+                stream = ffmpeg.output(stream, "pipe:", **self._pcm_output_args())
+                pcm, _ = await async_run_and_collect_output(
+                    stream, video_info.duration, timeout, progress_callback
+                )
+                audio_info = await asyncio.to_thread(
+                    self._audio_info_from_pcm, video_info, pcm, output_path
+                )
+            else:
+                wav_path = self._prepare_output_path(video_info, output_path)
+                stream = ffmpeg.output(
+                    stream, str(wav_path), **self._audio_output_args()
+                )
+                stream = ffmpeg.overwrite_output(stream)
+                await async_run_and_collect_output(
+                    stream, video_info.duration, timeout, progress_callback
+                )
+                audio_info = await asyncio.to_thread(
+                    self._verify_extracted_audio, video_info, wav_path
+                )
+
+        except AudioProcessingError:
+            raise
+        except OperationCancelledError:
+            if wav_path is not None:
+                wav_path.unlink(missing_ok=True)
+            raise
+        except subprocess.TimeoutExpired as e:
+            raise AudioProcessingError(
+                message=f"Audio extraction timed out after {timeout:.0f} seconds",
+                file_path=video_info.file_path,
+                cause=e,
+            ) from e
+        except ffmpeg.Error as e:
+            raise handle_ffmpeg_error(e, "audio extraction", video_info.file_path) from e
+        except Exception as e:
+            raise AudioProcessingError(
+                message=f"Unexpected error during audio extraction: {str(e)}",
+                file_path=video_info.file_path,
+                cause=e,
+            ) from e
+
+        logger.info(
+            f"Audio extracted successfully: {audio_info.duration:.1f}s, "
+            f"{audio_info.sample_rate}Hz, {audio_info.channels} channels"
+        )
+
+        return audio_info
+
+    @property
+    def in_memory(self) -> bool:
+        """Whether audio is decoded into memory instead of a WAV file."""
+        return self.config.audio.in_memory
+
+    def audio_output(
+        self,
+        video_info: VideoInfo,
+        source: Any,
+        output_path: Path | str | None = None,
+    ) -> Any:
+        """
+        Build the ffmpeg output extracting a video's audio, for a combined run.
+
+        Checks that the video has a usable audio stream and applies the
+        configured filters. The audio is written to a WAV file, or to stdout
+        as float32 PCM when audio is decoded into memory; pass what the run
+        wrote to audio_info_from_output.
+
+        Args:
+            video_info: VideoInfo object from validated video file
+            source: ffmpeg input node of the video
+            output_path: Optional custom output path for audio file
+
+        Returns:
+            ffmpeg output node to merge with the run's other outputs
+
+        Raises:
+            AudioProcessingError: If there is no usable audio stream
+        """
+        self._probe_audio_stream(video_info)
+        stream = self._apply_audio_filters(source.audio)
+        if self.in_memory:
+            return ffmpeg.output(stream, "pipe:", **self._pcm_output_args())
+
+        wav_path = self._prepare_output_path(video_info, output_path)
+        return ffmpeg.output(stream, str(wav_path), **self._audio_output_args())
+
+    def audio_info_from_output(
+        self,
+        video_info: VideoInfo,
+        output_path: Path | str | None = None,
+        pcm: bytes | None = None,
+    ) -> AudioInfo:
+        """
+        Read the audio written by an output from audio_output.
+
+        Args:
+            video_info: VideoInfo object from validated video file
+            output_path: The output path given to audio_output
+            pcm: What ffmpeg wrote to stdout, when audio is decoded into memory
+
+        Returns:
+            AudioInfo object with extracted audio metadata
+
+        Raises:
+            AudioProcessingError: If the audio is missing, empty or unreadable
+        """
+        if self.in_memory:
+            return self._audio_info_from_pcm(video_info, pcm or b"", output_path)
+
+        wav_path = self._prepare_output_path(video_info, output_path)
+        return self._verify_extracted_audio(video_info, wav_path)
+
+    def _pcm_output_args(self) -> dict[str, Any]:
+        """Get ffmpeg output arguments for raw float32 PCM on stdout."""
+        return {
+            "acodec": "pcm_f32le",
+            "ar": PCM_SAMPLE_RATE,
+            "ac": 1,
+            "f": "f32le",
+        }
+
+    def _audio_info_from_pcm(
+        self, video_info: VideoInfo, pcm: bytes, output_path: Path | str | None
+    ) -> AudioInfo:
+        """
+        Build AudioInfo from raw float32 PCM, optionally saving a WAV copy.
+
+        Args:
+            video_info: VideoInfo object for the source video
+            pcm: Raw little-endian float32 mono samples
+            output_path: Optional path to save the audio as a WAV file
+
+        Returns:
+            AudioInfo object carrying the samples
+
+        Raises:
+            AudioProcessingError: If no samples were decoded or the WAV cannot be written
+        """
+        sample_count = len(pcm) // 4
+        if sample_count == 0:
+            raise AudioProcessingError(
+                message="Audio extraction produced no samples",
+                file_path=video_info.file_path,
+            )
+
+        # Copy so the array is writable (torch warns on read-only buffers)
+        samples = np.frombuffer(pcm, dtype="<f4", count=sample_count).copy()
+
+        file_path = video_info.file_path
+        audio_format = "f32le"
+        if output_path is not None:
+            file_path = self._prepare_output_path(video_info, output_path)
+            try:
+                self._write_wav(file_path, samples)
+            except OSError as e:
+                raise AudioProcessingError(
+                    message=f"Cannot write audio file: {file_path}",
+                    file_path=video_info.file_path,
+                    cause=e,
+                ) from e
+            audio_format = "wav"
+
+        return AudioInfo(
+            file_path=file_path,
+            duration=sample_count / PCM_SAMPLE_RATE,
+            sample_rate=PCM_SAMPLE_RATE,
+            channels=1,
+            size_mb=samples.nbytes / (1024 * 1024),
+            format=audio_format,
+            samples=samples,
+        )
+
+    @staticmethod
+    def _write_wav(output_path: Path, samples: np.ndarray) -> None:
+        """Write float32 mono samples as a 16-bit PCM WAV file."""
+        pcm16 = (np.clip(samples, -1.0, 1.0) * 32767).astype("<i2")
+        with wave.open(str(output_path), "wb") as wav_file:
+            wav_file.setnchannels(1)
+            wav_file.setsampwidth(2)
+            wav_file.setframerate(PCM_SAMPLE_RATE)
+            wav_file.writeframes(pcm16.tobytes())
+
+    def _prepare_output_path(
+        self, video_info: VideoInfo, output_path: Path | str | None
+    ) -> Path:
+        """
+        Resolve the WAV output path and make sure its directory exists.
+
+        Args:
+            video_info: VideoInfo object for the source video
+            output_path: Optional custom output path for audio file
+
+        Returns:
+            Output path for the extracted audio
+
+        Raises:
+            AudioProcessingError: If the output directory cannot be created
+        """
+        if output_path is None:
+            output_path = self.temp_dir / f"{video_info.file_path.stem}_audio.wav"
+        else:
+            output_path = Path(output_path)
+
+        try:
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+        except OSError as e:
+            raise AudioProcessingError(
+                message=f"Cannot create output directory: {output_path.parent}",
+                file_path=video_info.file_path,
+                cause=e,
+            ) from e
+
+        return output_path
+
+    def _probe_audio_stream(self, video_info: VideoInfo) -> dict[str, Any]:
+        """
+        Find and validate the first audio stream of a video.
+
+        Args:
+            video_info: VideoInfo object for the source video
+
+        Returns:
+            ffprobe metadata of the audio stream
+
+        Raises:
+            AudioProcessingError: If there is no usable audio stream
+        """
+        try:
+            probe = probe_media(video_info.file_path)
+        except ffmpeg.Error as e:
+            raise handle_ffmpeg_error(e, "audio probe", video_info.file_path) from e
+
+        # Check if video has audio stream
+        audio_streams = [s for s in probe["streams"] if s["codec_type"] == "audio"]
+        if not audio_streams:
+            raise AudioProcessingError(
+                message="Video file contains no audio stream",
+                error_code=ErrorCode.NO_AUDIO_STREAM,
+                file_path=video_info.file_path,
+            )
+
+        # Get original audio info and validate
+        original_audio = audio_streams[0]
+        try:
+            original_sample_rate = int(original_audio.get("sample_rate", 0))
+            original_channels = int(original_audio.get("channels", 0))
+            original_codec = original_audio.get("codec_name", "unknown")
+        except (ValueError, TypeError) as e:
+            raise AudioProcessingError(
+                message="Invalid audio stream metadata",
+                error_code=ErrorCode.AUDIO_CODEC_ERROR,
+                file_path=video_info.file_path,
+                details={"audio_stream": original_audio},
+                cause=e,
+            ) from e
+
+        if original_sample_rate <= 0 or original_channels <= 0:
+            raise AudioProcessingError(
+                message=f"Invalid audio parameters: {original_sample_rate}Hz, {original_channels} channels",
+                error_code=ErrorCode.AUDIO_CODEC_ERROR,
+                file_path=video_info.file_path,
+                details={
+                    "sample_rate": original_sample_rate,
+                    "channels": original_channels,
+                    "codec": original_codec,
+                },
+            )
+
+        logger.debug(
+            f"Original audio: {original_sample_rate}Hz, {original_channels} channels, codec: {original_codec}"
+        )
+
+        return original_audio
+
+    def _apply_audio_filters(self, stream: Any) -> Any:
+        """
+        Apply the configured normalization and noise reduction filters.
+
+        Args:
+            stream: ffmpeg stream carrying the source audio
+
+        Returns:
+            Filtered ffmpeg stream
+        """
+        # Add audio normalization if enabled
+        if self.config.audio.normalize_audio:
+            stream = ffmpeg.filter(stream, "loudnorm")  # type: ignore[reportUnknownMemberType,reportUnknownArgumentType]
+            logger.debug("Audio normalization enabled")
+
+        # Add noise reduction if enabled (simple high-pass filter)
+        if self.config.audio.noise_reduction:
+            stream = ffmpeg.filter(  # type: ignore[reportUnknownMemberType,reportUnknownArgumentType]
+                stream, "highpass", f=200
+            )  # Remove low-frequency noise
+            logger.debug("Noise reduction enabled")
+
+        return stream
+
+    def _audio_output_args(self) -> dict[str, Any]:
+        """Get ffmpeg output arguments for the extracted WAV file."""
+        return {
+            "acodec": "pcm_s16le",  # 16-bit PCM for compatibility
+            "ar": self.config.audio.sample_rate,  # Sample rate
+            "ac": self.config.audio.channels,  # Channel count
+            "f": "wav",  # Output format
+        }
+
+    def _verify_extracted_audio(
+        self, video_info: VideoInfo, output_path: Path
+    ) -> AudioInfo:
+        """
+        Check that ffmpeg produced a usable WAV file and read its metadata.
+
+        Args:
+            video_info: VideoInfo object for the source video
+            output_path: Path of the extracted audio file
+
+        Returns:
+            AudioInfo object with extracted audio metadata
+
+        Raises:
+            AudioProcessingError: If the output is missing, empty or unreadable
+        """
+        # Verify output file was created
+        if not output_path.exists():
+            raise AudioProcessingError(
+                message="Audio extraction completed but output file not found",
+                file_path=video_info.file_path,
+            )
+
+        # Verify file has content
+        try:
+            file_size = output_path.stat().st_size
+            if file_size == 0:
+                raise AudioProcessingError(
+                    message="Audio extraction produced empty file",
+                    file_path=video_info.file_path,
+                )
+        except OSError as e:
+            raise AudioProcessingError(
+                message="Cannot access extracted audio file",
+                file_path=video_info.file_path,
+                cause=e,
+            ) from e
+
+        # Get extracted audio info
+        try:
+            return self._get_audio_info(output_path)
+        except Exception as e:
+            raise AudioProcessingError(
+                message="Failed to validate extracted audio file",
+                file_path=video_info.file_path,
+                cause=e,
+            ) from e
+
     def extract_audio_segment(
         self,
         video_info: VideoInfo,
@@ -265,7 +643,8 @@ class AudioExtractor:
             raise ValueError("Start time cannot be negative")
         if duration <= 0:
             raise ValueError("Duration must be positive")
-        if start_time + duration > video_info.duration:
+        # Tolerate rounding in segments computed up to the end of the video
+        if start_time + duration > video_info.duration + 1e-6:
             raise ValueError("Segment extends beyond video duration")
 
         if output_path is None:
@@ -301,7 +680,7 @@ class AudioExtractor:
             stream = ffmpeg.overwrite_output(stream)  # type: ignore[reportUnknownMemberType,reportUnknownArgumentType]
 
             # Execute extraction
-            ffmpeg.run(stream, quiet=True, capture_stdout=True, capture_stderr=True)  # type: ignore[reportUnknownMemberType,reportUnknownArgumentType]
+            run_ffmpeg(stream, quiet=True, capture_stdout=True, capture_stderr=True)  # type: ignore[reportUnknownMemberType,reportUnknownArgumentType]
 
             # Get extracted audio info
             audio_info = self._get_audio_info(output_path)
@@ -331,7 +710,7 @@ class AudioExtractor:
             AudioInfo object with metadata
         """
         try:
-            probe = ffmpeg.probe(str(audio_path))
+            probe = probe_media(audio_path)
 
             # Find audio stream
             audio_stream = None
@@ -379,47 +758,52 @@ class AudioExtractor:
         try:
             process = ffmpeg.run_async(stream, pipe_stderr=True, quiet=True)
 
-            while True:
-                if process.stderr is None:
-                    break
-                output = process.stderr.readline()
-                if output == b"" and process.poll() is not None:
-                    break
-
-                if output:
-                    line = output.decode("utf-8").strip()
-
-                    # Parse ffmpeg progress output
-                    if "time=" in line:
-                        try:
-                            # Extract time from ffmpeg output (format: time=00:01:23.45)
-                            time_str = line.split("time=")[1].split()[0]
-
-                            # Convert time to seconds
-                            if ":" in time_str:
-                                parts = time_str.split(":")
-                                if len(parts) == 3:
-                                    hours = float(parts[0])
-                                    minutes = float(parts[1])
-                                    seconds = float(parts[2])
-                                    current_time = hours * 3600 + minutes * 60 + seconds
-
-                                    # Calculate progress (0.0 to 1.0)
-                                    progress = min(current_time / total_duration, 1.0)
-                                    progress_callback(progress)
-                        except (ValueError, IndexError):
-                            # Ignore parsing errors
-                            pass
-
-            # Wait for process to complete
-            process.wait()
-
-            # Final progress update
-            progress_callback(1.0)
-
-            if process.returncode != 0:
-                stderr_content = process.stderr.read() if process.stderr else b""
-                raise ffmpeg.Error("ffmpeg", "", stderr_content)
+            with terminate_on_cancel(process):
+                while True:
+                    if process.stderr is None:
+                        break
+                    output = process.stderr.readline()
+                    if output == b"" and process.poll() is not None:
+                        break
+
+                    if output:
+                        line = output.decode("utf-8").strip()
+
+                        # Parse ffmpeg progress output
+                        if "time=" in line:
+                            try:
+                                # Extract time from ffmpeg output (format: time=00:01:23.45)
+                                time_str = line.split("time=")[1].split()[0]
+
+                                # Convert time to seconds
+                                if ":" in time_str:
+                                    parts = time_str.split(":")
+                                    if len(parts) == 3:
+                                        hours = float(parts[0])
+                                        minutes = float(parts[1])
+                                        seconds = float(parts[2])
+                                        current_time = (
+                                            hours * 3600 + minutes * 60 + seconds
+                                        )
+
+                                        # Calculate progress (0.0 to 1.0)
+                                        progress = min(
+                                            current_time / total_duration, 1.0
+                                        )
+                                        progress_callback(progress)
+                            except (ValueError, IndexError):
+                                # Ignore parsing errors
+                                pass
+
+                # Wait for process to complete
+                process.wait()
+
+                # Final progress update
+                progress_callback(1.0)
+
+                if process.returncode != 0:
+                    stderr_content = process.stderr.read() if process.stderr else b""
+                    raise ffmpeg.Error("ffmpeg", "", stderr_content)
 
         except Exception as e:
             logger.error(f"Error during progress tracking: {e}")
@@ -462,3 +846,43 @@ class AudioExtractor:
             "noise_reduction": self.config.audio.noise_reduction,
             "normalize_audio": self.config.audio.normalize_audio,
         }
+
+
+def decode_pcm(
+    media_path: Path | str, start_time: float = 0.0, duration: float | None = None
+) -> np.ndarray:
+    """
+    Decode part of a media file's audio to 16 kHz mono float32 samples.
+
+    ffmpeg seeks the input before decoding, so only the requested window is
+    decoded however long the file is.
+
+    Args:
+        media_path: Audio or video file to decode
+        start_time: Start of the window in seconds
+        duration: Length of the window in seconds (None decodes to the end)
+
+    Returns:
+        Decoded samples, as Whisper expects them
+
+    Raises:
+        FFmpegError: If ffmpeg fails to decode the file
+    """
+    input_args: dict[str, Any] = {"ss": start_time} if start_time > 0 else {}
+    if duration is not None:
+        input_args["t"] = duration
+
+    stream = ffmpeg.input(str(media_path), **input_args)
+    stream = ffmpeg.output(
+        stream, "pipe:", acodec="pcm_f32le", ar=PCM_SAMPLE_RATE, ac=1, f="f32le"
+    )
+    timeout = duration * 2 + 60 if duration is not None else None
+    try:
+        pcm, _ = run_ffmpeg(
+            stream, capture_stdout=True, capture_stderr=True, timeout=timeout
+        )
+    except ffmpeg.Error as e:
+        raise handle_ffmpeg_error(e, "audio decoding", media_path) from e
+
+    # Copy so the array is writable (torch warns on read-only buffers)
+    return np.frombuffer(pcm, dtype="<f4", count=len(pcm) // 4).copy()
@@ -0,0 +1,359 @@
+"""On-disk manifest of a checkpointed batch analysis job for DeepBrief."""
+
+import json
+import logging
+import os
+import pickle
+import time
+import uuid
+from collections.abc import Callable
+from enum import Enum
+from functools import partial
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Bump when the manifest layout changes
+MANIFEST_FORMAT = 1
+
+
+class VideoStatus(Enum):
+    """Status of one video within a batch job."""
+
+    PENDING = "pending"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+def _stage_entry(stage_result: Any) -> dict[str, Any]:
+    """Manifest entry of a StageResult."""
+    return {
+        "status": stage_result.status.value,
+        "duration": stage_result.duration,
+        "from_cache": stage_result.from_cache,
+    }
+
+
+def _record_stage(stages_path: Path, stage_result: Any) -> None:
+    """Add a finished stage to a video's stage file, rewriting it atomically."""
+    try:
+        with open(stages_path, encoding="utf-8") as f:
+            stages = json.load(f)
+    except (OSError, ValueError):
+        stages = {}
+    stages[stage_result.name] = _stage_entry(stage_result)
+
+    temp_file = stages_path.with_name(f".{stages_path.name}.{os.getpid()}.tmp")
+    try:
+        stages_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(temp_file, "w", encoding="utf-8") as f:
+            json.dump(stages, f, indent=2)
+        os.replace(temp_file, stages_path)
+    except OSError as e:
+        logger.warning(f"Could not record stage {stage_result.name}: {e}")
+        temp_file.unlink(missing_ok=True)
+
+
+class BatchManifest:
+    """
+    Record of a batch job's progress, kept in a job directory.
+
+    The manifest (``manifest.json``) lists every video of the job with its
+    status, the outcome of each of its stages and where its artifacts (the
+    pickled result, extracted audio, frames and report) were written. It is
+    rewritten atomically after every finished video, so a job interrupted
+    at any point can be resumed from it. Stage outputs of a video that was
+    interrupted part-way are checkpointed in ``checkpoint_dir`` by the stage
+    cache, and the outcome of each of its stages is recorded in a file of
+    its own under ``stages/`` as the stage finishes (see stage_recorder).
+    """
+
+    FILE_NAME = "manifest.json"
+
+    def __init__(self, job_dir: Path | str, data: dict[str, Any]):
+        """
+        Initialize a manifest from its JSON data.
+
+        Use create() or load() instead of calling this directly.
+
+        Args:
+            job_dir: Job directory holding the manifest
+            data: Manifest contents
+        """
+        self.job_dir = Path(job_dir)
+        self.data = data
+
+    @classmethod
+    def exists(cls, job_dir: Path | str) -> bool:
+        """Whether a job directory holds a manifest."""
+        return (Path(job_dir) / cls.FILE_NAME).is_file()
+
+    @classmethod
+    def create(
+        cls,
+        job_dir: Path | str,
+        video_paths: list[Path | str],
+        options: dict[str, Any],
+        output_dir: Path | str | None = None,
+        config: dict[str, Any] | None = None,
+    ) -> "BatchManifest":
+        """
+        Start a new job and write its manifest.
+
+        Args:
+            job_dir: Directory for the manifest, results and checkpoints
+            video_paths: Videos to analyze, in order
+            options: Analysis options passed to analyze_video for every video
+            output_dir: Optional output directory for extracted files
+            config: Optional configuration snapshot to resume the job with
+
+        Returns:
+            The new manifest
+
+        Raises:
+            FileExistsError: If the directory already holds a job
+        """
+        if cls.exists(job_dir):
+            raise FileExistsError(
+                f"Batch job already exists in {job_dir}; resume it instead"
+            )
+
+        now = time.time()
+        manifest = cls(
+            job_dir,
+            {
+                "format": MANIFEST_FORMAT,
+                "job_id": f"batch_job_{uuid.uuid4().hex[:8]}",
+                "created_at": now,
+                "updated_at": now,
+                "options": options,
+                "output_dir": str(output_dir) if output_dir else None,
+                "config": config,
+                "videos": [
+                    {
+                        "path": str(Path(video_path).resolve()),
+                        "status": VideoStatus.PENDING.value,
+                        "stages": {},
+                        "artifacts": {},
+                        "error_message": None,
+                    }
+                    for video_path in video_paths
+                ],
+            },
+        )
+        manifest.save()
+        logger.info(
+            f"Created batch job {manifest.job_id} with {len(video_paths)} videos: {job_dir}"
+        )
+        return manifest
+
+    @classmethod
+    def load(cls, job_dir: Path | str) -> "BatchManifest":
+        """
+        Load a job's manifest.
+
+        Args:
+            job_dir: Job directory
+
+        Returns:
+            The manifest
+
+        Raises:
+            FileNotFoundError: If the directory holds no job
+            ValueError: If the manifest is unreadable or has another format
+        """
+        manifest_path = Path(job_dir) / cls.FILE_NAME
+        try:
+            with open(manifest_path, encoding="utf-8") as f:
+                data = json.load(f)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Corrupt batch manifest {manifest_path}: {e}") from e
+
+        if data.get("format") != MANIFEST_FORMAT:
+            raise ValueError(
+                f"Unsupported batch manifest format {data.get('format')!r} "
+                f"in {manifest_path}"
+            )
+        return cls(job_dir, data)
+
+    @property
+    def job_id(self) -> str:
+        """Identifier of the job."""
+        return self.data["job_id"]
+
+    @property
+    def options(self) -> dict[str, Any]:
+        """Analysis options used for every video."""
+        return self.data["options"]
+
+    @property
+    def output_dir(self) -> Path | None:
+        """Output directory for extracted files, if any."""
+        output_dir = self.data.get("output_dir")
+        return Path(output_dir) if output_dir else None
+
+    @property
+    def config(self) -> dict[str, Any] | None:
+        """Configuration snapshot the job was started with, if recorded."""
+        return self.data.get("config")
+
+    @property
+    def video_paths(self) -> list[Path]:
+        """Videos of the job, in order."""
+        return [Path(video["path"]) for video in self.data["videos"]]
+
+    @property
+    def checkpoint_dir(self) -> Path:
+        """Directory for stage output checkpoints."""
+        return self.job_dir / "checkpoints"
+
+    def get_status(self, index: int) -> VideoStatus:
+        """Get the status of a video."""
+        return VideoStatus(self.data["videos"][index]["status"])
+
+    def remaining_indices(self, retry_failed: bool = True) -> list[int]:
+        """
+        Get the videos that still need analyzing.
+
+        Args:
+            retry_failed: Whether videos that failed count as remaining
+
+        Returns:
+            Indices into video_paths
+        """
+        finished = {VideoStatus.COMPLETED}
+        if not retry_failed:
+            finished.add(VideoStatus.FAILED)
+        return [
+            index
+            for index in range(len(self.data["videos"]))
+            if self.get_status(index) not in finished
+        ]
+
+    def _result_path(self, index: int) -> Path:
+        """File holding a video's pickled result."""
+        return self.job_dir / "results" / f"{index:05d}.pkl"
+
+    def _stages_path(self, index: int) -> Path:
+        """File recording the stages of a video still being analyzed."""
+        return self.job_dir / "stages" / f"{index:05d}.json"
+
+    def stage_recorder(self, index: int) -> Callable[[Any], None]:
+        """
+        Get a callback recording a video's stages as each one finishes.
+
+        Stages are recorded in a file of the video's own rather than in the
+        manifest, so batch worker processes can record them while only the
+        job's process writes the manifest. The callback can be pickled.
+
+        Args:
+            index: Index of the video
+
+        Returns:
+            on_stage_finished callback for analyzing the video
+        """
+        return partial(_record_stage, self._stages_path(index))
+
+    def get_stages(self, index: int) -> dict[str, dict[str, Any]]:
+        """
+        Get the outcome of each stage of a video.
+
+        Args:
+            index: Index of the video
+
+        Returns:
+            Stage entries by name: those recorded so far while the video is
+            analyzed (or when it was interrupted), else those recorded with
+            its result
+        """
+        try:
+            with open(self._stages_path(index), encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return self.data["videos"][index]["stages"]
+
+    def record_result(self, index: int, result: Any) -> None:
+        """
+        Record a finished video and save the manifest.
+
+        Args:
+            index: Index of the video
+            result: Its VideoAnalysisResult (without in-memory audio samples)
+        """
+        result_path = self._result_path(index)
+        result_path.parent.mkdir(parents=True, exist_ok=True)
+        temp_file = result_path.with_suffix(".tmp")
+        with open(temp_file, "wb") as f:
+            pickle.dump(result, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_file, result_path)
+
+        artifacts: dict[str, Any] = {"result": str(result_path)}
+        video_info = getattr(result, "video_info", None)
+        audio_info = getattr(result, "audio_info", None)
+        # In-memory and windowed audio point at the source video, which is
+        # not an artifact of the analysis
+        if audio_info is not None and (
+            video_info is None or audio_info.file_path != video_info.file_path
+        ):
+            artifacts["audio"] = str(audio_info.file_path)
+        frame_infos = getattr(result, "frame_infos", None) or []
+        if frame_infos:
+            artifacts["frames"] = [str(frame.frame_path) for frame in frame_infos]
+        if result.report is not None and self.output_dir and video_info is not None:
+            artifacts["report"] = str(
+                self.output_dir
+                / video_info.file_path.stem
+                / f"{video_info.file_path.stem}_report.json"
+            )
+
+        video = self.data["videos"][index]
+        video["status"] = (
+            VideoStatus.COMPLETED if result.success else VideoStatus.FAILED
+        ).value
+        video["error_message"] = result.error_message
+        video["artifacts"] = artifacts
+        video["stages"] = {
+            name: _stage_entry(stage_result)
+            for name, stage_result in (result.stage_results or {}).items()
+        }
+        self.save()
+        self._stages_path(index).unlink(missing_ok=True)
+
+    def load_result(self, index: int) -> Any | None:
+        """
+        Load the stored result of a finished video.
+
+        Args:
+            index: Index of the video
+
+        Returns:
+            The VideoAnalysisResult, or None if it is missing or unreadable
+        """
+        try:
+            with open(self._result_path(index), "rb") as f:
+                return pickle.load(f)
+        except Exception as e:
+            logger.warning(f"Could not load stored result for video {index}: {e}")
+            return None
+
+    def save(self) -> None:
+        """Write the manifest atomically."""
+        self.data["updated_at"] = time.time()
+        self.job_dir.mkdir(parents=True, exist_ok=True)
+        manifest_path = self.job_dir / self.FILE_NAME
+        temp_file = manifest_path.with_name(f".{self.FILE_NAME}.{os.getpid()}.tmp")
+        with open(temp_file, "w", encoding="utf-8") as f:
+            json.dump(self.data, f, indent=2, default=str)
+        os.replace(temp_file, manifest_path)
+
+    def get_summary(self) -> dict[str, Any]:
+        """Get counts of videos by status."""
+        counts = {status.value: 0 for status in VideoStatus}
+        for video in self.data["videos"]:
+            counts[video["status"]] += 1
+        return {
+            "job_id": self.job_id,
+            "total_videos": len(self.data["videos"]),
+            **counts,
+        }
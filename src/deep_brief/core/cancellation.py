@@ -0,0 +1,136 @@
+"""Cooperative cancellation of running analyses for DeepBrief."""
+
+import logging
+import threading
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from deep_brief.core.exceptions import OperationCancelledError
+
+logger = logging.getLogger(__name__)
+
+
+class CancellationToken:
+    """
+    Signal that an operation and everything it started should stop.
+
+    Long-running work checks the token between units of work (frames,
+    scenes, stages) with raise_if_cancelled(). Work that cannot check, such
+    as an ffmpeg subprocess, registers a callback with on_cancel() that
+    stops it, for example by killing the process. Callbacks run once, on the
+    thread that calls cancel().
+    """
+
+    def __init__(self) -> None:
+        """Initialize an uncancelled token."""
+        self.reason: str | None = None
+        self._event = threading.Event()
+        self._lock = threading.Lock()
+        self._callbacks: dict[int, Callable[[], None]] = {}
+        self._next_id = 0
+
+    @property
+    def cancelled(self) -> bool:
+        """Whether cancel() has been called."""
+        return self._event.is_set()
+
+    def cancel(self, reason: str = "Operation cancelled") -> None:
+        """
+        Cancel the operation and run the registered callbacks.
+
+        Args:
+            reason: Why the operation was cancelled, used as the error message
+        """
+        with self._lock:
+            if self._event.is_set():
+                return
+            self.reason = reason
+            self._event.set()
+            callbacks = list(self._callbacks.values())
+            self._callbacks.clear()
+
+        logger.info(f"Cancelling: {reason}")
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception as e:
+                logger.warning(f"Cancellation callback failed: {e}")
+
+    def raise_if_cancelled(self, operation: str | None = None) -> None:
+        """
+        Raise if the operation was cancelled.
+
+        Args:
+            operation: Optional name of the work being stopped, for the error
+
+        Raises:
+            OperationCancelledError: If cancel() has been called
+        """
+        if self._event.is_set():
+            raise OperationCancelledError(
+                message=self.reason or "Operation cancelled", operation=operation
+            )
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """Block until cancelled or the timeout passes; returns cancelled."""
+        return self._event.wait(timeout)
+
+    @contextmanager
+    def on_cancel(self, callback: Callable[[], None]) -> Iterator[None]:
+        """
+        Run a callback if the token is cancelled while the block runs.
+
+        The callback runs immediately if the token is already cancelled.
+        """
+        with self._lock:
+            callback_id = self._next_id
+            self._next_id += 1
+            if not self._event.is_set():
+                self._callbacks[callback_id] = callback
+                callback = None  # type: ignore[assignment]
+        if callback is not None:
+            callback()
+
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._callbacks.pop(callback_id, None)
+
+
+# Token of the operation running in the current thread or task. Stage
+# threads and asyncio tasks inherit it from the scheduler that started them.
+_current_token: ContextVar[CancellationToken | None] = ContextVar(
+    "deep_brief_cancellation_token", default=None
+)
+
+
+def get_current_token() -> CancellationToken | None:
+    """Get the cancellation token of the running operation, if any."""
+    return _current_token.get()
+
+
+@contextmanager
+def cancellation_scope(token: CancellationToken | None) -> Iterator[None]:
+    """Make a token the current one for the work started in the block."""
+    reset = _current_token.set(token)
+    try:
+        yield
+    finally:
+        _current_token.reset(reset)
+
+
+def raise_if_cancelled(operation: str | None = None) -> None:
+    """
+    Raise if the running operation was cancelled.
+
+    Args:
+        operation: Optional name of the work being stopped, for the error
+
+    Raises:
+        OperationCancelledError: If the current token is cancelled
+    """
+    token = _current_token.get()
+    if token is not None:
+        token.raise_if_cancelled(operation)
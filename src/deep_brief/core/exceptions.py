@@ -1,5 +1,6 @@
 """Custom exceptions for video processing operations."""
 
+import pickle
 from enum import Enum
 from pathlib import Path
 from typing import Any
@@ -102,6 +103,33 @@ class VideoProcessingError(Exception):
 
         return " | ".join(parts)
 
+    def __reduce__(self) -> tuple[Any, ...]:
+        """
+        Pickle by state rather than by constructor arguments.
+
+        Subclasses take extra required arguments, so the default exception
+        pickling (which calls the class with ``args``) cannot rebuild them.
+        A cause that cannot itself be pickled is replaced by its text.
+        """
+        state = dict(self.__dict__)
+        cause = state.get("cause")
+        if cause is not None:
+            try:
+                pickle.loads(pickle.dumps(cause))
+            except Exception:
+                state["cause"] = Exception(f"{type(cause).__name__}: {cause}")
+        return (_restore_error, (type(self), self.args, state))
+
+
+def _restore_error(
+    cls: type[VideoProcessingError], args: tuple[Any, ...], state: dict[str, Any]
+) -> VideoProcessingError:
+    """Rebuild a pickled VideoProcessingError without calling __init__."""
+    error = cls.__new__(cls)
+    error.args = args
+    error.__dict__.update(state)
+    return error
+
 
 class FileValidationError(VideoProcessingError):
     """Error during file validation."""
@@ -290,6 +318,27 @@ class ProcessingTimeoutError(VideoProcessingError):
         )
 
 
+class OperationCancelledError(VideoProcessingError):
+    """Error when an operation is cancelled before it finishes."""
+
+    def __init__(
+        self,
+        message: str = "Operation cancelled",
+        operation: str | None = None,
+        file_path: Path | str | None = None,
+        cause: Exception | None = None,
+    ):
+        details = {"operation": operation} if operation else None
+
+        super().__init__(
+            message=message,
+            error_code=ErrorCode.OPERATION_CANCELLED,
+            file_path=file_path,
+            details=details,
+            cause=cause,
+        )
+
+
 def handle_ffmpeg_error(
     error: Exception, operation: str, file_path: Path | str | None = None
 ) -> FFmpegError:
@@ -351,6 +400,7 @@ def get_user_friendly_message(error: VideoProcessingError) -> str:
         ErrorCode.INSUFFICIENT_MEMORY: "Not enough memory available for processing this video.",
         ErrorCode.INSUFFICIENT_DISK_SPACE: "Not enough disk space available for processing.",
         ErrorCode.MISSING_DEPENDENCY: "Required software dependency is missing.",
+        ErrorCode.OPERATION_CANCELLED: "The analysis was cancelled.",
     }
 
     user_message = error_messages.get(error.error_code, error.message)
@@ -0,0 +1,415 @@
+"""Helpers for running ffmpeg while keeping its log output."""
+
+# NOTE: ffmpeg-python library lacks comprehensive type annotations
+# See: https://github.com/kkroening/ffmpeg-python/issues/247
+# pyright: reportUnknownMemberType=false, reportUnknownVariableType=false, reportUnknownArgumentType=false
+
+import asyncio
+import subprocess
+import threading
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from typing import Any
+
+import ffmpeg
+
+from deep_brief.core.cancellation import get_current_token
+from deep_brief.core.exceptions import OperationCancelledError
+
+
+def run_ffmpeg(stream: Any, timeout: float | None = None, **kwargs: Any) -> Any:
+    """
+    Run ffmpeg like ``ffmpeg.run``, killing it if the operation is cancelled.
+
+    Without a cancellation token in scope this is ``ffmpeg.run``. Under a
+    token, ffmpeg is started with ``ffmpeg.run_async`` so the process can be
+    killed as soon as the token is cancelled.
+
+    Args:
+        stream: ffmpeg stream object
+        timeout: Timeout in seconds for the whole run
+        **kwargs: ``ffmpeg.run`` options (capture_stdout, capture_stderr, quiet, ...)
+
+    Returns:
+        Tuple of (stdout, stderr) as returned by ``ffmpeg.run``
+
+    Raises:
+        ffmpeg.Error: If ffmpeg exits with an error
+        subprocess.TimeoutExpired: If ffmpeg runs longer than the timeout
+        OperationCancelledError: If the operation is cancelled
+    """
+    token = get_current_token()
+    if token is None:
+        if timeout is not None:
+            kwargs["timeout"] = timeout
+        return ffmpeg.run(stream, **kwargs)
+
+    token.raise_if_cancelled("ffmpeg")
+    process = ffmpeg.run_async(
+        stream,
+        pipe_stdout=kwargs.get("capture_stdout", False),
+        pipe_stderr=kwargs.get("capture_stderr", False),
+        quiet=kwargs.get("quiet", False),
+        overwrite_output=kwargs.get("overwrite_output", False),
+    )
+    with terminate_on_cancel(process):
+        try:
+            stdout, stderr = process.communicate(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.communicate()
+            raise
+        if process.returncode != 0:
+            raise ffmpeg.Error("ffmpeg", stdout, stderr)
+    return stdout, stderr
+
+
+@contextmanager
+def terminate_on_cancel(process: Any, operation: str = "ffmpeg") -> Iterator[None]:
+    """
+    Kill a running subprocess if the current operation is cancelled.
+
+    Errors raised in the block after the process was killed, such as the
+    ffmpeg.Error of the killed run, are raised as OperationCancelledError.
+
+    Args:
+        process: Running ``subprocess.Popen``
+        operation: Name of the work, for the cancellation error
+    """
+    token = get_current_token()
+    if token is None:
+        yield
+        return
+
+    with token.on_cancel(lambda: _terminate(process)):
+        try:
+            yield
+        except OperationCancelledError:
+            raise
+        except Exception as e:
+            if token.cancelled:
+                raise OperationCancelledError(
+                    message=token.reason or "Operation cancelled",
+                    operation=operation,
+                    cause=e,
+                ) from e
+            raise
+    token.raise_if_cancelled(operation)
+
+
+def _terminate(process: Any) -> None:
+    """Kill a subprocess that is still running."""
+    if process.poll() is None:
+        try:
+            process.kill()
+        except ProcessLookupError:
+            pass
+
+
+def run_and_collect_log(
+    stream: Any,
+    total_duration: float,
+    timeout: float,
+    progress_callback: Callable[[float], None] | None,
+) -> str:
+    """
+    Run ffmpeg and return its full stderr log.
+
+    Args:
+        stream: ffmpeg stream object
+        total_duration: Total duration in seconds for progress calculation
+        timeout: Timeout in seconds for the whole run
+        progress_callback: Optional callback function for progress updates
+
+    Returns:
+        Decoded stderr output
+
+    Raises:
+        ffmpeg.Error: If ffmpeg exits with an error
+        subprocess.TimeoutExpired: If ffmpeg runs longer than the timeout
+    """
+    if progress_callback is None:
+        _, stderr = run_ffmpeg(
+            stream, capture_stdout=True, capture_stderr=True, timeout=timeout
+        )
+        return stderr.decode("utf-8", errors="ignore") if stderr else ""
+
+    process = ffmpeg.run_async(stream, pipe_stderr=True, quiet=True)
+    with terminate_on_cancel(process):
+        return _collect_log(process, total_duration, timeout, progress_callback)
+
+
+def run_and_collect_output(
+    stream: Any,
+    total_duration: float,
+    timeout: float,
+    progress_callback: Callable[[float], None] | None,
+) -> tuple[bytes, str]:
+    """
+    Run ffmpeg writing to ``pipe:`` and return its stdout data and stderr log.
+
+    Args:
+        stream: ffmpeg stream object with an output on stdout
+        total_duration: Total duration in seconds for progress calculation
+        timeout: Timeout in seconds for the whole run
+        progress_callback: Optional callback function for progress updates
+
+    Returns:
+        Tuple of (stdout bytes, decoded stderr output)
+
+    Raises:
+        ffmpeg.Error: If ffmpeg exits with an error
+        subprocess.TimeoutExpired: If ffmpeg runs longer than the timeout
+    """
+    if progress_callback is None:
+        stdout, stderr = run_ffmpeg(
+            stream, capture_stdout=True, capture_stderr=True, timeout=timeout
+        )
+        log = stderr.decode("utf-8", errors="ignore") if stderr else ""
+        return stdout or b"", log
+
+    process = ffmpeg.run_async(stream, pipe_stdout=True, pipe_stderr=True, quiet=True)
+
+    # Drain stdout on its own thread so neither pipe can fill up and stall ffmpeg
+    chunks: list[bytes] = []
+    reader = threading.Thread(
+        target=_drain_pipe, args=(process.stdout, chunks), daemon=True
+    )
+    reader.start()
+    try:
+        with terminate_on_cancel(process):
+            log = _collect_log(process, total_duration, timeout, progress_callback)
+    finally:
+        reader.join()
+
+    return b"".join(chunks), log
+
+
+def _drain_pipe(pipe: Any, chunks: list[bytes]) -> None:
+    """Read a pipe to EOF, appending the data to ``chunks``."""
+    while True:
+        chunk = pipe.read(1 << 20)
+        if not chunk:
+            break
+        chunks.append(chunk)
+
+
+def _collect_log(
+    process: Any,
+    total_duration: float,
+    timeout: float,
+    progress_callback: Callable[[float], None],
+) -> str:
+    """
+    Read the stderr of a running ffmpeg process, reporting progress.
+
+    Reading blocks until ffmpeg writes or exits, so the timeout is enforced
+    by a timer that kills the process, which ends the read.
+    """
+    timed_out = threading.Event()
+
+    def kill_on_timeout() -> None:
+        if process.poll() is None:
+            timed_out.set()
+            _terminate(process)
+
+    timer = threading.Timer(timeout, kill_on_timeout)
+    timer.daemon = True
+    timer.start()
+
+    lines: list[bytes] = []
+    try:
+        # ffmpeg separates progress updates with carriage returns, so read raw
+        # chunks and split on both line terminators
+        pending = b""
+        while True:
+            chunk = process.stderr.read1(4096) if process.stderr else b""
+            if not chunk:
+                break
+            pending = _split_log_chunk(
+                pending + chunk, lines, total_duration, progress_callback
+            )
+        if pending:
+            lines.append(pending)
+
+        process.wait()
+    finally:
+        timer.cancel()
+
+    if timed_out.is_set():
+        raise subprocess.TimeoutExpired(process.args, timeout)
+    stderr = b"\n".join(lines)
+
+    if process.returncode != 0:
+        raise ffmpeg.Error("ffmpeg", b"", stderr)
+
+    progress_callback(1.0)
+    return stderr.decode("utf-8", errors="ignore")
+
+
+def _split_log_chunk(
+    data: bytes,
+    lines: list[bytes],
+    total_duration: float,
+    progress_callback: Callable[[float], None] | None,
+) -> bytes:
+    """
+    Append the complete lines of ``data`` to ``lines``, reporting progress.
+
+    Returns:
+        The trailing partial line, to be prepended to the next chunk
+    """
+    *complete, pending = data.replace(b"\r", b"\n").split(b"\n")
+    for line in complete:
+        lines.append(line)
+        if progress_callback is not None:
+            _report_progress(line, total_duration, progress_callback)
+    return pending
+
+
+async def async_run_and_collect_log(
+    stream: Any,
+    total_duration: float,
+    timeout: float,
+    progress_callback: Callable[[float], None] | None,
+) -> str:
+    """
+    Run ffmpeg without blocking the event loop and return its full stderr log.
+
+    Args:
+        stream: ffmpeg stream object
+        total_duration: Total duration in seconds for progress calculation
+        timeout: Timeout in seconds for the whole run
+        progress_callback: Optional callback function for progress updates
+
+    Returns:
+        Decoded stderr output
+
+    Raises:
+        ffmpeg.Error: If ffmpeg exits with an error
+        subprocess.TimeoutExpired: If ffmpeg runs longer than the timeout
+    """
+    _, log = await async_run_and_collect_output(
+        stream, total_duration, timeout, progress_callback
+    )
+    return log
+
+
+async def async_run_and_collect_output(
+    stream: Any,
+    total_duration: float,
+    timeout: float,
+    progress_callback: Callable[[float], None] | None,
+) -> tuple[bytes, str]:
+    """
+    Run ffmpeg without blocking the event loop, returning stdout and stderr.
+
+    The process is started with ``asyncio.create_subprocess_exec``; stdout is
+    drained by its own task while stderr is parsed for progress as it
+    arrives. If the run times out or the awaiting task is cancelled, ffmpeg
+    is killed.
+
+    Args:
+        stream: ffmpeg stream object, optionally with an output on stdout
+        total_duration: Total duration in seconds for progress calculation
+        timeout: Timeout in seconds for the whole run
+        progress_callback: Optional callback function for progress updates
+
+    Returns:
+        Tuple of (stdout bytes, decoded stderr output)
+
+    Raises:
+        ffmpeg.Error: If ffmpeg exits with an error
+        subprocess.TimeoutExpired: If ffmpeg runs longer than the timeout
+    """
+    args = ffmpeg.compile(stream)
+    process = await asyncio.create_subprocess_exec(
+        *args,
+        stdin=asyncio.subprocess.DEVNULL,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+    )
+
+    async def communicate() -> tuple[bytes, bytes]:
+        stdout_task = asyncio.ensure_future(process.stdout.read())  # type: ignore[union-attr]
+        lines: list[bytes] = []
+        pending = b""
+        try:
+            while True:
+                chunk = await process.stderr.read(4096)  # type: ignore[union-attr]
+                if not chunk:
+                    break
+                pending = _split_log_chunk(
+                    pending + chunk, lines, total_duration, progress_callback
+                )
+            stdout = await stdout_task
+        finally:
+            stdout_task.cancel()
+        if pending:
+            lines.append(pending)
+        await process.wait()
+        return stdout, b"\n".join(lines)
+
+    token = get_current_token()
+    loop = asyncio.get_running_loop()
+
+    def kill_on_cancel() -> None:
+        loop.call_soon_threadsafe(_kill_nowait, process)
+
+    try:
+        if token is None:
+            stdout, stderr = await asyncio.wait_for(communicate(), timeout)
+        else:
+            with token.on_cancel(kill_on_cancel):
+                stdout, stderr = await asyncio.wait_for(communicate(), timeout)
+    except asyncio.TimeoutError as e:
+        await _kill(process)
+        raise subprocess.TimeoutExpired(args, timeout) from e
+    except BaseException:
+        # Cancelled (or failed) while ffmpeg is still running
+        await _kill(process)
+        raise
+
+    if token is not None:
+        token.raise_if_cancelled("ffmpeg")
+    if process.returncode != 0:
+        raise ffmpeg.Error("ffmpeg", stdout, stderr)
+
+    if progress_callback is not None:
+        progress_callback(1.0)
+    return stdout, stderr.decode("utf-8", errors="ignore")
+
+
+async def _kill(process: asyncio.subprocess.Process) -> None:
+    """Kill an ffmpeg process that is still running and reap it."""
+    if process.returncode is None:
+        try:
+            process.kill()
+        except ProcessLookupError:
+            pass
+        await process.wait()
+
+
+def _kill_nowait(process: asyncio.subprocess.Process) -> None:
+    """Kill an ffmpeg process if it is still running, without reaping it."""
+    if process.returncode is None:
+        try:
+            process.kill()
+        except ProcessLookupError:
+            pass
+
+
+def _report_progress(
+    line: bytes, total_duration: float, progress_callback: Callable[[float], None]
+) -> None:
+    """Parse an ffmpeg ``time=HH:MM:SS.xx`` status line and report progress."""
+    if b"time=" not in line or total_duration <= 0:
+        return
+
+    try:
+        time_str = line.split(b"time=")[1].split()[0].decode()
+        hours, minutes, seconds = time_str.split(":")
+        current_time = float(hours) * 3600 + float(minutes) * 60 + float(seconds)
+        progress_callback(min(current_time / total_duration, 1.0))
+    except (ValueError, IndexError):
+        pass
@@ -0,0 +1,110 @@
+"""Single-decode pass that extracts audio and detects scenes together."""
+
+# NOTE: ffmpeg-python library lacks comprehensive type annotations
+# See: https://github.com/kkroening/ffmpeg-python/issues/247
+# pyright: reportUnknownMemberType=false, reportUnknownVariableType=false, reportUnknownArgumentType=false
+
+import logging
+import subprocess
+from collections.abc import Callable
+from pathlib import Path
+
+import ffmpeg
+
+from deep_brief.core.audio_extractor import AudioExtractor, AudioInfo
+from deep_brief.core.exceptions import (
+    ProcessingTimeoutError,
+    handle_ffmpeg_error,
+)
+from deep_brief.core.ffmpeg_runner import (
+    run_and_collect_log,
+    run_and_collect_output,
+)
+from deep_brief.core.scene_detector import SceneDetectionResult, SceneDetector
+from deep_brief.core.video_processor import VideoInfo
+
+logger = logging.getLogger(__name__)
+
+
+def extract_audio_and_detect_scenes(
+    video_info: VideoInfo,
+    audio_extractor: AudioExtractor,
+    scene_detector: SceneDetector,
+    output_path: Path | str | None = None,
+    progress_callback: Callable[[float], None] | None = None,
+) -> tuple[AudioInfo, SceneDetectionResult]:
+    """
+    Extract the WAV and run scdet from one read of the input.
+
+    The input is demuxed and decoded once; the audio stream goes through the
+    extractor's normalization/resampling chain into the WAV file (or into
+    memory when ``audio.in_memory`` is set) while the video stream goes
+    through scdet into a null sink, and the scene changes are parsed from
+    the shared ffmpeg log.
+
+    Args:
+        video_info: VideoInfo object from validated video file
+        audio_extractor: Extractor providing audio filters and output settings
+        scene_detector: Detector providing the scene filter and log parsing
+        output_path: Optional custom output path for audio file
+        progress_callback: Optional callback function for progress updates (0.0 to 1.0)
+
+    Returns:
+        Tuple of (AudioInfo, SceneDetectionResult)
+
+    Raises:
+        AudioProcessingError: If the video has no usable audio stream or the WAV is invalid
+        FFmpegError: If the combined ffmpeg run fails
+        ProcessingTimeoutError: If the combined ffmpeg run times out
+    """
+    logger.info(
+        f"Extracting audio and detecting scenes in one pass: {video_info.file_path.name}"
+    )
+
+    source = ffmpeg.input(str(video_info.file_path))
+    audio_output = audio_extractor.audio_output(video_info, source, output_path)
+
+    video = scene_detector.apply_scene_filter(source.video)
+    video_output = ffmpeg.output(video, "-", f="null")
+
+    # scdet reports scene changes at info level
+    stream = (
+        ffmpeg.merge_outputs(audio_output, video_output)
+        .global_args("-loglevel", "info")
+        .overwrite_output()
+    )
+
+    timeout = video_info.duration * 2 + 60
+    pcm = None
+    try:
+        # In-memory audio goes to stdout; a WAV copy is only saved when asked for
+        if audio_extractor.in_memory:
+            pcm, ffmpeg_output = run_and_collect_output(
+                stream, video_info.duration, timeout, progress_callback
+            )
+        else:
+            ffmpeg_output = run_and_collect_log(
+                stream, video_info.duration, timeout, progress_callback
+            )
+    except subprocess.TimeoutExpired as e:
+        raise ProcessingTimeoutError(
+            message=f"Combined audio and scene pass timed out after {timeout:.0f} seconds",
+            timeout_seconds=timeout,
+            operation="audio and scene detection",
+            file_path=video_info.file_path,
+            cause=e,
+        ) from e
+    except ffmpeg.Error as e:
+        raise handle_ffmpeg_error(
+            e, "audio and scene detection", video_info.file_path
+        ) from e
+
+    audio_info = audio_extractor.audio_info_from_output(video_info, output_path, pcm)
+    scene_result = scene_detector.detect_scenes_from_output(video_info, ffmpeg_output)
+
+    logger.info(
+        f"Single pass complete: {audio_info.duration:.1f}s audio, "
+        f"{scene_result.total_scenes} scenes"
+    )
+
+    return audio_info, scene_result
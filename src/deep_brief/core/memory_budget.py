@@ -0,0 +1,341 @@
+"""Process-wide memory budget for loaded models and decoded frames."""
+
+import logging
+import threading
+from collections import OrderedDict, deque
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+MB = 1024 * 1024
+
+# Approximate resident memory (MB) of the models stages load, used against
+# processing.max_model_memory_mb and processing.memory_budget_mb
+WHISPER_MODEL_MEMORY_MB = {
+    "whisper-tiny": 400,
+    "whisper-base": 500,
+    "whisper-small": 1000,
+    "whisper-medium": 2600,
+    "whisper-large": 4700,
+    "whisper-large-v2": 4700,
+    "whisper-large-v3": 4700,
+}
+CAPTION_MODEL_MEMORY_MB = {
+    "Salesforce/blip2-opt-2.7b": 8000,
+    "Salesforce/blip2-opt-6.7b": 16000,
+    "Salesforce/blip2-flan-t5-xl": 9000,
+    "Salesforce/blip-image-captioning-base": 1000,
+    "Salesforce/blip-image-captioning-large": 1900,
+}
+EASYOCR_MODEL_MEMORY_MB = 500
+DEFAULT_MODEL_MEMORY_MB = 4000
+
+
+@dataclass
+class _ResidentModel:
+    """A loaded model accounted against the budget."""
+
+    size_bytes: int
+    unload: Callable[[], None]
+
+
+class MemoryBudget:
+    """
+    Memory accounting shared by everything in the process that loads models
+    or buffers decoded frames.
+
+    Model loads are serialized, so two large models never materialize at the
+    same time. Before a model is loaded, resident models that are not in use
+    are unloaded, least recently used first, until the new one fits. Decoded
+    frames waiting in a FrameBuffer are counted too, and adding them also
+    unloads idle models when the budget is exceeded. Without a limit the
+    budget only serializes loads and keeps statistics.
+    """
+
+    def __init__(self, limit_mb: float | None = None):
+        """
+        Initialize the memory budget.
+
+        Args:
+            limit_mb: Memory models and buffered frames may use together,
+                or None for no limit
+        """
+        self.limit_bytes = int(limit_mb * MB) if limit_mb else None
+        self._lock = threading.Lock()
+        self._load_lock = threading.Lock()
+        self._models: OrderedDict[str, _ResidentModel] = OrderedDict()
+        self._pins: dict[str, int] = {}
+        self._model_bytes = 0
+        self._frame_bytes = 0
+
+        # Statistics
+        self.loads = 0
+        self.unloads = 0
+        self.peak_bytes = 0
+
+    def set_limit(self, limit_mb: float | None) -> None:
+        """Change the limit; models over a lowered limit unload on next pressure."""
+        with self._lock:
+            self.limit_bytes = int(limit_mb * MB) if limit_mb else None
+
+    @property
+    def used_bytes(self) -> int:
+        """Memory currently accounted to models and buffered frames."""
+        with self._lock:
+            return self._model_bytes + self._frame_bytes
+
+    def load_model(
+        self,
+        key: str,
+        size_mb: float,
+        load: Callable[[], T],
+        unload: Callable[[], None],
+    ) -> T:
+        """
+        Load a model once there is room for it.
+
+        Loads are serialized across threads. Idle models are unloaded first
+        if the new model would not fit; a model larger than what can be freed
+        is still loaded, with a warning, rather than failing the analysis.
+
+        Args:
+            key: Identifier of the model, such as "whisper:whisper-base:cpu"
+            size_mb: Estimated resident size of the model
+            load: Loads the model and returns it
+            unload: Drops the owner's reference to the model; called when the
+                budget needs the memory back
+
+        Returns:
+            Whatever load returned
+        """
+        size_bytes = int(size_mb * MB)
+        with self._load_lock:
+            self.release_model(key)
+            self._reclaim(size_bytes, exclude=key)
+            used = self.used_bytes
+            if self.limit_bytes is not None and used + size_bytes > self.limit_bytes:
+                logger.warning(
+                    f"Loading {key} ({size_mb:.0f}MB) exceeds the memory budget "
+                    f"({used / MB:.0f}MB of {self.limit_bytes / MB:.0f}MB in use)"
+                )
+
+            model = load()
+
+            with self._lock:
+                self._models[key] = _ResidentModel(size_bytes, unload)
+                self._model_bytes += size_bytes
+                self.loads += 1
+                self._update_peak()
+            logger.debug(f"Model loaded under memory budget: {key} ({size_mb:.0f}MB)")
+            return model
+
+    def release_model(self, key: str) -> None:
+        """Stop accounting for a model its owner has unloaded itself."""
+        with self._lock:
+            resident = self._models.pop(key, None)
+            if resident is not None:
+                self._model_bytes -= resident.size_bytes
+
+    def touch(self, key: str) -> None:
+        """Mark a model as recently used."""
+        with self._lock:
+            if key in self._models:
+                self._models.move_to_end(key)
+
+    def demote(self, key: str) -> None:
+        """Mark a model as the first to unload under memory pressure."""
+        with self._lock:
+            if key in self._models:
+                self._models.move_to_end(key, last=False)
+
+    @contextmanager
+    def using(self, key: str) -> Iterator[None]:
+        """Keep a model from being unloaded while it runs."""
+        with self._lock:
+            self._pins[key] = self._pins.get(key, 0) + 1
+            if key in self._models:
+                self._models.move_to_end(key)
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._pins[key] -= 1
+                if not self._pins[key]:
+                    del self._pins[key]
+
+    def add_frame_bytes(self, nbytes: int) -> None:
+        """Account for decoded frames, unloading idle models if over budget."""
+        with self._lock:
+            self._frame_bytes += nbytes
+            self._update_peak()
+        self._reclaim(0)
+
+    def remove_frame_bytes(self, nbytes: int) -> None:
+        """Stop accounting for frames that were analyzed or dropped."""
+        with self._lock:
+            self._frame_bytes -= nbytes
+
+    def _reclaim(self, needed_bytes: int, exclude: str | None = None) -> None:
+        """Unload idle models, least recently used first, until needed_bytes fit."""
+        while True:
+            with self._lock:
+                if self.limit_bytes is None:
+                    return
+                used = self._model_bytes + self._frame_bytes
+                if used + needed_bytes <= self.limit_bytes:
+                    return
+                victim = next(
+                    (
+                        key
+                        for key in self._models
+                        if key != exclude and not self._pins.get(key)
+                    ),
+                    None,
+                )
+                if victim is None:
+                    return
+                resident = self._models.pop(victim)
+                self._model_bytes -= resident.size_bytes
+                self.unloads += 1
+
+            # Unload outside the lock; owners may call back into the budget
+            logger.info(
+                f"Unloading idle model {victim} "
+                f"({resident.size_bytes / MB:.0f}MB) under memory pressure"
+            )
+            try:
+                resident.unload()
+            except Exception as e:
+                logger.warning(f"Failed to unload model {victim}: {e}")
+
+    def _update_peak(self) -> None:
+        """Record peak usage; call with the lock held."""
+        self.peak_bytes = max(self.peak_bytes, self._model_bytes + self._frame_bytes)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get memory budget statistics."""
+        with self._lock:
+            return {
+                "limit_mb": self.limit_bytes / MB if self.limit_bytes else None,
+                "used_mb": (self._model_bytes + self._frame_bytes) / MB,
+                "model_mb": self._model_bytes / MB,
+                "frame_mb": self._frame_bytes / MB,
+                "peak_mb": self.peak_bytes / MB,
+                "resident_models": list(self._models),
+                "loads": self.loads,
+                "unloads": self.unloads,
+            }
+
+
+class FrameBuffer:
+    """
+    Byte-bounded queue of decoded frames waiting to be analyzed.
+
+    put() blocks the producer while the queued frames would exceed
+    ``max_bytes``, so decoding never runs further ahead of analysis than the
+    buffer allows. A single frame larger than the buffer is still admitted
+    when the buffer is empty. Queued bytes are reported to a MemoryBudget.
+    """
+
+    def __init__(self, max_bytes: int, budget: MemoryBudget | None = None):
+        """
+        Initialize the frame buffer.
+
+        Args:
+            max_bytes: Maximum bytes of frames queued at once
+            budget: Memory budget to account queued frames against
+        """
+        self.max_bytes = max_bytes
+        self.budget = budget
+        self._items: deque[tuple[Any, int]] = deque()
+        self._bytes = 0
+        self._closed = False
+        self._condition = threading.Condition()
+
+        # Statistics
+        self.producer_waits = 0
+        self.peak_bytes = 0
+
+    def put(self, item: Any, nbytes: int) -> bool:
+        """
+        Queue an item, blocking while the buffer is full.
+
+        Args:
+            item: Item to queue
+            nbytes: Memory the item holds
+
+        Returns:
+            False if the buffer was closed instead
+        """
+        with self._condition:
+            if self._items and self._bytes + nbytes > self.max_bytes:
+                self.producer_waits += 1
+            while (
+                not self._closed
+                and self._items
+                and self._bytes + nbytes > self.max_bytes
+            ):
+                self._condition.wait()
+            if self._closed:
+                return False
+            self._items.append((item, nbytes))
+            self._bytes += nbytes
+            self.peak_bytes = max(self.peak_bytes, self._bytes)
+            self._condition.notify_all()
+
+        if self.budget is not None:
+            self.budget.add_frame_bytes(nbytes)
+        return True
+
+    def get(self) -> Any:
+        """Take the next item, blocking until one is queued."""
+        with self._condition:
+            while not self._items:
+                self._condition.wait()
+            item, nbytes = self._items.popleft()
+            self._bytes -= nbytes
+            self._condition.notify_all()
+
+        if self.budget is not None:
+            self.budget.remove_frame_bytes(nbytes)
+        return item
+
+    def close(self) -> None:
+        """Wake a blocked producer and drop anything still queued."""
+        with self._condition:
+            self._closed = True
+            dropped = sum(nbytes for _, nbytes in self._items)
+            self._items.clear()
+            self._bytes = 0
+            self._condition.notify_all()
+
+        if self.budget is not None and dropped:
+            self.budget.remove_frame_bytes(dropped)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get frame buffer statistics."""
+        with self._condition:
+            return {
+                "queued_frames": len(self._items),
+                "queued_mb": self._bytes / MB,
+                "peak_mb": self.peak_bytes / MB,
+                "max_mb": self.max_bytes / MB,
+                "producer_waits": self.producer_waits,
+            }
+
+
+# Global memory budget shared by all components in the process
+_global_memory_budget: MemoryBudget | None = None
+
+
+def get_memory_budget() -> MemoryBudget:
+    """Get the process-wide memory budget instance."""
+    global _global_memory_budget
+    if _global_memory_budget is None:
+        _global_memory_budget = MemoryBudget()
+    return _global_memory_budget
@@ -0,0 +1,305 @@
+"""Process-wide registry sharing loaded models between components."""
+
+import logging
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any
+
+from deep_brief.core.memory_budget import MemoryBudget, get_memory_budget
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class ModelKey:
+    """What makes two loaded models interchangeable."""
+
+    name: str  # Model name, such as "whisper-base"
+    device: str
+    dtype: str = "float32"
+
+    def __str__(self) -> str:
+        """Key of the model in the memory budget."""
+        return f"{self.name}:{self.device}:{self.dtype}"
+
+
+class ModelHandle:
+    """
+    One component's reference to a shared model.
+
+    get() returns the model, loading it if no other handle has. The model may
+    be unloaded under memory pressure while the handle is held but not in
+    use; the handle's on_unload callback then lets the component drop its own
+    references, and the next get() loads the model again. release() the
+    handle when the component no longer needs the model.
+    """
+
+    def __init__(
+        self,
+        registry: "ModelRegistry",
+        key: ModelKey,
+        on_unload: Callable[[], None] | None,
+    ):
+        """
+        Initialize the handle; use ModelRegistry.acquire() to get one.
+
+        Args:
+            registry: Registry the model is shared through
+            key: Key of the model
+            on_unload: Called when the model is unloaded while held
+        """
+        self.key = key
+        self.released = False
+        self._registry = registry
+        self._on_unload = on_unload
+
+    def get(self) -> Any:
+        """Get the model, loading it if it is not loaded."""
+        return self._registry._get(self)
+
+    @contextmanager
+    def using(self) -> Iterator[Any]:
+        """Get the model and keep it from being unloaded while it runs."""
+        model = self.get()
+        with self._registry.budget.using(str(self.key)):
+            yield model
+
+    def release(self) -> None:
+        """Give up the reference; the model stays loaded for reuse while it fits."""
+        self._registry._release(self)
+
+
+@dataclass
+class _SharedModel:
+    """A model the registry hands out."""
+
+    size_mb: float
+    load: Callable[[], Any]
+    model: Any = None
+    loaded: bool = False
+    handles: list[ModelHandle] = field(default_factory=list)
+
+
+class ModelRegistry:
+    """
+    Loaded models shared by every component in the process.
+
+    Components acquire reference-counted handles keyed by model name, device
+    and dtype, so a second transcriber or captioner with the same settings
+    reuses the loaded model instead of loading its own copy. Loads go
+    through the memory budget, which unloads models not in use, least
+    recently used first, when memory runs short. Models no handle refers to
+    any more stay loaded for the next component that asks for them, up to
+    the idle limit; beyond it the least recently released are unloaded.
+    """
+
+    def __init__(
+        self, budget: MemoryBudget | None = None, idle_limit_mb: float | None = None
+    ):
+        """
+        Initialize the registry.
+
+        Args:
+            budget: Memory budget to load models under (the process-wide one
+                by default)
+            idle_limit_mb: Memory unreferenced models may keep loaded, or
+                None for no limit
+        """
+        self._budget = budget
+        self.idle_limit_mb = idle_limit_mb
+        self._lock = threading.Lock()
+        self._models: dict[ModelKey, _SharedModel] = {}
+        self._idle: OrderedDict[ModelKey, None] = OrderedDict()
+
+        # Statistics
+        self.loads = 0
+        self.hits = 0
+        self.unloads = 0
+
+    @property
+    def budget(self) -> MemoryBudget:
+        """Memory budget models are loaded under."""
+        return self._budget or get_memory_budget()
+
+    def set_idle_limit(self, idle_limit_mb: float | None) -> None:
+        """Change the idle limit, unloading idle models over the new one."""
+        with self._lock:
+            self.idle_limit_mb = idle_limit_mb
+            victims = self._idle_over_limit()
+        self._unload_idle(victims)
+
+    def acquire(
+        self,
+        key: ModelKey,
+        size_mb: float,
+        load: Callable[[], Any],
+        on_unload: Callable[[], None] | None = None,
+    ) -> ModelHandle:
+        """
+        Get a handle to a shared model; the model loads on the first get().
+
+        Args:
+            key: Key of the model
+            size_mb: Estimated resident size of the model
+            load: Loads the model and returns it, if no handle has loaded it
+            on_unload: Called when the model is unloaded while the handle is held
+
+        Returns:
+            Handle to the model
+        """
+        handle = ModelHandle(self, key, on_unload)
+        with self._lock:
+            shared = self._models.get(key)
+            if shared is None:
+                shared = self._models[key] = _SharedModel(size_mb, load)
+            shared.handles.append(handle)
+            self._idle.pop(key, None)
+        return handle
+
+    def _get(self, handle: ModelHandle) -> Any:
+        """Get the model of a handle, loading it under the budget if needed."""
+        if handle.released:
+            raise RuntimeError(f"Model handle for {handle.key} was released")
+
+        key = handle.key
+        with self._lock:
+            shared = self._models[key]
+            loaded = shared.loaded
+            if loaded:
+                self.hits += 1
+                model = shared.model
+        if loaded:
+            self.budget.touch(str(key))
+            return model
+
+        return self.budget.load_model(
+            str(key),
+            shared.size_mb,
+            lambda: self._load(key, shared),
+            lambda: self._unload(key),
+        )
+
+    def _load(self, key: ModelKey, shared: _SharedModel) -> Any:
+        """Load a model; the budget runs one load at a time."""
+        with self._lock:
+            # Another handle may have loaded it while this one waited
+            if shared.loaded:
+                self.hits += 1
+                return shared.model
+
+        logger.info(f"Loading shared model {key}")
+        model = shared.load()
+        with self._lock:
+            shared.model = model
+            shared.loaded = True
+            self.loads += 1
+        return model
+
+    def _release(self, handle: ModelHandle) -> None:
+        """Drop a handle; unreferenced models become idle."""
+        key = handle.key
+        with self._lock:
+            if handle.released:
+                return
+            handle.released = True
+            shared = self._models[key]
+            shared.handles.remove(handle)
+            if shared.handles:
+                return
+            if not shared.loaded:
+                del self._models[key]
+                return
+            self._idle[key] = None
+            victims = self._idle_over_limit()
+
+        if key not in victims:
+            # Models nobody holds are the first to go under memory pressure
+            self.budget.demote(str(key))
+        self._unload_idle(victims)
+
+    def _idle_over_limit(self) -> list[ModelKey]:
+        """Pick idle models to unload, oldest first; call with the lock held."""
+        if self.idle_limit_mb is None:
+            return []
+        idle_mb = sum(self._models[key].size_mb for key in self._idle)
+        victims = []
+        for key in self._idle:
+            if idle_mb <= self.idle_limit_mb:
+                break
+            victims.append(key)
+            idle_mb -= self._models[key].size_mb
+        return victims
+
+    def _unload_idle(self, keys: list[ModelKey]) -> None:
+        """Unload idle models and stop accounting for them in the budget."""
+        for key in keys:
+            self.budget.release_model(str(key))
+            self._unload(key)
+
+    def _unload(self, key: ModelKey) -> None:
+        """Drop a loaded model and tell the handles still holding it."""
+        with self._lock:
+            shared = self._models.get(key)
+            if shared is None or not shared.loaded:
+                return
+            shared.model = None
+            shared.loaded = False
+            self.unloads += 1
+            self._idle.pop(key, None)
+            handles = list(shared.handles)
+            if not handles:
+                del self._models[key]
+
+        logger.info(f"Unloaded shared model {key}")
+        for handle in handles:
+            if handle._on_unload is not None:
+                try:
+                    handle._on_unload()
+                except Exception as e:
+                    logger.warning(f"Model unload callback failed for {key}: {e}")
+
+    def clear(self) -> None:
+        """Unload every model and reset the statistics."""
+        with self._lock:
+            keys = [key for key, shared in self._models.items() if shared.loaded]
+        self._unload_idle(keys)
+        with self._lock:
+            self._models.clear()
+            self._idle.clear()
+            self.loads = 0
+            self.hits = 0
+            self.unloads = 0
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get model registry statistics."""
+        with self._lock:
+            requests = self.loads + self.hits
+            return {
+                "loads": self.loads,
+                "hits": self.hits,
+                "hit_rate": self.hits / requests if requests else 0.0,
+                "unloads": self.unloads,
+                "loaded_models": {
+                    str(key): len(shared.handles)
+                    for key, shared in self._models.items()
+                    if shared.loaded
+                },
+                "idle_models": [str(key) for key in self._idle],
+                "idle_mb": sum(self._models[key].size_mb for key in self._idle),
+                "idle_limit_mb": self.idle_limit_mb,
+            }
+
+
+# Global model registry shared by all components in the process
+_global_model_registry: ModelRegistry | None = None
+
+
+def get_model_registry() -> ModelRegistry:
+    """Get the process-wide model registry instance."""
+    global _global_model_registry
+    if _global_model_registry is None:
+        _global_model_registry = ModelRegistry()
+    return _global_model_registry
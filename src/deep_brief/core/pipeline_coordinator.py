@@ -1,34 +1,82 @@
 """Pipeline coordinator for orchestrating complete video analysis workflows."""
 
+import asyncio
+import copy
+import dataclasses
+import json
 import logging
+import os
+import pickle
+import threading
+import time
 import uuid
+from collections.abc import Callable, Iterator
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from functools import partial
 from pathlib import Path
 from typing import Any
 
+from deep_brief.core.artifact_cache import ArtifactCache
 from deep_brief.core.audio_extractor import AudioExtractor, AudioInfo
+from deep_brief.core.batch_manifest import BatchManifest
+from deep_brief.core.cancellation import CancellationToken
 from deep_brief.core.exceptions import (
     AudioProcessingError,
     ErrorCode,
+    OperationCancelledError,
     VideoProcessingError,
     get_user_friendly_message,
 )
+from deep_brief.core.fused_pass import extract_audio_and_detect_scenes
+from deep_brief.core.memory_budget import (
+    CAPTION_MODEL_MEMORY_MB,
+    DEFAULT_MODEL_MEMORY_MB,
+    EASYOCR_MODEL_MEMORY_MB,
+    WHISPER_MODEL_MEMORY_MB,
+    get_memory_budget,
+)
+from deep_brief.core.model_registry import get_model_registry
+from deep_brief.core.probe_cache import get_probe_cache, probe_media
 from deep_brief.core.progress_tracker import (
     CompositeProgressTracker,
     ProgressTracker,
 )
+from deep_brief.core.result_cache import ResultCache, fingerprint_file
 from deep_brief.core.scene_detector import SceneDetectionResult, SceneDetector
+from deep_brief.core.stage_scheduler import (
+    RESOURCE_CPU,
+    RESOURCE_FFMPEG,
+    RESOURCE_MODEL_MEMORY,
+    Stage,
+    StageCachePolicy,
+    StageGraph,
+    StageResult,
+    StageRun,
+    StageRunCancelledError,
+    StageScheduler,
+    stage_cache_key,
+)
 from deep_brief.core.video_processor import FrameInfo, VideoInfo, VideoProcessor
-from deep_brief.utils.config import get_config
+from deep_brief.core.windowed import (
+    WindowedScenes,
+    WindowedTranscript,
+    WindowOutputs,
+    plan_windows,
+)
+from deep_brief.utils.config import DeepBriefConfig, get_config
 
 logger = logging.getLogger(__name__)
 
+# Detected languages below this confidence are left for Whisper to re-detect
+MIN_LANGUAGE_CONFIDENCE = 0.5
+
 
 class VideoAnalysisResult:
     """Complete video analysis result containing all processing outputs."""
 
     def __init__(
         self,
-        video_info: VideoInfo,
+        video_info: VideoInfo | None,
         audio_info: AudioInfo | None = None,
         scene_result: SceneDetectionResult | None = None,
         frame_infos: list[FrameInfo] | None = None,
@@ -57,6 +105,40 @@ class VideoAnalysisResult:
         self.error_message = error_message
         self.errors: list[VideoProcessingError] = []  # Detailed error information
 
+        # Outputs of the optional analysis stages
+        self.transcription: Any = None  # TranscriptionResult
+        self.speech_analysis: Any = None  # SpeechAnalysisResult
+        self.visual_analysis: Any = None  # VisualAnalysisResult
+        self.report: dict[str, Any] | None = None
+        self.stage_results: dict[str, StageResult] = {}
+        self.from_cache = False  # Returned from the result cache without re-running
+
+    def detached(self) -> "VideoAnalysisResult":
+        """
+        Get a copy of the result that is safe to pickle and store.
+
+        In-memory audio samples are dropped, and stage errors that cannot be
+        pickled are replaced by their text. The result itself is unchanged.
+
+        Returns:
+            Shallow copy of the result
+        """
+        result = copy.copy(self)
+        if self.audio_info is not None and self.audio_info.samples is not None:
+            result.audio_info = self.audio_info.model_copy(update={"samples": None})
+
+        result.stage_results = {}
+        for name, stage_result in self.stage_results.items():
+            error = stage_result.error
+            if error is not None:
+                try:
+                    pickle.loads(pickle.dumps(error))
+                except Exception:
+                    error = RuntimeError(f"{type(error).__name__}: {error}")
+            result.stage_results[name] = dataclasses.replace(stage_result, error=error)
+
+        return result
+
     def add_error(self, error: VideoProcessingError) -> None:
         """Add an error to the result."""
         self.errors.append(error)
@@ -139,6 +221,24 @@ class VideoAnalysisResult:
                 }
                 for frame in self.frame_infos
             ],
+            "transcription": self.transcription.to_dict()
+            if self.transcription
+            else None,
+            "speech_analysis": self.speech_analysis.to_dict()
+            if self.speech_analysis
+            else None,
+            "visual_analysis": self.visual_analysis.to_dict()
+            if self.visual_analysis
+            else None,
+            "stages": {
+                name: {
+                    "status": stage_result.status.value,
+                    "duration": stage_result.duration,
+                    "skipped_reason": stage_result.skipped_reason,
+                    "from_cache": stage_result.from_cache,
+                }
+                for name, stage_result in self.stage_results.items()
+            },
             "processing_time": self.processing_time,
             "success": self.success,
             "error_message": self.error_message,
@@ -146,6 +246,97 @@ class VideoAnalysisResult:
         }
 
 
+@dataclasses.dataclass
+class _Analysis:
+    """A prepared analysis run: its stage graph, result and progress workflow."""
+
+    video_path: Path
+    workflow_id: str
+    result: VideoAnalysisResult
+    graph: StageGraph
+    composite_tracker: CompositeProgressTracker | None
+    cache_key: str | None  # Result cache key, if the result is to be stored
+    cancel_token: CancellationToken
+
+
+# Configuration fields changing a transcript
+TRANSCRIBE_CACHE_FIELDS = (
+    "transcription.model",
+    "transcription.device",
+    "transcription.quantize",
+    "transcription.language",
+    "transcription.temperature",
+    "transcription.word_timestamps",
+    # Chunking changes where segments are cut
+    "transcription.parallel_workers",
+    "transcription.chunk_seconds",
+    "transcription.min_silence_seconds",
+    # Voice activity decides what is transcribed
+    "transcription.skip_silence",
+    "transcription.min_skipped_silence_seconds",
+    "transcription.speech_pad_seconds",
+    "transcription.segment_context_seconds",
+)
+
+# _WindowedRun fields the windows build up, saved with each window's outputs
+WINDOWED_STATE_FIELDS = (
+    "scenes",
+    "transcript",
+    "audio_available",
+    "audio_chunks",
+    "frame_infos",
+    "scene_analyses",
+    "visual_stats",
+    "visual_time",
+    "windows_done",
+)
+
+
+@dataclasses.dataclass
+class _WindowedRun:
+    """State shared by the window stages of one windowed analysis."""
+
+    result: VideoAnalysisResult
+    window_count: int
+    output_dir: Path | None
+    extract_audio: bool
+    detect_scenes: bool
+    extract_frames: bool
+    transcribe: bool
+    analyze_frames: bool
+    scenes: WindowedScenes
+    transcript: WindowedTranscript = dataclasses.field(
+        default_factory=WindowedTranscript
+    )
+    audio_available: bool | None = None  # Not known until the first window
+    audio_chunks: list[AudioInfo] = dataclasses.field(default_factory=list)
+    frame_infos: list[FrameInfo] = dataclasses.field(default_factory=list)
+    scene_analyses: list[Any] = dataclasses.field(default_factory=list)
+    visual_stats: Any = None  # VisualAnalysisStats over all windows
+    visual_time: float = 0.0
+    windows_done: int = 0  # Windows folded into the state so far
+
+    def save_state(self) -> dict[str, Any]:
+        """
+        Get the state built up by the windows so far, with the result's errors.
+
+        The state is not copied: the stage cache stores a window's outputs
+        before the next window changes it.
+        """
+        return {
+            **{name: getattr(self, name) for name in WINDOWED_STATE_FIELDS},
+            "errors": self.result.errors,
+            "error_message": self.result.error_message,
+        }
+
+    def restore_state(self, state: dict[str, Any]) -> None:
+        """Continue from the state saved with a window loaded from the cache."""
+        for name in WINDOWED_STATE_FIELDS:
+            setattr(self, name, state[name])
+        self.result.errors = state["errors"]
+        self.result.error_message = state["error_message"]
+
+
 class PipelineCoordinator:
     """Coordinates the complete video analysis pipeline with progress tracking."""
 
@@ -167,6 +358,39 @@ class PipelineCoordinator:
         self.audio_extractor = AudioExtractor(self.config)
         self.scene_detector = SceneDetector(self.config)
 
+        # Reuse complete results for videos analyzed before with the same settings
+        self.result_cache: ResultCache | None = None
+        processing = self.config.processing
+        if processing.result_cache:
+            cache_dir = processing.result_cache_dir
+            if cache_dir is None:
+                cache_dir = Path(processing.temp_dir) / "result_cache"
+            self.result_cache = ResultCache(cache_dir, processing.result_cache_max_mb)
+
+        # Reuse individual stage outputs when only some settings changed
+        self.stage_cache: ArtifactCache | None = None
+        if processing.stage_cache:
+            cache_dir = processing.stage_cache_dir
+            if cache_dir is None:
+                cache_dir = Path(processing.temp_dir) / "stage_cache"
+            self.stage_cache = ArtifactCache(cache_dir, processing.stage_cache_max_mb)
+
+        # Analysis components are created on first use by the stages needing them
+        self._components_lock = threading.Lock()
+        self._transcriber: Any = None
+        self._speech_analyzer: Any = None
+        self._frame_extractor: Any = None
+
+        # Models and decoded frames in this process share one memory budget
+        if processing.memory_budget_mb is not None:
+            get_memory_budget().set_limit(processing.memory_budget_mb)
+        get_model_registry().set_idle_limit(processing.idle_model_cache_mb)
+
+        # Share probe results with earlier runs when a cache file is configured
+        probe_cache_file = self.config.processing.probe_cache_file
+        if probe_cache_file is not None:
+            get_probe_cache().set_cache_file(Path(probe_cache_file))
+
         logger.info("PipelineCoordinator initialized")
 
     def analyze_video(
@@ -176,232 +400,1853 @@ class PipelineCoordinator:
         detect_scenes: bool = True,
         extract_frames: bool = True,
         output_dir: Path | str | None = None,
+        transcribe: bool = False,
+        analyze_speech: bool = False,
+        analyze_frames: bool = False,
+        generate_report: bool = False,
+        use_cache: bool = True,
+        cancel_token: CancellationToken | None = None,
+        on_stage_finished: Callable[[StageResult], None] | None = None,
     ) -> VideoAnalysisResult:
         """
         Perform complete video analysis with progress tracking.
 
+        The requested work is turned into a stage graph (see
+        build_stage_graph) and run by a StageScheduler, which starts each
+        stage as soon as its inputs are ready, within the configured ffmpeg
+        process and model memory limits. With processing.windowed_processing
+        enabled, videos longer than processing.window_seconds or larger than
+        processing.max_video_size_mb are analyzed in fixed time windows
+        instead (see build_windowed_stage_graph), keeping memory bounded.
+
         Args:
             video_path: Path to video file
             extract_audio: Whether to extract audio
             detect_scenes: Whether to detect scenes
             extract_frames: Whether to extract frames
             output_dir: Optional output directory for extracted files
+            transcribe: Whether to transcribe the audio (implies extract_audio)
+            analyze_speech: Whether to compute per-scene speech metrics
+                (implies transcribe and detect_scenes)
+            analyze_frames: Whether to assess frame quality and run the enabled
+                captioning, OCR and object detection (implies detect_scenes)
+            generate_report: Whether to assemble a combined report, written
+                as JSON to output_dir when one is given
+            use_cache: Whether to look up and store the result in the result
+                cache and stage outputs in the stage cache (when enabled in
+                the processing settings)
+            cancel_token: Optional token that cancels the analysis. Cancelling
+                the analysis's workflow with ProgressTracker.cancel_operation
+                has the same effect. A cancelled analysis kills its ffmpeg
+                processes, removes the files it extracted and returns a
+                failed result with error code OPERATION_CANCELLED.
+            on_stage_finished: Optional callback receiving the StageResult of
+                each stage as it completes or fails (not called for results
+                from the result cache)
 
         Returns:
             VideoAnalysisResult with all analysis outputs
         """
         video_path = Path(video_path)
-        workflow_id = f"video_analysis_{uuid.uuid4().hex[:8]}"
+        analysis = self._start_analysis(
+            video_path,
+            {
+                "extract_audio": extract_audio,
+                "detect_scenes": detect_scenes,
+                "extract_frames": extract_frames,
+                "output_dir": output_dir,
+                "transcribe": transcribe,
+                "analyze_speech": analyze_speech,
+                "analyze_frames": analyze_frames,
+                "generate_report": generate_report,
+            },
+            use_cache,
+            cancel_token,
+        )
+        if isinstance(analysis, VideoAnalysisResult):
+            return analysis  # From the result cache
 
-        # Set up progress tracking
-        composite_tracker = None
-        if self.progress_tracker:
-            composite_tracker = CompositeProgressTracker(self.progress_tracker)
+        try:
+            logger.info(f"Starting video analysis: {video_path}")
+
+            stage_run = self.create_stage_scheduler(
+                analysis.graph, use_cache=use_cache
+            ).run(
+                {"video_path": video_path},
+                analysis.composite_tracker,
+                artifact_keys=self._video_artifact_keys(video_path),
+                cancel_token=analysis.cancel_token,
+                on_stage_finished=on_stage_finished,
+            )
+            return self._complete_analysis(analysis, stage_run)
+
+        except Exception as e:
+            return self._fail_analysis(analysis, e)
+
+    async def analyze_video_async(
+        self,
+        video_path: Path | str,
+        extract_audio: bool = True,
+        detect_scenes: bool = True,
+        extract_frames: bool = True,
+        output_dir: Path | str | None = None,
+        transcribe: bool = False,
+        analyze_speech: bool = False,
+        analyze_frames: bool = False,
+        generate_report: bool = False,
+        use_cache: bool = True,
+        cancel_token: CancellationToken | None = None,
+        on_stage_finished: Callable[[StageResult], None] | None = None,
+    ) -> VideoAnalysisResult:
+        """
+        Perform complete video analysis without blocking the event loop.
+
+        Runs the same stage graph as analyze_video with
+        StageScheduler.run_async: audio extraction, scene detection and frame
+        extraction start ffmpeg through asyncio and read its progress as it
+        arrives, while validation, model inference, CPU-bound analysis and
+        cache access run on the loop's default executor (size it with
+        ``loop.set_default_executor``). Many videos can be analyzed
+        concurrently from one loop; see analyze_video_batch_async.
+
+        Cancelling the returned coroutine cancels the running stages and
+        kills their ffmpeg processes; cancelling through ``cancel_token``
+        also returns a failed result, as with analyze_video.
+
+        Args:
+            video_path: Path to video file
+            extract_audio: Whether to extract audio
+            detect_scenes: Whether to detect scenes
+            extract_frames: Whether to extract frames
+            output_dir: Optional output directory for extracted files
+            transcribe: Whether to transcribe the audio (implies extract_audio)
+            analyze_speech: Whether to compute per-scene speech metrics
+            analyze_frames: Whether to run frame quality and content analysis
+            generate_report: Whether to assemble a combined report
+            use_cache: Whether to use the result and stage caches
+            cancel_token: Optional token that cancels the analysis
+            on_stage_finished: Optional callback receiving the StageResult of
+                each stage as it completes or fails
+
+        Returns:
+            VideoAnalysisResult with all analysis outputs
+        """
+        video_path = Path(video_path)
+        analysis = await asyncio.to_thread(
+            self._start_analysis,
+            video_path,
+            {
+                "extract_audio": extract_audio,
+                "detect_scenes": detect_scenes,
+                "extract_frames": extract_frames,
+                "output_dir": output_dir,
+                "transcribe": transcribe,
+                "analyze_speech": analyze_speech,
+                "analyze_frames": analyze_frames,
+                "generate_report": generate_report,
+            },
+            use_cache,
+            cancel_token,
+        )
+        if isinstance(analysis, VideoAnalysisResult):
+            return analysis  # From the result cache
+
+        try:
+            logger.info(f"Starting video analysis: {video_path}")
+
+            artifact_keys = await asyncio.to_thread(
+                self._video_artifact_keys, video_path
+            )
+            stage_run = await self.create_stage_scheduler(
+                analysis.graph, use_cache=use_cache
+            ).run_async(
+                {"video_path": video_path},
+                analysis.composite_tracker,
+                artifact_keys=artifact_keys,
+                cancel_token=analysis.cancel_token,
+                on_stage_finished=on_stage_finished,
+            )
+            return await asyncio.to_thread(
+                self._complete_analysis, analysis, stage_run
+            )
 
-            # Define workflow operations with weights
-            operations = [("validate", "Validating video file", 0.05)]
+        except Exception as e:
+            return self._fail_analysis(analysis, e)
 
-            if extract_audio:
-                operations.append(("audio", "Extracting audio", 0.25))
+    async def analyze_video_batch_async(
+        self,
+        video_paths: list[Path | str],
+        max_concurrent: int | None = None,
+        **options: Any,
+    ) -> list[VideoAnalysisResult]:
+        """
+        Analyze multiple videos concurrently on the running event loop.
 
-            if detect_scenes:
-                operations.append(("scenes", "Detecting scenes", 0.35))
+        Args:
+            video_paths: List of paths to video files
+            max_concurrent: Videos analyzed at once (defaults to
+                processing.max_concurrent_videos)
+            **options: analyze_video_async arguments used for every video
+
+        Returns:
+            List of VideoAnalysisResult objects, in the order of video_paths
+        """
+        if max_concurrent is None:
+            max_concurrent = self.config.processing.max_concurrent_videos
+        semaphore = asyncio.Semaphore(max(max_concurrent, 1))
+
+        async def analyze(video_path: Path | str) -> VideoAnalysisResult:
+            async with semaphore:
+                return await self.analyze_video_async(video_path, **options)
 
-            if extract_frames and detect_scenes:
-                operations.append(("frames", "Extracting frames", 0.35))
+        logger.info(
+            f"Analyzing {len(video_paths)} videos, up to {max_concurrent} at once"
+        )
+        return list(await asyncio.gather(*(analyze(path) for path in video_paths)))
+
+    def _start_analysis(
+        self,
+        video_path: Path,
+        options: dict[str, Any],
+        use_cache: bool,
+        cancel_token: CancellationToken | None = None,
+    ) -> "VideoAnalysisResult | _Analysis":
+        """
+        Look up a cached result, or build the stage graph and progress workflow.
+
+        Args:
+            video_path: Path to the video file
+            options: analyze_video options other than use_cache
+            use_cache: Whether to use the result and stage caches
+            cancel_token: Token cancelling the analysis (created if not given,
+                so the workflow can always be cancelled from the tracker)
+
+        Returns:
+            The cached VideoAnalysisResult, or the analysis to run
+        """
+        workflow_id = f"video_analysis_{uuid.uuid4().hex[:8]}"
+
+        # An unchanged video analyzed with the same settings needs no stages
+        cache_key = None
+        if use_cache and self.result_cache is not None:
+            output_dir = options["output_dir"]
+            cache_key, cached = self._lookup_cached_result(
+                video_path,
+                {**options, "output_dir": str(output_dir) if output_dir else None},
+            )
+            if cached is not None:
+                if self.progress_tracker:
+                    self.progress_tracker.start_operation(
+                        operation_id=workflow_id,
+                        operation_name=f"Analyzing {video_path.name}",
+                        details={"cached": True},
+                    )
+                    self.progress_tracker.complete_operation(
+                        operation_id=workflow_id, details={"cached": True}
+                    )
+                return cached
+
+        result = VideoAnalysisResult(video_info=None)
+        windows = self._plan_video_windows(video_path)
+        if windows:
+            logger.info(f"Analyzing {video_path.name} in {len(windows)} windows")
+            graph = self.build_windowed_stage_graph(result, windows, **options)
+        else:
+            graph = self.build_stage_graph(result, **options, use_cache=use_cache)
+        if cancel_token is None:
+            cancel_token = CancellationToken()
+
+        # Set up progress tracking with one operation per stage
+        composite_tracker = None
+        if self.progress_tracker:
+            composite_tracker = CompositeProgressTracker(self.progress_tracker)
 
             # Normalize weights
-            total_weight = sum(weight for _, _, weight in operations)
+            total_weight = sum(stage.weight for stage in graph.stages)
             operations = [
-                (op_id, name, weight / total_weight)
-                for op_id, name, weight in operations
+                (stage.name, stage.description, stage.weight / total_weight)
+                for stage in graph.stages
             ]
 
             composite_tracker.start_workflow(
                 workflow_id=workflow_id,
                 workflow_name=f"Analyzing {video_path.name}",
                 operations=operations,
+                cancel_token=cancel_token,
             )
 
+        return _Analysis(
+            video_path=video_path,
+            workflow_id=workflow_id,
+            result=result,
+            graph=graph,
+            composite_tracker=composite_tracker,
+            cache_key=cache_key,
+            cancel_token=cancel_token,
+        )
+
+    def _plan_video_windows(self, video_path: Path) -> list[tuple[float, float]] | None:
+        """
+        Plan the windows of a video that should be analyzed in windowed mode.
+
+        Args:
+            video_path: Path to the video file
+
+        Returns:
+            (start, end) times of the windows, or None to analyze the video
+            as a whole: windowed processing is off, the video fits in one
+            window and the size limit, or it fails validation (which the
+            validate stage then reports)
+        """
+        processing = self.config.processing
+        if not processing.windowed_processing:
+            return None
+
         try:
-            # Step 1: Validate video file
-            progress_callback = (
-                composite_tracker.start_next_operation() if composite_tracker else None
+            video_info = self.video_processor.validate_file(video_path)
+        except VideoProcessingError:
+            return None
+
+        windows = plan_windows(video_info.duration, processing.window_seconds)
+        if len(windows) == 1 and video_info.size_mb <= processing.max_video_size_mb:
+            return None
+        return windows
+
+    def _complete_analysis(
+        self, analysis: "_Analysis", stage_run: StageRun
+    ) -> VideoAnalysisResult:
+        """Fill in the result from a finished stage run and cache it."""
+        result = analysis.result
+        artifacts = stage_run.artifacts
+
+        result.audio_info = artifacts.get("audio_info")
+        result.scene_result = artifacts.get("scene_result")
+        result.frame_infos = artifacts.get("frame_infos") or []
+        result.transcription = artifacts.get("transcription")
+        result.speech_analysis = artifacts.get("speech_analysis")
+        result.visual_analysis = artifacts.get("visual_analysis")
+        result.report = artifacts.get("report")
+        result.stage_results = stage_run.results
+        result.processing_time = stage_run.processing_time
+        logger.debug(f"Shared models: {get_model_registry().get_stats()}")
+
+        # Optional stages record their failures instead of aborting
+        for stage_result in stage_run.failed_stages():
+            result.add_error(
+                self._stage_error(
+                    stage_result.name, stage_result.error, analysis.video_path
+                )
             )
-            logger.info(f"Starting video analysis: {video_path}")
 
-            if progress_callback:
-                progress_callback(0.5)
+        # Mark workflow as complete
+        if analysis.composite_tracker:
+            # Final progress update
+            self.progress_tracker.update_progress(
+                operation_id=analysis.workflow_id,
+                progress=1.0,
+                current_step="Analysis complete",
+            )
+            self.progress_tracker.complete_operation(
+                operation_id=analysis.workflow_id,
+                details={
+                    "total_scenes": result.scene_result.total_scenes
+                    if result.scene_result
+                    else 0,
+                    "total_frames": len(result.frame_infos),
+                    "has_audio": result.audio_info is not None,
+                    "video_duration": result.video_info.duration,
+                },
+            )
 
-            video_info = self.video_processor.validate_file(video_path)
+        # Results with recorded errors are retried next time instead
+        if analysis.cache_key is not None and not result.errors:
+            self.result_cache.put(analysis.cache_key, result.detached())
 
-            if progress_callback:
-                progress_callback(1.0)
+        logger.info(f"Video analysis complete: {analysis.video_path.name}")
+        return result
+
+    def _fail_analysis(
+        self, analysis: "_Analysis", error: Exception
+    ) -> VideoAnalysisResult:
+        """Turn an error that aborted the analysis into a failed result."""
+        if analysis.cancel_token.cancelled and not isinstance(
+            error, OperationCancelledError
+        ):
+            # A stage reported the cancellation as a failure of its own
+            error = OperationCancelledError(
+                message=analysis.cancel_token.reason or "Operation cancelled",
+                file_path=analysis.video_path,
+                cause=error,
+            )
+        if isinstance(error, StageRunCancelledError):
+            self._discard_cancelled_files(analysis, error.artifacts)
 
-            if composite_tracker:
-                composite_tracker.complete_current_operation()
+        if isinstance(error, VideoProcessingError):
+            # Handle our custom video processing errors
+            error_msg = get_user_friendly_message(error)
+            logger.error(f"Video analysis failed: {error}")
+        else:
+            # Handle unexpected errors
+            error_msg = f"Unexpected error during video analysis: {str(error)}"
+            logger.error(error_msg)
 
-            logger.info(
-                f"Video validated: {video_info.duration:.1f}s, {video_info.width}x{video_info.height}"
+            # Create a generic video processing error
+            error = VideoProcessingError(
+                message=str(error), file_path=analysis.video_path, cause=error
             )
 
-            # Initialize result
-            result = VideoAnalysisResult(video_info=video_info)
+        if analysis.composite_tracker:
+            if isinstance(error, OperationCancelledError):
+                analysis.composite_tracker.cancel_workflow()
+            else:
+                analysis.composite_tracker.fail_workflow(error_msg)
+
+        result = VideoAnalysisResult(
+            video_info=analysis.result.video_info,
+            success=False,
+            error_message=error_msg,
+        )
+        result.add_error(error)
+        return result
+
+    def _discard_cancelled_files(
+        self, analysis: "_Analysis", artifacts: dict[str, Any]
+    ) -> None:
+        """Remove the audio and frame files a cancelled analysis extracted."""
+        paths: list[Path] = []
+        audio_info = artifacts.get("audio_info")
+        # In-memory audio points at the source video, which is not ours to remove
+        if audio_info is not None and audio_info.file_path != analysis.video_path:
+            paths.append(audio_info.file_path)
+        paths.extend(frame.frame_path for frame in artifacts.get("frame_infos") or [])
+        # Files of the windows a windowed analysis finished before the cancel
+        for artifact in artifacts.values():
+            if isinstance(artifact, WindowOutputs):
+                paths.extend(artifact.files)
+
+        self._remove_files(set(paths), "cancelled analysis")
+
+    @staticmethod
+    def _remove_files(paths: Any, reason: str) -> None:
+        """Remove files an analysis extracted, logging what could not be removed."""
+        removed = 0
+        for path in paths:
+            try:
+                path.unlink(missing_ok=True)
+                removed += 1
+            except OSError as e:
+                logger.warning(f"Could not remove {reason} file {path}: {e}")
+        if removed:
+            logger.info(f"Removed {removed} files of {reason}")
+
+    def _lookup_cached_result(
+        self, video_path: Path, options: dict[str, Any]
+    ) -> tuple[str | None, VideoAnalysisResult | None]:
+        """
+        Look up a stored result for a video.
 
-            # Step 2: Extract audio (if requested)
-            audio_info = None
-            if extract_audio:
-                progress_callback = (
-                    composite_tracker.start_next_operation()
-                    if composite_tracker
-                    else None
+        Args:
+            video_path: Path to the video file
+            options: Analysis options that are part of the cache key
+
+        Returns:
+            Tuple of (cache key or None if the video cannot be read, cached result or None)
+        """
+        try:
+            cache_key = self.result_cache.make_key(video_path, self.config, options)
+        except OSError as e:
+            logger.debug(f"Not caching result for {video_path}: {e}")
+            return None, None
+
+        cached = self.result_cache.get(cache_key)
+        if cached is None:
+            return cache_key, None
+
+        source_path = cached.video_info.file_path if cached.video_info else None
+        paths = [frame.frame_path for frame in cached.frame_infos]
+        if cached.audio_info is not None:
+            if cached.audio_info.file_path == source_path:
+                # In-memory and windowed audio point at the analyzed video
+                cached.audio_info = cached.audio_info.model_copy(
+                    update={"file_path": video_path}
                 )
+            else:
+                paths.append(cached.audio_info.file_path)
 
-                try:
-                    audio_info = self.audio_extractor.extract_audio(
-                        video_info=video_info,
-                        output_path=Path(output_dir) / f"{video_path.stem}_audio.wav"
-                        if output_dir
-                        else None,
-                        progress_callback=progress_callback,
-                    )
-                    result.audio_info = audio_info
+        # Extracted audio or frames may have been removed since, and the
+        # result must not point at them
+        missing = [path for path in paths if not path.is_file()]
+        if missing:
+            logger.info(
+                f"Not using cached analysis result for {video_path.name}: "
+                f"{len(missing)} of its extracted files are missing"
+            )
+            return cache_key, None
+
+        logger.info(f"Using cached analysis result: {video_path.name}")
+        cached.from_cache = True
+        if cached.video_info is not None:
+            # The same content may have been analyzed under another name
+            cached.video_info = cached.video_info.model_copy(
+                update={"file_path": video_path}
+            )
+        return cache_key, cached
 
-                    if composite_tracker:
-                        composite_tracker.complete_current_operation()
+    def _video_artifact_keys(self, video_path: Path) -> dict[str, str]:
+        """
+        Cache key of the input video for the stage cache.
 
-                    logger.info(
-                        f"Audio extracted: {audio_info.duration:.1f}s, {audio_info.sample_rate}Hz"
-                    )
+        The key combines the file's content fingerprint with its resolved path
+        (output file names derive from it) and the package version, so any
+        code update invalidates every stage.
+        """
+        if self.stage_cache is None:
+            return {}
+        from deep_brief import __version__
 
-                except AudioProcessingError as e:
-                    # Handle specific audio processing errors
-                    if e.error_code == ErrorCode.NO_AUDIO_STREAM:
-                        # No audio stream - this is okay, continue without audio
-                        logger.warning(f"No audio stream found: {e.message}")
-                        if progress_callback:
-                            progress_callback(1.0)
-                        if composite_tracker:
-                            composite_tracker.complete_current_operation()
-                    else:
-                        # Other audio errors should be logged but not stop processing
-                        logger.error(f"Audio extraction failed: {e}")
-                        result.add_error(e)
-                        if progress_callback:
-                            progress_callback(1.0)
-                        if composite_tracker:
-                            composite_tracker.complete_current_operation()
-
-            # Step 3: Detect scenes (if requested)
-            scene_result = None
-            if detect_scenes:
-                progress_callback = (
-                    composite_tracker.start_next_operation()
-                    if composite_tracker
-                    else None
+        try:
+            fingerprint = fingerprint_file(video_path)
+        except OSError as e:
+            logger.debug(f"Not caching stage outputs for {video_path}: {e}")
+            return {}
+        return {
+            "video_path": stage_cache_key(
+                "video",
+                {},
+                {
+                    "fingerprint": fingerprint,
+                    "path": str(video_path.resolve()),
+                    "version": __version__,
+                },
+            )
+        }
+
+    def _cache_policy(
+        self,
+        config_fields: tuple[str, ...],
+        params: dict[str, Any] | None = None,
+        **kwargs: Any,
+    ) -> StageCachePolicy | None:
+        """
+        Build a stage's cache policy from the configuration fields it reads.
+
+        Args:
+            config_fields: Dotted config fields, such as "audio.sample_rate",
+                or whole sections, such as "scene_detection"
+            params: Stage parameters that also change its outputs
+            **kwargs: Other StageCachePolicy fields
+
+        Returns:
+            StageCachePolicy, or None when the stage cache is disabled
+        """
+        if self.stage_cache is None:
+            return None
+
+        settings: dict[str, Any] = dict(params or {})
+        for field_name in config_fields:
+            value: Any = self.config
+            for part in field_name.split("."):
+                value = getattr(value, part)
+            if hasattr(value, "model_dump"):
+                value = value.model_dump(mode="json")
+            settings[field_name] = value
+        return StageCachePolicy(settings=settings, **kwargs)
+
+    def build_stage_graph(
+        self,
+        result: VideoAnalysisResult,
+        extract_audio: bool = True,
+        detect_scenes: bool = True,
+        extract_frames: bool = True,
+        output_dir: Path | str | None = None,
+        transcribe: bool = False,
+        analyze_speech: bool = False,
+        analyze_frames: bool = False,
+        generate_report: bool = False,
+        use_cache: bool = True,
+    ) -> StageGraph:
+        """
+        Build the stage graph for one analysis run.
+
+        Only the stages needed for the requested outputs are added. Stages
+        whose failure should abort the analysis (validation, scenes, frames)
+        are required; the rest record their errors on the result. Audio
+        errors other than a missing audio stream are recorded by the audio
+        stage itself, as before.
+
+        With the stage cache enabled, each stage's cache policy lists the
+        settings it reads, so changing e.g. analysis.filler_words re-runs
+        only speech analysis. Captioning, OCR and object detection cache
+        their results per frame instead.
+
+        Args:
+            result: Result the validate and audio stages record on
+            extract_audio: Whether to extract audio
+            detect_scenes: Whether to detect scenes
+            extract_frames: Whether to extract frames
+            output_dir: Optional output directory for extracted files
+            transcribe: Whether to transcribe the audio
+            analyze_speech: Whether to compute per-scene speech metrics
+            analyze_frames: Whether to run frame quality and content analysis
+            generate_report: Whether to assemble a combined report
+            use_cache: Whether content analysis may reuse per-frame results
+
+        Returns:
+            StageGraph consuming the "video_path" artifact
+        """
+        output_dir = Path(output_dir) if output_dir else None
+        transcribe = transcribe or analyze_speech
+        extract_audio = extract_audio or transcribe
+        detect_scenes = detect_scenes or analyze_speech or analyze_frames
+        visual_config = self.config.visual_analysis
+
+        # Decode the input once for both audio and scene detection when
+        # possible; sharded detection decodes on its own
+        single_pass = (
+            extract_audio
+            and detect_scenes
+            and self.scene_detector.supports_single_pass()
+            and self.config.scene_detection.parallel_shards <= 1
+        )
+
+        graph = StageGraph()
+        graph.add_stage(self._make_validate_stage(result))
+
+        if extract_audio or generate_report:
+            graph.add_stage(
+                Stage(
+                    name="probe",
+                    run=self._probe_stage,
+                    inputs=("video_info",),
+                    outputs=("media_probe",),
+                    resources={RESOURCE_CPU: 1},
+                    weight=0.01,
+                    required=False,
+                    description="Probing media streams",
                 )
+            )
 
-                scene_result = self.scene_detector.detect_scenes(
-                    video_info=video_info, progress_callback=progress_callback
+        if extract_audio:
+            graph.add_stage(
+                Stage(
+                    name="audio",
+                    run=partial(
+                        self._audio_stage,
+                        result=result,
+                        output_dir=output_dir,
+                        single_pass=single_pass,
+                    ),
+                    run_async=partial(
+                        self._audio_stage_async,
+                        result=result,
+                        output_dir=output_dir,
+                        single_pass=single_pass,
+                    ),
+                    inputs=("video_info",),
+                    optional_inputs=("media_probe",),
+                    outputs=("audio_info", "audio_scenes")
+                    if single_pass
+                    else ("audio_info",),
+                    resources={RESOURCE_FFMPEG: 1},
+                    weight=0.25,
+                    description="Extracting audio",
+                    # Scenes from the shared pass are not stored; the scenes
+                    # stage is cached on its own settings
+                    cache=self._cache_policy(
+                        (
+                            "audio.sample_rate",
+                            "audio.channels",
+                            "audio.normalize_audio",
+                            "audio.noise_reduction",
+                            "audio.in_memory",
+                        ),
+                        {"output_dir": str(output_dir) if output_dir else None},
+                        key_inputs=("video_info",),
+                        stored_outputs=("audio_info",),
+                    ),
                 )
-                result.scene_result = scene_result
+            )
 
-                if composite_tracker:
-                    composite_tracker.complete_current_operation()
+        if transcribe:
+            whisper_memory = WHISPER_MODEL_MEMORY_MB.get(
+                self.config.transcription.model, DEFAULT_MODEL_MEMORY_MB
+            )
+            transcribe_inputs: tuple[str, ...] = ()
+            if self.config.transcription.language == "auto":
+                graph.add_stage(
+                    Stage(
+                        name="language",
+                        run=self._language_stage,
+                        inputs=("audio_info",),
+                        outputs=("language_detection",),
+                        resources={RESOURCE_MODEL_MEMORY: whisper_memory},
+                        weight=0.05,
+                        required=False,
+                        description="Detecting language",
+                        cache=self._cache_policy(
+                            (
+                                "transcription.model",
+                                "transcription.device",
+                                "transcription.quantize",
+                            )
+                        ),
+                    )
+                )
+                transcribe_inputs = ("language_detection",)
+            graph.add_stage(
+                Stage(
+                    name="transcribe",
+                    run=self._transcribe_stage,
+                    inputs=("audio_info",),
+                    optional_inputs=transcribe_inputs,
+                    outputs=("transcription",),
+                    resources={RESOURCE_MODEL_MEMORY: whisper_memory},
+                    weight=0.4,
+                    required=False,
+                    description="Transcribing speech",
+                    cache=self._cache_policy(TRANSCRIBE_CACHE_FIELDS),
+                )
+            )
 
-                logger.info(
-                    f"Scenes detected: {scene_result.total_scenes} scenes using {scene_result.detection_method}"
+        if detect_scenes:
+            graph.add_stage(
+                Stage(
+                    name="scenes",
+                    run=self._scenes_stage,
+                    run_async=self._scenes_stage_async,
+                    inputs=("video_info",),
+                    optional_inputs=("audio_scenes",) if single_pass else (),
+                    outputs=("scene_result",),
+                    resources={RESOURCE_FFMPEG: 1},
+                    weight=0.35,
+                    description="Detecting scenes",
+                    cache=self._cache_policy(
+                        ("scene_detection",), key_inputs=("video_info",)
+                    ),
                 )
+            )
 
-            # Step 4: Extract frames (if requested and we have scenes)
-            frame_infos = []
-            if extract_frames and scene_result and scene_result.scenes:
-                progress_callback = (
-                    composite_tracker.start_next_operation()
-                    if composite_tracker
-                    else None
+        if extract_frames and detect_scenes:
+            graph.add_stage(
+                Stage(
+                    name="frames",
+                    run=partial(
+                        self._frames_stage,
+                        output_dir=output_dir / "frames" if output_dir else None,
+                    ),
+                    run_async=partial(
+                        self._frames_stage_async,
+                        output_dir=output_dir / "frames" if output_dir else None,
+                    ),
+                    inputs=("video_info", "scene_result"),
+                    outputs=("frame_infos",),
+                    resources={RESOURCE_FFMPEG: 1},
+                    weight=0.35,
+                    description="Extracting frames",
+                    cache=self._cache_policy(
+                        ("output.frame_quality", "processing.batch_frame_extraction"),
+                        {
+                            "output_dir": str(output_dir) if output_dir else None,
+                            # Read by the frame extractor when set
+                            "max_frame_width": getattr(
+                                self.config.processing, "max_frame_width", None
+                            ),
+                        },
+                    ),
                 )
+            )
 
-                # Convert scenes to format expected by frame extraction
-                scene_tuples = [
-                    (scene.start_time, scene.end_time, scene.scene_number)
-                    for scene in scene_result.scenes
-                ]
+        if analyze_frames:
+            graph.add_stage(
+                Stage(
+                    name="quality",
+                    run=self._quality_stage,
+                    inputs=("video_info", "scene_result"),
+                    outputs=("visual_analysis", "frame_images"),
+                    resources={RESOURCE_CPU: 1},
+                    weight=0.2,
+                    required=False,
+                    description="Assessing frame quality",
+                    # Frame images are too large to store, so the cached
+                    # result is only used when no content analysis needs them
+                    cache=self._cache_policy(
+                        tuple(
+                            f"visual_analysis.{name}"
+                            for name in (
+                                "frames_per_scene",
+                                "frame_sampling_method",
+                                "sequential_max_gap_seconds",
+                                "pipe_scale_frames",
+                                "max_frame_width",
+                                "max_frame_height",
+                                "blur_threshold",
+                                "contrast_threshold",
+                                "brightness_min",
+                                "brightness_max",
+                                "blur_weight",
+                                "contrast_weight",
+                                "brightness_weight",
+                                "enable_quality_filtering",
+                                "min_quality_score",
+                            )
+                        ),
+                        stored_outputs=("visual_analysis",),
+                    ),
+                )
+            )
 
-                frame_infos = self.video_processor.extract_frames_from_scenes(
-                    video_info=video_info,
-                    scenes=scene_tuples,
-                    output_dir=Path(output_dir) / "frames" if output_dir else None,
-                    progress_callback=progress_callback,
+            caption_memory = CAPTION_MODEL_MEMORY_MB.get(
+                visual_config.captioning_model, DEFAULT_MODEL_MEMORY_MB
+            )
+            ocr_resources = (
+                {RESOURCE_MODEL_MEMORY: EASYOCR_MODEL_MEMORY_MB}
+                if visual_config.ocr_engine == "easyocr"
+                else {RESOURCE_CPU: 1}
+            )
+            content_stages = [
+                (
+                    "caption",
+                    visual_config.enable_captioning,
+                    {RESOURCE_MODEL_MEMORY: caption_memory},
+                    0.3,
+                    "Captioning frames",
+                ),
+                (
+                    "ocr",
+                    visual_config.enable_ocr,
+                    ocr_resources,
+                    0.15,
+                    "Reading text in frames",
+                ),
+                (
+                    "objects",
+                    visual_config.enable_object_detection,
+                    {RESOURCE_CPU: 1},
+                    0.1,
+                    "Detecting objects in frames",
+                ),
+            ]
+            for name, enabled, resources, weight, description in content_stages:
+                if not enabled:
+                    continue
+                graph.add_stage(
+                    Stage(
+                        name=name,
+                        run=partial(
+                            self._content_stage, analysis=name, use_cache=use_cache
+                        ),
+                        inputs=("visual_analysis", "frame_images"),
+                        outputs=(f"{name}_frames",),
+                        resources=resources,
+                        weight=weight,
+                        required=False,
+                        description=description,
+                    )
                 )
-                result.frame_infos = frame_infos
 
-                if composite_tracker:
-                    composite_tracker.complete_current_operation()
+        if analyze_speech:
+            graph.add_stage(self._make_speech_analysis_stage())
+
+        if generate_report:
+            graph.add_stage(self._make_report_stage(graph, output_dir))
+
+        return graph
+
+    def _make_validate_stage(self, result: VideoAnalysisResult) -> Stage:
+        """Stage validating the video and recording its info on the result."""
+        return Stage(
+            name="validate",
+            run=partial(self._validate_stage, result=result),
+            inputs=("video_path",),
+            outputs=("video_info",),
+            resources={RESOURCE_CPU: 1},
+            weight=0.05,
+            description="Validating video file",
+            # Always re-checked; the key carries over from the video itself
+            cache=self._cache_policy(
+                (
+                    "processing.max_video_size_mb",
+                    "processing.supported_formats",
+                ),
+                cacheable=False,
+            ),
+        )
+
+    def _make_speech_analysis_stage(self) -> Stage:
+        """Stage computing per-scene speech metrics."""
+        return Stage(
+            name="speech_analysis",
+            run=self._speech_analysis_stage,
+            inputs=("transcription", "scene_result"),
+            outputs=("speech_analysis",),
+            resources={RESOURCE_CPU: 1},
+            weight=0.05,
+            required=False,
+            description="Analyzing speech",
+            cache=self._cache_policy(
+                (
+                    "analysis.filler_words",
+                    "analysis.target_wpm_range",
+                    "analysis.confidence_threshold",
+                    "analysis.sentiment_analysis",
+                )
+            ),
+        )
+
+    def _make_report_stage(self, graph: StageGraph, output_dir: Path | None) -> Stage:
+        """Stage assembling the outputs of every stage already in the graph."""
+        report_inputs = [
+            artifact
+            for stage in graph.stages
+            for artifact in stage.outputs
+            if artifact not in ("video_info", "frame_images")
+        ]
+        return Stage(
+            name="report",
+            run=partial(self._report_stage, output_dir=output_dir),
+            inputs=("video_info",),
+            optional_inputs=tuple(report_inputs),
+            outputs=("report",),
+            resources={RESOURCE_CPU: 1},
+            weight=0.02,
+            required=False,
+            description="Generating report",
+        )
+
+    def build_windowed_stage_graph(
+        self,
+        result: VideoAnalysisResult,
+        windows: list[tuple[float, float]],
+        extract_audio: bool = True,
+        detect_scenes: bool = True,
+        extract_frames: bool = True,
+        output_dir: Path | str | None = None,
+        transcribe: bool = False,
+        analyze_speech: bool = False,
+        analyze_frames: bool = False,
+        generate_report: bool = False,
+    ) -> StageGraph:
+        """
+        Build the stage graph for analyzing a video in fixed time windows.
+
+        Each window is one stage, run after the previous one. It extracts the
+        window's audio chunk and transcribes it, detects the window's scene
+        changes, and extracts and analyzes frames of the scenes that ended in
+        it. Only compact per-window outputs outlive the stage, so memory does
+        not grow with the length of the video: the merged visual analysis
+        keeps the best frame of each scene, while its totals still count
+        every frame. A merge stage then produces the same artifacts as
+        build_stage_graph, on which speech analysis and the report run as
+        usual.
+
+        Audio chunks are written to output_dir as <stem>_audio_<n>.wav when
+        one is given; otherwise they go to the temp directory and are removed
+        once transcribed. The merged audio info describes the whole track and
+        points at the source video.
+
+        With the stage cache enabled, each window is cached under its index,
+        start and end, together with the state the windows built up so far,
+        so an interrupted analysis resumes after the last finished window.
+        Once a window records an error, it and the windows after it are not
+        cached.
 
-                logger.info(
-                    f"Frames extracted: {len(frame_infos)} frames from {len(scene_result.scenes)} scenes"
+        Args:
+            result: Result the validate and window stages record on
+            windows: (start, end) times of the windows, from plan_windows
+            extract_audio: Whether to extract audio
+            detect_scenes: Whether to detect scenes
+            extract_frames: Whether to extract frames
+            output_dir: Optional output directory for extracted files
+            transcribe: Whether to transcribe the audio
+            analyze_speech: Whether to compute per-scene speech metrics
+            analyze_frames: Whether to run frame quality and content analysis
+            generate_report: Whether to assemble a combined report
+
+        Returns:
+            StageGraph consuming the "video_path" artifact
+        """
+        output_dir = Path(output_dir) if output_dir else None
+        transcribe = transcribe or analyze_speech
+        run = _WindowedRun(
+            result=result,
+            window_count=len(windows),
+            output_dir=output_dir,
+            extract_audio=extract_audio or transcribe,
+            detect_scenes=detect_scenes or analyze_speech or analyze_frames,
+            extract_frames=extract_frames,
+            transcribe=transcribe,
+            analyze_frames=analyze_frames,
+            scenes=WindowedScenes(
+                self.config.scene_detection.min_scene_duration,
+                self.config.scene_detection.fallback_interval,
+            ),
+        )
+
+        graph = StageGraph()
+        graph.add_stage(self._make_validate_stage(result))
+
+        previous: tuple[str, ...] = ()
+        for index, (start, end) in enumerate(windows):
+            name = f"window_{index + 1}"
+            graph.add_stage(
+                Stage(
+                    name=name,
+                    run=partial(
+                        self._window_stage, index=index, start=start, end=end, run=run
+                    ),
+                    # Windows run one after another, in order
+                    inputs=("video_info", *previous),
+                    outputs=(name,),
+                    resources={RESOURCE_FFMPEG: 1},
+                    weight=0.9 / len(windows),
+                    description=f"Analyzing window {index + 1} of {len(windows)}",
+                    cache=self._cache_policy(
+                        (
+                            "audio",
+                            "scene_detection",
+                            "visual_analysis",
+                            "output.frame_quality",
+                            "processing.batch_frame_extraction",
+                            "processing.cleanup_temp_files",
+                            *TRANSCRIBE_CACHE_FIELDS,
+                        ),
+                        {
+                            "window": index,
+                            "start": start,
+                            "end": end,
+                            "window_count": len(windows),
+                            "output_dir": str(output_dir) if output_dir else None,
+                            "extract_audio": run.extract_audio,
+                            "detect_scenes": run.detect_scenes,
+                            "extract_frames": run.extract_frames,
+                            "transcribe": transcribe,
+                            "analyze_frames": analyze_frames,
+                            "max_frame_width": getattr(
+                                self.config.processing, "max_frame_width", None
+                            ),
+                        },
+                        store_if=self._window_cacheable,
+                    ),
                 )
+            )
+            previous = (name,)
+
+        outputs = [
+            artifact
+            for artifact, wanted in (
+                ("audio_info", run.extract_audio),
+                ("scene_result", run.detect_scenes),
+                ("frame_infos", run.extract_frames and run.detect_scenes),
+                ("transcription", transcribe),
+                ("visual_analysis", analyze_frames),
+            )
+            if wanted
+        ]
+        graph.add_stage(
+            Stage(
+                name="merge_windows",
+                run=partial(self._merge_windows_stage, run=run),
+                inputs=("video_info", *previous),
+                outputs=tuple(outputs),
+                resources={RESOURCE_CPU: 1},
+                weight=0.01,
+                description="Merging window results",
+                cache=self._cache_policy((), cacheable=False),
+            )
+        )
+
+        if analyze_speech:
+            graph.add_stage(self._make_speech_analysis_stage())
+
+        if generate_report:
+            graph.add_stage(self._make_report_stage(graph, output_dir))
+
+        return graph
+
+    def create_stage_scheduler(
+        self, graph: StageGraph, use_cache: bool = True
+    ) -> StageScheduler:
+        """
+        Create a scheduler for a stage graph using the configured limits.
+
+        With processing.concurrent_branches, the audio branch (audio,
+        language, transcription) runs alongside the visual branch (scenes,
+        frames, frame analysis). When audio and scenes come from one shared
+        decode, the branches overlap once that pass is done. Without it,
+        stages run one at a time in graph order.
+
+        Args:
+            graph: Stage graph to run
+            use_cache: Whether to load and store stage outputs in the stage cache
+
+        Returns:
+            StageScheduler limited by CPU count, ffmpeg processes and model
+            memory (capped by the memory budget when one is set)
+        """
+        processing = self.config.processing
+        max_model_memory = processing.max_model_memory_mb
+
+        # Under a memory budget, stages may only hold model memory the frame
+        # buffer leaves over
+        memory_budget_mb = processing.memory_budget_mb
+        if memory_budget_mb is not None:
+            max_model_memory = min(
+                max_model_memory,
+                max(memory_budget_mb - processing.frame_buffer_mb, 1),
+            )
 
-            # Mark workflow as complete
-            if composite_tracker:
-                # Final progress update
-                self.progress_tracker.update_progress(
-                    operation_id=workflow_id,
-                    progress=1.0,
-                    current_step="Analysis complete",
+        resource_limits = {
+            RESOURCE_CPU: os.cpu_count() or 1,
+            RESOURCE_FFMPEG: processing.max_ffmpeg_processes,
+            RESOURCE_MODEL_MEMORY: max_model_memory,
+        }
+
+        max_workers = None if processing.concurrent_branches else 1
+        return StageScheduler(
+            graph,
+            resource_limits,
+            max_workers=max_workers,
+            cache=self.stage_cache if use_cache else None,
+        )
+
+    def _validate_stage(
+        self,
+        inputs: dict[str, Any],
+        progress_callback: Callable[[float], None] | None,
+        result: VideoAnalysisResult,
+    ) -> dict[str, Any]:
+        """Validate the video file."""
+        if progress_callback:
+            progress_callback(0.5)
+
+        video_info = self.video_processor.validate_file(inputs["video_path"])
+        result.video_info = video_info
+
+        if progress_callback:
+            progress_callback(1.0)
+
+        logger.info(
+            f"Video validated: {video_info.duration:.1f}s, {video_info.width}x{video_info.height}"
+        )
+        return {"video_info": video_info}
+
+    def _probe_stage(
+        self,
+        inputs: dict[str, Any],
+        progress_callback: Callable[[float], None] | None,  # noqa: ARG002
+    ) -> dict[str, Any]:
+        """Read stream metadata through the shared probe cache."""
+        try:
+            media_probe = probe_media(inputs["video_info"].file_path)
+        except Exception as e:
+            # Audio extraction probes (and reports errors) on its own
+            logger.debug(f"Media probe failed: {e}")
+            media_probe = None
+        return {"media_probe": media_probe}
+
+    def _audio_stage(
+        self,
+        inputs: dict[str, Any],
+        progress_callback: Callable[[float], None] | None,
+        result: VideoAnalysisResult,
+        output_dir: Path | None,
+        single_pass: bool,
+    ) -> dict[str, Any]:
+        """
+        Extract audio, recording non-fatal audio errors on the result.
+
+        A missing audio stream is tolerated; other audio errors are recorded
+        without stopping the rest of the analysis.
+        """
+        video_info: VideoInfo = inputs["video_info"]
+        media_probe = inputs.get("media_probe")
+        output_path = (
+            output_dir / f"{video_info.file_path.stem}_audio.wav" if output_dir else None
+        )
+
+        audio_info = None
+        scene_result = None
+        try:
+            self._check_audio_stream(video_info, media_probe)
+
+            # Scenes can only come from the shared pass if the video is not sharded
+            if single_pass and self.scene_detector.supports_single_pass(video_info):
+                audio_info, scene_result = self._extract_audio_and_scenes(
+                    video_info, output_path, progress_callback
                 )
-                self.progress_tracker.complete_operation(
-                    operation_id=workflow_id,
-                    details={
-                        "total_scenes": scene_result.total_scenes
-                        if scene_result
-                        else 0,
-                        "total_frames": len(frame_infos),
-                        "has_audio": audio_info is not None,
-                        "video_duration": video_info.duration,
-                    },
+            else:
+                audio_info = self.audio_extractor.extract_audio(
+                    video_info=video_info,
+                    output_path=output_path,
+                    progress_callback=progress_callback,
                 )
 
-            logger.info(f"Video analysis complete: {video_path.name}")
-            return result
+            logger.info(
+                f"Audio extracted: {audio_info.duration:.1f}s, {audio_info.sample_rate}Hz"
+            )
 
-        except VideoProcessingError as e:
-            # Handle our custom video processing errors
-            error_msg = get_user_friendly_message(e)
-            logger.error(f"Video analysis failed: {e}")
+        except AudioProcessingError as e:
+            self._record_audio_error(e, result, progress_callback)
 
-            if composite_tracker:
-                composite_tracker.fail_workflow(error_msg)
+        return {"audio_info": audio_info, "audio_scenes": scene_result}
 
-            result = VideoAnalysisResult(
-                video_info=video_info if "video_info" in locals() else None,
-                success=False,
-                error_message=error_msg,
+    async def _audio_stage_async(
+        self,
+        inputs: dict[str, Any],
+        progress_callback: Callable[[float], None] | None,
+        result: VideoAnalysisResult,
+        output_dir: Path | None,
+        single_pass: bool,
+    ) -> dict[str, Any]:
+        """Async counterpart of _audio_stage."""
+        video_info: VideoInfo = inputs["video_info"]
+        if single_pass and self.scene_detector.supports_single_pass(video_info):
+            # The shared audio and scene pass runs on the executor
+            return await asyncio.to_thread(
+                self._audio_stage,
+                inputs,
+                progress_callback,
+                result=result,
+                output_dir=output_dir,
+                single_pass=single_pass,
             )
-            result.add_error(e)
-            return result
 
+        output_path = (
+            output_dir / f"{video_info.file_path.stem}_audio.wav" if output_dir else None
+        )
+        audio_info = None
+        try:
+            self._check_audio_stream(video_info, inputs.get("media_probe"))
+            audio_info = await self.audio_extractor.extract_audio_async(
+                video_info=video_info,
+                output_path=output_path,
+                progress_callback=progress_callback,
+            )
+            logger.info(
+                f"Audio extracted: {audio_info.duration:.1f}s, {audio_info.sample_rate}Hz"
+            )
+        except AudioProcessingError as e:
+            self._record_audio_error(e, result, progress_callback)
+
+        return {"audio_info": audio_info, "audio_scenes": None}
+
+    @staticmethod
+    def _check_audio_stream(video_info: VideoInfo, media_probe: Any) -> None:
+        """Raise NO_AUDIO_STREAM early when the probe shows no audio stream."""
+        if isinstance(media_probe, dict) and not any(
+            stream.get("codec_type") == "audio"
+            for stream in media_probe.get("streams", [])
+        ):
+            raise AudioProcessingError(
+                message="Video file contains no audio stream",
+                error_code=ErrorCode.NO_AUDIO_STREAM,
+                file_path=video_info.file_path,
+            )
+
+    @staticmethod
+    def _record_audio_error(
+        error: AudioProcessingError,
+        result: VideoAnalysisResult,
+        progress_callback: Callable[[float], None] | None,
+    ) -> None:
+        """Tolerate a missing audio stream and record other audio errors."""
+        if error.error_code == ErrorCode.NO_AUDIO_STREAM:
+            # No audio stream - this is okay, continue without audio
+            logger.warning(f"No audio stream found: {error.message}")
+        else:
+            # Other audio errors should be logged but not stop processing
+            logger.error(f"Audio extraction failed: {error}")
+            result.add_error(error)
+        if progress_callback:
+            progress_callback(1.0)
+
+    def _language_stage(
+        self,
+        inputs: dict[str, Any],
+        progress_callback: Callable[[float], None] | None,  # noqa: ARG002
+    ) -> dict[str, Any]:
+        """Detect the spoken language."""
+        detection = self._get_transcriber().detect_language(inputs["audio_info"])
+        logger.info(
+            f"Language detected: {detection.detected_language} "
+            f"(confidence {detection.confidence:.3f})"
+        )
+        return {"language_detection": detection}
+
+    def _transcribe_stage(
+        self,
+        inputs: dict[str, Any],
+        progress_callback: Callable[[float], None] | None,  # noqa: ARG002
+    ) -> dict[str, Any]:
+        """Transcribe the audio, reusing the detected language when confident."""
+        transcriber = self._get_transcriber()
+        detection = inputs.get("language_detection")
+
+        if detection is not None and detection.confidence >= MIN_LANGUAGE_CONFIDENCE:
+            transcription = transcriber.transcribe_audio(
+                inputs["audio_info"], language=detection.detected_language
+            )
+            transcription.language_detection = detection
+        else:
+            transcription = transcriber.transcribe_audio(inputs["audio_info"])
+
+        logger.info(
+            f"Transcription complete: {transcription.word_count} words, "
+            f"language {transcription.language}"
+        )
+        return {"transcription": transcription}
+
+    def _scenes_stage(
+        self,
+        inputs: dict[str, Any],
+        progress_callback: Callable[[float], None] | None,
+    ) -> dict[str, Any]:
+        """Detect scenes unless the shared audio pass already did."""
+        scene_result = inputs.get("audio_scenes")
+        if scene_result is None:
+            scene_result = self.scene_detector.detect_scenes(
+                video_info=inputs["video_info"], progress_callback=progress_callback
+            )
+        elif progress_callback:
+            # Already detected during the combined audio pass
+            progress_callback(1.0)
+
+        logger.info(
+            f"Scenes detected: {scene_result.total_scenes} scenes using {scene_result.detection_method}"
+        )
+        return {"scene_result": scene_result}
+
+    async def _scenes_stage_async(
+        self,
+        inputs: dict[str, Any],
+        progress_callback: Callable[[float], None] | None,
+    ) -> dict[str, Any]:
+        """Async counterpart of _scenes_stage."""
+        if inputs.get("audio_scenes") is not None:
+            return self._scenes_stage(inputs, progress_callback)
+
+        scene_result = await self.scene_detector.detect_scenes_async(
+            video_info=inputs["video_info"], progress_callback=progress_callback
+        )
+        logger.info(
+            f"Scenes detected: {scene_result.total_scenes} scenes using {scene_result.detection_method}"
+        )
+        return {"scene_result": scene_result}
+
+    def _frames_stage(
+        self,
+        inputs: dict[str, Any],
+        progress_callback: Callable[[float], None] | None,
+        output_dir: Path | None,
+    ) -> dict[str, Any]:
+        """Extract one frame per scene."""
+        scene_result: SceneDetectionResult = inputs["scene_result"]
+        if not scene_result.scenes:
+            if progress_callback:
+                progress_callback(1.0)
+            return {"frame_infos": []}
+
+        # Convert scenes to format expected by frame extraction
+        scene_tuples = [
+            (scene.start_time, scene.end_time, scene.scene_number)
+            for scene in scene_result.scenes
+        ]
+
+        frame_infos = self.video_processor.extract_frames_from_scenes(
+            video_info=inputs["video_info"],
+            scenes=scene_tuples,
+            output_dir=output_dir,
+            progress_callback=progress_callback,
+            batched=self.config.processing.batch_frame_extraction,
+        )
+
+        logger.info(
+            f"Frames extracted: {len(frame_infos)} frames from {len(scene_result.scenes)} scenes"
+        )
+        return {"frame_infos": frame_infos}
+
+    async def _frames_stage_async(
+        self,
+        inputs: dict[str, Any],
+        progress_callback: Callable[[float], None] | None,
+        output_dir: Path | None,
+    ) -> dict[str, Any]:
+        """Async counterpart of _frames_stage."""
+        scene_result: SceneDetectionResult = inputs["scene_result"]
+        if not scene_result.scenes:
+            if progress_callback:
+                progress_callback(1.0)
+            return {"frame_infos": []}
+
+        frame_infos = await self.video_processor.extract_frames_from_scenes_async(
+            video_info=inputs["video_info"],
+            scenes=[
+                (scene.start_time, scene.end_time, scene.scene_number)
+                for scene in scene_result.scenes
+            ],
+            output_dir=output_dir,
+            progress_callback=progress_callback,
+            batched=self.config.processing.batch_frame_extraction,
+        )
+
+        logger.info(
+            f"Frames extracted: {len(frame_infos)} frames from {len(scene_result.scenes)} scenes"
+        )
+        return {"frame_infos": frame_infos}
+
+    def _quality_stage(
+        self,
+        inputs: dict[str, Any],
+        progress_callback: Callable[[float], None] | None,
+    ) -> dict[str, Any]:
+        """Sample frames per scene and assess their quality."""
+        # Captioning, OCR and object detection run as their own stages on
+        # the images kept here
+        frame_images: dict[tuple[int, int], Any] = {}
+        total_scenes = len(inputs["scene_result"].scenes)
+
+        def on_scene(_scene_analysis: Any, stats: Any) -> None:
+            # Report progress as each scene completes rather than only at the end
+            if progress_callback:
+                progress_callback(stats.scenes_completed / total_scenes)
+
+        visual_analysis = self._get_frame_extractor().extract_frames_from_scenes(
+            inputs["video_info"].file_path,
+            inputs["scene_result"],
+            analyze_content=False,
+            frame_images=frame_images,
+            scene_callback=on_scene,
+        )
+        if progress_callback:
+            progress_callback(1.0)
+        return {"visual_analysis": visual_analysis, "frame_images": frame_images}
+
+    def _content_stage(
+        self,
+        inputs: dict[str, Any],
+        progress_callback: Callable[[float], None] | None,
+        analysis: str,
+        use_cache: bool = True,
+    ) -> dict[str, Any]:
+        """Run one kind of frame content analysis."""
+        analyzed = self._get_frame_extractor().analyze_frame_content(
+            inputs["visual_analysis"],
+            inputs["frame_images"],
+            analysis,
+            cache=self.stage_cache if use_cache else None,
+        )
+        if progress_callback:
+            progress_callback(1.0)
+        return {f"{analysis}_frames": analyzed}
+
+    def _speech_analysis_stage(
+        self,
+        inputs: dict[str, Any],
+        progress_callback: Callable[[float], None] | None,  # noqa: ARG002
+    ) -> dict[str, Any]:
+        """Compute per-scene speech metrics."""
+        with self._components_lock:
+            if self._speech_analyzer is None:
+                from deep_brief.analysis.speech_analyzer import SpeechAnalyzer
+
+                self._speech_analyzer = SpeechAnalyzer(self.config)
+
+        speech_analysis = self._speech_analyzer.analyze_speech(
+            inputs["transcription"], inputs["scene_result"]
+        )
+        return {"speech_analysis": speech_analysis}
+
+    def _report_stage(
+        self,
+        inputs: dict[str, Any],
+        progress_callback: Callable[[float], None] | None,  # noqa: ARG002
+        output_dir: Path | None,
+    ) -> dict[str, Any]:
+        """Assemble the outputs of every other stage into one report."""
+        video_info: VideoInfo = inputs["video_info"]
+        report = VideoAnalysisResult(
+            video_info=video_info,
+            audio_info=inputs.get("audio_info"),
+            scene_result=inputs.get("scene_result"),
+            frame_infos=inputs.get("frame_infos"),
+        ).to_dict()
+
+        for key in ("transcription", "speech_analysis", "visual_analysis"):
+            value = inputs.get(key)
+            report[key] = value.to_dict() if value is not None else None
+
+        media_probe = inputs.get("media_probe")
+        if media_probe is not None:
+            report["streams"] = [
+                {
+                    "codec_type": stream.get("codec_type"),
+                    "codec_name": stream.get("codec_name"),
+                }
+                for stream in media_probe.get("streams", [])
+            ]
+
+        if output_dir:
+            report_path = output_dir / f"{video_info.file_path.stem}_report.json"
+            output_dir.mkdir(parents=True, exist_ok=True)
+            with open(report_path, "w", encoding="utf-8") as f:
+                json.dump(report, f, indent=2, default=str)
+            logger.info(f"Report written: {report_path}")
+
+        return {"report": report}
+
+    def _window_stage(
+        self,
+        inputs: dict[str, Any],
+        progress_callback: Callable[[float], None] | None,
+        index: int,
+        start: float,
+        end: float,
+        run: _WindowedRun,
+    ) -> dict[str, Any]:
+        """
+        Analyze one time window and fold its outputs into the windowed run.
+
+        Transcription and frame analysis failures are recorded on the result
+        without stopping the analysis, as their stages are in the
+        whole-video graph; frame extraction failures abort it.
+        """
+        video_info: VideoInfo = inputs["video_info"]
+        previous = inputs.get(f"window_{index}")
+        if previous is not None and run.windows_done < index:
+            # The previous windows were loaded from the stage cache
+            run.restore_state(previous.state)
+        window = WindowOutputs(index=index, start_time=start, end_time=end)
+
+        try:
+            if run.extract_audio:
+                self._window_audio(video_info, window, run)
+                if progress_callback:
+                    progress_callback(0.5)
+
+            scenes = (
+                self._window_scenes(video_info, window, run)
+                if run.detect_scenes
+                else []
+            )
+            if scenes and run.extract_frames:
+                self._window_frames(video_info, window, run, scenes)
+            if scenes and run.analyze_frames:
+                self._window_visual_analysis(video_info, run, scenes)
+        except OperationCancelledError:
+            self._remove_files(window.files, "cancelled analysis")
+            raise
+
+        run.windows_done = index + 1
+        window.state = run.save_state()
+        if progress_callback:
+            progress_callback(1.0)
+        logger.info(
+            f"Window {index + 1}/{run.window_count} "
+            f"({start:.1f}s - {end:.1f}s) analyzed: {window.scenes} scenes, "
+            f"{window.frames} frames, {window.segments} transcript segments"
+        )
+        return {f"window_{index + 1}": window}
+
+    @staticmethod
+    def _window_cacheable(outputs: dict[str, Any]) -> bool:
+        """
+        Whether a window's outputs may be stored in the stage cache.
+
+        Its state carries the errors of all windows so far, so once one is
+        recorded no later window is stored, and the failed work is retried.
+        """
+        return not any(window.state["errors"] for window in outputs.values())
+
+    def _window_audio(
+        self, video_info: VideoInfo, window: WindowOutputs, run: _WindowedRun
+    ) -> None:
+        """Extract and transcribe the audio chunk of a window."""
+        if run.audio_available is None:
+            try:
+                media_probe = probe_media(video_info.file_path)
+            except Exception as e:
+                logger.debug(f"Media probe failed: {e}")
+                media_probe = None
+            try:
+                self._check_audio_stream(video_info, media_probe)
+                run.audio_available = True
+            except AudioProcessingError as e:
+                run.audio_available = False
+                self._record_audio_error(e, run.result, None)
+        if not run.audio_available:
+            return
+
+        output_path = (
+            run.output_dir
+            / f"{video_info.file_path.stem}_audio_{window.index + 1:03d}.wav"
+            if run.output_dir
+            else None
+        )
+        try:
+            audio_info = self.audio_extractor.extract_audio_segment(
+                video_info,
+                window.start_time,
+                window.end_time - window.start_time,
+                output_path,
+            )
+        except OperationCancelledError:
+            if output_path is not None:
+                window.files.append(output_path)
+            raise
         except Exception as e:
-            # Handle unexpected errors
-            error_msg = f"Unexpected error during video analysis: {str(e)}"
-            logger.error(error_msg)
+            logger.error(f"Audio extraction failed in window {window.index + 1}: {e}")
+            run.result.add_error(
+                AudioProcessingError(
+                    message=f"Audio extraction failed in window {window.index + 1}",
+                    file_path=video_info.file_path,
+                    details={"window": window.index + 1},
+                    cause=e,
+                )
+            )
+            return
+        window.files.append(audio_info.file_path)
+        run.audio_chunks.append(audio_info)
+
+        if not run.transcribe:
+            return
+        # Later windows keep the language detected in the first one
+        language = (
+            run.transcript.language
+            if self.config.transcription.language == "auto"
+            else None
+        )
+        try:
+            transcription = self._get_transcriber().transcribe_audio(
+                audio_info, language=language
+            )
+            run.transcript.add_window(transcription, window.start_time)
+            window.segments = len(transcription.segments)
+        except OperationCancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Transcription failed in window {window.index + 1}: {e}")
+            run.result.add_error(
+                self._stage_error(f"window_{window.index + 1}", e, video_info.file_path)
+            )
 
-            if composite_tracker:
-                composite_tracker.fail_workflow(error_msg)
+        # Chunks only extracted for transcription are not kept
+        if run.output_dir is None and self.config.processing.cleanup_temp_files:
+            audio_info.file_path.unlink(missing_ok=True)
+            window.files.remove(audio_info.file_path)
 
-            # Create a generic video processing error
-            generic_error = VideoProcessingError(
-                message=str(e), file_path=video_path, cause=e
+    def _window_scenes(
+        self, video_info: VideoInfo, window: WindowOutputs, run: _WindowedRun
+    ) -> list[Any]:
+        """Detect a window's scene changes and close the scenes ending in it."""
+        try:
+            scene_changes = self.scene_detector.detect_scene_changes(
+                video_info, window.start_time, window.end_time
+            )
+        except OperationCancelledError:
+            raise
+        except Exception as e:
+            logger.warning(
+                f"Scene detection failed in window {window.index + 1}: {e}, "
+                "using fallback"
+            )
+            scene_changes = []
+
+        scenes = run.scenes.add_window(
+            window.end_time,
+            scene_changes,
+            final=window.index == run.window_count - 1,
+        )
+        window.scenes = len(scenes)
+        return scenes
+
+    def _window_frames(
+        self,
+        video_info: VideoInfo,
+        window: WindowOutputs,
+        run: _WindowedRun,
+        scenes: list[Any],
+    ) -> None:
+        """Extract one frame per scene closed in a window."""
+        frame_infos = self.video_processor.extract_frames_from_scenes(
+            video_info=video_info,
+            scenes=[
+                (scene.start_time, scene.end_time, scene.scene_number)
+                for scene in scenes
+            ],
+            output_dir=run.output_dir / "frames" if run.output_dir else None,
+            batched=self.config.processing.batch_frame_extraction,
+        )
+        window.frames = len(frame_infos)
+        window.files.extend(frame.frame_path for frame in frame_infos)
+        run.frame_infos.extend(frame_infos)
+
+    def _window_visual_analysis(
+        self, video_info: VideoInfo, run: _WindowedRun, scenes: list[Any]
+    ) -> None:
+        """Assess and analyze the frames of the scenes closed in a window."""
+        extractor = self._get_frame_extractor()
+        if run.visual_stats is None:
+            from deep_brief.analysis.visual_analyzer import VisualAnalysisStats
+
+            run.visual_stats = VisualAnalysisStats()
+
+        window_scenes = SceneDetectionResult(
+            scenes=scenes,
+            total_scenes=len(scenes),
+            detection_method=self.config.scene_detection.method,
+            threshold_used=self.config.scene_detection.threshold,
+            video_duration=video_info.duration,
+            average_scene_duration=sum(scene.duration for scene in scenes)
+            / len(scenes),
+        )
+        started = time.time()
+        try:
+            for scene_analysis in extractor.iter_frames_from_scenes(
+                video_info.file_path, window_scenes, stats=run.visual_stats
+            ):
+                best_frame = scene_analysis.best_frame
+                run.scene_analyses.append(
+                    scene_analysis.model_copy(
+                        update={"frames": [best_frame] if best_frame else []}
+                    )
+                )
+        except OperationCancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Frame analysis failed: {e}")
+            run.result.add_error(
+                self._stage_error("quality", e, video_info.file_path)
+            )
+        run.visual_time += time.time() - started
+
+    def _merge_windows_stage(
+        self,
+        inputs: dict[str, Any],
+        progress_callback: Callable[[float], None] | None,
+        run: _WindowedRun,
+    ) -> dict[str, Any]:
+        """Merge the outputs of all windows into whole-video artifacts."""
+        video_info: VideoInfo = inputs["video_info"]
+        last_window = inputs[f"window_{run.window_count}"]
+        if run.windows_done < run.window_count:
+            # The last windows were loaded from the stage cache
+            run.restore_state(last_window.state)
+        scene_result = run.scenes.to_result(
+            video_info.duration,
+            self.config.scene_detection.method,
+            self.config.scene_detection.threshold,
+        )
+
+        audio_info = None
+        if run.audio_chunks:
+            # The chunks are separate files; the merged info describes the
+            # whole track and, like in-memory audio, points at the video
+            first_chunk = run.audio_chunks[0]
+            audio_info = first_chunk.model_copy(
+                update={
+                    "file_path": video_info.file_path,
+                    "duration": sum(chunk.duration for chunk in run.audio_chunks),
+                    "size_mb": sum(chunk.size_mb for chunk in run.audio_chunks),
+                }
+            )
+
+        visual_analysis = None
+        if run.visual_stats is not None:
+            visual_analysis = run.visual_stats.to_result(
+                run.scene_analyses,
+                total_scenes=scene_result.total_scenes,
+                video_duration=video_info.duration,
+                processing_time=run.visual_time,
             )
 
-            result = VideoAnalysisResult(
-                video_info=video_info if "video_info" in locals() else None,
-                success=False,
-                error_message=error_msg,
+        if progress_callback:
+            progress_callback(1.0)
+        logger.info(
+            f"Merged {run.window_count} windows: {scene_result.total_scenes} scenes, "
+            f"{len(run.frame_infos)} frames"
+        )
+        return {
+            "audio_info": audio_info,
+            "scene_result": scene_result,
+            "frame_infos": run.frame_infos,
+            "transcription": run.transcript.to_result(video_info.duration),
+            "visual_analysis": visual_analysis,
+        }
+
+    def _get_transcriber(self) -> Any:
+        """Get the shared transcriber, creating it on first use."""
+        with self._components_lock:
+            if self._transcriber is None:
+                from deep_brief.analysis.transcriber import WhisperTranscriber
+
+                self._transcriber = WhisperTranscriber(self.config)
+            return self._transcriber
+
+    def _get_frame_extractor(self) -> Any:
+        """Get the shared frame analyzer, creating it on first use."""
+        with self._components_lock:
+            if self._frame_extractor is None:
+                from deep_brief.analysis.visual_analyzer import FrameExtractor
+
+                self._frame_extractor = FrameExtractor(self.config)
+            return self._frame_extractor
+
+    @staticmethod
+    def _stage_error(
+        stage_name: str, error: Exception | None, video_path: Path
+    ) -> VideoProcessingError:
+        """Wrap an optional stage's failure for the result's error list."""
+        if isinstance(error, VideoProcessingError):
+            return error
+        return VideoProcessingError(
+            message=f"Stage '{stage_name}' failed: {error}",
+            file_path=video_path,
+            details={"stage": stage_name},
+            cause=error,
+        )
+
+    def _extract_audio_and_scenes(
+        self,
+        video_info: VideoInfo,
+        output_path: Path | None,
+        progress_callback: Any,
+    ) -> tuple[AudioInfo, SceneDetectionResult | None]:
+        """
+        Extract audio and detect scenes from a single decode of the input.
+
+        Falls back to plain audio extraction (leaving scene detection to its
+        own pass) if the combined run fails for any reason other than the
+        video having no audio.
+
+        Args:
+            video_info: Validated video information
+            output_path: Optional output path for the audio file
+            progress_callback: Optional progress callback for the audio step
+
+        Returns:
+            Tuple of (audio info, scene result or None if scenes still need detecting)
+        """
+        try:
+            return extract_audio_and_detect_scenes(
+                video_info,
+                self.audio_extractor,
+                self.scene_detector,
+                output_path=output_path,
+                progress_callback=progress_callback,
             )
-            result.add_error(generic_error)
-            return result
+        except AudioProcessingError as e:
+            if e.error_code == ErrorCode.NO_AUDIO_STREAM:
+                raise
+            logger.warning(f"Combined audio/scene pass failed, decoding separately: {e}")
+        except Exception as e:
+            logger.warning(f"Combined audio/scene pass failed, decoding separately: {e}")
+
+        audio_info = self.audio_extractor.extract_audio(
+            video_info=video_info,
+            output_path=output_path,
+            progress_callback=progress_callback,
+        )
+        return audio_info, None
 
     def analyze_video_batch(
         self,
@@ -410,78 +2255,360 @@ class PipelineCoordinator:
         detect_scenes: bool = True,
         extract_frames: bool = True,
         output_dir: Path | str | None = None,
+        max_workers: int | None = None,
+        transcribe: bool = False,
+        analyze_speech: bool = False,
+        analyze_frames: bool = False,
+        generate_report: bool = False,
+        use_cache: bool = True,
+        job_dir: Path | str | None = None,
     ) -> list[VideoAnalysisResult]:
         """
         Analyze multiple videos with progress tracking.
 
+        With a job directory, the batch is checkpointed: a manifest records
+        each finished video and its stages, and every stage's outputs are
+        stored as they complete, so resume_batch can pick up an interrupted
+        job where it stopped.
+
         Args:
             video_paths: List of paths to video files
             extract_audio: Whether to extract audio
             detect_scenes: Whether to detect scenes
             extract_frames: Whether to extract frames
             output_dir: Optional output directory for extracted files
+            max_workers: Worker processes to analyze videos on (defaults to
+                processing.batch_max_workers; 1 analyzes them in this process)
+            transcribe: Whether to transcribe the audio
+            analyze_speech: Whether to compute per-scene speech metrics
+            analyze_frames: Whether to run frame quality and content analysis
+            generate_report: Whether to assemble a combined report per video
+            use_cache: Whether to use the result cache for each video (stage
+                checkpoints of a job are only kept when True)
+            job_dir: Optional directory to checkpoint the job in
 
         Returns:
-            List of VideoAnalysisResult objects
+            List of VideoAnalysisResult objects, in the order of video_paths
+
+        Raises:
+            FileExistsError: If job_dir already holds a job
+        """
+        if job_dir is not None:
+            manifest = BatchManifest.create(
+                job_dir,
+                video_paths,
+                options={
+                    "extract_audio": extract_audio,
+                    "detect_scenes": detect_scenes,
+                    "extract_frames": extract_frames,
+                    "transcribe": transcribe,
+                    "analyze_speech": analyze_speech,
+                    "analyze_frames": analyze_frames,
+                    "generate_report": generate_report,
+                    "use_cache": use_cache,
+                },
+                output_dir=output_dir,
+                config=self.config.model_dump(mode="json")
+                if isinstance(self.config, DeepBriefConfig)
+                else None,
+            )
+            return self._run_batch_job(manifest, max_workers)
+
+        results: dict[int, VideoAnalysisResult] = {}
+        try:
+            for index, result in self.iter_video_batch(
+                video_paths,
+                extract_audio=extract_audio,
+                detect_scenes=detect_scenes,
+                extract_frames=extract_frames,
+                output_dir=output_dir,
+                max_workers=max_workers,
+                transcribe=transcribe,
+                analyze_speech=analyze_speech,
+                analyze_frames=analyze_frames,
+                generate_report=generate_report,
+                use_cache=use_cache,
+            ):
+                results[index] = result
+        except Exception:
+            # Already logged and reported by iter_video_batch
+            pass
+
+        return [results[index] for index in sorted(results)]  # Partial on failure
+
+    def resume_batch(
+        self,
+        job_dir: Path | str,
+        max_workers: int | None = None,
+        retry_failed: bool = True,
+    ) -> list[VideoAnalysisResult]:
+        """
+        Resume a checkpointed batch job started by analyze_video_batch.
+
+        Videos the manifest records as finished are not analyzed again, and
+        the stages an interrupted video had completed are loaded from their
+        checkpoints. The job runs with the options and configuration it was
+        started with.
+
+        Args:
+            job_dir: Directory the job was checkpointed in
+            max_workers: Worker processes to analyze videos on (defaults to
+                processing.batch_max_workers)
+            retry_failed: Whether to analyze videos that failed again
+
+        Returns:
+            List of VideoAnalysisResult objects for every video of the job,
+            in the order the job was started with
+
+        Raises:
+            FileNotFoundError: If job_dir holds no job
+            ValueError: If the manifest cannot be read
+        """
+        manifest = BatchManifest.load(job_dir)
+        summary = manifest.get_summary()
+        logger.info(
+            f"Resuming batch job {manifest.job_id}: {summary['completed']} of "
+            f"{summary['total_videos']} videos already completed"
+        )
+        return self._run_batch_job(manifest, max_workers, retry_failed)
+
+    def _run_batch_job(
+        self,
+        manifest: BatchManifest,
+        max_workers: int | None,
+        retry_failed: bool = True,
+    ) -> list[VideoAnalysisResult]:
+        """Analyze a job's remaining videos, recording each in its manifest."""
+        video_paths = manifest.video_paths
+        remaining = manifest.remaining_indices(retry_failed)
+        finished = set(range(len(video_paths))) - set(remaining)
+        results: dict[int, VideoAnalysisResult] = {}
+
+        for index in sorted(finished):
+            stored = manifest.load_result(index)
+            if stored is None:
+                remaining.append(index)  # Lost its result; analyze it again
+            else:
+                results[index] = stored
+        remaining.sort()
+
+        if remaining:
+            coordinator = self._job_coordinator(manifest)
+            try:
+                for position, result in coordinator.iter_video_batch(
+                    [video_paths[index] for index in remaining],
+                    output_dir=manifest.output_dir,
+                    max_workers=max_workers,
+                    stage_callbacks=[
+                        manifest.stage_recorder(index) for index in remaining
+                    ],
+                    **manifest.options,
+                ):
+                    index = remaining[position]
+                    manifest.record_result(index, result.detached())
+                    results[index] = result
+            except Exception:
+                # Already logged and reported by iter_video_batch; the
+                # manifest holds everything finished so far
+                pass
+
+        return [results[index] for index in sorted(results)]  # Partial on failure
+
+    def _job_coordinator(self, manifest: BatchManifest) -> "PipelineCoordinator":
+        """
+        Get a coordinator running a job with its recorded configuration.
+
+        Stage checkpoints need a stage cache; when the configuration has
+        none, the job keeps its own in the job directory.
+        """
+        config = self.config
+        if manifest.config is not None:
+            config = DeepBriefConfig.model_validate(manifest.config)
+
+        if not config.processing.stage_cache:
+            config = config.model_copy(deep=True)
+            config.processing.stage_cache = True
+            config.processing.stage_cache_dir = manifest.checkpoint_dir
+
+        if config == self.config:
+            return self
+        return PipelineCoordinator(config, self.progress_tracker)
+
+    def iter_video_batch(
+        self,
+        video_paths: list[Path | str],
+        extract_audio: bool = True,
+        detect_scenes: bool = True,
+        extract_frames: bool = True,
+        output_dir: Path | str | None = None,
+        max_workers: int | None = None,
+        transcribe: bool = False,
+        analyze_speech: bool = False,
+        analyze_frames: bool = False,
+        generate_report: bool = False,
+        use_cache: bool = True,
+        stage_callbacks: list[Callable[[StageResult], None]] | None = None,
+    ) -> Iterator[tuple[int, VideoAnalysisResult]]:
+        """
+        Analyze multiple videos, yielding each result as soon as it is ready.
+
+        With more than one worker, videos are analyzed on a process pool.
+        Each worker process builds its own PipelineCoordinator once, loads
+        the Whisper model and captioner up front when the requested analysis
+        needs them, and reuses all of them for every video it is handed.
+        Results then arrive in completion order rather than input order.
+
+        Args:
+            video_paths: List of paths to video files
+            extract_audio: Whether to extract audio
+            detect_scenes: Whether to detect scenes
+            extract_frames: Whether to extract frames
+            output_dir: Optional output directory for extracted files
+            max_workers: Worker processes to analyze videos on (defaults to
+                processing.batch_max_workers; 1 analyzes them in this process)
+            transcribe: Whether to transcribe the audio
+            analyze_speech: Whether to compute per-scene speech metrics
+            analyze_frames: Whether to run frame quality and content analysis
+            generate_report: Whether to assemble a combined report per video
+            use_cache: Whether to use the result cache for each video
+            stage_callbacks: Optional on_stage_finished callback of each
+                video, in the order of video_paths; they must be picklable
+                when the videos are analyzed on worker processes
+
+        Yields:
+            Tuples of (index into video_paths, VideoAnalysisResult)
         """
         batch_id = f"batch_analysis_{uuid.uuid4().hex[:8]}"
-        results = []
+        total = len(video_paths)
+        successful = 0
+
+        if max_workers is None:
+            max_workers = self.config.processing.batch_max_workers
+        max_workers = max(1, min(max_workers, total))
+
+        options = {
+            "extract_audio": extract_audio,
+            "detect_scenes": detect_scenes,
+            "extract_frames": extract_frames,
+            "transcribe": transcribe,
+            "analyze_speech": analyze_speech,
+            "analyze_frames": analyze_frames,
+            "generate_report": generate_report,
+            "use_cache": use_cache,
+        }
+
+        def video_output_dir(video_path: Path | str) -> Path | None:
+            return Path(output_dir) / Path(video_path).stem if output_dir else None
+
+        def stage_callback(index: int) -> Callable[[StageResult], None] | None:
+            return stage_callbacks[index] if stage_callbacks else None
 
         # Set up batch progress tracking
         if self.progress_tracker:
             self.progress_tracker.start_operation(
                 operation_id=batch_id,
-                operation_name=f"Analyzing {len(video_paths)} videos",
-                total_steps=len(video_paths),
-                details={"video_count": len(video_paths)},
+                operation_name=f"Analyzing {total} videos",
+                total_steps=total,
+                details={"video_count": total, "max_workers": max_workers},
             )
 
         try:
-            for i, video_path in enumerate(video_paths):
-                logger.info(
-                    f"Processing video {i + 1}/{len(video_paths)}: {video_path}"
-                )
-
-                # Update batch progress
-                if self.progress_tracker:
-                    self.progress_tracker.update_progress(
-                        operation_id=batch_id,
-                        progress=i / len(video_paths),
-                        current_step=f"Processing {Path(video_path).name}",
-                        current_step_number=i + 1,
+            if max_workers == 1:
+                for i, video_path in enumerate(video_paths):
+                    logger.info(f"Processing video {i + 1}/{total}: {video_path}")
+
+                    # Update batch progress
+                    if self.progress_tracker:
+                        self.progress_tracker.update_progress(
+                            operation_id=batch_id,
+                            progress=i / total,
+                            current_step=f"Processing {Path(video_path).name}",
+                            current_step_number=i + 1,
+                        )
+
+                    # Analyze individual video
+                    result = self.analyze_video(
+                        video_path=video_path,
+                        output_dir=video_output_dir(video_path),
+                        on_stage_finished=stage_callback(i),
+                        **options,
                     )
-
-                # Analyze individual video
-                result = self.analyze_video(
-                    video_path=video_path,
-                    extract_audio=extract_audio,
-                    detect_scenes=detect_scenes,
-                    extract_frames=extract_frames,
-                    output_dir=Path(output_dir) / Path(video_path).stem
-                    if output_dir
-                    else None,
+                    if result.success:
+                        successful += 1
+                    else:
+                        logger.error(
+                            f"Failed to analyze {video_path}: {result.error_message}"
+                        )
+                    yield i, result
+            else:
+                logger.info(f"Analyzing {total} videos on {max_workers} worker processes")
+                executor = ProcessPoolExecutor(
+                    max_workers=max_workers,
+                    initializer=_init_batch_worker,
+                    initargs=(self.config, transcribe or analyze_speech, analyze_frames),
                 )
-                results.append(result)
-
-                if not result.success:
-                    logger.error(
-                        f"Failed to analyze {video_path}: {result.error_message}"
-                    )
+                try:
+                    futures = {
+                        executor.submit(
+                            _analyze_in_batch_worker,
+                            Path(video_path),
+                            video_output_dir(video_path),
+                            options,
+                            stage_callback(i),
+                        ): i
+                        for i, video_path in enumerate(video_paths)
+                    }
+                    for completed, future in enumerate(as_completed(futures), start=1):
+                        i = futures[future]
+                        video_path = Path(video_paths[i])
+                        try:
+                            result = future.result()
+                        except Exception as e:
+                            # The worker itself failed (e.g. it was killed)
+                            error = VideoProcessingError(
+                                message=f"Batch worker failed: {e}",
+                                file_path=video_path,
+                                cause=e,
+                            )
+                            result = VideoAnalysisResult(
+                                video_info=None,
+                                success=False,
+                                error_message=get_user_friendly_message(error),
+                            )
+                            result.add_error(error)
+
+                        if result.success:
+                            successful += 1
+                        else:
+                            logger.error(
+                                f"Failed to analyze {video_path}: {result.error_message}"
+                            )
+
+                        # Progress counts finished videos, whatever order they finish in
+                        if self.progress_tracker:
+                            self.progress_tracker.update_progress(
+                                operation_id=batch_id,
+                                progress=completed / total,
+                                current_step=f"Finished {video_path.name}",
+                                current_step_number=completed,
+                                details={"completed": completed, "successful": successful},
+                            )
+                        yield i, result
+                finally:
+                    executor.shutdown(wait=True, cancel_futures=True)
 
             # Complete batch processing
             if self.progress_tracker:
-                successful_results = [r for r in results if r.success]
                 self.progress_tracker.complete_operation(
                     operation_id=batch_id,
                     details={
-                        "total_videos": len(video_paths),
-                        "successful": len(successful_results),
-                        "failed": len(video_paths) - len(successful_results),
+                        "total_videos": total,
+                        "successful": successful,
+                        "failed": total - successful,
                     },
                 )
 
-            logger.info(f"Batch analysis complete: {len(results)} videos processed")
-            return results
+            logger.info(f"Batch analysis complete: {total} videos processed")
 
         except Exception as e:
             error_msg = f"Batch analysis failed: {e}"
@@ -490,7 +2617,70 @@ class PipelineCoordinator:
             if self.progress_tracker:
                 self.progress_tracker.fail_operation(batch_id, error_msg)
 
-            return results  # Return partial results
+            raise
+
+    def warm_up_models(self, transcription: bool = True, captioning: bool = True) -> None:
+        """
+        Load analysis models now instead of on first use.
+
+        Load failures are only logged; the stage needing the model reports
+        them when it runs.
+
+        Args:
+            transcription: Whether to load the Whisper model
+            captioning: Whether to load the image captioning model (if enabled)
+        """
+        if transcription:
+            try:
+                self._get_transcriber()._load_model()
+            except Exception as e:
+                logger.warning(f"Could not preload Whisper model: {e}")
+
+        if captioning and self.config.visual_analysis.enable_captioning:
+            try:
+                from deep_brief.analysis.image_captioner import ImageCaptioner
+
+                frame_extractor = self._get_frame_extractor()
+                if frame_extractor.captioner is None:
+                    frame_extractor.captioner = ImageCaptioner(config=self.config)
+                frame_extractor.captioner._load_model()
+            except Exception as e:
+                logger.warning(f"Could not preload captioning model: {e}")
+
+
+# Coordinator reused for every video handed to a batch worker process
+_batch_worker_coordinator: PipelineCoordinator | None = None
+
+
+def _init_batch_worker(config: Any, warm_transcriber: bool, warm_captioner: bool) -> None:
+    """Set up a batch worker process once, before it receives any videos."""
+    global _batch_worker_coordinator
+    _batch_worker_coordinator = PipelineCoordinator(config)
+    if warm_transcriber or warm_captioner:
+        _batch_worker_coordinator.warm_up_models(
+            transcription=warm_transcriber, captioning=warm_captioner
+        )
+
+
+def _analyze_in_batch_worker(
+    video_path: Path,
+    output_dir: Path | None,
+    options: dict[str, Any],
+    on_stage_finished: Callable[[StageResult], None] | None = None,
+) -> VideoAnalysisResult:
+    """Analyze one video in a batch worker process."""
+    if _batch_worker_coordinator is None:
+        raise RuntimeError("Batch worker was not initialized")
+
+    result = _batch_worker_coordinator.analyze_video(
+        video_path,
+        output_dir=output_dir,
+        on_stage_finished=on_stage_finished,
+        **options,
+    )
+
+    # Decoded samples are only needed inside the worker, so don't send them back
+    return result.detached()
 
 
 def create_pipeline_coordinator(
@@ -0,0 +1,190 @@
+"""Process-wide cache of ffprobe results for DeepBrief."""
+
+# NOTE: ffmpeg-python library lacks comprehensive type annotations
+# See: https://github.com/kkroening/ffmpeg-python/issues/247
+# pyright: reportUnknownMemberType=false, reportUnknownVariableType=false, reportUnknownArgumentType=false
+
+import copy
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any
+
+import ffmpeg
+
+logger = logging.getLogger(__name__)
+
+# Cache key: (resolved path, size in bytes, modification time in ns)
+ProbeKey = tuple[str, int, int]
+
+
+class ProbeCache:
+    """
+    Cache full ffprobe stream/format JSON keyed by (path, size, mtime).
+
+    A file that is rewritten gets a new size or mtime and is probed again, so
+    entries never need explicit invalidation. Entries can optionally be
+    persisted to a JSON file so later runs over the same files skip probing.
+    """
+
+    def __init__(self, cache_file: Path | None = None, max_entries: int = 1024):
+        """
+        Initialize the probe cache.
+
+        Args:
+            cache_file: Optional JSON file to load entries from and persist to
+            max_entries: Maximum number of entries kept, least recently used first out
+        """
+        self.max_entries = max_entries
+        self.cache_file: Path | None = None
+        self._entries: OrderedDict[ProbeKey, dict[str, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+        # Statistics
+        self.hits = 0
+        self.misses = 0
+
+        if cache_file is not None:
+            self.set_cache_file(cache_file)
+
+    @staticmethod
+    def _make_key(file_path: Path) -> ProbeKey | None:
+        """Build the cache key for a file, or None if it cannot be stat'ed."""
+        try:
+            stat = file_path.stat()
+        except OSError:
+            return None
+        return (str(file_path.resolve()), stat.st_size, stat.st_mtime_ns)
+
+    def probe(self, file_path: Path | str) -> dict[str, Any]:
+        """
+        Probe a media file, returning cached metadata when the file is unchanged.
+
+        Args:
+            file_path: Path to the media file
+
+        Returns:
+            ffprobe output with "streams" and "format" entries
+
+        Raises:
+            ffmpeg.Error: If ffprobe fails (failures are never cached)
+        """
+        file_path = Path(file_path)
+        key = self._make_key(file_path)
+
+        if key is not None:
+            with self._lock:
+                cached = self._entries.get(key)
+                if cached is not None:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    logger.debug(f"Probe cache hit: {file_path.name}")
+                    return copy.deepcopy(cached)
+
+        probe = ffmpeg.probe(str(file_path))
+
+        if key is not None:
+            with self._lock:
+                self.misses += 1
+                self._entries[key] = copy.deepcopy(probe)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+            self._save()
+
+        return probe
+
+    def set_cache_file(self, cache_file: Path | None) -> None:
+        """
+        Persist entries to a JSON file, loading any entries already stored there.
+
+        Args:
+            cache_file: JSON file to use, or None to stop persisting
+        """
+        self.cache_file = Path(cache_file) if cache_file is not None else None
+        if self.cache_file is None or not self.cache_file.exists():
+            return
+
+        try:
+            with open(self.cache_file, encoding="utf-8") as f:
+                stored = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable probe cache {self.cache_file}: {e}")
+            return
+
+        loaded = 0
+        with self._lock:
+            for entry in stored.get("entries", []):
+                try:
+                    key = (entry["path"], int(entry["size"]), int(entry["mtime_ns"]))
+                    self._entries[key] = entry["probe"]
+                    loaded += 1
+                except (KeyError, TypeError, ValueError):
+                    continue
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+        logger.debug(f"Loaded {loaded} probe cache entries from {self.cache_file}")
+
+    def _save(self) -> None:
+        """Write all entries to the cache file, if persistence is enabled."""
+        if self.cache_file is None:
+            return
+
+        with self._lock:
+            stored = {
+                "entries": [
+                    {"path": path, "size": size, "mtime_ns": mtime_ns, "probe": probe}
+                    for (path, size, mtime_ns), probe in self._entries.items()
+                ]
+            }
+
+        # Write to a temporary file first so a crash never leaves a torn cache
+        temp_file = self.cache_file.with_name(
+            f".{self.cache_file.name}.{os.getpid()}.tmp"
+        )
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(temp_file, "w", encoding="utf-8") as f:
+                json.dump(stored, f)
+            os.replace(temp_file, self.cache_file)
+        except OSError as e:
+            logger.warning(f"Failed to persist probe cache to {self.cache_file}: {e}")
+            temp_file.unlink(missing_ok=True)
+
+    def clear(self) -> None:
+        """Remove all in-memory entries and reset statistics."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get cache statistics."""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "cache_file": str(self.cache_file) if self.cache_file else None,
+            }
+
+
+# Global probe cache shared by all components in the process
+_global_probe_cache: ProbeCache | None = None
+
+
+def get_probe_cache() -> ProbeCache:
+    """Get the process-wide probe cache instance."""
+    global _global_probe_cache
+    if _global_probe_cache is None:
+        _global_probe_cache = ProbeCache()
+    return _global_probe_cache
+
+
+def probe_media(file_path: Path | str) -> dict[str, Any]:
+    """Probe a media file through the process-wide cache."""
+    return get_probe_cache().probe(file_path)
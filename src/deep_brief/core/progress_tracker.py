@@ -1,12 +1,15 @@
 """Comprehensive progress tracking system for video processing operations."""
 
 import logging
+import threading
 import time
 from collections.abc import Callable
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any
 
+from deep_brief.core.cancellation import CancellationToken
+
 logger = logging.getLogger(__name__)
 
 
@@ -44,6 +47,7 @@ class ProgressTracker:
         self.operations: dict[str, ProgressUpdate] = {}
         self.callbacks: list[Callable[[ProgressUpdate], None]] = []
         self.start_times: dict[str, float] = {}
+        self.cancel_tokens: dict[str, CancellationToken] = {}
 
     def add_callback(self, callback: Callable[[ProgressUpdate], None]) -> None:
         """
@@ -72,6 +76,7 @@ class ProgressTracker:
         operation_name: str,
         total_steps: int = 1,
         details: dict[str, Any] | None = None,
+        cancel_token: CancellationToken | None = None,
     ) -> None:
         """
         Start tracking a new operation.
@@ -81,8 +86,12 @@ class ProgressTracker:
             operation_name: Human-readable name for the operation
             total_steps: Total number of steps in the operation
             details: Additional details about the operation
+            cancel_token: Token that cancel_operation cancels, stopping the
+                work itself rather than only marking it cancelled
         """
         self.start_times[operation_id] = time.time()
+        if cancel_token is not None:
+            self.cancel_tokens[operation_id] = cancel_token
 
         progress_update = ProgressUpdate(
             operation_id=operation_id,
@@ -168,6 +177,7 @@ class ProgressTracker:
             logger.warning(f"Unknown operation ID: {operation_id}")
             return
 
+        self.cancel_tokens.pop(operation_id, None)
         operation = self.operations[operation_id]
         operation.status = OperationStatus.COMPLETED
         operation.progress = 1.0
@@ -203,6 +213,7 @@ class ProgressTracker:
             logger.warning(f"Unknown operation ID: {operation_id}")
             return
 
+        self.cancel_tokens.pop(operation_id, None)
         operation = self.operations[operation_id]
         operation.status = OperationStatus.FAILED
         operation.current_step = f"Failed: {error}"
@@ -225,6 +236,9 @@ class ProgressTracker:
         """
         Cancel an operation.
 
+        If the operation was started with a cancellation token, the token is
+        cancelled too, which stops the running work and its subprocesses.
+
         Args:
             operation_id: Unique identifier for the operation
         """
@@ -233,6 +247,13 @@ class ProgressTracker:
             return
 
         operation = self.operations[operation_id]
+        if operation.status == OperationStatus.CANCELLED:
+            return
+
+        cancel_token = self.cancel_tokens.pop(operation_id, None)
+        if cancel_token is not None:
+            cancel_token.cancel(f"{operation.operation_name} cancelled")
+
         operation.status = OperationStatus.CANCELLED
         operation.current_step = "Cancelled"
         operation.estimated_seconds_remaining = None
@@ -361,11 +382,18 @@ class CompositeProgressTracker:
         self.operations: list[tuple[str, str, float]] = []  # (id, name, weight)
         self.current_operation_index = 0
 
+        # Per-operation progress for operations that run concurrently
+        self.operation_progress: dict[str, float] = {}
+        self.running_operations: list[str] = []
+        self.completed_operations: set[str] = set()
+        self._lock = threading.Lock()
+
     def start_workflow(
         self,
         workflow_id: str,
         workflow_name: str,
         operations: list[tuple[str, str, float]],  # (id, name, weight)
+        cancel_token: CancellationToken | None = None,
     ) -> None:
         """
         Start a complex workflow with multiple operations.
@@ -374,10 +402,14 @@ class CompositeProgressTracker:
             workflow_id: Unique identifier for the workflow
             workflow_name: Human-readable name for the workflow
             operations: List of (operation_id, operation_name, weight) tuples
+            cancel_token: Token cancelled when the workflow is cancelled
         """
         self.workflow_id = workflow_id
         self.operations = operations
         self.current_operation_index = 0
+        self.operation_progress = {}
+        self.running_operations = []
+        self.completed_operations = set()
 
         total_weight = sum(weight for _, _, weight in operations)
         if abs(total_weight - 1.0) > 0.01:  # Allow for small floating point errors
@@ -393,6 +425,7 @@ class CompositeProgressTracker:
                     for op_id, op_name, weight in operations
                 ]
             },
+            cancel_token=cancel_token,
         )
 
     def start_next_operation(self) -> Callable[[float], None] | None:
@@ -439,6 +472,104 @@ class CompositeProgressTracker:
 
         return True
 
+    def start_operation(self, operation_id: str) -> Callable[[float], None] | None:
+        """
+        Start a workflow operation by ID, alongside any others still running.
+
+        Unlike start_next_operation, operations started this way may overlap.
+        Workflow progress is the weighted sum of every operation's own
+        progress, so concurrent operations each contribute their share. The
+        returned callback is safe to call from worker threads.
+
+        Args:
+            operation_id: ID of an operation passed to start_workflow
+
+        Returns:
+            Progress callback for the operation, or None if it is not part of the workflow
+        """
+        operation = self._find_operation(operation_id)
+        if not self.workflow_id or operation is None:
+            return None
+
+        with self._lock:
+            self.operation_progress[operation_id] = 0.0
+            if operation_id not in self.running_operations:
+                self.running_operations.append(operation_id)
+            self._update_workflow_progress(f"Starting {operation[1]}...")
+
+        def operation_progress_callback(progress: float) -> None:
+            with self._lock:
+                if operation_id in self.completed_operations:
+                    return
+                self.operation_progress[operation_id] = max(0.0, min(1.0, progress))
+                self._update_workflow_progress()
+
+        return operation_progress_callback
+
+    def complete_operation(self, operation_id: str) -> bool:
+        """
+        Mark an operation started with start_operation as complete.
+
+        Args:
+            operation_id: ID of the operation
+
+        Returns:
+            True if there are more operations, False if workflow is complete
+        """
+        if not self.workflow_id or self._find_operation(operation_id) is None:
+            return False
+
+        with self._lock:
+            self.operation_progress[operation_id] = 1.0
+            self.completed_operations.add(operation_id)
+            if operation_id in self.running_operations:
+                self.running_operations.remove(operation_id)
+
+            if len(self.completed_operations) >= len(self.operations):
+                self.tracker.complete_operation(self.workflow_id)
+                return False
+
+            self._update_workflow_progress()
+            return True
+
+    def _find_operation(self, operation_id: str) -> tuple[str, str, float] | None:
+        """Look up a workflow operation by ID."""
+        for operation in self.operations:
+            if operation[0] == operation_id:
+                return operation
+        return None
+
+    def _update_workflow_progress(self, current_step: str | None = None) -> None:
+        """Report the weighted progress of all operations (caller holds the lock)."""
+        if not self.workflow_id:
+            return
+
+        total_weight = sum(weight for _, _, weight in self.operations) or 1.0
+        progress = (
+            sum(
+                weight * self.operation_progress.get(op_id, 0.0)
+                for op_id, _, weight in self.operations
+            )
+            / total_weight
+        )
+
+        if current_step is None:
+            running_names = [
+                op_name
+                for op_id, op_name, _ in self.operations
+                if op_id in self.running_operations
+            ]
+            current_step = " + ".join(running_names) if running_names else None
+
+        self.tracker.update_progress(
+            operation_id=self.workflow_id,
+            progress=progress,
+            current_step=current_step,
+            current_step_number=len(self.completed_operations)
+            + len(self.running_operations),
+            details={"operation_progress": dict(self.operation_progress)},
+        )
+
     def fail_workflow(self, error: str) -> None:
         """
         Mark the entire workflow as failed.
@@ -449,6 +580,11 @@ class CompositeProgressTracker:
         if self.workflow_id:
             self.tracker.fail_operation(self.workflow_id, error)
 
+    def cancel_workflow(self) -> None:
+        """Mark the entire workflow as cancelled, cancelling its token."""
+        if self.workflow_id:
+            self.tracker.cancel_operation(self.workflow_id)
+
 
 # Global progress tracker instance
 _global_tracker: ProgressTracker | None = None
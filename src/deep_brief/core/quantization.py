@@ -0,0 +1,286 @@
+"""Int8 dynamic quantization of models for CPU inference, with an on-disk cache.
+
+Dynamic quantization stores the weights of Linear layers as int8 and
+quantizes activations on the fly, which makes transformer models such as
+Whisper and BLIP roughly half the size and several times faster on CPU at a
+small cost in accuracy. benchmark_quantization() measures that cost.
+"""
+
+import io
+import logging
+import os
+import re
+import time
+import uuid
+from collections.abc import Callable, Sequence
+from pathlib import Path
+from typing import Any
+
+import torch
+from pydantic import BaseModel
+
+logger = logging.getLogger(__name__)
+
+# Bump when the cached model layout changes so old files are ignored
+QUANTIZED_CACHE_FORMAT = 2
+
+# ModelKey dtype of quantized models, so they are shared apart from fp32 ones
+QUANTIZED_DTYPE = "qint8"
+
+# Quantized models take about this fraction of the fp32 model's memory
+QUANTIZED_MEMORY_FACTOR = 0.5
+
+
+def quantize_linear_layers(model: torch.nn.Module) -> torch.nn.Module:
+    """
+    Quantize the Linear layers of a model to int8, in place.
+
+    Subclasses of Linear that only change forward() (such as Whisper's, which
+    casts its weights to the input dtype) are turned back into plain Linear
+    layers first, as PyTorch only quantizes exact Linear modules.
+
+    Args:
+        model: fp32 model on the CPU
+
+    Returns:
+        The quantized model, for inference on the CPU only
+    """
+    for module in model.modules():
+        if isinstance(module, torch.nn.Linear) and type(module) is not torch.nn.Linear:
+            module.__class__ = torch.nn.Linear
+
+    return torch.ao.quantization.quantize_dynamic(
+        model, {torch.nn.Linear}, dtype=torch.qint8, inplace=True
+    )
+
+
+def model_size_mb(model: torch.nn.Module) -> float:
+    """Size of a model's serialized weights in MB."""
+    buffer = io.BytesIO()
+    torch.save(model.state_dict(), buffer)
+    return buffer.tell() / (1024 * 1024)
+
+
+class QuantizedModelCache:
+    """
+    Quantized model weights saved on disk, so models are only quantized once.
+
+    Only the quantized state dict and a plain description of the model's
+    architecture are saved, and they are read back with weights_only=True,
+    so a file planted in the cache directory cannot run code. A cached
+    model is rebuilt from its architecture, quantized while its weights are
+    still untrained, and then given the cached weights, which skips loading
+    the pretrained fp32 weights. Files are keyed by model and by the
+    versions of the libraries that built it, and replaced atomically.
+    """
+
+    def __init__(self, cache_dir: Path | str):
+        """
+        Initialize the cache.
+
+        Args:
+            cache_dir: Directory to store quantized models in
+        """
+        self.cache_dir = Path(cache_dir)
+
+    def model_path(self, key: str, library: str) -> Path:
+        """
+        File storing the quantized model for a key.
+
+        Args:
+            key: Key of the quantized model
+            library: Name and version of the library defining the model, such
+                as "whisper20250625"
+        """
+        name = re.sub(r"[^\w.-]+", "_", f"{key}-{library}-torch{torch.__version__}")
+        return self.cache_dir / f"v{QUANTIZED_CACHE_FORMAT}-{name}.pt"
+
+    def load_or_quantize(
+        self,
+        key: str,
+        library: str,
+        load_float: Callable[[], torch.nn.Module],
+        describe: Callable[[torch.nn.Module], dict[str, Any]],
+        build: Callable[[dict[str, Any]], torch.nn.Module],
+    ) -> torch.nn.Module:
+        """
+        Load a cached quantized model, or load the fp32 model and quantize it.
+
+        Args:
+            key: Key of the quantized model, such as its model registry key
+            library: Name and version of the library defining the model
+            load_float: Loads the pretrained fp32 model onto the CPU
+            describe: Describes a model's architecture in plain values
+            build: Builds an fp32 model with untrained weights from the
+                description of its architecture
+
+        Returns:
+            Quantized model in evaluation mode
+        """
+        path = self.model_path(key, library)
+        if path.is_file():
+            try:
+                saved = torch.load(path, map_location="cpu", weights_only=True)
+                model = quantize_linear_layers(build(saved["architecture"]))
+                model.load_state_dict(saved["state_dict"])
+                logger.info(f"Loaded quantized model {key} from {path}")
+                return model.eval()
+            except Exception as e:
+                logger.warning(f"Ignoring unreadable quantized model {path}: {e}")
+
+        start_time = time.time()
+        model = quantize_linear_layers(load_float()).eval()
+        logger.info(
+            f"Quantized {key} to int8 in {time.time() - start_time:.1f}s "
+            f"({model_size_mb(model):.0f}MB)"
+        )
+        self._save(
+            {"architecture": describe(model), "state_dict": model.state_dict()}, path
+        )
+        return model
+
+    def _save(self, saved: dict[str, Any], path: Path) -> None:
+        """Save a quantized model atomically; failing to save is not fatal."""
+        temp_path = path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            torch.save(saved, temp_path)
+            os.replace(temp_path, path)
+        except Exception as e:
+            logger.warning(f"Failed to cache quantized model at {path}: {e}")
+            temp_path.unlink(missing_ok=True)
+
+
+def get_quantized_model_cache(config: Any) -> QuantizedModelCache:
+    """
+    Get the quantized model cache for a configuration.
+
+    Args:
+        config: DeepBrief configuration
+
+    Returns:
+        Cache in processing.quantized_model_dir, or <temp_dir>/quantized_models
+    """
+    processing = config.processing
+    cache_dir = processing.quantized_model_dir
+    if cache_dir is None:
+        cache_dir = Path(processing.temp_dir) / "quantized_models"
+    return QuantizedModelCache(cache_dir)
+
+
+class QuantizationBenchmark(BaseModel):
+    """Speed, size and accuracy of a quantized model against the fp32 one."""
+
+    samples: int
+    float_seconds: float
+    quantized_seconds: float
+    float_size_mb: float
+    quantized_size_mb: float
+    agreement: float  # Mean agreement of quantized with fp32 outputs, 0 to 1
+
+    @property
+    def speedup(self) -> float:
+        """How many times faster the quantized model ran."""
+        if self.quantized_seconds <= 0:
+            return 0.0
+        return self.float_seconds / self.quantized_seconds
+
+    @property
+    def size_ratio(self) -> float:
+        """Size of the quantized model relative to the fp32 one."""
+        if self.float_size_mb <= 0:
+            return 0.0
+        return self.quantized_size_mb / self.float_size_mb
+
+    @property
+    def accuracy_delta(self) -> float:
+        """Share of the fp32 output the quantized model got differently."""
+        return 1.0 - self.agreement
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for serialization."""
+        return {
+            **self.model_dump(),
+            "speedup": self.speedup,
+            "size_ratio": self.size_ratio,
+            "accuracy_delta": self.accuracy_delta,
+        }
+
+
+def benchmark_quantization(
+    float_model: torch.nn.Module,
+    quantized_model: torch.nn.Module,
+    samples: Sequence[Any],
+    run: Callable[[torch.nn.Module, Any], Any],
+    agreement: Callable[[Any, Any], float],
+) -> QuantizationBenchmark:
+    """
+    Run a quantized model and its fp32 original on the same inputs.
+
+    The fp32 outputs serve as the reference, so the accuracy delta is what
+    quantization changed rather than the error against a ground truth.
+
+    Args:
+        float_model: fp32 model
+        quantized_model: Quantized copy of the model
+        samples: Inputs to run both models on
+        run: Runs a model on one input and returns its output
+        agreement: Scores a quantized output against the fp32 one, 0 to 1
+
+    Returns:
+        Benchmark of the quantized model
+    """
+    float_seconds = quantized_seconds = 0.0
+    scores = []
+    for sample in samples:
+        start_time = time.perf_counter()
+        expected = run(float_model, sample)
+        float_seconds += time.perf_counter() - start_time
+
+        start_time = time.perf_counter()
+        actual = run(quantized_model, sample)
+        quantized_seconds += time.perf_counter() - start_time
+
+        scores.append(agreement(expected, actual))
+
+    benchmark = QuantizationBenchmark(
+        samples=len(scores),
+        float_seconds=float_seconds,
+        quantized_seconds=quantized_seconds,
+        float_size_mb=model_size_mb(float_model),
+        quantized_size_mb=model_size_mb(quantized_model),
+        agreement=sum(scores) / len(scores) if scores else 1.0,
+    )
+    logger.info(
+        f"Quantization benchmark: {benchmark.speedup:.2f}x faster, "
+        f"{benchmark.size_ratio:.0%} of the size, "
+        f"accuracy delta {benchmark.accuracy_delta:.2%}"
+    )
+    return benchmark
+
+
+def word_agreement(reference: str, hypothesis: str) -> float:
+    """
+    Score how closely a text matches a reference, as 1 - word error rate.
+
+    Args:
+        reference: Reference text
+        hypothesis: Text to score
+
+    Returns:
+        Agreement from 0 (nothing alike) to 1 (the same words)
+    """
+    expected = reference.lower().split()
+    actual = hypothesis.lower().split()
+    if not expected:
+        return 0.0 if actual else 1.0
+
+    # Word-level edit distance, one row at a time
+    previous = list(range(len(actual) + 1))
+    for i, word in enumerate(expected, 1):
+        current = [i]
+        for j, other in enumerate(actual, 1):
+            substitution = previous[j - 1] + (word != other)
+            current.append(min(previous[j] + 1, current[j - 1] + 1, substitution))
+        previous = current
+    return max(0.0, 1.0 - previous[-1] / len(expected))
@@ -0,0 +1,257 @@
+"""On-disk cache of complete video analysis results for DeepBrief."""
+
+import hashlib
+import json
+import logging
+import os
+import pickle
+import threading
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Configuration sections, or dotted fields of a section, whose values change
+# analysis results
+RESULT_CONFIG_SECTIONS = (
+    "audio",
+    "scene_detection",
+    "transcription",
+    "analysis",
+    "visual_analysis",
+    "output",
+    "processing.windowed_processing",
+    "processing.window_seconds",
+    "processing.batch_frame_extraction",
+    "processing.max_frame_width",
+)
+
+# Bump when the pickled result layout changes so old entries are ignored
+RESULT_CACHE_FORMAT = 1
+
+
+def fingerprint_file(
+    file_path: Path | str, block_size: int = 64 * 1024, sample_blocks: int = 8
+) -> str:
+    """
+    Compute a fast content fingerprint of a (large) file.
+
+    Hashes the file size together with ``sample_blocks`` blocks spread evenly
+    from the start to the end of the file, so fingerprinting a multi-gigabyte
+    video reads well under a megabyte. Unlike the probe cache key, the
+    fingerprint survives copies, renames and touched modification times.
+
+    Args:
+        file_path: File to fingerprint
+        block_size: Bytes read per sampled block
+        sample_blocks: Number of blocks to sample
+
+    Returns:
+        Hex digest identifying the file's content
+
+    Raises:
+        OSError: If the file cannot be read
+    """
+    file_path = Path(file_path)
+    size = file_path.stat().st_size
+    digest = hashlib.sha256(str(size).encode())
+
+    with open(file_path, "rb") as f:
+        if size <= block_size * sample_blocks:
+            digest.update(f.read())
+        else:
+            step = (size - block_size) / (sample_blocks - 1)
+            for index in range(sample_blocks):
+                f.seek(int(index * step))
+                digest.update(f.read(block_size))
+
+    return digest.hexdigest()
+
+
+def fingerprint_config(config: Any, sections: tuple[str, ...] = RESULT_CONFIG_SECTIONS) -> str:
+    """
+    Hash the configuration sections that affect analysis results.
+
+    Args:
+        config: DeepBriefConfig instance
+        sections: Names of the sections to include, or dotted names such as
+            "processing.window_seconds" of single fields (fields a section
+            does not define are hashed as None)
+
+    Returns:
+        Hex digest of the selected sections
+    """
+    selected = {}
+    for name in sections:
+        section, _, field = name.partition(".")
+        value = getattr(config, section)
+        if field:
+            selected[name] = getattr(value, field, None)
+        else:
+            selected[name] = value.model_dump(mode="json")
+    encoded = json.dumps(selected, sort_keys=True, default=str).encode()
+    return hashlib.sha256(encoded).hexdigest()
+
+
+class ResultCache:
+    """
+    Size-bounded LRU cache of pickled analysis results on disk.
+
+    Entries are keyed by the video's content fingerprint, the relevant
+    configuration and the requested analysis options, so resubmitting an
+    unchanged video returns the stored result instead of re-running any
+    stage. A cache hit refreshes the entry's modification time; when the
+    cache grows past ``max_size_mb`` the least recently used entries are
+    removed first. Several processes may share one cache directory.
+    """
+
+    def __init__(self, cache_dir: Path | str, max_size_mb: float = 2048):
+        """
+        Initialize the result cache.
+
+        Args:
+            cache_dir: Directory to store entries in
+            max_size_mb: Maximum total size of all entries
+        """
+        self.cache_dir = Path(cache_dir)
+        self.max_size_bytes = int(max_size_mb * 1024 * 1024)
+        self._lock = threading.Lock()
+
+        # Statistics
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def make_key(
+        self,
+        video_path: Path | str,
+        config: Any,
+        options: dict[str, Any] | None = None,
+    ) -> str:
+        """
+        Build the cache key for analyzing a video.
+
+        Args:
+            video_path: Path to the video file
+            config: DeepBriefConfig used for the analysis
+            options: Analysis options, such as which stages to run
+
+        Returns:
+            Hex digest cache key
+
+        Raises:
+            OSError: If the video cannot be read
+        """
+        from deep_brief import __version__
+
+        parts = {
+            "format": RESULT_CACHE_FORMAT,
+            "version": __version__,
+            "video": fingerprint_file(video_path),
+            "config": fingerprint_config(config),
+            "options": options or {},
+        }
+        encoded = json.dumps(parts, sort_keys=True, default=str).encode()
+        return hashlib.sha256(encoded).hexdigest()
+
+    def _entry_path(self, key: str) -> Path:
+        """Path of the file storing an entry."""
+        return self.cache_dir / f"{key}.pkl"
+
+    def get(self, key: str) -> Any | None:
+        """
+        Load a cached result.
+
+        Args:
+            key: Cache key from make_key
+
+        Returns:
+            The stored result, or None on a miss or unreadable entry
+        """
+        entry_path = self._entry_path(key)
+        try:
+            with open(entry_path, "rb") as f:
+                result = pickle.load(f)
+            os.utime(entry_path)  # Mark as recently used
+        except FileNotFoundError:
+            with self._lock:
+                self.misses += 1
+            return None
+        except Exception as e:
+            logger.warning(f"Discarding unreadable result cache entry {entry_path}: {e}")
+            entry_path.unlink(missing_ok=True)
+            with self._lock:
+                self.misses += 1
+            return None
+
+        with self._lock:
+            self.hits += 1
+        logger.debug(f"Result cache hit: {key[:12]}")
+        return result
+
+    def put(self, key: str, result: Any) -> None:
+        """
+        Store a result, evicting least recently used entries if needed.
+
+        Args:
+            key: Cache key from make_key
+            result: Picklable analysis result
+        """
+        entry_path = self._entry_path(key)
+
+        # Write to a temporary file first so readers never see a torn entry
+        temp_file = entry_path.with_name(f".{entry_path.name}.{os.getpid()}.tmp")
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            with open(temp_file, "wb") as f:
+                pickle.dump(result, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_file, entry_path)
+        except Exception as e:
+            logger.warning(f"Failed to store result cache entry {entry_path}: {e}")
+            temp_file.unlink(missing_ok=True)
+            return
+
+        self._evict()
+
+    def _evict(self) -> None:
+        """Remove least recently used entries until the cache fits."""
+        entries = []
+        for entry_path in self.cache_dir.glob("*.pkl"):
+            try:
+                stat = entry_path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, entry_path))
+
+        total_size = sum(size for _, size, _ in entries)
+        for _, size, entry_path in sorted(entries):
+            if total_size <= self.max_size_bytes:
+                break
+            entry_path.unlink(missing_ok=True)
+            total_size -= size
+            with self._lock:
+                self.evictions += 1
+            logger.debug(f"Evicted result cache entry: {entry_path.name}")
+
+    def clear(self) -> None:
+        """Remove all entries and reset statistics."""
+        for entry_path in self.cache_dir.glob("*.pkl"):
+            entry_path.unlink(missing_ok=True)
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get cache statistics."""
+        entries = list(self.cache_dir.glob("*.pkl")) if self.cache_dir.exists() else []
+        with self._lock:
+            return {
+                "entries": len(entries),
+                "size_mb": sum(p.stat().st_size for p in entries if p.exists())
+                / (1024 * 1024),
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "cache_dir": str(self.cache_dir),
+            }
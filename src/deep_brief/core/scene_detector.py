@@ -4,15 +4,27 @@
 # See: https://github.com/kkroening/ffmpeg-python/issues/247
 # pyright: reportUnknownMemberType=false, reportUnknownVariableType=false, reportUnknownArgumentType=false
 
+import asyncio
+import contextvars
 import logging
+import os
 import re
+import subprocess
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Any
 
 import ffmpeg
 from pydantic import BaseModel
 
+from deep_brief.core.exceptions import OperationCancelledError
+from deep_brief.core.ffmpeg_runner import (
+    async_run_and_collect_log,
+    run_and_collect_log,
+    run_ffmpeg,
+    terminate_on_cancel,
+)
 from deep_brief.core.video_processor import VideoInfo
 from deep_brief.utils.config import get_config
 
@@ -68,6 +80,9 @@ class SceneDetectionResult(BaseModel):
 class SceneDetector:
     """Scene detection system using ffmpeg scene filter with configurable thresholds."""
 
+    # Iterations used when bisecting towards a target scene count
+    BISECTION_STEPS = 32
+
     def __init__(self, config: Any = None):
         """Initialize SceneDetector with configuration."""
         self.config = config or get_config()
@@ -109,10 +124,70 @@ class SceneDetector:
                     f"Unknown scene detection method: {self.config.scene_detection.method}"
                 )
 
+        except OperationCancelledError:
+            raise
         except Exception as e:
             logger.error(f"Scene detection failed: {e}")
             raise RuntimeError(f"Scene detection failed: {e}") from e
 
+    async def detect_scenes_async(
+        self,
+        video_info: VideoInfo,
+        progress_callback: Callable[[float], None] | None = None,
+    ) -> SceneDetectionResult:
+        """
+        Detect scenes without blocking the event loop.
+
+        A single threshold pass runs ffmpeg through asyncio and reads its log
+        as it arrives. Adaptive and sharded detection, which coordinate
+        several ffmpeg passes of their own, run detect_scenes on the loop's
+        default executor instead.
+
+        Args:
+            video_info: VideoInfo object from validated video file
+            progress_callback: Optional callback function for progress updates (0.0 to 1.0)
+
+        Returns:
+            SceneDetectionResult with detected scenes
+
+        Raises:
+            RuntimeError: If scene detection fails
+        """
+        if self.config.scene_detection.method != "threshold" or self._plan_shards(
+            video_info.duration
+        ):
+            return await asyncio.to_thread(
+                self.detect_scenes, video_info, progress_callback
+            )
+
+        logger.info(f"Detecting scenes in {video_info.file_path.name}")
+
+        threshold = self.config.scene_detection.threshold
+        try:
+            output = await async_run_and_collect_log(
+                self._scene_detection_stream(video_info, threshold),
+                video_info.duration,
+                video_info.duration * 2 + 60,
+                progress_callback,
+            )
+            scene_times = self._scene_times_from_log(output, video_info)
+            logger.debug(
+                f"Found {len(scene_times)} scene changes with threshold {threshold}"
+            )
+            return self._build_threshold_result(video_info, scene_times, threshold)
+
+        except OperationCancelledError:
+            raise
+        except Exception as e:
+            logger.warning(f"Threshold detection failed: {e}, using fallback")
+            try:
+                return self._fallback_scene_detection(video_info, threshold)
+            except Exception as fallback_error:
+                logger.error(f"Scene detection failed: {fallback_error}")
+                raise RuntimeError(
+                    f"Scene detection failed: {fallback_error}"
+                ) from fallback_error
+
     def _detect_scenes_threshold(
         self,
         video_info: VideoInfo,
@@ -132,42 +207,195 @@ class SceneDetector:
         logger.debug(f"Using threshold scene detection: {threshold}")
 
         try:
-            # Use ffmpeg scene filter to detect scene changes
-            scene_times = self._run_scene_detection(
-                video_info, threshold, progress_callback
-            )
-
-            # If no scenes detected or too few, use fallback
-            if len(scene_times) <= 1:
-                logger.warning(
-                    "Threshold detection found no/few scenes, using fallback"
+            if self._plan_shards(video_info.duration):
+                # Long video: detect cuts in parallel time windows
+                scene_times = [0.0] + [
+                    time
+                    for time, _ in self._run_sharded_scoring(
+                        video_info, threshold, progress_callback
+                    )
+                ]
+            else:
+                # Use ffmpeg scene filter to detect scene changes
+                scene_times = self._run_scene_detection(
+                    video_info, threshold, progress_callback
                 )
-                return self._fallback_scene_detection(video_info, threshold)
+            return self._build_threshold_result(video_info, scene_times, threshold)
 
-            # Create scenes from detected timestamps
-            scenes = self._create_scenes_from_timestamps(
-                scene_times, video_info.duration
-            )
+        except OperationCancelledError:
+            raise
+        except Exception as e:
+            logger.warning(f"Threshold detection failed: {e}, using fallback")
+            return self._fallback_scene_detection(video_info, threshold)
+
+    def _build_threshold_result(
+        self, video_info: VideoInfo, scene_times: list[float], threshold: float
+    ) -> SceneDetectionResult:
+        """
+        Build a threshold detection result from scene change timestamps.
 
-            # Filter scenes by minimum duration
-            scenes = self._filter_scenes_by_duration(scenes)
+        Args:
+            video_info: VideoInfo object
+            scene_times: Scene change timestamps, starting with 0.0
+            threshold: Threshold the timestamps were detected with
+
+        Returns:
+            SceneDetectionResult with detected scenes, or fallback scenes
+        """
+        # If no scenes detected or too few, use fallback
+        if len(scene_times) <= 1:
+            logger.warning("Threshold detection found no/few scenes, using fallback")
+            return self._fallback_scene_detection(video_info, threshold)
 
-            logger.info(f"Detected {len(scenes)} scenes using threshold method")
+        # Create scenes from detected timestamps
+        scenes = self._create_scenes_from_timestamps(scene_times, video_info.duration)
 
-            return SceneDetectionResult(
-                scenes=scenes,
-                total_scenes=len(scenes),
-                detection_method="threshold",
-                threshold_used=threshold,
-                video_duration=video_info.duration,
-                average_scene_duration=sum(s.duration for s in scenes) / len(scenes)
-                if scenes
-                else 0.0,
+        # Filter scenes by minimum duration
+        scenes = self._filter_scenes_by_duration(scenes)
+
+        logger.info(f"Detected {len(scenes)} scenes using threshold method")
+
+        return SceneDetectionResult(
+            scenes=scenes,
+            total_scenes=len(scenes),
+            detection_method="threshold",
+            threshold_used=threshold,
+            video_duration=video_info.duration,
+            average_scene_duration=sum(s.duration for s in scenes) / len(scenes)
+            if scenes
+            else 0.0,
+        )
+
+    def supports_single_pass(self, video_info: VideoInfo | None = None) -> bool:
+        """
+        Whether scenes can be detected from one scdet pass shared with other work.
+
+        Videos long enough to be split into parallel shards are detected on
+        their own, since the shared pass would decode them serially.
+
+        Args:
+            video_info: Optional VideoInfo of the video about to be processed
+
+        Returns:
+            True if apply_scene_filter/detect_scenes_from_output can be used
+        """
+        if self.config.scene_detection.method not in ("threshold", "adaptive"):
+            return False
+        return video_info is None or not self._plan_shards(video_info.duration)
+
+    def apply_scene_filter(self, video_stream: Any) -> Any:
+        """
+        Attach the scdet scene detection filter to a video stream.
+
+        Used to run scene detection inside a filter graph that also does other
+        work on the same decoded input. The fps/scale detection proxy is
+        applied, but keyframe-only decoding is not, since the input is shared.
+
+        Args:
+            video_stream: ffmpeg video stream
+
+        Returns:
+            Filtered stream whose scene scores are logged by ffmpeg
+        """
+        # Adaptive detection needs the score of every frame
+        threshold = (
+            0
+            if self.config.scene_detection.method == "adaptive"
+            else self.config.scene_detection.threshold
+        )
+        video_stream = self._apply_detection_proxy(video_stream)
+        return ffmpeg.filter(video_stream, "scdet", threshold=threshold)
+
+    def _proxy_input_args(self) -> dict[str, Any]:
+        """Input options for the detection proxy (keyframe-only decoding)."""
+        if self.config.scene_detection.proxy_keyframes_only:
+            return {"skip_frame": "nokey"}
+        return {}
+
+    def _apply_detection_proxy(self, video_stream: Any) -> Any:
+        """
+        Reduce frame rate and resolution before scene scoring.
+
+        Scene scores are computed from coarse frame differences, so a small,
+        low frame rate proxy gives nearly the same scores for a fraction of
+        the filtering cost.
+
+        Args:
+            video_stream: ffmpeg video stream
+
+        Returns:
+            Stream with the configured fps/scale filters prepended
+        """
+        proxy_fps = self.config.scene_detection.proxy_fps
+        proxy_width = self.config.scene_detection.proxy_width
+
+        # Drop frames first so fewer frames need scaling
+        if proxy_fps > 0:
+            video_stream = ffmpeg.filter(video_stream, "fps", fps=proxy_fps)
+        if proxy_width > 0:
+            video_stream = ffmpeg.filter(video_stream, "scale", proxy_width, -2)
+
+        return video_stream
+
+    def _uses_detection_proxy(self) -> bool:
+        """Whether detected times come from a reduced frame rate stream."""
+        return (
+            self.config.scene_detection.proxy_fps > 0
+            or self.config.scene_detection.proxy_keyframes_only
+        )
+
+    def _map_to_source_time(self, timestamp: float, video_info: VideoInfo) -> float:
+        """
+        Map a timestamp from the proxy stream back onto the source timeline.
+
+        Proxy frames land on a coarser grid than the source, so the time is
+        snapped to the nearest source frame and clamped to the video duration.
+
+        Args:
+            timestamp: Time reported by the proxy detection pass
+            video_info: VideoInfo of the source video
+
+        Returns:
+            Timestamp on the source frame grid
+        """
+        if not self._uses_detection_proxy() or video_info.fps <= 0:
+            return timestamp
+
+        source_time = round(timestamp * video_info.fps) / video_info.fps
+        return round(min(max(source_time, 0.0), video_info.duration), 6)
+
+    def detect_scenes_from_output(
+        self, video_info: VideoInfo, ffmpeg_output: str
+    ) -> SceneDetectionResult:
+        """
+        Detect scenes from the log of an ffmpeg run that used apply_scene_filter.
+
+        Args:
+            video_info: VideoInfo object
+            ffmpeg_output: ffmpeg stderr output with scdet log lines
+
+        Returns:
+            SceneDetectionResult with detected scenes
+        """
+        if self.config.scene_detection.method == "adaptive":
+            return self._select_adaptive_result(
+                video_info,
+                self._map_scores_to_source(
+                    self._parse_scene_scores(ffmpeg_output), video_info
+                ),
             )
 
-        except Exception as e:
-            logger.warning(f"Threshold detection failed: {e}, using fallback")
-            return self._fallback_scene_detection(video_info, threshold)
+        threshold = self.config.scene_detection.threshold
+        scene_times = sorted(
+            {
+                self._map_to_source_time(time, video_info)
+                for time in self._parse_scene_timestamps(ffmpeg_output)
+            }
+        )
+        logger.debug(
+            f"Found {len(scene_times)} scene changes with threshold {threshold}"
+        )
+        return self._build_threshold_result(video_info, scene_times, threshold)
 
     def _detect_scenes_adaptive(
         self,
@@ -177,6 +405,9 @@ class SceneDetector:
         """
         Detect scenes using adaptive threshold method.
 
+        The video is decoded once to collect the scene score of every frame;
+        candidate thresholds are then applied to that score series in memory.
+
         Args:
             video_info: VideoInfo object
             progress_callback: Optional progress callback
@@ -187,65 +418,434 @@ class SceneDetector:
         base_threshold = self.config.scene_detection.threshold
         logger.debug(f"Using adaptive scene detection: base_threshold={base_threshold}")
 
-        # Try multiple thresholds to find optimal scene count
-        thresholds_to_try = [
-            base_threshold * 0.5,  # More sensitive
-            base_threshold,  # Default
-            base_threshold * 1.5,  # Less sensitive
-            base_threshold * 2.0,  # Much less sensitive
-        ]
-
-        best_result = None
-        best_scene_count = 0
-
-        for i, threshold in enumerate(thresholds_to_try):
-            try:
-                # Update progress for adaptive attempts
-                if progress_callback:
-                    progress_callback(
-                        i / len(thresholds_to_try) * 0.8
-                    )  # 80% for trying thresholds
-
-                scene_times = self._run_scene_detection(video_info, threshold, None)
+        try:
+            scoring_callback = (
+                (lambda progress: progress_callback(progress * 0.9))
+                if progress_callback
+                else None
+            )
+            if self._plan_shards(video_info.duration):
+                scene_scores = self._run_sharded_scoring(
+                    video_info, 0, scoring_callback
+                )
+            else:
+                scene_scores = self._run_scene_scoring(video_info, scoring_callback)
+        except OperationCancelledError:
+            raise
+        except Exception as e:
+            logger.warning(f"Adaptive scene scoring failed: {e}, using fallback")
+            if progress_callback:
+                progress_callback(1.0)
+            return self._fallback_scene_detection(video_info, base_threshold)
 
-                if scene_times:
-                    scenes = self._create_scenes_from_timestamps(
-                        scene_times, video_info.duration
-                    )
-                    scenes = self._filter_scenes_by_duration(scenes)
-
-                    # Prefer results with reasonable scene count (2-20 scenes for most videos)
-                    scene_count = len(scenes)
-                    if 2 <= scene_count <= 20 and scene_count > best_scene_count:
-                        best_result = SceneDetectionResult(
-                            scenes=scenes,
-                            total_scenes=scene_count,
-                            detection_method="adaptive",
-                            threshold_used=threshold,
-                            video_duration=video_info.duration,
-                            average_scene_duration=sum(s.duration for s in scenes)
-                            / scene_count,
-                        )
-                        best_scene_count = scene_count
-
-            except Exception as e:
-                logger.debug(f"Adaptive threshold {threshold} failed: {e}")
-                continue
+        result = self._select_adaptive_result(video_info, scene_scores)
 
         # Final progress update
         if progress_callback:
             progress_callback(1.0)
 
+        return result
+
+    def _select_adaptive_result(
+        self, video_info: VideoInfo, scene_scores: list[tuple[float, float]]
+    ) -> SceneDetectionResult:
+        """
+        Pick the best threshold for a per-frame scene score series.
+
+        With ``target_scene_count`` configured the threshold is found by
+        bisection; otherwise thresholds from 0.5x to 2x the base threshold are
+        swept and the result with the most scenes in a reasonable range wins.
+
+        Args:
+            video_info: VideoInfo object
+            scene_scores: (timestamp, score) pairs for every scored frame
+
+        Returns:
+            SceneDetectionResult with detected scenes, or fallback scenes
+        """
+        base_threshold = self.config.scene_detection.threshold
+        target_scene_count = self.config.scene_detection.target_scene_count
+
+        if target_scene_count:
+            best_threshold, best_scenes = self._bisect_threshold(
+                video_info, scene_scores, target_scene_count
+            )
+            if len(best_scenes) < 2:
+                best_scenes = []
+        else:
+            best_threshold, best_scenes = base_threshold, []
+            for threshold in self._adaptive_thresholds(base_threshold):
+                scenes = self._scenes_for_threshold(video_info, scene_scores, threshold)
+
+                # Prefer results with reasonable scene count (2-20 scenes for most videos)
+                if 2 <= len(scenes) <= 20 and len(scenes) > len(best_scenes):
+                    best_threshold, best_scenes = threshold, scenes
+
         # Return best result or fallback
-        if best_result:
+        if best_scenes:
             logger.info(
-                f"Adaptive detection found {best_result.total_scenes} scenes with threshold {best_result.threshold_used}"
+                f"Adaptive detection found {len(best_scenes)} scenes with threshold {best_threshold:.3f}"
+            )
+            return SceneDetectionResult(
+                scenes=best_scenes,
+                total_scenes=len(best_scenes),
+                detection_method="adaptive",
+                threshold_used=best_threshold,
+                video_duration=video_info.duration,
+                average_scene_duration=sum(s.duration for s in best_scenes)
+                / len(best_scenes),
             )
-            return best_result
         else:
             logger.warning("Adaptive detection failed, using fallback")
             return self._fallback_scene_detection(video_info, base_threshold)
 
+    def _adaptive_thresholds(self, base_threshold: float) -> list[float]:
+        """Evenly spaced thresholds from 0.5x to 2x the base threshold."""
+        steps = self.config.scene_detection.adaptive_sweep_steps
+        low, high = base_threshold * 0.5, base_threshold * 2.0
+        return [low + (high - low) * i / (steps - 1) for i in range(steps)]
+
+    def _bisect_threshold(
+        self,
+        video_info: VideoInfo,
+        scene_scores: list[tuple[float, float]],
+        target_scene_count: int,
+    ) -> tuple[float, list[Scene]]:
+        """
+        Bisect the threshold until the scene count is as close to the target as possible.
+
+        Args:
+            video_info: VideoInfo object
+            scene_scores: (timestamp, score) pairs for every scored frame
+            target_scene_count: Desired number of scenes
+
+        Returns:
+            Tuple of (threshold, scenes) closest to the target
+        """
+        low = 0.0
+        high = max((score for _, score in scene_scores), default=0.0) + 1e-6
+
+        best_threshold = high
+        best_scenes = self._scenes_for_threshold(video_info, scene_scores, high)
+
+        # Scene count falls as the threshold rises
+        for _ in range(self.BISECTION_STEPS):
+            threshold = (low + high) / 2
+            scenes = self._scenes_for_threshold(video_info, scene_scores, threshold)
+
+            if abs(len(scenes) - target_scene_count) < abs(
+                len(best_scenes) - target_scene_count
+            ):
+                best_threshold, best_scenes = threshold, scenes
+
+            if len(scenes) > target_scene_count:
+                low = threshold
+            elif len(scenes) < target_scene_count:
+                high = threshold
+            else:
+                break
+
+        logger.debug(
+            f"Bisection for {target_scene_count} scenes chose threshold "
+            f"{best_threshold:.3f} ({len(best_scenes)} scenes)"
+        )
+        return best_threshold, best_scenes
+
+    def _scenes_for_threshold(
+        self,
+        video_info: VideoInfo,
+        scene_scores: list[tuple[float, float]],
+        threshold: float,
+    ) -> list[Scene]:
+        """
+        Build the scenes a detection pass at ``threshold`` would have produced.
+
+        Args:
+            video_info: VideoInfo object
+            scene_scores: (timestamp, score) pairs for every scored frame
+            threshold: Scene change threshold to apply
+
+        Returns:
+            List of scenes after the minimum duration filter
+        """
+        scene_times = sorted(
+            {0.0} | {time for time, score in scene_scores if score >= threshold}
+        )
+        scenes = self._create_scenes_from_timestamps(scene_times, video_info.duration)
+        return self._filter_scenes_by_duration(scenes)
+
+    def _run_scene_scoring(
+        self,
+        video_info: VideoInfo,
+        progress_callback: Callable[[float], None] | None = None,
+    ) -> list[tuple[float, float]]:
+        """
+        Run one scdet pass at threshold 0 to score every frame.
+
+        Args:
+            video_info: VideoInfo object
+            progress_callback: Optional progress callback
+
+        Returns:
+            List of (timestamp, score) pairs
+
+        Raises:
+            RuntimeError: If ffmpeg scene scoring fails
+        """
+        stream = ffmpeg.input(str(video_info.file_path), **self._proxy_input_args())
+        stream = self._apply_detection_proxy(stream)
+        stream = ffmpeg.filter(stream, "scdet", threshold=0)
+        stream = ffmpeg.output(stream, "-", f="null").global_args("-loglevel", "info")
+
+        try:
+            output = run_and_collect_log(
+                stream,
+                video_info.duration,
+                video_info.duration * 2 + 60,
+                progress_callback,
+            )
+        except (ffmpeg.Error, subprocess.TimeoutExpired) as e:
+            stderr = getattr(e, "stderr", None)
+            error_msg = (
+                stderr.decode(errors="ignore") if isinstance(stderr, bytes) else str(e)
+            )
+            logger.error(f"FFmpeg scene scoring error: {error_msg}")
+            raise RuntimeError(f"Scene scoring failed: {error_msg}") from e
+
+        scene_scores = self._map_scores_to_source(
+            self._parse_scene_scores(output), video_info
+        )
+        logger.debug(f"Scored {len(scene_scores)} frames for adaptive detection")
+        return scene_scores
+
+    def _plan_shards(self, duration: float) -> list[tuple[float, float, float]]:
+        """
+        Split a video into time windows for parallel scene detection.
+
+        Each window owns the range [owned_start, owned_end) and starts decoding
+        ``shard_overlap_seconds`` earlier, so scdet has reference frames for
+        cuts right at the start of the owned range.
+
+        Args:
+            duration: Video duration in seconds
+
+        Returns:
+            List of (window_start, owned_start, owned_end), empty if the video
+            should be detected in a single pass
+        """
+        config = self.config.scene_detection
+        shard_count = config.parallel_shards
+        if shard_count <= 1:
+            return []
+
+        shard_count = min(shard_count, int(duration // config.min_shard_duration))
+        if shard_count <= 1:
+            return []
+
+        shard_length = duration / shard_count
+        shards = []
+        for index in range(shard_count):
+            owned_start = index * shard_length
+            owned_end = duration if index == shard_count - 1 else owned_start + shard_length
+            window_start = max(0.0, owned_start - config.shard_overlap_seconds)
+            shards.append((window_start, owned_start, owned_end))
+        return shards
+
+    def _run_sharded_scoring(
+        self,
+        video_info: VideoInfo,
+        threshold: float,
+        progress_callback: Callable[[float], None] | None = None,
+    ) -> list[tuple[float, float]]:
+        """
+        Run scdet over time windows concurrently and stitch the results.
+
+        Each window is decoded by its own ffmpeg process, so a thread pool is
+        enough to keep several cores busy.
+
+        Args:
+            video_info: VideoInfo object
+            threshold: scdet threshold (0 scores every frame)
+            progress_callback: Optional progress callback, updated per finished window
+
+        Returns:
+            (timestamp, score) pairs on the source timeline, in time order
+
+        Raises:
+            RuntimeError: If any window fails
+        """
+        shards = self._plan_shards(video_info.duration)
+        max_workers = min(len(shards), os.cpu_count() or 1)
+        logger.debug(
+            f"Scene detection split into {len(shards)} windows "
+            f"on {max_workers} workers"
+        )
+
+        scene_scores: list[tuple[float, float]] = []
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # Windows run under the caller's context so cancelling the
+            # analysis also kills their ffmpeg processes
+            futures = [
+                executor.submit(
+                    contextvars.copy_context().run,
+                    self._score_shard,
+                    video_info,
+                    threshold,
+                    *shard,
+                )
+                for shard in shards
+            ]
+            for completed, future in enumerate(as_completed(futures), start=1):
+                scene_scores.extend(future.result())
+                if progress_callback:
+                    progress_callback(completed / len(shards))
+
+        return self._stitch_shard_scores(video_info, scene_scores, threshold)
+
+    def _score_shard(
+        self,
+        video_info: VideoInfo,
+        threshold: float,
+        window_start: float,
+        owned_start: float,
+        owned_end: float,
+    ) -> list[tuple[float, float]]:
+        """
+        Run scdet on one time window.
+
+        Args:
+            video_info: VideoInfo object
+            threshold: scdet threshold
+            window_start: Time decoding starts at
+            owned_start: Start of the range this window reports cuts for
+            owned_end: End (exclusive) of the range this window reports cuts for
+
+        Returns:
+            (timestamp, score) pairs within the owned range, on the source timeline
+
+        Raises:
+            RuntimeError: If ffmpeg fails on this window
+        """
+        window_length = owned_end - window_start
+
+        # Input seeking restarts output timestamps at zero
+        stream = ffmpeg.input(
+            str(video_info.file_path),
+            ss=window_start,
+            t=window_length,
+            **self._proxy_input_args(),
+        )
+        stream = self._apply_detection_proxy(stream)
+        stream = ffmpeg.filter(stream, "scdet", threshold=threshold)
+        stream = ffmpeg.output(stream, "-", f="null").global_args("-loglevel", "info")
+
+        try:
+            output = run_and_collect_log(
+                stream, window_length, window_length * 2 + 60, None
+            )
+        except (ffmpeg.Error, subprocess.TimeoutExpired) as e:
+            stderr = getattr(e, "stderr", None)
+            error_msg = (
+                stderr.decode(errors="ignore") if isinstance(stderr, bytes) else str(e)
+            )
+            logger.error(
+                f"FFmpeg scene detection error in window at {window_start:.1f}s: "
+                f"{error_msg}"
+            )
+            raise RuntimeError(f"Scene detection failed: {error_msg}") from e
+
+        shard_scores = []
+        for time, score in self._parse_scene_scores(output):
+            source_time = self._map_to_source_time(window_start + time, video_info)
+            if owned_start <= source_time < owned_end:
+                shard_scores.append((source_time, score))
+        return shard_scores
+
+    def detect_scene_changes(
+        self, video_info: VideoInfo, start_time: float, end_time: float
+    ) -> list[float]:
+        """
+        Detect the scene changes within one time window of a video.
+
+        Used by windowed processing, which builds scenes on the full timeline
+        from the changes of consecutive windows. Decoding starts
+        ``shard_overlap_seconds`` before the window so a cut right at its
+        start is still seen. Adaptive threshold selection needs the scores of
+        the whole video, so windows are always detected at the base threshold.
+
+        Args:
+            video_info: VideoInfo object
+            start_time: Start of the window in seconds
+            end_time: End (exclusive) of the window in seconds
+
+        Returns:
+            Scene change timestamps within the window, on the source timeline
+
+        Raises:
+            RuntimeError: If ffmpeg fails on the window
+        """
+        threshold = self.config.scene_detection.threshold
+        window_start = max(
+            0.0, start_time - self.config.scene_detection.shard_overlap_seconds
+        )
+        scene_scores = self._score_shard(
+            video_info, threshold, window_start, start_time, end_time
+        )
+        scene_scores = self._stitch_shard_scores(video_info, scene_scores, threshold)
+        return [time for time, _ in scene_scores]
+
+    def _stitch_shard_scores(
+        self,
+        video_info: VideoInfo,
+        scene_scores: list[tuple[float, float]],
+        threshold: float,
+    ) -> list[tuple[float, float]]:
+        """
+        Merge per-window results into one time-ordered series.
+
+        Duplicate timestamps keep the highest score. When detecting cuts
+        (threshold > 0), cuts from neighbouring windows that land within one
+        detection frame of each other are the same cut seen twice, so only
+        the higher scoring one is kept.
+
+        Args:
+            video_info: VideoInfo object
+            scene_scores: (timestamp, score) pairs from all windows
+            threshold: scdet threshold the windows were run with
+
+        Returns:
+            Deduplicated (timestamp, score) pairs in time order
+        """
+        best: dict[float, float] = {}
+        for time, score in scene_scores:
+            best[time] = max(score, best.get(time, score))
+        merged = sorted(best.items())
+
+        if threshold <= 0:
+            return merged
+
+        proxy_fps = self.config.scene_detection.proxy_fps
+        frame_fps = proxy_fps if proxy_fps > 0 else video_info.fps
+        tolerance = 1.0 / frame_fps if frame_fps > 0 else 0.0
+
+        stitched: list[tuple[float, float]] = []
+        for time, score in merged:
+            if stitched and round(time - stitched[-1][0], 6) <= tolerance:
+                if score > stitched[-1][1]:
+                    stitched[-1] = (time, score)
+                continue
+            stitched.append((time, score))
+        return stitched
+
+    def _map_scores_to_source(
+        self, scene_scores: list[tuple[float, float]], video_info: VideoInfo
+    ) -> list[tuple[float, float]]:
+        """Map (timestamp, score) pairs from the proxy onto the source timeline."""
+        return [
+            (self._map_to_source_time(time, video_info), score)
+            for time, score in scene_scores
+        ]
+
     def _run_scene_detection(
         self,
         video_info: VideoInfo,
@@ -267,28 +867,7 @@ class SceneDetector:
             RuntimeError: If ffmpeg scene detection fails
         """
         try:
-            # Build ffmpeg command for scene detection
-            # Use select filter to detect scene changes
-            stream = ffmpeg.input(str(video_info.file_path))
-            stream = ffmpeg.filter(stream, "select", f"gt(scene,{threshold})")
-            stream = ffmpeg.output(
-                stream,
-                "-",
-                f="null",
-                **{"show_entries": "packet=pts_time", "of": "csv=p=0"},
-            )
-
-            # Alternative approach using scene detection filter
-            # This gives us scene change information
-            scene_stream = ffmpeg.input(str(video_info.file_path))
-            scene_stream = ffmpeg.filter(scene_stream, "scdet", threshold=threshold)
-            scene_stream = ffmpeg.output(
-                scene_stream,
-                "-",
-                f="null",
-                vf=f"scdet=threshold={threshold}:sc_pass=1",
-                loglevel="info",
-            )
+            scene_stream = self._scene_detection_stream(video_info, threshold)
 
             # Run scene detection
             if progress_callback:
@@ -298,13 +877,12 @@ class SceneDetector:
                 )
                 stderr_output = ""
             else:
-                _, stderr = ffmpeg.run(
+                _, stderr = run_ffmpeg(
                     scene_stream, capture_stdout=True, capture_stderr=True
                 )
                 stderr_output = stderr.decode() if stderr else ""
 
-            # Parse scene change timestamps from stderr output
-            scene_times = self._parse_scene_timestamps(stderr_output)
+            scene_times = self._scene_times_from_log(stderr_output, video_info)
 
             logger.debug(
                 f"Found {len(scene_times)} scene changes with threshold {threshold}"
@@ -322,6 +900,29 @@ class SceneDetector:
             logger.error(f"FFmpeg scene detection error: {error_msg}")
             raise RuntimeError(f"Scene detection failed: {error_msg}") from e
 
+    def _scene_detection_stream(self, video_info: VideoInfo, threshold: float) -> Any:
+        """Build the scdet pass over the (optionally downscaled) detection proxy."""
+        scene_stream = ffmpeg.input(str(video_info.file_path), **self._proxy_input_args())
+        scene_stream = self._apply_detection_proxy(scene_stream)
+        scene_stream = ffmpeg.filter(scene_stream, "scdet", threshold=threshold)
+        return ffmpeg.output(
+            scene_stream,
+            "-",
+            f="null",
+            loglevel="info",
+        )
+
+    def _scene_times_from_log(
+        self, ffmpeg_output: str, video_info: VideoInfo
+    ) -> list[float]:
+        """Parse scene change timestamps from stderr output, in source time."""
+        return sorted(
+            {
+                self._map_to_source_time(time, video_info)
+                for time in self._parse_scene_timestamps(ffmpeg_output)
+            }
+        )
+
     def _parse_scene_timestamps(self, ffmpeg_output: str) -> list[float]:
         """
         Parse scene detection timestamps from ffmpeg output.
@@ -357,8 +958,47 @@ class SceneDetector:
             except (ValueError, IndexError):
                 continue
 
+        # scdet log format
+        # Pattern like: [scdet @ 0x...] lavfi.scd.score: 12.345, lavfi.scd.time: 12.345
+        scdet_pattern = r"lavfi\.scd\.score:\s*[\d.]+,\s*lavfi\.scd\.time:\s*([\d.]+)"
+
+        for match in re.finditer(scdet_pattern, ffmpeg_output):
+            try:
+                timestamp = float(match.group(1))
+                if timestamp not in scene_times:
+                    scene_times.append(timestamp)
+            except (ValueError, IndexError):
+                continue
+
         return sorted(set(scene_times))  # Remove duplicates and sort
 
+    def _parse_scene_scores(self, ffmpeg_output: str) -> list[tuple[float, float]]:
+        """
+        Parse per-frame scene scores from ffmpeg output.
+
+        Args:
+            ffmpeg_output: FFmpeg stderr output containing scene scores
+
+        Returns:
+            List of (timestamp, score) pairs in time order
+        """
+        patterns = [
+            # [scdet @ 0x...] lavfi.scd.score: 12.345, lavfi.scd.time: 12.345
+            r"lavfi\.scd\.score:\s*(?P<score>[\d.]+),\s*lavfi\.scd\.time:\s*(?P<time>[\d.]+)",
+            # lavfi.scene_score=0.123456 pts_time:12.345
+            r"lavfi\.scene_score=(?P<score>[\d.]+).*?pts_time:(?P<time>[\d.]+)",
+        ]
+
+        scores: dict[float, float] = {}
+        for pattern in patterns:
+            for match in re.finditer(pattern, ffmpeg_output):
+                try:
+                    scores[float(match.group("time"))] = float(match.group("score"))
+                except ValueError:
+                    continue
+
+        return sorted(scores.items())
+
     def _create_scenes_from_timestamps(
         self, timestamps: list[float], total_duration: float
     ) -> list[Scene]:
@@ -491,43 +1131,48 @@ class SceneDetector:
         try:
             process = ffmpeg.run_async(stream, pipe_stderr=True, quiet=True)
 
-            while True:
-                if process.stderr is None:
-                    break
-                output = process.stderr.readline()
-                if output == b"" and process.poll() is not None:
-                    break
-
-                if output:
-                    line = output.decode("utf-8").strip()
-
-                    # Parse progress from ffmpeg output
-                    if "time=" in line:
-                        try:
-                            time_str = line.split("time=")[1].split()[0]
-
-                            if ":" in time_str:
-                                parts = time_str.split(":")
-                                if len(parts) == 3:
-                                    hours = float(parts[0])
-                                    minutes = float(parts[1])
-                                    seconds = float(parts[2])
-                                    current_time = hours * 3600 + minutes * 60 + seconds
-
-                                    progress = min(current_time / total_duration, 1.0)
-                                    progress_callback(progress)
-                        except (ValueError, IndexError):
-                            pass
-
-            process.wait()
-            progress_callback(1.0)  # Final progress update
-
-            # Create result object with stderr
-            class Result:
-                def __init__(self, stderr: bytes):
-                    self.stderr = stderr
-
-            return Result(process.stderr.read() if process.stderr else b"")
+            with terminate_on_cancel(process):
+                while True:
+                    if process.stderr is None:
+                        break
+                    output = process.stderr.readline()
+                    if output == b"" and process.poll() is not None:
+                        break
+
+                    if output:
+                        line = output.decode("utf-8").strip()
+
+                        # Parse progress from ffmpeg output
+                        if "time=" in line:
+                            try:
+                                time_str = line.split("time=")[1].split()[0]
+
+                                if ":" in time_str:
+                                    parts = time_str.split(":")
+                                    if len(parts) == 3:
+                                        hours = float(parts[0])
+                                        minutes = float(parts[1])
+                                        seconds = float(parts[2])
+                                        current_time = (
+                                            hours * 3600 + minutes * 60 + seconds
+                                        )
+
+                                        progress = min(
+                                            current_time / total_duration, 1.0
+                                        )
+                                        progress_callback(progress)
+                            except (ValueError, IndexError):
+                                pass
+
+                process.wait()
+                progress_callback(1.0)  # Final progress update
+
+                # Create result object with stderr
+                class Result:
+                    def __init__(self, stderr: bytes):
+                        self.stderr = stderr
+
+                return Result(process.stderr.read() if process.stderr else b"")
 
         except Exception as e:
             logger.error(f"Error during scene detection progress tracking: {e}")
@@ -0,0 +1,895 @@
+"""Declarative stage graph and resource-aware scheduler for analysis pipelines."""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import time
+from collections import defaultdict
+from collections.abc import Awaitable, Callable, Iterable, Iterator
+from contextlib import contextmanager
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, Protocol
+
+from deep_brief.core.cancellation import CancellationToken, cancellation_scope
+from deep_brief.core.exceptions import OperationCancelledError
+from deep_brief.core.progress_tracker import CompositeProgressTracker
+
+logger = logging.getLogger(__name__)
+
+# Resources stages can reserve while they run
+RESOURCE_CPU = "cpu"  # CPU-bound work in this process
+RESOURCE_FFMPEG = "ffmpeg"  # ffmpeg subprocesses
+RESOURCE_MODEL_MEMORY = "model_memory_mb"  # Estimated model memory in MB
+
+StageFunction = Callable[
+    [dict[str, Any], Callable[[float], None] | None], dict[str, Any]
+]
+AsyncStageFunction = Callable[
+    [dict[str, Any], Callable[[float], None] | None], Awaitable[dict[str, Any]]
+]
+
+
+class StageCache(Protocol):
+    """Storage for stage outputs, keyed by stage cache keys."""
+
+    def contains(self, key: str) -> bool: ...
+
+    def get(self, key: str) -> dict[str, Any] | None: ...
+
+    def put(self, key: str, outputs: dict[str, Any]) -> None: ...
+
+
+class StageStatus(Enum):
+    """Status of a stage within a scheduler run."""
+
+    PENDING = "pending"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+    SKIPPED = "skipped"
+
+
+@dataclass
+class StageCachePolicy:
+    """
+    What a stage's outputs depend on, for caching them between runs.
+
+    The stage's cache key is derived from the keys of its input artifacts and
+    from ``settings``, which must hold every configuration value (and stage
+    parameter) the stage reads. Its output artifacts are keyed from the stage
+    key, so changing a setting invalidates that stage and everything
+    downstream of it, and nothing else.
+    """
+
+    settings: dict[str, Any] = field(default_factory=dict)
+    key_inputs: tuple[str, ...] | None = None  # Inputs that affect outputs (None: all)
+    stored_outputs: tuple[str, ...] | None = None  # Outputs kept (None: all)
+    cacheable: bool = True  # False: key outputs for dependents but always run
+    store_if: Callable[[dict[str, Any]], bool] | None = None  # Outputs worth storing
+
+
+@dataclass
+class Stage:
+    """
+    One unit of work in a stage graph.
+
+    A stage runs once every stage producing its inputs has finished. Required
+    inputs must be available (not None) or the stage is skipped; optional
+    inputs are waited for but may be None. The stage function receives its
+    inputs and a progress callback and returns a dict of its outputs.
+    StageScheduler.run_async awaits ``run_async`` instead when a stage has
+    one, and runs ``run`` on the event loop's default executor otherwise.
+    """
+
+    name: str
+    run: StageFunction
+    inputs: tuple[str, ...] = ()
+    optional_inputs: tuple[str, ...] = ()
+    outputs: tuple[str, ...] = ()
+    resources: dict[str, int] = field(default_factory=dict)
+    weight: float = 1.0
+    required: bool = True  # A failure aborts the run instead of being recorded
+    description: str = ""
+    cache: StageCachePolicy | None = None  # None: outputs are never cached
+    run_async: AsyncStageFunction | None = None  # Coroutine variant of run
+
+
+def stage_cache_key(
+    stage_name: str, input_keys: dict[str, str], settings: dict[str, Any]
+) -> str:
+    """
+    Derive a stage's cache key from its input artifact keys and settings.
+
+    Args:
+        stage_name: Name of the stage
+        input_keys: Cache keys of the inputs the outputs depend on
+        settings: Configuration values and parameters the stage reads
+
+    Returns:
+        Hex digest cache key
+    """
+    encoded = json.dumps(
+        {"stage": stage_name, "inputs": input_keys, "settings": settings},
+        sort_keys=True,
+        default=str,
+    ).encode()
+    return hashlib.sha256(encoded).hexdigest()
+
+
+@dataclass
+class StageResult:
+    """Outcome of a single stage."""
+
+    name: str
+    status: StageStatus = StageStatus.PENDING
+    duration: float = 0.0
+    error: Exception | None = None
+    skipped_reason: str | None = None
+    from_cache: bool = False  # Outputs were loaded from the stage cache
+
+
+@dataclass
+class StageRun:
+    """Artifacts and per-stage outcomes of a scheduler run."""
+
+    artifacts: dict[str, Any]
+    results: dict[str, StageResult]
+    processing_time: float = 0.0
+    artifact_keys: dict[str, str] = field(default_factory=dict)
+
+    def failed_stages(self) -> list[StageResult]:
+        """Get the stages that raised an error."""
+        return [r for r in self.results.values() if r.status == StageStatus.FAILED]
+
+    def skipped_stages(self) -> list[StageResult]:
+        """Get the stages that were skipped."""
+        return [r for r in self.results.values() if r.status == StageStatus.SKIPPED]
+
+    def cached_stages(self) -> list[StageResult]:
+        """Get the stages whose outputs were loaded from the stage cache."""
+        return [r for r in self.results.values() if r.from_cache]
+
+
+class StageRunCancelledError(OperationCancelledError):
+    """A stage run was cancelled; carries the artifacts produced before it stopped."""
+
+    def __init__(self, message: str, artifacts: dict[str, Any]):
+        super().__init__(message=message, operation="stage run")
+        self.artifacts = artifacts
+
+
+@dataclass
+class _RunState:
+    """Bookkeeping of one scheduler run."""
+
+    artifacts: dict[str, Any]
+    pending: list[Stage]
+    results: dict[str, StageResult]
+    keys: dict[str, str]
+    progress_tracker: CompositeProgressTracker | None
+    # Future -> (stage, start time, reserved resources)
+    running: dict[Any, tuple[Stage, float, dict[str, int]]] = field(
+        default_factory=dict
+    )
+    in_use: dict[str, int] = field(default_factory=lambda: defaultdict(int))
+    fatal_error: BaseException | None = None
+    cancel_token: CancellationToken | None = None
+    on_stage_finished: Callable[[StageResult], None] | None = None
+
+
+class StageGraph:
+    """A set of stages connected by the artifacts they produce and consume."""
+
+    def __init__(self, stages: Iterable[Stage] | None = None):
+        """
+        Initialize the stage graph.
+
+        Args:
+            stages: Optional stages to add
+        """
+        self._stages: dict[str, Stage] = {}
+        self._producers: dict[str, str] = {}
+        for stage in stages or []:
+            self.add_stage(stage)
+
+    @property
+    def stages(self) -> list[Stage]:
+        """Stages in the order they were added."""
+        return list(self._stages.values())
+
+    def add_stage(self, stage: Stage) -> None:
+        """
+        Add a stage to the graph.
+
+        Args:
+            stage: Stage to add
+
+        Raises:
+            ValueError: If the name or one of the outputs is already taken
+        """
+        if stage.name in self._stages:
+            raise ValueError(f"Duplicate stage name: {stage.name}")
+        for output in stage.outputs:
+            if output in self._producers:
+                raise ValueError(
+                    f"Artifact '{output}' is produced by both "
+                    f"'{self._producers[output]}' and '{stage.name}'"
+                )
+
+        self._stages[stage.name] = stage
+        for output in stage.outputs:
+            self._producers[output] = stage.name
+
+    def get_stage(self, name: str) -> Stage | None:
+        """Get a stage by name."""
+        return self._stages.get(name)
+
+    def producer_of(self, artifact: str) -> Stage | None:
+        """Get the stage producing an artifact, or None for external inputs."""
+        name = self._producers.get(artifact)
+        return self._stages[name] if name is not None else None
+
+    def consumers_of(self, artifact: str) -> list[Stage]:
+        """Get the stages reading an artifact."""
+        return [
+            stage
+            for stage in self._stages.values()
+            if artifact in stage.inputs or artifact in stage.optional_inputs
+        ]
+
+    def validate(self, initial_artifacts: Iterable[str] = ()) -> list[Stage]:
+        """
+        Check that every input has a source and the graph has no cycles.
+
+        Args:
+            initial_artifacts: Artifacts supplied by the caller
+
+        Returns:
+            Stages in a dependency-respecting order
+
+        Raises:
+            ValueError: If an input has no producer or the graph has a cycle
+        """
+        available = set(initial_artifacts)
+        for stage in self._stages.values():
+            for artifact in (*stage.inputs, *stage.optional_inputs):
+                if artifact not in self._producers and artifact not in available:
+                    raise ValueError(
+                        f"Stage '{stage.name}' needs '{artifact}', "
+                        "which no stage produces"
+                    )
+
+        # Kahn's algorithm, keeping insertion order among ready stages
+        dependencies = {
+            name: {
+                self._producers[artifact]
+                for artifact in (*stage.inputs, *stage.optional_inputs)
+                if artifact in self._producers
+            }
+            for name, stage in self._stages.items()
+        }
+        order: list[Stage] = []
+        done: set[str] = set()
+        while len(order) < len(self._stages):
+            ready = [
+                name
+                for name, deps in dependencies.items()
+                if name not in done and deps <= done
+            ]
+            if not ready:
+                cycle = sorted(set(self._stages) - done)
+                raise ValueError(f"Stage graph has a cycle among: {cycle}")
+            for name in ready:
+                order.append(self._stages[name])
+                done.add(name)
+
+        return order
+
+
+class StageScheduler:
+    """
+    Run a stage graph, starting stages as soon as their inputs are ready.
+
+    Ready stages run concurrently on a thread pool as long as their declared
+    resources fit within the configured limits. A stage asking for more of a
+    resource than the limit is clamped to the limit, so it runs once nothing
+    else holds that resource. Resources without a limit are not constrained.
+
+    Given a stage cache, a stage with a cache policy whose key is already
+    stored is loaded instead of run, without reserving its resources, and
+    newly computed outputs are stored for the next run.
+    """
+
+    def __init__(
+        self,
+        graph: StageGraph,
+        resource_limits: dict[str, int] | None = None,
+        max_workers: int | None = None,
+        cache: StageCache | None = None,
+    ):
+        """
+        Initialize the scheduler.
+
+        Args:
+            graph: Stage graph to run
+            resource_limits: Maximum units of each resource held at once
+                (defaults to one CPU slot per core)
+            max_workers: Maximum number of stages running at once
+            cache: Optional stage cache for stages with a cache policy
+        """
+        self.graph = graph
+        self.resource_limits = (
+            dict(resource_limits)
+            if resource_limits is not None
+            else {RESOURCE_CPU: os.cpu_count() or 1}
+        )
+        self.max_workers = max_workers or max(1, len(graph.stages))
+        self.cache = cache
+
+    def run(
+        self,
+        artifacts: dict[str, Any] | None = None,
+        progress_tracker: CompositeProgressTracker | None = None,
+        artifact_keys: dict[str, str] | None = None,
+        cancel_token: CancellationToken | None = None,
+        on_stage_finished: Callable[[StageResult], None] | None = None,
+    ) -> StageRun:
+        """
+        Run every stage in the graph.
+
+        Optional stages that fail are recorded and the stages depending on
+        their outputs are skipped. When a required stage fails, no further
+        stages are started, running stages are allowed to finish, and the
+        original exception is re-raised.
+
+        Stages run with ``cancel_token`` as their current cancellation token.
+        Once it is cancelled no further stages are started and the run
+        returns without waiting for the running ones, which stop at their
+        next cancellation check (ffmpeg processes they started are killed).
+
+        Args:
+            artifacts: Initial artifacts, such as the input path
+            progress_tracker: Optional workflow tracker with one operation per stage
+            artifact_keys: Cache keys of the initial artifacts, such as a
+                content fingerprint of the input file; stages depending on
+                an artifact without a key are not cached
+            cancel_token: Optional token that cancels the run
+            on_stage_finished: Optional callback receiving the result of each
+                stage as it completes or fails, such as to checkpoint progress
+
+        Returns:
+            StageRun with all artifacts and per-stage results
+
+        Raises:
+            ValueError: If the graph is invalid
+            StageRunCancelledError: If the run was cancelled
+            Exception: Whatever a failing required stage raised
+        """
+        start_time = time.time()
+        state = self._start_run(artifacts, progress_tracker, artifact_keys)
+        state.cancel_token = cancel_token
+        state.on_stage_finished = on_stage_finished
+
+        executor = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="deep_brief_stage"
+        )
+
+        def submit(
+            stage: Stage,
+            stage_inputs: dict[str, Any],
+            progress_callback: Callable[[float], None] | None,
+            cache_key: str | None,
+        ) -> Future[tuple[dict[str, Any], bool]]:
+            return executor.submit(
+                self._execute,
+                stage,
+                stage_inputs,
+                progress_callback,
+                cache_key,
+                cancel_token,
+            )
+
+        # Completed when the run is cancelled, to stop waiting on stages
+        cancelled: Future[None] = Future()
+        try:
+            with self._on_cancel(cancel_token, lambda: cancelled.set_result(None)):
+                while self._schedule(state, submit):
+                    done, _ = wait(
+                        [*state.running, cancelled], return_when=FIRST_COMPLETED
+                    )
+                    for future in done - {cancelled}:
+                        self._finish_stage(state, future)
+                    if cancelled.done():
+                        self._abandon_running(state)
+        finally:
+            # Stages of a cancelled run finish in the background
+            executor.shutdown(wait=not cancelled.done(), cancel_futures=True)
+
+        return self._end_run(state, start_time)
+
+    async def run_async(
+        self,
+        artifacts: dict[str, Any] | None = None,
+        progress_tracker: CompositeProgressTracker | None = None,
+        artifact_keys: dict[str, str] | None = None,
+        cancel_token: CancellationToken | None = None,
+        on_stage_finished: Callable[[StageResult], None] | None = None,
+    ) -> StageRun:
+        """
+        Run every stage in the graph on the running event loop.
+
+        Behaves like run, but stages run as tasks: stages with a
+        ``run_async`` coroutine are awaited directly, and the others (and
+        stage cache access) run on the loop's default executor, so the loop
+        is never blocked. Cancelling the run, by cancelling the awaiting task
+        or through ``cancel_token``, cancels the running stages.
+
+        Args:
+            artifacts: Initial artifacts, such as the input path
+            progress_tracker: Optional workflow tracker with one operation per stage
+            artifact_keys: Cache keys of the initial artifacts
+            cancel_token: Optional token that cancels the run
+            on_stage_finished: Optional callback receiving the result of each
+                stage as it completes or fails
+
+        Returns:
+            StageRun with all artifacts and per-stage results
+
+        Raises:
+            ValueError: If the graph is invalid
+            StageRunCancelledError: If the run was cancelled through the token
+            Exception: Whatever a failing required stage raised
+        """
+        start_time = time.time()
+        state = self._start_run(artifacts, progress_tracker, artifact_keys)
+        state.cancel_token = cancel_token
+        state.on_stage_finished = on_stage_finished
+
+        def submit(
+            stage: Stage,
+            stage_inputs: dict[str, Any],
+            progress_callback: Callable[[float], None] | None,
+            cache_key: str | None,
+        ) -> asyncio.Task[tuple[dict[str, Any], bool]]:
+            return asyncio.ensure_future(
+                self._execute_async(
+                    stage, stage_inputs, progress_callback, cache_key, cancel_token
+                )
+            )
+
+        loop = asyncio.get_running_loop()
+        cancelled = loop.create_future()
+
+        def on_cancel() -> None:
+            loop.call_soon_threadsafe(
+                lambda: cancelled.done() or cancelled.set_result(None)
+            )
+
+        try:
+            with self._on_cancel(cancel_token, on_cancel):
+                while self._schedule(state, submit):
+                    done, _ = await asyncio.wait(
+                        [*state.running, cancelled],
+                        return_when=asyncio.FIRST_COMPLETED,
+                    )
+                    for future in done - {cancelled}:
+                        self._finish_stage(state, future)
+                    if cancelled.done():
+                        abandoned = self._abandon_running(state)
+                        await asyncio.gather(*abandoned, return_exceptions=True)
+        except asyncio.CancelledError:
+            for future in state.running:
+                future.cancel()
+            await asyncio.gather(*state.running, return_exceptions=True)
+            raise
+
+        return self._end_run(state, start_time)
+
+    def _start_run(
+        self,
+        artifacts: dict[str, Any] | None,
+        progress_tracker: CompositeProgressTracker | None,
+        artifact_keys: dict[str, str] | None,
+    ) -> _RunState:
+        """Validate the graph against the initial artifacts and set up a run."""
+        artifacts = dict(artifacts or {})
+        pending = self.graph.validate(artifacts)
+        logger.debug(f"Running stage graph: {[stage.name for stage in pending]}")
+        return _RunState(
+            artifacts=artifacts,
+            pending=pending,
+            results={stage.name: StageResult(name=stage.name) for stage in pending},
+            keys=self.compute_keys(pending, artifact_keys or {}),
+            progress_tracker=progress_tracker,
+        )
+
+    def _schedule(self, state: _RunState, submit: Callable[..., Any]) -> bool:
+        """
+        Start ready stages (or skip the rest after a fatal error or cancellation).
+
+        Returns:
+            Whether any stage is running and needs to be waited for
+        """
+        cancelled = state.cancel_token is not None and state.cancel_token.cancelled
+        if state.fatal_error is None and not cancelled:
+            self._start_ready_stages(state, submit)
+        else:
+            reason = "cancelled" if cancelled else "aborted"
+            for stage in state.pending:
+                self._skip(stage, state.results, reason, state.progress_tracker)
+            state.pending.clear()
+
+        if not state.running:
+            if state.pending:
+                # Cannot happen for a validated graph; guard against hangs
+                raise RuntimeError(
+                    f"Stages could not be scheduled: {[s.name for s in state.pending]}"
+                )
+            return False
+        return True
+
+    def _finish_stage(self, state: _RunState, future: Any) -> None:
+        """Record the outcome of a finished stage and release its resources."""
+        stage, stage_start, reserved = state.running.pop(future)
+        self._release(reserved, state.in_use)
+        result = state.results[stage.name]
+        result.duration = time.time() - stage_start
+
+        error = future.exception()
+        if error is None:
+            outputs, from_cache = future.result()
+            for artifact in stage.outputs:
+                state.artifacts[artifact] = outputs.get(artifact)
+            result.status = StageStatus.COMPLETED
+            result.from_cache = from_cache
+            logger.debug(
+                f"Stage '{stage.name}' "
+                f"{'loaded from cache' if from_cache else 'completed'} "
+                f"in {result.duration:.2f}s"
+            )
+        else:
+            result.status = StageStatus.FAILED
+            result.error = error  # type: ignore[assignment]
+            for artifact in stage.outputs:
+                state.artifacts[artifact] = None
+            if stage.required and state.fatal_error is None:
+                state.fatal_error = error
+                logger.error(f"Required stage '{stage.name}' failed: {error}")
+            else:
+                logger.warning(f"Stage '{stage.name}' failed: {error}")
+
+        if state.progress_tracker:
+            state.progress_tracker.complete_operation(stage.name)
+        if state.on_stage_finished:
+            state.on_stage_finished(result)
+
+    def _abandon_running(self, state: _RunState) -> list[Any]:
+        """
+        Stop waiting for the running stages of a cancelled run.
+
+        Returns:
+            The abandoned futures, which have been asked to cancel
+        """
+        abandoned = list(state.running)
+        for future in abandoned:
+            stage, stage_start, reserved = state.running.pop(future)
+            future.cancel()
+            self._release(reserved, state.in_use)
+            result = state.results[stage.name]
+            result.status = StageStatus.FAILED
+            result.duration = time.time() - stage_start
+            result.error = OperationCancelledError(operation=stage.name)
+            for artifact in stage.outputs:
+                state.artifacts[artifact] = None
+            if state.progress_tracker:
+                state.progress_tracker.complete_operation(stage.name)
+            logger.info(f"Stage '{stage.name}' abandoned: run cancelled")
+        return abandoned
+
+    @staticmethod
+    @contextmanager
+    def _on_cancel(
+        cancel_token: CancellationToken | None, callback: Callable[[], None]
+    ) -> Iterator[None]:
+        """Run a callback if the token is cancelled during the block."""
+        if cancel_token is None:
+            yield
+        else:
+            with cancel_token.on_cancel(callback):
+                yield
+
+    def _end_run(self, state: _RunState, start_time: float) -> StageRun:
+        """Re-raise a fatal error or package the run's outcome."""
+        token = state.cancel_token
+        if token is not None and token.cancelled:
+            raise StageRunCancelledError(
+                token.reason or "Stage run cancelled", state.artifacts
+            )
+        if state.fatal_error is not None:
+            raise state.fatal_error
+
+        return StageRun(
+            artifacts=state.artifacts,
+            results=state.results,
+            processing_time=time.time() - start_time,
+            artifact_keys=state.keys,
+        )
+
+    def compute_keys(
+        self, order: list[Stage], artifact_keys: dict[str, str]
+    ) -> dict[str, str]:
+        """
+        Derive the cache key of every artifact before anything runs.
+
+        Keys depend only on the initial artifact keys and the stages' cache
+        policies, never on artifact values, so they are known up front. A
+        stage without a cache policy, or with an input whose key is unknown,
+        leaves its outputs (and everything downstream) without a key.
+
+        Args:
+            order: Stages in dependency order
+            artifact_keys: Cache keys of the initial artifacts
+
+        Returns:
+            Cache keys by artifact name, including stage keys under
+            "stage:<name>"
+        """
+        keys = dict(artifact_keys)
+        for stage in order:
+            policy = stage.cache
+            if policy is None:
+                continue
+
+            key_inputs = (
+                policy.key_inputs
+                if policy.key_inputs is not None
+                else (*stage.inputs, *stage.optional_inputs)
+            )
+            input_keys = {}
+            for artifact in key_inputs:
+                if artifact in keys:
+                    input_keys[artifact] = keys[artifact]
+                elif artifact in stage.inputs or self.graph.producer_of(artifact):
+                    break
+            else:
+                stage_key = stage_cache_key(stage.name, input_keys, policy.settings)
+                keys[f"stage:{stage.name}"] = stage_key
+                for artifact in stage.outputs:
+                    keys[artifact] = stage_cache_key(artifact, {stage.name: stage_key}, {})
+        return keys
+
+    def _restorable(self, stage: Stage) -> bool:
+        """Whether cached outputs can stand in for running the stage."""
+        policy = stage.cache
+        if policy is None or not policy.cacheable:
+            return False
+        if policy.stored_outputs is None:
+            return True
+
+        # Outputs that are not stored come back as None, which only
+        # consumers reading them as optional inputs can handle
+        return not any(
+            artifact in consumer.inputs
+            for artifact in stage.outputs
+            if artifact not in policy.stored_outputs
+            for consumer in self.graph.consumers_of(artifact)
+        )
+
+    def _execute(
+        self,
+        stage: Stage,
+        stage_inputs: dict[str, Any],
+        progress_callback: Callable[[float], None] | None,
+        cache_key: str | None,
+        cancel_token: CancellationToken | None = None,
+    ) -> tuple[dict[str, Any], bool]:
+        """Load a stage's outputs from the cache or run it and store them."""
+        with cancellation_scope(cancel_token):
+            if cancel_token is not None:
+                cancel_token.raise_if_cancelled(stage.name)
+
+            cached = self._load_cached(stage, progress_callback, cache_key)
+            if cached is not None:
+                return cached, True
+
+            outputs = stage.run(stage_inputs, progress_callback) or {}
+            self._store(stage, outputs, cache_key)
+            return outputs, False
+
+    async def _execute_async(
+        self,
+        stage: Stage,
+        stage_inputs: dict[str, Any],
+        progress_callback: Callable[[float], None] | None,
+        cache_key: str | None,
+        cancel_token: CancellationToken | None = None,
+    ) -> tuple[dict[str, Any], bool]:
+        """Async counterpart of _execute, keeping blocking work off the loop."""
+        # Each task has its own context, which to_thread passes on to threads
+        with cancellation_scope(cancel_token):
+            if cancel_token is not None:
+                cancel_token.raise_if_cancelled(stage.name)
+            return await self._execute_stage_async(
+                stage, stage_inputs, progress_callback, cache_key
+            )
+
+    async def _execute_stage_async(
+        self,
+        stage: Stage,
+        stage_inputs: dict[str, Any],
+        progress_callback: Callable[[float], None] | None,
+        cache_key: str | None,
+    ) -> tuple[dict[str, Any], bool]:
+        """Load a stage's outputs from the cache or run it, on the event loop."""
+        if cache_key is not None and self.cache is not None:
+            cached = await asyncio.to_thread(
+                self._load_cached, stage, progress_callback, cache_key
+            )
+            if cached is not None:
+                return cached, True
+
+        if stage.run_async is not None:
+            outputs = await stage.run_async(stage_inputs, progress_callback) or {}
+        else:
+            outputs = (
+                await asyncio.to_thread(stage.run, stage_inputs, progress_callback)
+                or {}
+            )
+
+        if cache_key is not None and self.cache is not None:
+            await asyncio.to_thread(self._store, stage, outputs, cache_key)
+        return outputs, False
+
+    def _load_cached(
+        self,
+        stage: Stage,
+        progress_callback: Callable[[float], None] | None,
+        cache_key: str | None,
+    ) -> dict[str, Any] | None:
+        """Load a stage's stored outputs, if any."""
+        if cache_key is None or self.cache is None:
+            return None
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            logger.info(f"Stage '{stage.name}' loaded from cache")
+            if progress_callback:
+                progress_callback(1.0)
+        return cached
+
+    def _store(
+        self, stage: Stage, outputs: dict[str, Any], cache_key: str | None
+    ) -> None:
+        """Store a stage's outputs under its cache key."""
+        if cache_key is None or self.cache is None:
+            return
+
+        policy: StageCachePolicy = stage.cache  # type: ignore[assignment]
+        if policy.store_if is not None and not policy.store_if(outputs):
+            return
+
+        stored_outputs = policy.stored_outputs
+        stored = {
+            artifact: outputs.get(artifact)
+            for artifact in (
+                stored_outputs if stored_outputs is not None else stage.outputs
+            )
+        }
+        # Stages that produced nothing (for example after a recorded
+        # error) are retried next time
+        if any(value is not None for value in stored.values()):
+            self.cache.put(cache_key, stored)
+
+    def _start_ready_stages(
+        self, state: _RunState, submit: Callable[..., Any]
+    ) -> None:
+        """Skip stages with missing inputs and submit stages that are ready."""
+        # Skipping a stage can make its dependents skippable, so repeat
+        changed = True
+        while changed:
+            changed = False
+            for stage in list(state.pending):
+                if not self._inputs_finished(stage, state.results):
+                    continue
+
+                missing = [name for name in stage.inputs if state.artifacts.get(name) is None]
+                if missing:
+                    state.pending.remove(stage)
+                    self._skip(
+                        stage,
+                        state.results,
+                        f"missing input: {', '.join(missing)}",
+                        state.progress_tracker,
+                    )
+                    changed = True
+                    continue
+
+                cache_key = None
+                if self.cache is not None and self._restorable(stage):
+                    cache_key = state.keys.get(f"stage:{stage.name}")
+                cached = cache_key is not None and self.cache.contains(cache_key)  # type: ignore[union-attr]
+
+                # Loading cached outputs needs none of the stage's resources
+                resources = {} if cached else stage.resources
+                if len(state.running) >= self.max_workers or not self._fits(
+                    resources, state.in_use
+                ):
+                    continue
+
+                state.pending.remove(stage)
+                reserved = self._reserve(resources, state.in_use)
+                state.results[stage.name].status = StageStatus.RUNNING
+                progress_callback = (
+                    state.progress_tracker.start_operation(stage.name)
+                    if state.progress_tracker
+                    else None
+                )
+                stage_inputs = {
+                    name: state.artifacts.get(name)
+                    for name in (*stage.inputs, *stage.optional_inputs)
+                }
+                logger.debug(f"Starting stage '{stage.name}'")
+                future = submit(stage, stage_inputs, progress_callback, cache_key)
+                state.running[future] = (stage, time.time(), reserved)
+                changed = True
+
+    def _inputs_finished(self, stage: Stage, results: dict[str, StageResult]) -> bool:
+        """Whether every stage producing one of the inputs has finished."""
+        for artifact in (*stage.inputs, *stage.optional_inputs):
+            producer = self.graph.producer_of(artifact)
+            if producer is not None and results[producer.name].status in (
+                StageStatus.PENDING,
+                StageStatus.RUNNING,
+            ):
+                return False
+        return True
+
+    def _skip(
+        self,
+        stage: Stage,
+        results: dict[str, StageResult],
+        reason: str,
+        progress_tracker: CompositeProgressTracker | None,
+    ) -> None:
+        """Mark a stage as skipped."""
+        result = results[stage.name]
+        result.status = StageStatus.SKIPPED
+        result.skipped_reason = reason
+        logger.debug(f"Skipping stage '{stage.name}': {reason}")
+        if progress_tracker:
+            progress_tracker.complete_operation(stage.name)
+
+    def _amount(self, resources: dict[str, int], resource: str) -> int:
+        """Units of a resource a stage holds, clamped to the limit."""
+        amount = resources.get(resource, 0)
+        limit = self.resource_limits.get(resource)
+        return min(amount, limit) if limit is not None else amount
+
+    def _fits(self, resources: dict[str, int], in_use: dict[str, int]) -> bool:
+        """Whether the requested resources are available now."""
+        for resource in resources:
+            limit = self.resource_limits.get(resource)
+            if limit is None:
+                continue
+            if in_use[resource] + self._amount(resources, resource) > limit:
+                return False
+        return True
+
+    def _reserve(
+        self, resources: dict[str, int], in_use: dict[str, int]
+    ) -> dict[str, int]:
+        """Take resources, returning the units reserved."""
+        reserved = {
+            resource: self._amount(resources, resource) for resource in resources
+        }
+        for resource, amount in reserved.items():
+            in_use[resource] += amount
+        return reserved
+
+    def _release(self, reserved: dict[str, int], in_use: dict[str, int]) -> None:
+        """Return reserved resources."""
+        for resource, amount in reserved.items():
+            in_use[resource] -= amount
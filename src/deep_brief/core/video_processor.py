@@ -4,10 +4,12 @@
 # See: https://github.com/kkroening/ffmpeg-python/issues/247
 # pyright: reportUnknownMemberType=false, reportUnknownVariableType=false, reportUnknownArgumentType=false
 
+import asyncio
 import logging
 import os
 import shutil
 import subprocess
+import uuid
 from collections.abc import Callable
 from pathlib import Path
 from typing import Any
@@ -19,9 +21,13 @@ from deep_brief.core.exceptions import (
     ErrorCode,
     FileValidationError,
     FrameExtractionError,
+    OperationCancelledError,
     VideoProcessingError,
     handle_ffmpeg_error,
 )
+from deep_brief.core.cancellation import raise_if_cancelled
+from deep_brief.core.ffmpeg_runner import async_run_and_collect_log, run_ffmpeg
+from deep_brief.core.probe_cache import probe_media
 from deep_brief.utils.config import get_config
 
 logger = logging.getLogger(__name__)
@@ -128,7 +134,12 @@ class VideoProcessor:
                     cause=e,
                 ) from e
 
-            if file_size_mb > self.config.processing.max_video_size_mb:
+            # Windowed processing only holds one window in memory at a time,
+            # so the size limit does not apply to it
+            if (
+                file_size_mb > self.config.processing.max_video_size_mb
+                and not self.config.processing.windowed_processing
+            ):
                 raise FileValidationError(
                     message=f"Video file is too large ({file_size_mb:.1f}MB)",
                     file_path=file_path,
@@ -152,7 +163,7 @@ class VideoProcessor:
 
             # Probe video file with ffmpeg to get metadata
             try:
-                probe = ffmpeg.probe(str(file_path))
+                probe = probe_media(file_path)
             except ffmpeg.Error as e:
                 # Handle ffmpeg probe errors
                 stderr_str = ""
@@ -268,6 +279,22 @@ class VideoProcessor:
                 cause=e,
             ) from e
 
+    async def validate_file_async(self, file_path: Path | str) -> VideoInfo:
+        """
+        Validate a video file on the loop's default executor.
+
+        Args:
+            file_path: Path to video file
+
+        Returns:
+            VideoInfo object with video metadata
+
+        Raises:
+            FileValidationError: For all file validation issues
+            VideoProcessingError: For processing-related errors
+        """
+        return await asyncio.to_thread(self.validate_file, file_path)
+
     def _check_disk_space(self, required_mb: float) -> bool:
         """
         Check if sufficient disk space is available for processing.
@@ -360,6 +387,188 @@ class VideoProcessor:
         Raises:
             FrameExtractionError: If frame extraction fails
         """
+        timestamp, output_path = self._prepare_scene_frame(
+            video_info, scene_start, scene_end, scene_number, output_dir
+        )
+
+        logger.info(f"Extracting frame from scene {scene_number} at {timestamp:.2f}s")
+
+        try:
+            # Check if FFmpeg is available
+            if not self._check_ffmpeg_available():
+                raise FrameExtractionError(
+                    message="FFmpeg not found or not available",
+                    timestamp=timestamp,
+                    scene_number=scene_number,
+                    file_path=video_info.file_path,
+                    details={"error_code": ErrorCode.FFMPEG_NOT_FOUND.value},
+                )
+
+            stream = self._scene_frame_stream(video_info, timestamp, output_path)
+
+            # Execute extraction with timeout
+            try:
+                run_ffmpeg(
+                    stream,
+                    quiet=True,
+                    capture_stdout=True,
+                    capture_stderr=True,
+                    timeout=30,  # 30 second timeout for frame extraction
+                )
+            except subprocess.TimeoutExpired as e:
+                raise FrameExtractionError(
+                    message="Frame extraction timed out after 30 seconds",
+                    timestamp=timestamp,
+                    scene_number=scene_number,
+                    file_path=video_info.file_path,
+                    cause=e,
+                ) from e
+
+            frame_info = self._scene_frame_info(
+                video_info, output_path, timestamp, scene_number
+            )
+
+            if progress_callback:
+                progress_callback(1.0)
+
+            return frame_info
+
+        except ffmpeg.Error as e:
+            # Handle ffmpeg-specific errors
+            raise handle_ffmpeg_error(
+                e, "frame extraction", video_info.file_path
+            ) from e
+
+        except FrameExtractionError:
+            # Re-raise our custom exceptions
+            raise
+
+        except OperationCancelledError:
+            output_path.unlink(missing_ok=True)
+            raise
+
+        except Exception as e:
+            # Handle any other unexpected errors
+            raise FrameExtractionError(
+                message=f"Unexpected error during frame extraction: {str(e)}",
+                timestamp=timestamp,
+                scene_number=scene_number,
+                file_path=video_info.file_path,
+                cause=e,
+            ) from e
+
+    async def extract_frame_from_scene_async(
+        self,
+        video_info: VideoInfo,
+        scene_start: float,
+        scene_end: float,
+        scene_number: int,
+        output_dir: Path | str | None = None,
+        progress_callback: Callable[[float], None] | None = None,
+    ) -> FrameInfo:
+        """
+        Extract a scene's representative frame without blocking the event loop.
+
+        Args:
+            video_info: VideoInfo object from validated video file
+            scene_start: Scene start time in seconds
+            scene_end: Scene end time in seconds
+            scene_number: Scene number for naming
+            output_dir: Optional custom output directory for frame
+            progress_callback: Optional callback function for progress updates
+
+        Returns:
+            FrameInfo object with extracted frame metadata
+
+        Raises:
+            FrameExtractionError: If frame extraction fails
+        """
+        timestamp, output_path = await asyncio.to_thread(
+            self._prepare_scene_frame,
+            video_info,
+            scene_start,
+            scene_end,
+            scene_number,
+            output_dir,
+        )
+
+        logger.info(f"Extracting frame from scene {scene_number} at {timestamp:.2f}s")
+
+        try:
+            if not await asyncio.to_thread(self._check_ffmpeg_available):
+                raise FrameExtractionError(
+                    message="FFmpeg not found or not available",
+                    timestamp=timestamp,
+                    scene_number=scene_number,
+                    file_path=video_info.file_path,
+                    details={"error_code": ErrorCode.FFMPEG_NOT_FOUND.value},
+                )
+
+            await async_run_and_collect_log(
+                self._scene_frame_stream(video_info, timestamp, output_path),
+                0.0,
+                30,  # 30 second timeout for frame extraction
+                None,
+            )
+            frame_info = self._scene_frame_info(
+                video_info, output_path, timestamp, scene_number
+            )
+
+        except subprocess.TimeoutExpired as e:
+            raise FrameExtractionError(
+                message="Frame extraction timed out after 30 seconds",
+                timestamp=timestamp,
+                scene_number=scene_number,
+                file_path=video_info.file_path,
+                cause=e,
+            ) from e
+        except ffmpeg.Error as e:
+            raise handle_ffmpeg_error(
+                e, "frame extraction", video_info.file_path
+            ) from e
+        except FrameExtractionError:
+            raise
+        except OperationCancelledError:
+            output_path.unlink(missing_ok=True)
+            raise
+        except Exception as e:
+            raise FrameExtractionError(
+                message=f"Unexpected error during frame extraction: {str(e)}",
+                timestamp=timestamp,
+                scene_number=scene_number,
+                file_path=video_info.file_path,
+                cause=e,
+            ) from e
+
+        if progress_callback:
+            progress_callback(1.0)
+
+        return frame_info
+
+    def _prepare_scene_frame(
+        self,
+        video_info: VideoInfo,
+        scene_start: float,
+        scene_end: float,
+        scene_number: int,
+        output_dir: Path | str | None,
+    ) -> tuple[float, Path]:
+        """
+        Validate a scene and plan where its representative frame goes.
+
+        Args:
+            video_info: VideoInfo object from validated video file
+            scene_start: Scene start time in seconds
+            scene_end: Scene end time in seconds
+            scene_number: Scene number for naming
+            output_dir: Optional custom output directory for frame
+
+        Returns:
+            Tuple of (frame timestamp, output path)
+
+        Raises:
+            FrameExtractionError: If the scene is invalid or the frame cannot be written
+        """
         # Validate inputs
         if scene_start < 0 or scene_end <= scene_start:
             raise FrameExtractionError(
@@ -406,125 +615,91 @@ class VideoProcessor:
         output_filename = f"scene_{scene_number:03d}_frame_{timestamp:.2f}s.jpg"
         output_path = output_dir / output_filename
 
-        logger.info(f"Extracting frame from scene {scene_number} at {timestamp:.2f}s")
+        return timestamp, output_path
 
-        try:
-            # Check if FFmpeg is available
-            if not self._check_ffmpeg_available():
-                raise FrameExtractionError(
-                    message="FFmpeg not found or not available",
-                    timestamp=timestamp,
-                    scene_number=scene_number,
-                    file_path=video_info.file_path,
-                    details={"error_code": ErrorCode.FFMPEG_NOT_FOUND.value},
-                )
+    def _scene_frame_stream(
+        self, video_info: VideoInfo, timestamp: float, output_path: Path
+    ) -> Any:
+        """Build the ffmpeg command extracting one frame at a timestamp."""
+        stream = ffmpeg.input(str(video_info.file_path), ss=timestamp)
 
-            # Build ffmpeg command for frame extraction
-            stream = ffmpeg.input(str(video_info.file_path), ss=timestamp)
+        # Configure frame extraction
+        frame_args = {
+            "vframes": 1,  # Extract only 1 frame
+            "q:v": self._get_quality_value(),  # Quality setting
+            "f": "image2",  # Image format
+        }
 
-            # Configure frame extraction
-            frame_args = {
-                "vframes": 1,  # Extract only 1 frame
-                "q:v": self._get_quality_value(),  # Quality setting
-                "f": "image2",  # Image format
-            }
+        # Apply any scaling if needed (maintain aspect ratio)
+        max_frame_width = getattr(self.config.processing, "max_frame_width", None)
+        if max_frame_width and video_info.width > max_frame_width:
+            stream = ffmpeg.filter(stream, "scale", f"{max_frame_width}:-1")
 
-            # Apply any scaling if needed (maintain aspect ratio)
-            max_frame_width = getattr(self.config.processing, "max_frame_width", None)
-            if max_frame_width and video_info.width > max_frame_width:
-                stream = ffmpeg.filter(stream, "scale", f"{max_frame_width}:-1")
+        # Configure output
+        stream = ffmpeg.output(stream, str(output_path), **frame_args)
+        return ffmpeg.overwrite_output(stream)
 
-            # Configure output
-            stream = ffmpeg.output(stream, str(output_path), **frame_args)
-            stream = ffmpeg.overwrite_output(stream)
+    def _scene_frame_info(
+        self,
+        video_info: VideoInfo,
+        output_path: Path,
+        timestamp: float,
+        scene_number: int,
+    ) -> FrameInfo:
+        """
+        Check that ffmpeg wrote a non-empty frame and describe it.
 
-            # Execute extraction with timeout
-            try:
-                ffmpeg.run(
-                    stream,
-                    quiet=True,
-                    capture_stdout=True,
-                    capture_stderr=True,
-                    timeout=30,  # 30 second timeout for frame extraction
-                )
-            except subprocess.TimeoutExpired as e:
-                raise FrameExtractionError(
-                    message="Frame extraction timed out after 30 seconds",
-                    timestamp=timestamp,
-                    scene_number=scene_number,
-                    file_path=video_info.file_path,
-                    cause=e,
-                ) from e
+        Raises:
+            FrameExtractionError: If the frame is missing, empty or unreadable
+        """
+        # Verify output file was created
+        if not output_path.exists():
+            raise FrameExtractionError(
+                message="Frame extraction completed but output file not found",
+                timestamp=timestamp,
+                scene_number=scene_number,
+                file_path=video_info.file_path,
+            )
 
-            # Verify output file was created
-            if not output_path.exists():
+        # Verify file has content
+        try:
+            file_size_kb = output_path.stat().st_size / 1024
+            if file_size_kb == 0:
                 raise FrameExtractionError(
-                    message="Frame extraction completed but output file not found",
+                    message="Frame extraction produced empty file",
                     timestamp=timestamp,
                     scene_number=scene_number,
                     file_path=video_info.file_path,
                 )
-
-            # Verify file has content
-            try:
-                file_size_kb = output_path.stat().st_size / 1024
-                if file_size_kb == 0:
-                    raise FrameExtractionError(
-                        message="Frame extraction produced empty file",
-                        timestamp=timestamp,
-                        scene_number=scene_number,
-                        file_path=video_info.file_path,
-                    )
-            except OSError as e:
-                raise FrameExtractionError(
-                    message="Cannot access extracted frame file",
-                    timestamp=timestamp,
-                    scene_number=scene_number,
-                    file_path=video_info.file_path,
-                    cause=e,
-                ) from e
-
-            logger.info(f"Frame extracted: {output_path.name} ({file_size_kb:.1f}KB)")
-
-            if progress_callback:
-                progress_callback(1.0)
-
-            return FrameInfo(
-                frame_path=output_path,
-                timestamp=timestamp,
-                scene_number=scene_number,
-                width=video_info.width,
-                height=video_info.height,
-                size_kb=file_size_kb,
-                format="jpg",
-            )
-
-        except ffmpeg.Error as e:
-            # Handle ffmpeg-specific errors
-            raise handle_ffmpeg_error(
-                e, "frame extraction", video_info.file_path
-            ) from e
-
-        except FrameExtractionError:
-            # Re-raise our custom exceptions
-            raise
-
-        except Exception as e:
-            # Handle any other unexpected errors
+        except OSError as e:
             raise FrameExtractionError(
-                message=f"Unexpected error during frame extraction: {str(e)}",
+                message="Cannot access extracted frame file",
                 timestamp=timestamp,
                 scene_number=scene_number,
                 file_path=video_info.file_path,
                 cause=e,
             ) from e
 
+        logger.info(f"Frame extracted: {output_path.name} ({file_size_kb:.1f}KB)")
+
+        return FrameInfo(
+            frame_path=output_path,
+            timestamp=timestamp,
+            scene_number=scene_number,
+            width=video_info.width,
+            height=video_info.height,
+            size_kb=file_size_kb,
+            format="jpg",
+        )
+
+
     def extract_frames_from_scenes(
         self,
         video_info: VideoInfo,
         scenes: list[tuple[float, float, int]],  # (start, end, scene_number)
         output_dir: Path | str | None = None,
         progress_callback: Callable[[float], None] | None = None,
+        batched: bool = False,
     ) -> list[FrameInfo]:
         """
         Extract representative frames from multiple scenes.
@@ -534,6 +709,8 @@ class VideoProcessor:
             scenes: List of (start_time, end_time, scene_number) tuples
             output_dir: Optional custom output directory for frames
             progress_callback: Optional callback function for progress updates
+            batched: Extract all frames with a single ffmpeg decoder pass
+                instead of one ffmpeg process per scene
 
         Returns:
             List of FrameInfo objects for extracted frames
@@ -545,6 +722,18 @@ class VideoProcessor:
             logger.warning("No scenes provided for frame extraction")
             return []
 
+        if batched:
+            try:
+                return self._extract_frames_batched(
+                    video_info, scenes, output_dir, progress_callback
+                )
+            except OperationCancelledError:
+                raise
+            except VideoProcessingError as e:
+                logger.warning(
+                    f"Batched frame extraction failed, extracting per scene: {e}"
+                )
+
         logger.info(f"Extracting frames from {len(scenes)} scenes")
 
         extracted_frames = []
@@ -552,6 +741,8 @@ class VideoProcessor:
 
         for i, (start_time, end_time, scene_number) in enumerate(scenes):
             try:
+                raise_if_cancelled("frame extraction")
+
                 # Extract frame from this scene
                 frame_info = self.extract_frame_from_scene(
                     video_info,
@@ -568,6 +759,9 @@ class VideoProcessor:
                     progress = (i + 1) / total_scenes
                     progress_callback(progress)
 
+            except OperationCancelledError:
+                self._discard_frames(extracted_frames)
+                raise
             except Exception as e:
                 logger.error(f"Failed to extract frame from scene {scene_number}: {e}")
                 # Continue with other scenes rather than failing completely
@@ -578,6 +772,373 @@ class VideoProcessor:
         )
         return extracted_frames
 
+    async def extract_frames_from_scenes_async(
+        self,
+        video_info: VideoInfo,
+        scenes: list[tuple[float, float, int]],  # (start, end, scene_number)
+        output_dir: Path | str | None = None,
+        progress_callback: Callable[[float], None] | None = None,
+        batched: bool = False,
+    ) -> list[FrameInfo]:
+        """
+        Extract representative frames from scenes without blocking the event loop.
+
+        Behaves like extract_frames_from_scenes, with ffmpeg started through
+        asyncio and file checks run on the loop's default executor.
+
+        Args:
+            video_info: VideoInfo object from validated video file
+            scenes: List of (start_time, end_time, scene_number) tuples
+            output_dir: Optional custom output directory for frames
+            progress_callback: Optional callback function for progress updates
+            batched: Extract all frames with a single ffmpeg decoder pass
+                instead of one ffmpeg process per scene
+
+        Returns:
+            List of FrameInfo objects for extracted frames
+        """
+        if not scenes:
+            logger.warning("No scenes provided for frame extraction")
+            return []
+
+        if batched:
+            try:
+                return await self._extract_frames_batched_async(
+                    video_info, scenes, output_dir, progress_callback
+                )
+            except OperationCancelledError:
+                raise
+            except VideoProcessingError as e:
+                logger.warning(
+                    f"Batched frame extraction failed, extracting per scene: {e}"
+                )
+
+        logger.info(f"Extracting frames from {len(scenes)} scenes")
+
+        extracted_frames = []
+        for i, (start_time, end_time, scene_number) in enumerate(scenes):
+            try:
+                raise_if_cancelled("frame extraction")
+                frame_info = await self.extract_frame_from_scene_async(
+                    video_info, start_time, end_time, scene_number, output_dir
+                )
+                extracted_frames.append(frame_info)
+
+                if progress_callback:
+                    progress_callback((i + 1) / len(scenes))
+
+            except OperationCancelledError:
+                self._discard_frames(extracted_frames)
+                raise
+            except Exception as e:
+                logger.error(f"Failed to extract frame from scene {scene_number}: {e}")
+                continue
+
+        logger.info(
+            f"Successfully extracted {len(extracted_frames)} frames from {len(scenes)} scenes"
+        )
+        return extracted_frames
+
+    def _extract_frames_batched(
+        self,
+        video_info: VideoInfo,
+        scenes: list[tuple[float, float, int]],
+        output_dir: Path | str | None = None,
+        progress_callback: Callable[[float], None] | None = None,
+    ) -> list[FrameInfo]:
+        """
+        Extract representative frames for all scenes with one ffmpeg invocation.
+
+        Builds a single ``select`` filter matching the middle frame of every
+        scene so the video is opened, probed and decoded only once. Scenes that
+        are invalid or whose frame is missing from the output are logged and
+        skipped, matching the per-scene behaviour.
+
+        Args:
+            video_info: VideoInfo object from validated video file
+            scenes: List of (start_time, end_time, scene_number) tuples
+            output_dir: Optional custom output directory for frames
+            progress_callback: Optional callback function for progress updates
+
+        Returns:
+            List of FrameInfo objects for extracted frames, in scene order
+
+        Raises:
+            FrameExtractionError: If the ffmpeg pass itself cannot be run
+        """
+        plan = self._plan_batched_frames(video_info, scenes, output_dir)
+        if plan is None:
+            return []
+        stream, targets, batch_outputs = plan
+
+        timeout = video_info.duration * 2 + 60
+        try:
+            run_ffmpeg(
+                stream,
+                quiet=True,
+                capture_stdout=True,
+                capture_stderr=True,
+                timeout=timeout,
+            )
+        except OperationCancelledError:
+            self._discard_batch_outputs(batch_outputs)
+            raise
+        except subprocess.TimeoutExpired as e:
+            raise FrameExtractionError(
+                message=f"Batched frame extraction timed out after {timeout:.0f} seconds",
+                file_path=video_info.file_path,
+                cause=e,
+            ) from e
+        except ffmpeg.Error as e:
+            raise handle_ffmpeg_error(
+                e, "batched frame extraction", video_info.file_path
+            ) from e
+
+        return self._collect_batched_frames(
+            video_info, targets, batch_outputs, len(scenes), progress_callback
+        )
+
+    async def _extract_frames_batched_async(
+        self,
+        video_info: VideoInfo,
+        scenes: list[tuple[float, float, int]],
+        output_dir: Path | str | None = None,
+        progress_callback: Callable[[float], None] | None = None,
+    ) -> list[FrameInfo]:
+        """Async counterpart of _extract_frames_batched."""
+        plan = await asyncio.to_thread(
+            self._plan_batched_frames, video_info, scenes, output_dir
+        )
+        if plan is None:
+            return []
+        stream, targets, batch_outputs = plan
+
+        timeout = video_info.duration * 2 + 60
+        try:
+            await async_run_and_collect_log(stream, 0.0, timeout, None)
+        except OperationCancelledError:
+            self._discard_batch_outputs(batch_outputs)
+            raise
+        except subprocess.TimeoutExpired as e:
+            raise FrameExtractionError(
+                message=f"Batched frame extraction timed out after {timeout:.0f} seconds",
+                file_path=video_info.file_path,
+                cause=e,
+            ) from e
+        except ffmpeg.Error as e:
+            raise handle_ffmpeg_error(
+                e, "batched frame extraction", video_info.file_path
+            ) from e
+
+        return await asyncio.to_thread(
+            self._collect_batched_frames,
+            video_info,
+            targets,
+            batch_outputs,
+            len(scenes),
+            progress_callback,
+        )
+
+    def _plan_batched_frames(
+        self,
+        video_info: VideoInfo,
+        scenes: list[tuple[float, float, int]],
+        output_dir: Path | str | None,
+    ) -> tuple[Any, list[tuple[int, float, int]], dict[int, Path]] | None:
+        """
+        Plan the single ffmpeg pass extracting every scene's frame.
+
+        Args:
+            video_info: VideoInfo object from validated video file
+            scenes: List of (start_time, end_time, scene_number) tuples
+            output_dir: Optional custom output directory for frames
+
+        Returns:
+            Tuple of (ffmpeg stream, (frame_index, timestamp, scene_number)
+            targets, output file by frame index), or None if no scene is valid
+
+        Raises:
+            FrameExtractionError: If the environment cannot run the pass
+        """
+        # Set up output directory
+        if output_dir is None:
+            output_dir = self.temp_dir / "frames"
+        else:
+            output_dir = Path(output_dir)
+
+        try:
+            output_dir.mkdir(parents=True, exist_ok=True)
+        except OSError as e:
+            raise FrameExtractionError(
+                message=f"Cannot create output directory: {output_dir}",
+                file_path=video_info.file_path,
+                cause=e,
+            ) from e
+
+        # Environment checks run once for the whole batch
+        if not self._check_disk_space(len(scenes)):  # ~1MB per frame
+            raise FrameExtractionError(
+                message="Insufficient disk space for frame extraction",
+                file_path=video_info.file_path,
+                details={"error_code": ErrorCode.INSUFFICIENT_DISK_SPACE.value},
+            )
+
+        if not self._check_ffmpeg_available():
+            raise FrameExtractionError(
+                message="FFmpeg not found or not available",
+                file_path=video_info.file_path,
+                details={"error_code": ErrorCode.FFMPEG_NOT_FOUND.value},
+            )
+
+        if video_info.fps <= 0:
+            raise FrameExtractionError(
+                message=f"Cannot select frames by index with fps={video_info.fps}",
+                file_path=video_info.file_path,
+            )
+
+        # Plan one target frame per scene: (frame_index, timestamp, scene_number)
+        targets: list[tuple[int, float, int]] = []
+        for scene_start, scene_end, scene_number in scenes:
+            if scene_start < 0 or scene_end <= scene_start:
+                logger.error(
+                    f"Failed to extract frame from scene {scene_number}: "
+                    f"invalid scene times start={scene_start:.2f}s, end={scene_end:.2f}s"
+                )
+                continue
+
+            if scene_end > video_info.duration:
+                logger.warning(
+                    f"Scene end time ({scene_end:.2f}s) exceeds video duration ({video_info.duration:.2f}s)"
+                )
+                scene_end = video_info.duration
+
+            timestamp = scene_start + (scene_end - scene_start) / 2
+            targets.append((int(timestamp * video_info.fps), timestamp, scene_number))
+
+        if not targets:
+            return None
+
+        # ffmpeg emits selected frames in stream order, one file per unique index
+        frame_indices = sorted({frame_index for frame_index, _, _ in targets})
+        select_expr = "+".join(f"eq(n,{frame_index})" for frame_index in frame_indices)
+
+        batch_prefix = f".batch_{uuid.uuid4().hex[:8]}"
+        output_pattern = output_dir / f"{batch_prefix}_%05d.jpg"
+
+        logger.info(
+            f"Extracting {len(frame_indices)} frames from {len(scenes)} scenes in one pass"
+        )
+
+        stream = ffmpeg.input(str(video_info.file_path))
+        stream = ffmpeg.filter(stream, "select", select_expr)
+
+        # Apply any scaling if needed (maintain aspect ratio)
+        max_frame_width = getattr(self.config.processing, "max_frame_width", None)
+        if max_frame_width and video_info.width > max_frame_width:
+            stream = ffmpeg.filter(stream, "scale", f"{max_frame_width}:-1")
+
+        stream = ffmpeg.output(
+            stream,
+            str(output_pattern),
+            vsync="vfr",  # Only write the selected frames
+            **{"q:v": self._get_quality_value(), "f": "image2"},
+        )
+        stream = ffmpeg.overwrite_output(stream)
+
+        batch_outputs = {
+            frame_index: output_dir / f"{batch_prefix}_{i + 1:05d}.jpg"
+            for i, frame_index in enumerate(frame_indices)
+        }
+        return stream, targets, batch_outputs
+
+    def _collect_batched_frames(
+        self,
+        video_info: VideoInfo,
+        targets: list[tuple[int, float, int]],
+        batch_outputs: dict[int, Path],
+        scene_count: int,
+        progress_callback: Callable[[float], None] | None,
+    ) -> list[FrameInfo]:
+        """Rename the frames of a batched pass per scene and describe them."""
+        extracted_frames: list[FrameInfo] = []
+        for i, (frame_index, timestamp, scene_number) in enumerate(targets):
+            batch_output = batch_outputs[frame_index]
+            output_path = (
+                batch_output.parent
+                / f"scene_{scene_number:03d}_frame_{timestamp:.2f}s.jpg"
+            )
+
+            try:
+                if not batch_output.exists() or batch_output.stat().st_size == 0:
+                    raise FrameExtractionError(
+                        message="Frame missing from batched extraction output",
+                        timestamp=timestamp,
+                        scene_number=scene_number,
+                        file_path=video_info.file_path,
+                        details={"frame_index": frame_index},
+                    )
+
+                # Scenes can share a frame index; only move it for the last one
+                if any(other[0] == frame_index for other in targets[i + 1 :]):
+                    shutil.copyfile(batch_output, output_path)
+                else:
+                    batch_output.replace(output_path)
+
+                file_size_kb = output_path.stat().st_size / 1024
+            except FrameExtractionError as e:
+                logger.error(f"Failed to extract frame from scene {scene_number}: {e}")
+                continue
+            except OSError as e:
+                logger.error(
+                    f"Failed to extract frame from scene {scene_number}: "
+                    f"cannot access extracted frame file: {e}"
+                )
+                continue
+
+            extracted_frames.append(
+                FrameInfo(
+                    frame_path=output_path,
+                    timestamp=timestamp,
+                    scene_number=scene_number,
+                    width=video_info.width,
+                    height=video_info.height,
+                    size_kb=file_size_kb,
+                    format="jpg",
+                )
+            )
+
+            if progress_callback:
+                progress_callback((i + 1) / len(targets))
+
+        # Remove any batch outputs that were not claimed by a scene
+        self._discard_batch_outputs(batch_outputs)
+
+        if progress_callback:
+            progress_callback(1.0)
+
+        logger.info(
+            f"Successfully extracted {len(extracted_frames)} frames from {scene_count} scenes"
+        )
+        return extracted_frames
+
+    @staticmethod
+    def _discard_batch_outputs(batch_outputs: dict[int, Path]) -> None:
+        """Remove the files a batched pass wrote."""
+        for batch_output in batch_outputs.values():
+            try:
+                batch_output.unlink(missing_ok=True)
+            except OSError as e:
+                logger.warning(f"Could not remove batch frame {batch_output}: {e}")
+
+    @staticmethod
+    def _discard_frames(frames: list[FrameInfo]) -> None:
+        """Remove the files of frames extracted by a cancelled run."""
+        for frame in frames:
+            try:
+                frame.frame_path.unlink(missing_ok=True)
+            except OSError as e:
+                logger.warning(f"Could not remove frame {frame.frame_path}: {e}")
+
     def _get_quality_value(self) -> int:
         """
         Convert quality percentage to ffmpeg quality value.
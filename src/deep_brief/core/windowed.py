@@ -0,0 +1,256 @@
+"""Fixed time windows for analyzing long recordings piece by piece.
+
+In windowed processing a video is analyzed one window after another: an
+audio chunk, the scene changes and frames of the window, and the chunk's
+transcript. Only the current window's audio, decoded frames and model inputs
+are held in memory. The classes here fold each window's outputs into scenes
+and a transcript on the full timeline.
+"""
+
+import logging
+import math
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from deep_brief.core.scene_detector import Scene, SceneDetectionResult
+
+logger = logging.getLogger(__name__)
+
+# Confidence of scenes ending at a detected change and at a fallback split,
+# as in whole-video detection
+DETECTED_SCENE_CONFIDENCE = 0.8
+FALLBACK_SCENE_CONFIDENCE = 0.3
+
+
+def plan_windows(duration: float, window_seconds: float) -> list[tuple[float, float]]:
+    """
+    Split a video into equal windows no longer than window_seconds.
+
+    Args:
+        duration: Video duration in seconds
+        window_seconds: Maximum window length in seconds
+
+    Returns:
+        List of (start, end) times covering the video, in order
+    """
+    count = max(1, math.ceil(duration / window_seconds))
+    length = duration / count
+    return [
+        (index * length, duration if index == count - 1 else (index + 1) * length)
+        for index in range(count)
+    ]
+
+
+@dataclass
+class WindowOutputs:
+    """What one window added to the merged result."""
+
+    index: int
+    start_time: float
+    end_time: float
+    scenes: int = 0  # Scenes closed in the window
+    frames: int = 0
+    segments: int = 0  # Transcript segments
+    files: list[Path] = field(default_factory=list)  # Audio chunk and frames written
+    state: Any = None  # State of the windowed run after the window, to resume from
+
+
+class WindowedScenes:
+    """
+    Scenes on the full timeline, built from the scene changes of each window.
+
+    Window boundaries are not scene changes: the scene still open at the end
+    of a window continues into the next one and is reported once a later
+    change (or the end of the video) closes it. A window without any detected
+    change is split at the fallback interval, as whole-video detection does
+    when it finds nothing. Scenes shorter than the minimum duration are
+    dropped, also as in whole-video detection.
+    """
+
+    def __init__(self, min_scene_duration: float, fallback_interval: float):
+        """
+        Initialize the scene builder.
+
+        Args:
+            min_scene_duration: Scenes shorter than this are dropped
+            fallback_interval: Split interval for windows without scene changes
+        """
+        # Whole-video detection also drops anything under half a second
+        self.min_scene_duration = max(min_scene_duration, 0.5)
+        self.fallback_interval = fallback_interval
+        self.scenes: list[Scene] = []
+        self.detected_changes = 0
+        self._open_start = 0.0
+
+    def add_window(
+        self, end_time: float, scene_changes: list[float], final: bool = False
+    ) -> list[Scene]:
+        """
+        Close the scenes that end within a window.
+
+        Args:
+            end_time: End of the window in seconds
+            scene_changes: Scene change timestamps detected in the window
+            final: Whether this is the last window, closing the open scene
+
+        Returns:
+            The newly closed scenes, numbered on the full timeline
+        """
+        changes = sorted(t for t in scene_changes if self._open_start < t < end_time)
+        self.detected_changes += len(changes)
+        boundaries = [(time, DETECTED_SCENE_CONFIDENCE) for time in changes]
+
+        if not boundaries:
+            split = self._open_start + self.fallback_interval
+            while split < end_time - 1.0:  # Leave at least 1s for the next scene
+                boundaries.append((split, FALLBACK_SCENE_CONFIDENCE))
+                split += self.fallback_interval
+
+        if final:
+            boundaries.append(
+                (
+                    end_time,
+                    DETECTED_SCENE_CONFIDENCE
+                    if self.detected_changes
+                    else FALLBACK_SCENE_CONFIDENCE,
+                )
+            )
+
+        closed = []
+        for boundary, confidence in boundaries:
+            start = self._open_start
+            self._open_start = boundary
+            if boundary - start < self.min_scene_duration:
+                logger.debug(
+                    f"Filtered out short scene: {boundary - start:.1f}s "
+                    f"< {self.min_scene_duration}s"
+                )
+                continue
+
+            scene = Scene(
+                start_time=start,
+                end_time=boundary,
+                duration=boundary - start,
+                scene_number=len(self.scenes) + 1,
+                confidence=confidence,
+            )
+            self.scenes.append(scene)
+            closed.append(scene)
+        return closed
+
+    def to_result(
+        self, video_duration: float, method: str, threshold: float
+    ) -> SceneDetectionResult:
+        """
+        Get the scenes of all windows as one detection result.
+
+        Args:
+            video_duration: Duration of the whole video
+            method: Configured detection method
+            threshold: Threshold the windows were detected with
+
+        Returns:
+            SceneDetectionResult covering the whole video
+        """
+        return SceneDetectionResult(
+            scenes=self.scenes,
+            total_scenes=len(self.scenes),
+            detection_method=method if self.detected_changes else "fallback",
+            threshold_used=threshold,
+            video_duration=video_duration,
+            average_scene_duration=sum(s.duration for s in self.scenes)
+            / len(self.scenes)
+            if self.scenes
+            else 0.0,
+        )
+
+
+class WindowedTranscript:
+    """
+    Transcript on the full timeline, built from the transcripts of each window.
+
+    Segment and word times are shifted by the start of their window and
+    segment ids are renumbered so they stay unique and in order.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty transcript."""
+        self.segments: list[Any] = []  # Segment
+        self.texts: list[str] = []
+        self.word_count = 0
+        self.processing_time = 0.0
+        self.speech_seconds: float | None = None  # Set if windows skipped silence
+        self.skipped_seconds = 0.0
+        self._first: Any = None  # TranscriptionResult of the first window
+
+    @property
+    def language(self) -> str | None:
+        """Language of the first transcribed window."""
+        return self._first.language if self._first is not None else None
+
+    def add_window(self, transcription: Any, offset: float) -> None:
+        """
+        Add the transcript of one window.
+
+        Args:
+            transcription: TranscriptionResult of the window's audio chunk
+            offset: Start of the window in seconds
+        """
+        if self._first is None:
+            self._first = transcription
+        if transcription.text:
+            self.texts.append(transcription.text)
+        self.word_count += transcription.word_count
+        self.processing_time += transcription.processing_time
+        self.skipped_seconds += transcription.skipped_seconds
+        if transcription.speech_seconds is not None:
+            self.speech_seconds = (
+                self.speech_seconds or 0.0
+            ) + transcription.speech_seconds
+
+        for segment in transcription.segments:
+            self.segments.append(
+                segment.model_copy(
+                    update={
+                        "id": len(self.segments),
+                        "start": segment.start + offset,
+                        "end": segment.end + offset,
+                        "words": [
+                            word.model_copy(
+                                update={
+                                    "start": word.start + offset,
+                                    "end": word.end + offset,
+                                }
+                            )
+                            for word in segment.words
+                        ],
+                    }
+                )
+            )
+
+    def to_result(self, duration: float) -> Any:
+        """
+        Get the transcripts of all windows as one transcription.
+
+        Args:
+            duration: Duration of the whole video
+
+        Returns:
+            TranscriptionResult covering the whole video, or None if no
+            window was transcribed
+        """
+        if self._first is None:
+            return None
+
+        return self._first.model_copy(
+            update={
+                "text": " ".join(self.texts),
+                "segments": self.segments,
+                "duration": duration,
+                "word_count": self.word_count,
+                "processing_time": self.processing_time,
+                "speech_seconds": self.speech_seconds,
+                "skipped_seconds": self.skipped_seconds,
+            }
+        )
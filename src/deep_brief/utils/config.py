@@ -13,11 +13,68 @@ class ProcessingConfig(BaseModel):
     """Video processing configuration."""
 
     max_video_size_mb: int = Field(default=500, ge=1, le=5000)
+    windowed_processing: bool = Field(
+        default=False
+    )  # Analyze long or oversized videos in fixed time windows (accepts any size)
+    window_seconds: float = Field(
+        default=600.0, ge=30.0, le=7200.0
+    )  # Length of each window; videos longer than this are analyzed window by window
     supported_formats: list[str] = Field(
         default=["mp4", "mov", "avi", "webm"], min_length=1
     )
     temp_dir: Path = Field(default=Path("temp"))
     cleanup_temp_files: bool = Field(default=True)
+    batch_frame_extraction: bool = Field(
+        default=True
+    )  # One ffmpeg pass for all scene frames instead of one per scene
+    probe_cache_file: Path | None = Field(
+        default=None
+    )  # Persist ffprobe results so re-runs over the same files skip probing
+    concurrent_branches: bool = Field(
+        default=True
+    )  # Run audio and transcription stages alongside scene, frame and visual stages
+    max_ffmpeg_processes: int = Field(
+        default=2, ge=1, le=16
+    )  # ffmpeg subprocesses the stage scheduler runs at once
+    max_model_memory_mb: int = Field(
+        default=4096, ge=256, le=262144
+    )  # Estimated model memory the stage scheduler lets stages hold at once
+    memory_budget_mb: int | None = Field(
+        default=None, ge=512, le=1048576
+    )  # Process-wide memory for loaded models plus buffered frames; idle models unload beyond it (None = no budget)
+    idle_model_cache_mb: int | None = Field(
+        default=8192, ge=0, le=1048576
+    )  # Models no component holds stay loaded for reuse up to this size, least recently released unload beyond it (None = no limit)
+    frame_buffer_mb: int = Field(
+        default=256, ge=0, le=65536
+    )  # Decoded frames waiting for analysis before frame decoding blocks (0 = decode inline)
+    batch_max_workers: int = Field(
+        default=1, ge=1, le=64
+    )  # Worker processes analyze_video_batch runs videos on (1 = in this process)
+    max_concurrent_videos: int = Field(
+        default=4, ge=1, le=256
+    )  # Videos analyze_video_batch_async keeps in flight on one event loop
+    result_cache: bool = Field(
+        default=True
+    )  # Return stored results for unchanged videos analyzed with the same settings
+    result_cache_dir: Path | None = Field(
+        default=None
+    )  # Where results are stored (defaults to <temp_dir>/result_cache)
+    result_cache_max_mb: int = Field(
+        default=2048, ge=16, le=1048576
+    )  # Least recently used results are evicted beyond this size
+    stage_cache: bool = Field(
+        default=True
+    )  # Reuse individual stage outputs whose inputs and settings are unchanged
+    stage_cache_dir: Path | None = Field(
+        default=None
+    )  # Where stage outputs are stored (defaults to <temp_dir>/stage_cache)
+    stage_cache_max_mb: int = Field(
+        default=8192, ge=16, le=1048576
+    )  # Least recently used stage outputs are evicted beyond this size
+    quantized_model_dir: Path | None = Field(
+        default=None
+    )  # Where int8 quantized models are stored (defaults to <temp_dir>/quantized_models)
 
     @field_validator("supported_formats")
     @classmethod
@@ -37,6 +94,30 @@ class SceneDetectionConfig(BaseModel):
     threshold: float = Field(default=0.4, ge=0.1, le=0.9)
     min_scene_duration: float = Field(default=2.0, ge=0.5, le=30.0)
     fallback_interval: float = Field(default=30.0, ge=5.0, le=300.0)
+    adaptive_sweep_steps: int = Field(
+        default=16, ge=2, le=200
+    )  # Thresholds tried between 0.5x and 2x the base threshold
+    target_scene_count: int | None = Field(
+        default=None, ge=2, le=500
+    )  # Bisect the adaptive threshold towards this many scenes
+    proxy_width: int = Field(
+        default=320, ge=0, le=3840
+    )  # Downscale to this width before scoring scenes (0 keeps source size)
+    proxy_fps: float = Field(
+        default=5.0, ge=0.0, le=120.0
+    )  # Score scenes at this frame rate (0 keeps source rate)
+    proxy_keyframes_only: bool = Field(
+        default=False
+    )  # Decode only keyframes (-skip_frame nokey) for scene scoring
+    parallel_shards: int = Field(
+        default=1, ge=1, le=32
+    )  # Split scene detection into this many time windows run in parallel (1 disables)
+    shard_overlap_seconds: float = Field(
+        default=2.0, ge=0.0, le=30.0
+    )  # Extra seconds decoded before each window so boundary cuts are not missed
+    min_shard_duration: float = Field(
+        default=60.0, ge=10.0, le=3600.0
+    )  # Never split a video into windows shorter than this
 
 
 class AudioConfig(BaseModel):
@@ -46,6 +127,9 @@ class AudioConfig(BaseModel):
     channels: int = Field(default=1, ge=1, le=2)
     noise_reduction: bool = Field(default=False)
     normalize_audio: bool = Field(default=True)
+    in_memory: bool = Field(
+        default=False
+    )  # Decode 16 kHz mono float32 PCM straight into memory for Whisper (WAV only written when an output path is given)
 
 
 class TranscriptionConfig(BaseModel):
@@ -56,6 +140,30 @@ class TranscriptionConfig(BaseModel):
     word_timestamps: bool = Field(default=True)
     temperature: float = Field(default=0.0, ge=0.0, le=1.0)
     device: str = Field(default="auto")  # auto, cpu, cuda
+    parallel_workers: int = Field(
+        default=1, ge=1, le=32
+    )  # Transcribe chunks cut at pauses on this many worker processes (1 disables)
+    chunk_seconds: float = Field(
+        default=120.0, ge=30.0, le=3600.0
+    )  # Target length of the chunks; each is cut at the nearest pause
+    min_silence_seconds: float = Field(
+        default=0.3, ge=0.05, le=5.0
+    )  # Shortest pause a chunk may be cut at
+    skip_silence: bool = Field(
+        default=False
+    )  # Send only the speech found by a voice activity pre-pass to Whisper
+    min_skipped_silence_seconds: float = Field(
+        default=1.0, ge=0.2, le=30.0
+    )  # Shorter pauses are transcribed as they are
+    speech_pad_seconds: float = Field(
+        default=0.25, ge=0.0, le=2.0
+    )  # Silence kept either side of each speech interval
+    segment_context_seconds: float = Field(
+        default=1.0, ge=0.0, le=30.0
+    )  # Audio decoded either side of a transcribed segment so edge words are heard
+    quantize: bool = Field(
+        default=False
+    )  # Run Whisper with int8 dynamic quantization of its Linear layers (cpu only)
 
     @field_validator("model")
     @classmethod
@@ -107,6 +215,15 @@ class VisualAnalysisConfig(BaseModel):
     frame_format: str = Field(default="JPEG", pattern="^(JPEG|PNG|WEBP)$")
     max_frame_width: int = Field(default=1920, ge=480, le=4096)
     max_frame_height: int = Field(default=1080, ge=360, le=2160)
+    frame_sampling_method: str = Field(
+        default="seek", pattern="^(seek|sequential|pipe)$"
+    )  # seek per frame, decode forward once, or stream raw frames from ffmpeg
+    sequential_max_gap_seconds: float = Field(
+        default=10.0, ge=0.0, le=600.0
+    )  # Seek instead of grabbing when the next sample is further ahead
+    pipe_scale_frames: bool = Field(
+        default=False
+    )  # Scale piped frames to max_frame_width/height inside ffmpeg
 
     # Quality assessment thresholds
     blur_threshold: float = Field(default=100.0, ge=10.0, le=1000.0)
@@ -131,6 +248,9 @@ class VisualAnalysisConfig(BaseModel):
     max_caption_length: int = Field(default=50, ge=10, le=200)
     caption_temperature: float = Field(default=1.0, ge=0.1, le=2.0)
     caption_batch_size: int = Field(default=1, ge=1, le=8)
+    captioning_quantize: bool = Field(
+        default=False
+    )  # Run the captioner with int8 dynamic quantization of its Linear layers (cpu only)
 
     # OCR settings
     enable_ocr: bool = Field(default=True)
@@ -436,6 +436,38 @@ class TestFrameAnalysisPipeline:
             # Check progress updates were made
             assert len(progress_updates) > 0
     
+    def test_analyze_video_frames_streams_scenes(self, pipeline, test_video, mock_scene_result):
+        """Test that each completed scene is forwarded and reported as progress."""
+        progress_updates = []
+        streamed = []
+        scene_analyses = [MagicMock(scene_number=1), MagicMock(scene_number=2)]
+
+        def extract(**kwargs):
+            stats = MagicMock()
+            for completed, scene_analysis in enumerate(scene_analyses, start=1):
+                stats.scenes_completed = completed
+                kwargs["scene_callback"](scene_analysis, stats)
+            result = MagicMock()
+            result.total_frames_extracted = 0
+            result.total_frames_processed = 0
+            result.overall_quality_distribution = {}
+            result.average_quality_score = 0.0
+            result.scene_analyses = []
+            return result
+
+        with patch.object(
+            pipeline.frame_extractor, 'extract_frames_from_scenes', side_effect=extract
+        ):
+            pipeline.analyze_video_frames(
+                video_path=test_video,
+                scene_result=mock_scene_result,
+                progress_callback=lambda progress, message: progress_updates.append(progress),
+                scene_callback=lambda scene_analysis, stats: streamed.append(scene_analysis),
+            )
+
+        assert streamed == scene_analyses
+        assert 0.5 in progress_updates
+    
     def test_analyze_video_frames_error_handling(self, pipeline, test_video, mock_scene_result):
         """Test error handling in video analysis."""
         with patch.object(pipeline.frame_extractor, 'extract_frames_from_scenes') as mock_extract:
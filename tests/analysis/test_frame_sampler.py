@@ -0,0 +1,507 @@
+"""Tests for sequential frame sampling."""
+
+import io
+import tempfile
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import cv2
+import numpy as np
+import pytest
+
+from deep_brief.analysis.frame_sampler import (
+    RawFramePipeSampler,
+    SequentialFrameSampler,
+)
+from deep_brief.analysis.visual_analyzer import FrameExtractor
+from deep_brief.core.scene_detector import Scene, SceneDetectionResult
+from deep_brief.utils.config import DeepBriefConfig, VisualAnalysisConfig
+
+
+class FakeCapture:
+    """Minimal stand-in for cv2.VideoCapture that tracks decoder work."""
+
+    def __init__(self, total_frames: int = 1000):
+        self.total_frames = total_frames
+        self.position = 0
+        self.current = -1
+        self.grab_calls = 0
+        self.retrieve_calls = 0
+        self.set_calls: list[int] = []
+
+    def set(self, prop, value):
+        assert prop == cv2.CAP_PROP_POS_FRAMES
+        self.set_calls.append(int(value))
+        self.position = int(value)
+        return True
+
+    def grab(self):
+        if self.position >= self.total_frames:
+            return False
+        self.grab_calls += 1
+        self.current = self.position
+        self.position += 1
+        return True
+
+    def retrieve(self):
+        self.retrieve_calls += 1
+        # Encode the frame number in the pixel data so tests can verify it
+        frame = np.full((32, 32, 3), 128, dtype=np.uint8)
+        frame[8:24, 8:24] = 200
+        frame[0, 0, 0] = self.current // 256
+        frame[0, 0, 1] = self.current % 256
+        return True, frame
+
+
+class ChunkedReader(io.RawIOBase):
+    """Pipe-like reader that never returns more than ``chunk_size`` bytes."""
+
+    def __init__(self, data: bytes, chunk_size: int = 1000):
+        self.data = io.BytesIO(data)
+        self.chunk_size = chunk_size
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        chunk = self.data.read(min(len(buffer), self.chunk_size))
+        buffer[: len(chunk)] = chunk
+        return len(chunk)
+
+
+class FakeFFmpegProcess:
+    """Stand-in for the Popen object returned by ffmpeg.run_async."""
+
+    def __init__(self, frame_numbers: list[int], width: int, height: int):
+        frames = []
+        for number in frame_numbers:
+            frame = np.full((height, width, 3), 128, dtype=np.uint8)
+            frame[8:24, 8:24] = (200, 100, 50)
+            frame[0, 0, 0] = number // 256
+            frame[0, 0, 1] = number % 256
+            frames.append(frame.tobytes())
+        self.stdout = ChunkedReader(b"".join(frames))
+        self.killed = False
+
+    def poll(self):
+        return None if not self.killed else -9
+
+    def kill(self):
+        self.killed = True
+
+    def wait(self):
+        return 0
+
+
+def frame_index(frame: np.ndarray) -> int:
+    """Decode the frame number written by FakeCapture."""
+    return int(frame[0, 0, 0]) * 256 + int(frame[0, 0, 1])
+
+
+class TestSequentialFrameSampler:
+    """Test SequentialFrameSampler."""
+
+    def test_reads_forward_without_seeking(self):
+        """Test that nearby targets are reached by grabbing, not seeking."""
+        cap = FakeCapture()
+        sampler = SequentialFrameSampler(
+            cap, fps=30.0, frame_numbers=[10, 40, 70], max_gap_seconds=10.0
+        )
+
+        for target in [10, 40, 70]:
+            ret, frame = sampler.read(target)
+            assert ret
+            assert frame_index(frame) == target
+
+        assert cap.set_calls == []
+        assert cap.retrieve_calls == 3
+        assert cap.grab_calls == 71
+
+        stats = sampler.get_stats()
+        assert stats["planned_frames"] == 3
+        assert stats["frames_retrieved"] == 3
+        assert stats["seeks"] == 0
+
+    def test_seeks_when_gap_exceeds_limit(self):
+        """Test fallback to seeking across large gaps."""
+        cap = FakeCapture()
+        sampler = SequentialFrameSampler(
+            cap, fps=10.0, frame_numbers=[5, 500], max_gap_seconds=2.0
+        )
+
+        assert sampler.read(5)[0]
+        ret, frame = sampler.read(500)
+
+        assert ret
+        assert frame_index(frame) == 500
+        assert cap.set_calls == [500]
+        assert sampler.seeks == 1
+        # Only the frames up to 5 plus the target were decoded
+        assert cap.grab_calls == 7
+
+    def test_seeks_backwards(self):
+        """Test that out-of-order requests still return the right frame."""
+        cap = FakeCapture()
+        sampler = SequentialFrameSampler(
+            cap, fps=30.0, frame_numbers=[20, 10], max_gap_seconds=10.0
+        )
+
+        assert frame_index(sampler.read(20)[1]) == 20
+        ret, frame = sampler.read(10)
+
+        assert ret
+        assert frame_index(frame) == 10
+        assert cap.set_calls == [10]
+
+    def test_repeated_frame_is_not_decoded_twice(self):
+        """Test that duplicate targets reuse the last retrieved frame."""
+        cap = FakeCapture()
+        sampler = SequentialFrameSampler(cap, fps=30.0, frame_numbers=[3, 3])
+
+        first = sampler.read(3)[1]
+        second = sampler.read(3)[1]
+
+        assert cap.retrieve_calls == 1
+        assert np.array_equal(first, second)
+        assert first is not second
+
+    def test_end_of_stream(self):
+        """Test reading past the end of the stream."""
+        cap = FakeCapture(total_frames=50)
+        sampler = SequentialFrameSampler(cap, fps=30.0, frame_numbers=[60])
+
+        ret, frame = sampler.read(60)
+
+        assert not ret
+        assert frame is None
+
+
+class TestRawFramePipeSampler:
+    """Test RawFramePipeSampler."""
+
+    def test_output_size(self):
+        """Test scaling to fit within limits while keeping aspect ratio."""
+        assert RawFramePipeSampler._output_size(1920, 1080, None, None) == (1920, 1080)
+        assert RawFramePipeSampler._output_size(1920, 1080, 960, 1080) == (960, 540)
+        assert RawFramePipeSampler._output_size(1080, 1920, 1920, 960) == (540, 960)
+        assert RawFramePipeSampler._output_size(641, 361, 320, 360) == (320, 180)
+
+    @patch("ffmpeg.run_async")
+    def test_reads_planned_frames_from_pipe(self, mock_run_async):
+        """Test that frames are read in order into pooled buffers."""
+        mock_run_async.return_value = FakeFFmpegProcess([10, 40, 70], 32, 32)
+
+        sampler = RawFramePipeSampler(
+            Path("video.mp4"), [70, 10, 40], source_width=32, source_height=32
+        )
+        read_indices = []
+        for target in [10, 40, 40, 70]:
+            ret, frame = sampler.read(target)
+            assert ret
+            assert frame.shape == (32, 32, 3)
+            assert tuple(frame[10, 10]) == (200, 100, 50)
+            # Frames are read straight into the preallocated buffers
+            assert any(frame is buffer for buffer in sampler._buffers)
+            read_indices.append(frame_index(frame))
+        sampler.close()
+
+        assert read_indices == [10, 40, 40, 70]
+
+        stats = sampler.get_stats()
+        assert stats["frames_piped"] == 3
+        assert stats["frames_returned"] == 4
+
+        mock_run_async.assert_called_once()
+        args = mock_run_async.call_args[0][0].get_args()
+        assert args[args.index("-f") + 1] == "rawvideo"
+        assert args[args.index("-pix_fmt") + 1] == "rgb24"
+        assert "pipe:" in args
+        assert mock_run_async.call_args[1] == {"pipe_stdout": True}
+
+    @patch("ffmpeg.run_async")
+    def test_frames_valid_for_buffer_count_reads(self, mock_run_async):
+        """Test that a returned frame is overwritten buffer_count reads later."""
+        mock_run_async.return_value = FakeFFmpegProcess([10, 40, 70], 32, 32)
+
+        sampler = RawFramePipeSampler(
+            Path("video.mp4"),
+            [10, 40, 70],
+            source_width=32,
+            source_height=32,
+            buffer_count=2,
+        )
+        first = sampler.read(10)[1]
+        kept = first.copy()
+        second = sampler.read(40)[1]
+
+        assert sampler.reuses_buffers
+        assert frame_index(first) == 10
+        assert frame_index(second) == 40
+        sampler.read(70)
+        assert frame_index(first) == 70
+        assert frame_index(kept) == 10
+
+    @patch("ffmpeg.run_async")
+    def test_scale_filter_applied(self, mock_run_async):
+        """Test that downscaling happens in ffmpeg."""
+        mock_run_async.return_value = FakeFFmpegProcess([5], 32, 18)
+
+        sampler = RawFramePipeSampler(
+            Path("video.mp4"),
+            [5],
+            source_width=64,
+            source_height=36,
+            max_width=32,
+            max_height=36,
+        )
+        ret, frame = sampler.read(5)
+
+        assert ret
+        assert frame.shape == (18, 32, 3)
+        args = mock_run_async.call_args[0][0].get_args()
+        assert "scale=32:18" in args[args.index("-filter_complex") + 1]
+
+    @patch("ffmpeg.run_async")
+    def test_stream_ends_early(self, mock_run_async):
+        """Test that frames ffmpeg never produced are reported as failed reads."""
+        mock_run_async.return_value = FakeFFmpegProcess([10], 32, 32)
+
+        with RawFramePipeSampler(
+            Path("video.mp4"), [10, 20], source_width=32, source_height=32
+        ) as sampler:
+            assert sampler.read(10)[0]
+            ret, frame = sampler.read(20)
+
+        assert not ret
+        assert frame is None
+        assert mock_run_async.return_value.killed
+
+    @patch("ffmpeg.run_async")
+    def test_unplanned_frame(self, mock_run_async):
+        """Test that frames outside the plan are not returned."""
+        mock_run_async.return_value = FakeFFmpegProcess([10, 20], 32, 32)
+
+        sampler = RawFramePipeSampler(
+            Path("video.mp4"), [10, 20], source_width=32, source_height=32
+        )
+
+        assert sampler.read(15) == (False, None)
+        assert frame_index(sampler.read(20)[1]) == 20
+
+
+class TestFrameExtractorSequentialSampling:
+    """Test FrameExtractor with sequential sampling enabled."""
+
+    @pytest.fixture
+    def config(self):
+        return DeepBriefConfig(
+            visual_analysis=VisualAnalysisConfig(
+                frames_per_scene=3,
+                enable_quality_filtering=False,
+                enable_captioning=False,
+                enable_ocr=False,
+                enable_object_detection=False,
+                frame_sampling_method="sequential",
+                sequential_max_gap_seconds=5.0,
+            )
+        )
+
+    @pytest.fixture
+    def scene_result(self):
+        scenes = [
+            Scene(start_time=0.0, end_time=4.0, duration=4.0, scene_number=1),
+            Scene(start_time=4.0, end_time=8.0, duration=4.0, scene_number=2),
+            Scene(start_time=60.0, end_time=64.0, duration=4.0, scene_number=3),
+        ]
+        return SceneDetectionResult(
+            scenes=scenes,
+            total_scenes=3,
+            detection_method="threshold",
+            threshold_used=0.4,
+            video_duration=64.0,
+            average_scene_duration=4.0,
+        )
+
+    @patch("deep_brief.analysis.visual_analyzer.handle_corrupt_frame")
+    @patch("cv2.VideoCapture")
+    def test_single_pass_extraction(
+        self, mock_video_capture, mock_handle_corrupt, config, scene_result
+    ):
+        """Test that frames are decoded in one pass with a seek only for the gap."""
+        cap = FakeCapture(total_frames=64 * 10)
+        cap.isOpened = MagicMock(return_value=True)
+        cap.get = MagicMock(return_value=10.0)
+        cap.release = MagicMock()
+        mock_video_capture.return_value = cap
+        mock_handle_corrupt.side_effect = lambda frame, _info: frame
+
+        with tempfile.NamedTemporaryFile(suffix=".mp4", delete=False) as temp_file:
+            video_path = Path(temp_file.name)
+
+        try:
+            extractor = FrameExtractor(config=config)
+            result = extractor.extract_frames_from_scenes(video_path, scene_result)
+        finally:
+            video_path.unlink()
+
+        assert result.total_frames_extracted == 9
+        frame_numbers = [frame.frame_number for frame in result.get_all_frames()]
+        assert frame_numbers == [10, 20, 30, 50, 60, 70, 610, 620, 630]
+
+        # One seek to jump the gap between scene 2 and scene 3
+        assert cap.set_calls == [610]
+        assert cap.retrieve_calls == 9
+
+
+class TestFrameExtractorPipeSampling:
+    """Test FrameExtractor with raw frames piped from ffmpeg."""
+
+    @staticmethod
+    def extract_piped_frames(config, **kwargs):
+        """Extract frames of two scenes through a fake ffmpeg pipe."""
+        cap = MagicMock()
+        cap.isOpened.return_value = True
+        cap.get.side_effect = lambda prop: {
+            cv2.CAP_PROP_FPS: 10.0,
+            cv2.CAP_PROP_FRAME_WIDTH: 32,
+            cv2.CAP_PROP_FRAME_HEIGHT: 32,
+        }[prop]
+        scene_result = SceneDetectionResult(
+            scenes=[
+                Scene(start_time=0.0, end_time=4.0, duration=4.0, scene_number=1),
+                Scene(start_time=4.0, end_time=8.0, duration=4.0, scene_number=2),
+            ],
+            total_scenes=2,
+            detection_method="threshold",
+            threshold_used=0.4,
+            video_duration=8.0,
+            average_scene_duration=4.0,
+        )
+
+        with tempfile.NamedTemporaryFile(suffix=".mp4", delete=False) as temp_file:
+            video_path = Path(temp_file.name)
+        try:
+            with (
+                patch("cv2.VideoCapture", return_value=cap),
+                patch(
+                    "deep_brief.analysis.visual_analyzer.handle_corrupt_frame",
+                    side_effect=lambda frame, _info: frame,
+                ),
+                patch(
+                    "ffmpeg.run_async",
+                    return_value=FakeFFmpegProcess([10, 20, 30, 50, 60, 70], 32, 32),
+                ),
+            ):
+                return FrameExtractor(config=config).extract_frames_from_scenes(
+                    video_path, scene_result, **kwargs
+                )
+        finally:
+            video_path.unlink()
+
+    @pytest.fixture
+    def config(self):
+        return DeepBriefConfig(
+            visual_analysis=VisualAnalysisConfig(
+                frames_per_scene=3,
+                enable_quality_filtering=False,
+                enable_captioning=False,
+                enable_ocr=True,
+                enable_object_detection=False,
+                frame_sampling_method="pipe",
+            )
+        )
+
+    @patch("ffmpeg.run_async")
+    @patch("deep_brief.analysis.visual_analyzer.handle_corrupt_frame")
+    @patch("cv2.VideoCapture")
+    def test_frames_reach_analyzers_without_disk(
+        self, mock_video_capture, mock_handle_corrupt, mock_run_async, config
+    ):
+        """Test that piped RGB frames are analyzed without a JPEG round-trip."""
+        cap = MagicMock()
+        cap.isOpened.return_value = True
+        cap.get.side_effect = lambda prop: {
+            cv2.CAP_PROP_FPS: 10.0,
+            cv2.CAP_PROP_FRAME_WIDTH: 32,
+            cv2.CAP_PROP_FRAME_HEIGHT: 32,
+        }[prop]
+        mock_video_capture.return_value = cap
+        mock_handle_corrupt.side_effect = lambda frame, _info: frame
+        process = FakeFFmpegProcess([10, 20, 30, 50, 60, 70], 32, 32)
+        mock_run_async.return_value = process
+
+        scene_result = SceneDetectionResult(
+            scenes=[
+                Scene(start_time=4.0, end_time=8.0, duration=4.0, scene_number=2),
+                Scene(start_time=0.0, end_time=4.0, duration=4.0, scene_number=1),
+            ],
+            total_scenes=2,
+            detection_method="threshold",
+            threshold_used=0.4,
+            video_duration=8.0,
+            average_scene_duration=4.0,
+        )
+
+        with tempfile.NamedTemporaryFile(suffix=".mp4", delete=False) as temp_file:
+            video_path = Path(temp_file.name)
+
+        extractor = FrameExtractor(config=config)
+        try:
+            with (
+                patch.object(extractor, "_extract_text_from_frame") as mock_ocr,
+                patch("cv2.imwrite") as mock_imwrite,
+            ):
+                mock_ocr.return_value = None
+                result = extractor.extract_frames_from_scenes(video_path, scene_result)
+        finally:
+            video_path.unlink()
+
+        assert result.total_frames_extracted == 6
+        frame_numbers = [frame.frame_number for frame in result.get_all_frames()]
+        assert frame_numbers == [10, 20, 30, 50, 60, 70]
+        cap.read.assert_not_called()
+        mock_imwrite.assert_not_called()
+        assert process.killed
+
+        # OCR receives the RGB frame from the pipe; quality checks get BGR
+        bgr_frame, rgb_frame = mock_ocr.call_args_list[0][0]
+        assert tuple(rgb_frame[10, 10]) == (200, 100, 50)
+        assert tuple(bgr_frame[10, 10]) == (50, 100, 200)
+
+    def test_kept_frame_images_are_distinct(self, config):
+        """Test that each kept image holds its own frame, not a pooled buffer."""
+        config.processing.frame_buffer_mb = 0
+        frame_images = {}
+
+        self.extract_piped_frames(
+            config, analyze_content=False, frame_images=frame_images
+        )
+
+        indices = {key: frame_index(image) for key, image in frame_images.items()}
+        assert indices == {
+            (1, 10): 10,
+            (1, 20): 20,
+            (1, 30): 30,
+            (2, 50): 50,
+            (2, 60): 60,
+            (2, 70): 70,
+        }
+
+    def test_decoded_ahead_frames_are_distinct(self, config):
+        """Test that frames queued by the decode-ahead thread keep their pixels."""
+        config.processing.frame_buffer_mb = 64
+        frame_images = {}
+
+        self.extract_piped_frames(
+            config, analyze_content=False, frame_images=frame_images
+        )
+
+        indices = {key: frame_index(image) for key, image in frame_images.items()}
+        assert indices == {
+            (1, 10): 10,
+            (1, 20): 20,
+            (1, 30): 30,
+            (2, 50): 50,
+            (2, 60): 60,
+            (2, 70): 70,
+        }
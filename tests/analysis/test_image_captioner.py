@@ -8,6 +8,7 @@ import numpy as np
 import pytest
 import torch
 from PIL import Image
+from transformers import BlipConfig, BlipForConditionalGeneration
 
 from deep_brief.analysis.image_captioner import (
     CaptionResult,
@@ -15,6 +16,7 @@ from deep_brief.analysis.image_captioner import (
     create_image_captioner,
 )
 from deep_brief.core.exceptions import ErrorCode, VideoProcessingError
+from deep_brief.core.model_registry import get_model_registry
 from deep_brief.utils.config import DeepBriefConfig, VisualAnalysisConfig
 
 
@@ -207,6 +209,59 @@ class TestImageCaptioner:
         mock_processor_cls.from_pretrained.assert_called_once()
         mock_model_cls.from_pretrained.assert_called_once()
 
+    @patch("deep_brief.analysis.image_captioner.BlipProcessor")
+    def test_load_quantized_model_from_cache(
+        self, mock_processor_cls, mock_config, tmp_path
+    ):
+        """Test that the quantized captioner is built once and then loaded from disk."""
+        blip_config = BlipConfig(
+            text_config={
+                "hidden_size": 32,
+                "num_hidden_layers": 1,
+                "num_attention_heads": 2,
+                "intermediate_size": 37,
+                "vocab_size": 100,
+            },
+            vision_config={
+                "hidden_size": 32,
+                "num_hidden_layers": 1,
+                "num_attention_heads": 2,
+                "intermediate_size": 37,
+                "image_size": 32,
+                "patch_size": 8,
+            },
+            projection_dim=32,
+        )
+        mock_config.processing.temp_dir = tmp_path
+        mock_config.visual_analysis.captioning_model = (
+            "Salesforce/blip-image-captioning-base"
+        )
+        mock_config.visual_analysis.captioning_quantize = True
+
+        with patch.object(
+            BlipForConditionalGeneration,
+            "from_pretrained",
+            side_effect=lambda *args, **kwargs: BlipForConditionalGeneration(
+                blip_config
+            ),
+        ) as mock_from_pretrained:
+            captioner = ImageCaptioner(config=mock_config)
+            model, _ = captioner._load_model()
+            captioner.cleanup()
+            get_model_registry().clear()
+            cached, _ = ImageCaptioner(config=mock_config)._load_model()
+
+        assert captioner._model_key.dtype == "qint8"
+        quantized_linear = torch.ao.nn.quantized.dynamic.Linear
+        assert isinstance(cached.text_decoder.cls.predictions.decoder, quantized_linear)
+        pixels = torch.randn(1, 3, 32, 32)
+        input_ids = torch.tensor([[1, 2, 3]])
+        assert torch.equal(
+            model(pixel_values=pixels, input_ids=input_ids).logits,
+            cached(pixel_values=pixels, input_ids=input_ids).logits,
+        )
+        mock_from_pretrained.assert_called_once()
+
     @patch("deep_brief.analysis.image_captioner.Blip2Processor")
     @patch("deep_brief.analysis.image_captioner.Blip2ForConditionalGeneration")
     def test_load_model_failure(
@@ -1,8 +1,13 @@
 """Tests for speech transcription functionality."""
 
+from multiprocessing.pool import ThreadPool
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
+import numpy as np
 import pytest
+import torch
+import whisper
 
 from deep_brief.analysis.transcriber import (
     LanguageDetectionResult,
@@ -10,6 +15,7 @@ from deep_brief.analysis.transcriber import (
     TranscriptionResult,
     WhisperTranscriber,
     WordTimestamp,
+    _stitch_chunk_results,
     create_transcriber,
 )
 from deep_brief.core.audio_extractor import AudioInfo
@@ -18,7 +24,13 @@ from deep_brief.core.exceptions import (
     ErrorCode,
     VideoProcessingError,
 )
-from deep_brief.utils.config import DeepBriefConfig, TranscriptionConfig
+from deep_brief.core.memory_budget import WHISPER_MODEL_MEMORY_MB, MemoryBudget
+from deep_brief.core.model_registry import get_model_registry
+from deep_brief.utils.config import (
+    DeepBriefConfig,
+    ProcessingConfig,
+    TranscriptionConfig,
+)
 
 
 @pytest.fixture
@@ -398,6 +410,70 @@ class TestWhisperTranscriber:
 
         assert exc_info.value.error_code.value == "MISSING_DEPENDENCY"
 
+    @pytest.mark.parametrize("alignment_heads_known", [True, False])
+    @patch("whisper.load_model")
+    def test_load_quantized_model_from_cache(
+        self, mock_load_model, alignment_heads_known, tmp_path, monkeypatch
+    ):
+        """Test that the quantized model is built once and then loaded from disk."""
+        if not alignment_heads_known:
+            # Private to whisper, so it may be gone in a later release
+            monkeypatch.delattr(whisper, "_ALIGNMENT_HEADS")
+        # Dimensions of whisper-tiny, which its alignment heads must match
+        dims = whisper.ModelDimensions(
+            n_mels=80,
+            n_audio_ctx=1500,
+            n_audio_state=384,
+            n_audio_head=6,
+            n_audio_layer=4,
+            n_vocab=51865,
+            n_text_ctx=448,
+            n_text_state=384,
+            n_text_head=6,
+            n_text_layer=4,
+        )
+
+        def load_model(*args, **kwargs):
+            model = whisper.Whisper(dims)
+            torch.nn.init.normal_(model.decoder.positional_embedding)  # Not set
+            return model
+
+        mock_load_model.side_effect = load_model
+        config = DeepBriefConfig(
+            processing=ProcessingConfig(temp_dir=tmp_path),
+            transcription=TranscriptionConfig(
+                model="whisper-tiny", device="cpu", quantize=True
+            ),
+        )
+
+        transcriber = WhisperTranscriber(config=config)
+        model = transcriber._load_model()
+        transcriber.cleanup()
+        get_model_registry().clear()
+        cached = WhisperTranscriber(config=config)._load_model()
+
+        assert str(transcriber._model_key) == "whisper-tiny:cpu:qint8"
+        quantized_linear = torch.ao.nn.quantized.dynamic.Linear
+        assert isinstance(model.decoder.blocks[0].attn.query, quantized_linear)
+        assert isinstance(cached.decoder.blocks[0].attn.query, quantized_linear)
+        assert cached.dims == dims
+        mel = torch.randn(1, 80, 3000)
+        tokens = torch.tensor([[50258]])
+        assert torch.equal(model(mel, tokens), cached(mel, tokens))
+        mock_load_model.assert_called_once_with("tiny", device="cpu")
+        assert list((tmp_path / "quantized_models").glob("*.pt"))
+
+    @patch("torch.cuda.is_available", return_value=True)
+    def test_quantize_ignored_on_gpu(self, mock_cuda):
+        """Test that quantization is skipped off the CPU."""
+        config = DeepBriefConfig(
+            transcription=TranscriptionConfig(device="auto", quantize=True)
+        )
+
+        transcriber = WhisperTranscriber(config=config)
+
+        assert transcriber._model_key.dtype == "float32"
+
     @patch("whisper.load_model")
     def test_transcribe_audio_success(
         self, mock_load_model, transcriber, mock_audio_info, mock_whisper_result
@@ -442,6 +518,35 @@ class TestWhisperTranscriber:
         assert call_kwargs["temperature"] == 0.5
         assert call_kwargs["word_timestamps"] is False
 
+    @patch("whisper.load_audio")
+    @patch("whisper.load_model")
+    def test_transcribe_in_memory_samples(
+        self, mock_load_model, mock_load_audio, transcriber, mock_whisper_result, tmp_path
+    ):
+        """Test that in-memory samples go to Whisper without decoding a file."""
+        mock_model = MagicMock()
+        mock_model.transcribe.return_value = mock_whisper_result
+        mock_load_model.return_value = mock_model
+        samples = np.zeros(16000 * 5, dtype=np.float32)
+        audio_info = AudioInfo(
+            file_path=tmp_path / "video.mp4",  # not on disk
+            duration=5.0,
+            sample_rate=16000,
+            channels=1,
+            size_mb=0.3,
+            format="f32le",
+            samples=samples,
+        )
+
+        with patch.object(
+            transcriber, "detect_language", side_effect=AudioProcessingError(message="skip")
+        ):
+            result = transcriber.transcribe_audio(audio_info)
+
+        assert result.text == "Hello world. This is a test."
+        assert mock_model.transcribe.call_args[0][0] is samples
+        mock_load_audio.assert_not_called()
+
     def test_transcribe_audio_file_not_found(self, transcriber, tmp_path):
         """Test transcription with non-existent audio file."""
         audio_info = AudioInfo(
@@ -486,14 +591,21 @@ class TestWhisperTranscriber:
 
         assert exc_info.value.error_code.value == "INSUFFICIENT_MEMORY"
 
+    @patch("deep_brief.analysis.transcriber.decode_pcm")
     @patch("whisper.load_model")
     def test_transcribe_audio_segment(
-        self, mock_load_model, transcriber, mock_audio_info, mock_whisper_result
+        self,
+        mock_load_model,
+        mock_decode_pcm,
+        transcriber,
+        mock_audio_info,
+        mock_whisper_result,
     ):
         """Test transcribing audio segment."""
         mock_model = MagicMock()
         mock_model.transcribe.return_value = mock_whisper_result
         mock_load_model.return_value = mock_model
+        mock_decode_pcm.return_value = np.zeros(16000 * 5, dtype=np.float32)
 
         result = transcriber.transcribe_audio_segment(
             mock_audio_info, start_time=1.0, end_time=4.0
@@ -505,6 +617,42 @@ class TestWhisperTranscriber:
         # Should filter segments to time range
         assert len(result.segments) > 0
 
+        # Only the segment and its context are decoded
+        mock_decode_pcm.assert_called_once_with(mock_audio_info.file_path, 0.0, 5.0)
+
+    @patch("whisper.load_model")
+    def test_transcribe_audio_segment_slices_samples(
+        self, mock_load_model, transcriber, tmp_path
+    ):
+        """Test that only the window of in-memory samples goes to Whisper."""
+        mock_model = MagicMock()
+        # Times relative to the window, which starts 1s before the segment
+        mock_model.transcribe.return_value = chunk_result("hello", 1.5, 2.5)
+        mock_load_model.return_value = mock_model
+        audio_info = AudioInfo(
+            file_path=tmp_path / "video.mp4",
+            duration=600.0,
+            sample_rate=16000,
+            channels=1,
+            size_mb=36.6,
+            format="f32le",
+            samples=np.zeros(16000 * 600, dtype=np.float32),
+        )
+
+        result = transcriber.transcribe_audio_segment(
+            audio_info, start_time=100.0, end_time=110.0, language="en"
+        )
+
+        assert len(mock_model.transcribe.call_args[0][0]) == 16000 * 12
+        assert result.segments[0].start == pytest.approx(0.5)
+        assert result.segments[0].words[0].end == pytest.approx(1.5)
+        assert result.duration == 10.0
+
+    def test_transcribe_audio_segment_empty(self, transcriber, mock_audio_info):
+        """Test that an empty segment is rejected."""
+        with pytest.raises(ValueError, match="after its start time"):
+            transcriber.transcribe_audio_segment(mock_audio_info, 5.0, 5.0)
+
     def test_get_supported_languages(self, transcriber):
         """Test getting supported languages."""
         languages = transcriber.get_supported_languages()
@@ -537,6 +685,244 @@ class TestWhisperTranscriber:
         assert transcriber.model is None
 
 
+def chunk_result(text, start, end, language="en"):
+    """Whisper result of one chunk with a single one-word segment."""
+    return {
+        "text": f" {text}",
+        "language": language,
+        "segments": [
+            {
+                "id": 0,
+                "text": f" {text}",
+                "start": start,
+                "end": end,
+                "words": [{"word": text, "start": start, "end": end}],
+            }
+        ],
+    }
+
+
+def long_tone_audio(tmp_path):
+    """70 seconds of a steady tone, decoded in memory."""
+    return AudioInfo(
+        file_path=tmp_path / "video.mp4",
+        duration=70.0,
+        sample_rate=16000,
+        channels=1,
+        size_mb=4.5,
+        format="f32le",
+        samples=(0.3 * np.sin(np.arange(16000 * 70) * 0.1)).astype(np.float32),
+    )
+
+
+@pytest.fixture
+def thread_pool_context():
+    """Run chunk workers on threads in place of spawned processes."""
+    context = SimpleNamespace(Pool=MagicMock(side_effect=ThreadPool))
+    with (
+        patch(
+            "deep_brief.analysis.transcriber.multiprocessing.get_context",
+            return_value=context,
+        ) as get_context,
+        patch("deep_brief.analysis.transcriber._chunk_worker_model", None),
+    ):
+        yield SimpleNamespace(get_context=get_context, Pool=context.Pool)
+
+
+class TestParallelTranscription:
+    """Test transcribing chunks cut at pauses on worker processes."""
+
+    def test_stitch_chunk_results(self):
+        """Test that chunk times move onto the full timeline with new ids."""
+        result = _stitch_chunk_results(
+            [
+                chunk_result("hello", 1.0, 2.0),
+                {"text": "", "language": "fr", "segments": []},
+                chunk_result("again", 0.5, 1.5),
+            ],
+            [0.0, 30.0, 60.0],
+        )
+
+        assert [segment["id"] for segment in result["segments"]] == [0, 1]
+        assert result["segments"][1]["start"] == 60.5
+        assert result["segments"][1]["words"][0]["end"] == 61.5
+        assert result["text"] == "hello again"
+        assert result["language"] == "en"
+
+    @patch("whisper.load_model")
+    def test_transcribe_audio_in_parallel_chunks(
+        self, mock_load_model, mock_config, tmp_path, thread_pool_context
+    ):
+        """Test that long audio is split, transcribed by workers and stitched."""
+        mock_config.transcription.parallel_workers = 2
+        mock_config.transcription.chunk_seconds = 30.0
+        transcriber = WhisperTranscriber(config=mock_config)
+        mock_model = MagicMock()
+        mock_model.transcribe.side_effect = lambda samples, **kwargs: chunk_result(
+            f"len{len(samples) // 16000}", 0.5, 1.0
+        )
+        mock_load_model.return_value = mock_model
+
+        result = transcriber.transcribe_audio(long_tone_audio(tmp_path), language="en")
+
+        # A steady tone has no pauses, so it is cut at the target length
+        assert result.text == "len30 len30 len10"
+        assert [segment.id for segment in result.segments] == [0, 1, 2]
+        assert [segment.start for segment in result.segments] == [0.5, 30.5, 60.5]
+        assert result.segments[2].words[0].end == 61.0
+        assert mock_model.transcribe.call_args[1]["language"] == "en"
+        assert transcriber.model is None  # Workers hold the models
+        thread_pool_context.get_context.assert_called_once_with("spawn")
+
+    @patch("whisper.load_model")
+    def test_worker_pool_reused(
+        self, mock_load_model, mock_config, tmp_path, thread_pool_context
+    ):
+        """Test that the workers and their models serve later recordings too."""
+        mock_config.transcription.parallel_workers = 2
+        mock_config.transcription.chunk_seconds = 30.0
+        transcriber = WhisperTranscriber(config=mock_config)
+        mock_load_model.return_value.transcribe.return_value = chunk_result(
+            "hi", 0.5, 1.0
+        )
+
+        transcriber.transcribe_audio(long_tone_audio(tmp_path), language="en")
+        transcriber.transcribe_audio(long_tone_audio(tmp_path), language="en")
+        pool = transcriber._chunk_pool
+        transcriber.cleanup()
+
+        thread_pool_context.Pool.assert_called_once()
+        assert mock_load_model.call_count == 2  # Once per worker
+        assert pool is not None and transcriber._chunk_pool is None
+
+    @patch("whisper.load_model")
+    def test_worker_models_reserved_in_memory_budget(
+        self, mock_load_model, mock_config, tmp_path, thread_pool_context
+    ):
+        """Test that the budget accounts for one model per chunk worker."""
+        mock_config.transcription.parallel_workers = 2
+        mock_config.transcription.chunk_seconds = 30.0
+        transcriber = WhisperTranscriber(config=mock_config)
+        mock_load_model.return_value.transcribe.return_value = chunk_result(
+            "hi", 0.5, 1.0
+        )
+        budget = MemoryBudget(limit_mb=4096)
+
+        with patch(
+            "deep_brief.analysis.transcriber.get_memory_budget", return_value=budget
+        ):
+            transcriber.transcribe_audio(long_tone_audio(tmp_path), language="en")
+            reserved = budget.get_stats()
+            transcriber.cleanup()
+
+        assert reserved["resident_models"] == [transcriber._chunk_pool_memory_key]
+        assert reserved["model_mb"] == 2 * WHISPER_MODEL_MEMORY_MB["whisper-base"]
+        assert budget.get_stats()["model_mb"] == 0
+
+    @patch("whisper.load_model")
+    def test_gpu_not_split(
+        self, mock_load_model, mock_config, tmp_path, thread_pool_context
+    ):
+        """Test that chunks are only transcribed in parallel on the CPU."""
+        mock_config.transcription.parallel_workers = 2
+        mock_config.transcription.chunk_seconds = 30.0
+        transcriber = WhisperTranscriber(config=mock_config)
+        transcriber.device = "cuda"
+        mock_load_model.return_value.transcribe.return_value = chunk_result(
+            "hi", 0.5, 1.0
+        )
+
+        transcriber.transcribe_audio(long_tone_audio(tmp_path), language="en")
+
+        thread_pool_context.Pool.assert_not_called()
+        mock_load_model.assert_called_once_with("base", device="cuda")
+
+    @patch("whisper.load_model")
+    def test_short_audio_not_split(
+        self, mock_load_model, mock_config, mock_audio_info, mock_whisper_result
+    ):
+        """Test that audio shorter than a chunk is transcribed in-process."""
+        mock_config.transcription.parallel_workers = 4
+        transcriber = WhisperTranscriber(config=mock_config)
+        mock_model = MagicMock()
+        mock_model.transcribe.return_value = mock_whisper_result
+        mock_load_model.return_value = mock_model
+
+        with (
+            patch(
+                "deep_brief.analysis.transcriber.multiprocessing.get_context"
+            ) as mock_context,
+            patch.object(
+                transcriber,
+                "detect_language",
+                side_effect=AudioProcessingError(message="skip"),
+            ),
+        ):
+            result = transcriber.transcribe_audio(mock_audio_info)
+
+        mock_context.assert_not_called()
+        assert len(result.segments) == 2
+
+
+class TestSkipSilence:
+    """Test transcribing only the speech found by voice activity detection."""
+
+    @patch("whisper.load_model")
+    def test_only_speech_transcribed(self, mock_load_model, mock_config, tmp_path):
+        """Test that silence is cut out and times are mapped back."""
+        mock_config.transcription.skip_silence = True
+        mock_config.transcription.speech_pad_seconds = 0.0
+        transcriber = WhisperTranscriber(config=mock_config)
+        mock_model = MagicMock()
+        mock_model.transcribe.return_value = chunk_result("hello", 2.5, 3.5)
+        mock_load_model.return_value = mock_model
+        tone = (0.3 * np.sin(np.arange(16000 * 3) * 0.1)).astype(np.float32)
+        silence = np.zeros(16000 * 10, dtype=np.float32)
+        audio_info = AudioInfo(
+            file_path=tmp_path / "video.mp4",
+            duration=16.0,
+            sample_rate=16000,
+            channels=1,
+            size_mb=1.0,
+            format="f32le",
+            samples=np.concatenate([tone, silence, tone]),
+        )
+
+        result = transcriber.transcribe_audio(audio_info, language="en")
+
+        assert len(mock_model.transcribe.call_args[0][0]) == pytest.approx(
+            16000 * 6, abs=1000
+        )
+        assert result.segments[0].start == pytest.approx(2.5, abs=0.05)
+        assert result.segments[0].words[0].end == pytest.approx(13.5, abs=0.05)
+        assert result.skipped_seconds == pytest.approx(10.0, abs=0.05)
+        assert result.speech_seconds == pytest.approx(6.0, abs=0.05)
+        assert result.duration == 16.0
+
+    @patch("whisper.load_model")
+    def test_silent_audio_not_transcribed(
+        self, mock_load_model, mock_config, tmp_path
+    ):
+        """Test that audio without speech skips Whisper entirely."""
+        mock_config.transcription.skip_silence = True
+        transcriber = WhisperTranscriber(config=mock_config)
+        audio_info = AudioInfo(
+            file_path=tmp_path / "video.mp4",
+            duration=5.0,
+            sample_rate=16000,
+            channels=1,
+            size_mb=0.3,
+            format="f32le",
+            samples=np.zeros(16000 * 5, dtype=np.float32),
+        )
+
+        result = transcriber.transcribe_audio(audio_info, language="en")
+
+        mock_load_model.assert_not_called()
+        assert result.segments == []
+        assert result.skipped_seconds == 5.0
+
+
 class TestTranscriberFactory:
     """Test transcriber factory function."""
 
@@ -609,6 +995,35 @@ class TestLanguageDetection:
         assert result.detection_method == "whisper"
         assert "en" in result.all_probabilities
 
+    @patch("whisper.load_model")
+    @patch("whisper.load_audio")
+    @patch("whisper.log_mel_spectrogram")
+    def test_detect_language_in_memory_samples(
+        self, mock_mel, mock_load_audio, mock_load_model, transcriber, tmp_path
+    ):
+        """Test that language detection uses in-memory samples directly."""
+        mock_model = MagicMock()
+        mock_model.detect_language.return_value = (None, {"en": 0.9, "de": 0.1})
+        mock_model.device = "cpu"
+        mock_load_model.return_value = mock_model
+        mock_mel.return_value.to.return_value = MagicMock()
+        audio_info = AudioInfo(
+            file_path=tmp_path / "video.mp4",
+            duration=60.0,
+            sample_rate=16000,
+            channels=1,
+            size_mb=3.7,
+            format="f32le",
+            samples=np.zeros(16000 * 60, dtype=np.float32),
+        )
+
+        result = transcriber.detect_language(audio_info)
+
+        assert result.detected_language == "en"
+        mock_load_audio.assert_not_called()
+        # Trimmed to Whisper's 30 second window
+        assert len(mock_mel.call_args[0][0]) == 16000 * 30
+
     def test_detect_language_file_not_found(self, transcriber, tmp_path):
         """Test language detection with non-existent file."""
         audio_info = AudioInfo(
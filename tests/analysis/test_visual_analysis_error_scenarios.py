@@ -32,6 +32,7 @@ class TestImageCaptionerErrors:
         config.visual_analysis.enable_captioning = True
         config.visual_analysis.captioning_model = "invalid-model-name"
         config.visual_analysis.captioning_device = "auto"
+        config.visual_analysis.captioning_quantize = False
         
         captioner = ImageCaptioner(config=config)
         
@@ -80,6 +81,7 @@ class TestImageCaptionerErrors:
         config.visual_analysis.captioning_device = "cpu"
         config.visual_analysis.max_caption_length = 50
         config.visual_analysis.caption_temperature = 1.0
+        config.visual_analysis.captioning_quantize = False
         
         captioner = ImageCaptioner(config=config)
         
@@ -320,6 +322,7 @@ class TestFrameExtractorErrors:
         config.visual_analysis.enable_captioning = False
         config.visual_analysis.enable_ocr = False
         config.visual_analysis.enable_object_detection = False
+        config.processing.frame_buffer_mb = 0
         
         video_path = tmp_path / "test.mp4"
         video_path.touch()
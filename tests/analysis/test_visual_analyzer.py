@@ -14,6 +14,7 @@ from deep_brief.analysis.visual_analyzer import (
     FrameQualityMetrics,
     SceneFrameAnalysis,
     VisualAnalysisResult,
+    VisualAnalysisStats,
     create_frame_extractor,
 )
 from deep_brief.core.exceptions import ErrorCode, VideoProcessingError
@@ -653,6 +654,88 @@ class TestFrameExtractor:
             if video_path.exists():
                 video_path.unlink()
 
+    @patch("cv2.VideoCapture")
+    def test_iter_frames_yields_each_scene(
+        self, mock_video_capture, frame_extractor, sample_scene_result, sample_frame,
+        tmp_path,
+    ):
+        """Test that scenes are yielded one at a time with running totals."""
+        video_path = tmp_path / "video.mp4"
+        video_path.touch()
+        mock_cap = MagicMock()
+        mock_cap.isOpened.return_value = True
+        mock_cap.get.return_value = 30.0  # FPS
+        mock_cap.read.return_value = (True, sample_frame)
+        mock_video_capture.return_value = mock_cap
+
+        stats = VisualAnalysisStats()
+        scenes = frame_extractor.iter_frames_from_scenes(
+            video_path, sample_scene_result, stats=stats
+        )
+
+        first = next(scenes)
+        assert isinstance(first, SceneFrameAnalysis)
+        assert first.scene_number == 1
+        assert stats.scenes_completed == 1
+        assert stats.total_frames_processed == first.total_frames_processed
+        mock_cap.release.assert_not_called()
+
+        # Stopping early releases the video
+        scenes.close()
+        mock_cap.release.assert_called_once()
+
+    @patch("cv2.VideoCapture")
+    def test_scene_callback_matches_result(
+        self, mock_video_capture, frame_extractor, sample_scene_result, sample_frame,
+        tmp_path,
+    ):
+        """Test that the callback sees every scene and totals match the result."""
+        video_path = tmp_path / "video.mp4"
+        video_path.touch()
+        mock_cap = MagicMock()
+        mock_cap.isOpened.return_value = True
+        mock_cap.get.return_value = 30.0  # FPS
+        mock_cap.read.return_value = (True, sample_frame)
+        mock_video_capture.return_value = mock_cap
+
+        seen = []
+        result = frame_extractor.extract_frames_from_scenes(
+            video_path,
+            sample_scene_result,
+            scene_callback=lambda analysis, stats: seen.append(
+                (analysis.scene_number, stats.scenes_completed)
+            ),
+        )
+
+        assert seen == [(1, 1), (2, 2)]
+        frames = result.get_all_frames()
+        assert result.total_frames_extracted == len(frames)
+        assert result.average_quality_score == pytest.approx(
+            sum(f.quality_metrics.overall_quality_score for f in frames) / len(frames)
+        )
+        assert sum(result.overall_quality_distribution.values()) == len(frames)
+        assert len(result.best_frames_per_scene) == 2
+
+    @patch("cv2.VideoCapture")
+    def test_decode_ahead_error_raised_to_consumer(
+        self, mock_video_capture, frame_extractor, sample_scene_result, tmp_path
+    ):
+        """Test that a failure on the decoder thread fails the extraction."""
+        video_path = tmp_path / "video.mp4"
+        video_path.touch()
+        mock_cap = MagicMock()
+        mock_cap.isOpened.return_value = True
+        mock_cap.get.return_value = 30.0  # FPS
+        mock_cap.read.side_effect = RuntimeError("decoder crashed")
+        mock_video_capture.return_value = mock_cap
+
+        with pytest.raises(VideoProcessingError) as exc_info:
+            frame_extractor.extract_frames_from_scenes(video_path, sample_scene_result)
+
+        assert exc_info.value.error_code == ErrorCode.FRAME_EXTRACTION_FAILED
+        assert "decoder crashed" in str(exc_info.value)
+        mock_cap.release.assert_called_once()
+
     def test_assess_frame_quality(self, frame_extractor, sample_frame):
         """Test frame quality assessment."""
         quality_metrics = frame_extractor._assess_frame_quality(sample_frame)
@@ -1007,6 +1090,113 @@ class TestFrameExtractionIntegration:
             if video_path.exists():
                 video_path.unlink()
 
+    @patch("cv2.VideoCapture")
+    def test_deferred_content_analysis(
+        self,
+        mock_video_capture,
+        frame_extractor,
+        sample_scene_result,
+        sample_frame,
+        tmp_path,
+    ):
+        """Test captioning frames in a later pass over the kept images."""
+        frame_extractor.config.visual_analysis.enable_captioning = True
+        video_path = tmp_path / "video.mp4"
+        video_path.write_bytes(b"fake video")
+
+        mock_cap = MagicMock()
+        mock_cap.isOpened.return_value = True
+        mock_cap.get.return_value = 30.0  # FPS
+        mock_cap.read.return_value = (True, sample_frame)
+        mock_video_capture.return_value = mock_cap
+
+        with patch.object(frame_extractor, "_caption_frame") as mock_caption_frame:
+            mock_caption_frame.return_value = MagicMock(caption="A slide")
+            frame_images = {}
+            result = frame_extractor.extract_frames_from_scenes(
+                video_path,
+                sample_scene_result,
+                analyze_content=False,
+                frame_images=frame_images,
+            )
+
+            mock_caption_frame.assert_not_called()
+            frames = result.get_all_frames()
+            assert len(frame_images) == len(frames) > 0
+            assert all(frame.caption_result is None for frame in frames)
+
+            analyzed = frame_extractor.analyze_frame_content(
+                result, frame_images, "caption"
+            )
+
+        assert analyzed == len(frames)
+        assert all(frame.caption_result.caption == "A slide" for frame in frames)
+        assert result.best_frames_per_scene[0].caption_result is not None
+
+        with pytest.raises(ValueError, match="Unknown content analysis"):
+            frame_extractor.analyze_frame_content(result, frame_images, "faces")
+
+    @patch("cv2.VideoCapture")
+    def test_content_results_cached_per_frame(
+        self,
+        mock_video_capture,
+        frame_extractor,
+        sample_scene_result,
+        sample_frame,
+        tmp_path,
+    ):
+        """Test that captions are reused for identical frames and settings."""
+        from deep_brief.analysis.image_captioner import CaptionResult
+        from deep_brief.core.artifact_cache import ArtifactCache
+
+        frame_extractor.config.visual_analysis.enable_captioning = True
+        video_path = tmp_path / "video.mp4"
+        video_path.write_bytes(b"fake video")
+        mock_cap = MagicMock()
+        mock_cap.isOpened.return_value = True
+        mock_cap.get.return_value = 30.0  # FPS
+        mock_cap.read.return_value = (True, sample_frame)
+        mock_video_capture.return_value = mock_cap
+        cache = ArtifactCache(tmp_path / "cache")
+
+        def caption_frames():
+            frame_images = {}
+            result = frame_extractor.extract_frames_from_scenes(
+                video_path,
+                sample_scene_result,
+                analyze_content=False,
+                frame_images=frame_images,
+            )
+            frame_extractor.analyze_frame_content(
+                result, frame_images, "caption", cache=cache
+            )
+            return result.get_all_frames()
+
+        with patch.object(frame_extractor, "_caption_frame") as mock_caption_frame:
+            mock_caption_frame.return_value = CaptionResult(
+                caption="A slide",
+                confidence=0.85,
+                processing_time=1.2,
+                model_used="Salesforce/blip2-opt-2.7b",
+                tokens_generated=2,
+                alternative_captions=[],
+            )
+
+            # Every sampled frame has the same pixels, so one caption serves all
+            frames = caption_frames()
+            assert mock_caption_frame.call_count == 1
+            assert all(frame.caption_result.caption == "A slide" for frame in frames)
+
+            # A changed quality filter does not re-run the captioner
+            frame_extractor.config.visual_analysis.min_quality_score = 0.0
+            caption_frames()
+            assert mock_caption_frame.call_count == 1
+
+            # A changed captioning setting does
+            frame_extractor.config.visual_analysis.max_caption_length = 20
+            caption_frames()
+            assert mock_caption_frame.call_count == 2
+
     @patch("cv2.VideoCapture")
     def test_extract_frames_with_ocr(
         self, mock_video_capture, frame_extractor, sample_scene_result, sample_frame
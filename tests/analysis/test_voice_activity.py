@@ -0,0 +1,133 @@
+"""Tests for energy-based voice activity detection."""
+
+import numpy as np
+import pytest
+
+from deep_brief.analysis.voice_activity import (
+    SAMPLE_RATE,
+    SpeechTimeline,
+    detect_speech_intervals,
+    find_silences,
+    frame_energy_db,
+    plan_silence_chunks,
+)
+
+
+def make_audio(*parts):
+    """Concatenate (seconds, is_speech) parts into 16 kHz samples."""
+    rng = np.random.default_rng(0)
+    pieces = []
+    for seconds, is_speech in parts:
+        count = int(seconds * SAMPLE_RATE)
+        t = np.arange(count) / SAMPLE_RATE
+        if is_speech:
+            pieces.append(0.3 * np.sin(2 * np.pi * 220 * t))
+        else:
+            pieces.append(0.001 * rng.standard_normal(count))
+    return np.concatenate(pieces).astype(np.float32)
+
+
+class TestFrameEnergy:
+    """Test frame energy measurement."""
+
+    def test_loud_frames_have_more_energy(self):
+        """Test that speech frames are louder than silent ones."""
+        energy = frame_energy_db(make_audio((1.0, True), (1.0, False)))
+
+        assert energy.size == 66  # 30 ms frames
+        assert energy[:30].min() > energy[-30:].max() + 20
+
+    def test_too_short_for_a_frame(self):
+        """Test that audio shorter than a frame has no frames."""
+        assert frame_energy_db(np.zeros(100, dtype=np.float32)).size == 0
+
+
+class TestFindSilences:
+    """Test finding pauses."""
+
+    def test_pauses_found_and_short_ones_ignored(self):
+        """Test that only pauses over the minimum length are reported."""
+        audio = make_audio(
+            (2.0, True), (1.0, False), (2.0, True), (0.1, False), (2.0, True)
+        )
+
+        silences = find_silences(audio, min_silence_seconds=0.3)
+
+        assert len(silences) == 1
+        start, end = silences[0]
+        assert start == pytest.approx(2.0, abs=0.05)
+        assert end == pytest.approx(3.0, abs=0.05)
+
+
+class TestPlanSilenceChunks:
+    """Test splitting audio into chunks at pauses."""
+
+    def test_chunks_cut_in_pauses(self):
+        """Test that chunks are cut in the middle of the nearest pause."""
+        audio = make_audio(
+            (25.0, True), (1.0, False), (28.0, True), (1.0, False), (20.0, True)
+        )
+
+        chunks = plan_silence_chunks(audio, chunk_seconds=30.0, min_silence_seconds=0.3)
+
+        assert len(chunks) == 3
+        assert chunks[0][0] == 0.0
+        assert chunks[0][1] == pytest.approx(25.5, abs=0.05)
+        assert chunks[1][1] == pytest.approx(54.5, abs=0.05)
+        assert chunks[2][1] == pytest.approx(75.0)
+        assert all(a[1] == b[0] for a, b in zip(chunks, chunks[1:], strict=False))
+
+    def test_no_pause_cuts_at_target(self):
+        """Test that continuous speech is cut at the target length."""
+        chunks = plan_silence_chunks(
+            make_audio((70.0, True)), chunk_seconds=30.0, min_silence_seconds=0.3
+        )
+
+        assert chunks == [(0.0, 30.0), (30.0, 60.0), (60.0, 70.0)]
+
+    def test_short_audio_single_chunk(self):
+        """Test that audio shorter than a chunk is not split."""
+        assert plan_silence_chunks(
+            make_audio((10.0, True)), chunk_seconds=30.0, min_silence_seconds=0.3
+        ) == [(0.0, 10.0)]
+
+
+class TestSpeechIntervals:
+    """Test finding speech and skipping the silence between it."""
+
+    def test_long_pauses_skipped_with_padding(self):
+        """Test that pauses are left out, less the padding around speech."""
+        audio = make_audio(
+            (1.5, False), (2.0, True), (3.0, False), (2.0, True), (0.5, False)
+        )
+
+        intervals = detect_speech_intervals(
+            audio, min_silence_seconds=1.0, pad_seconds=0.25
+        )
+
+        assert len(intervals) == 2
+        assert intervals[0][0] == pytest.approx(1.25, abs=0.05)
+        assert intervals[0][1] == pytest.approx(3.75, abs=0.05)
+        assert intervals[1][0] == pytest.approx(6.25, abs=0.05)
+        assert intervals[1][1] == pytest.approx(9.0)  # Short trailing pause kept
+
+    def test_silent_recording_has_no_speech(self):
+        """Test that a recording without speech has no intervals."""
+        audio = make_audio((5.0, False))
+
+        assert detect_speech_intervals(audio, 1.0, 0.25) == []
+
+    def test_timeline_maps_joined_times_back(self):
+        """Test that times in the joined speech map to the original recording."""
+        timeline = SpeechTimeline([(1.0, 3.0), (6.0, 8.0)], duration=10.0)
+        samples = np.arange(10 * SAMPLE_RATE, dtype=np.float32)
+
+        joined = timeline.join(samples)
+
+        assert len(joined) == 4 * SAMPLE_RATE
+        assert joined[2 * SAMPLE_RATE] == 6 * SAMPLE_RATE
+        assert timeline.speech_seconds == 4.0
+        assert timeline.skipped_seconds == 6.0
+        assert timeline.to_source_time(0.5) == 1.5
+        assert timeline.to_source_time(2.5) == 6.5
+        assert timeline.to_source_time(5.0) == 8.0  # Clamped to the last interval
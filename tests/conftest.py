@@ -6,6 +6,25 @@ from pathlib import Path
 
 import pytest
 
+from deep_brief.core.model_registry import get_model_registry
+from deep_brief.core.probe_cache import get_probe_cache
+
+
+@pytest.fixture(autouse=True)
+def clear_probe_cache() -> Generator[None, None, None]:
+    """Keep cached ffprobe results from leaking between tests."""
+    get_probe_cache().clear()
+    yield
+    get_probe_cache().clear()
+
+
+@pytest.fixture(autouse=True)
+def clear_model_registry() -> Generator[None, None, None]:
+    """Keep models loaded (or mocked) by one test from being shared with the next."""
+    get_model_registry().clear()
+    yield
+    get_model_registry().clear()
+
 
 @pytest.fixture
 def temp_dir() -> Generator[Path, None, None]:
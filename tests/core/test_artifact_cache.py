@@ -0,0 +1,138 @@
+"""Tests for the on-disk stage output cache."""
+
+import time
+
+import numpy as np
+
+from deep_brief.core.artifact_cache import ArtifactCache
+from deep_brief.core.audio_extractor import AudioInfo
+from deep_brief.core.video_processor import FrameInfo
+from deep_brief.core.windowed import WindowOutputs
+
+
+def make_audio_info(path):
+    """AudioInfo pointing at a WAV file."""
+    return AudioInfo(
+        file_path=path,
+        duration=1.0,
+        sample_rate=16000,
+        channels=1,
+        size_mb=0.1,
+        format="wav",
+    )
+
+
+class TestArtifactCache:
+    """Test ArtifactCache."""
+
+    def test_put_and_get(self, tmp_path):
+        """Test that stored outputs are returned on the next lookup."""
+        cache = ArtifactCache(tmp_path / "cache")
+
+        assert not cache.contains("abc")
+        assert cache.get("abc") is None
+        cache.put("abc", {"scene_result": [1, 2, 3]})
+
+        assert cache.contains("abc")
+        assert cache.get("abc") == {"scene_result": [1, 2, 3]}
+        assert cache.get_stats()["hits"] == 1
+
+    def test_referenced_files_restored(self, tmp_path):
+        """Test that files outputs point to are copied back on a hit."""
+        cache = ArtifactCache(tmp_path / "cache")
+        wav = tmp_path / "temp" / "lecture_audio.wav"
+        wav.parent.mkdir()
+        wav.write_bytes(b"RIFF original")
+        frame = tmp_path / "temp" / "scene_001.jpg"
+        frame.write_bytes(b"jpeg")
+        frame_info = FrameInfo(
+            frame_path=frame,
+            timestamp=1.0,
+            scene_number=1,
+            width=640,
+            height=360,
+            size_kb=1.0,
+            format="jpg",
+        )
+        cache.put("abc", {"audio_info": make_audio_info(wav), "frames": [frame_info]})
+
+        # Another video with the same name overwrote the temp file
+        wav.write_bytes(b"RIFF other video")
+        frame.unlink()
+
+        outputs = cache.get("abc")
+
+        assert outputs["audio_info"].file_path == wav
+        assert wav.read_bytes() == b"RIFF original"
+        assert frame.read_bytes() == b"jpeg"
+
+    def test_in_memory_audio_source_not_copied(self, tmp_path):
+        """Test that the source video behind in-memory audio is left alone."""
+        cache = ArtifactCache(tmp_path / "cache")
+        video = tmp_path / "lecture.mp4"
+        video.write_bytes(b"original video")
+        audio_info = make_audio_info(video).model_copy(
+            update={"samples": np.zeros(16000, dtype=np.float32)}
+        )
+        cache.put("abc", {"audio_info": audio_info})
+
+        video.write_bytes(b"edited video")
+        outputs = cache.get("abc")
+
+        assert outputs["audio_info"].file_path == video
+        assert outputs["audio_info"].samples is None  # PCM is not stored
+        assert video.read_bytes() == b"edited video"
+        assert [path.name for path in cache.cache_dir.rglob("file*")] == []
+
+    def test_listed_files_restored(self, tmp_path):
+        """Test that files listed by a window's outputs are restored."""
+        cache = ArtifactCache(tmp_path / "cache")
+        chunk = tmp_path / "lecture_audio_001.wav"
+        chunk.write_bytes(b"chunk")
+        window = WindowOutputs(index=0, start_time=0.0, end_time=600.0, files=[chunk])
+        cache.put("abc", {"window_1": window})
+
+        chunk.unlink()
+        outputs = cache.get("abc")
+
+        assert outputs["window_1"].files == [chunk]
+        assert chunk.read_bytes() == b"chunk"
+
+    def test_lru_eviction(self, tmp_path):
+        """Test that the least recently used entry is evicted first."""
+        payload = b"x" * 400 * 1024
+        cache = ArtifactCache(tmp_path / "cache", max_size_mb=1)
+
+        cache.put("a", payload)
+        time.sleep(0.01)
+        cache.put("b", payload)
+        time.sleep(0.01)
+        cache.get("a")  # a is now most recently used
+        time.sleep(0.01)
+        cache.put("c", payload)  # evicts b
+
+        assert cache.contains("a")
+        assert not cache.contains("b")
+        assert cache.contains("c")
+        assert cache.get_stats()["evictions"] == 1
+
+    def test_unpicklable_outputs_not_stored(self, tmp_path):
+        """Test that a failed store leaves no entry behind."""
+        cache = ArtifactCache(tmp_path / "cache")
+
+        cache.put("abc", {"model": lambda: None})
+
+        assert not cache.contains("abc")
+        assert not list((tmp_path / "cache").iterdir())
+
+    def test_incomplete_entry_discarded(self, tmp_path):
+        """Test that an entry missing a stored file counts as a miss."""
+        cache = ArtifactCache(tmp_path / "cache")
+        wav = tmp_path / "audio.wav"
+        wav.write_bytes(b"RIFF")
+        cache.put("abc", {"audio_info": make_audio_info(wav)})
+        for stored in (tmp_path / "cache").glob("*/file0*"):
+            stored.unlink()
+
+        assert cache.get("abc") is None
+        assert not cache.contains("abc")
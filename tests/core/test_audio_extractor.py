@@ -1,13 +1,16 @@
 """Tests for audio extractor functionality."""
 
+import io
 import tempfile
+import wave
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import ffmpeg
+import numpy as np
 import pytest
 
-from deep_brief.core.audio_extractor import AudioExtractor, AudioInfo
+from deep_brief.core.audio_extractor import AudioExtractor, AudioInfo, decode_pcm
 from deep_brief.core.exceptions import AudioProcessingError, ErrorCode, FFmpegError
 from deep_brief.core.video_processor import VideoInfo
 from deep_brief.utils.config import AudioConfig, DeepBriefConfig, ProcessingConfig
@@ -336,6 +339,180 @@ class TestAudioSegmentExtraction:
                 duration=50.0,  # 150s total, but video is only 120s
             )
 
+    @patch("ffmpeg.run")
+    def test_decode_pcm_seeks_to_window(self, mock_run, tmp_path):
+        """Test that only the requested window is decoded."""
+        samples = np.linspace(-0.5, 0.5, 16000 * 2, dtype="<f4")
+        mock_run.return_value = (samples.tobytes(), b"")
+
+        result = decode_pcm(tmp_path / "video.mp4", start_time=60.0, duration=2.0)
+
+        np.testing.assert_array_equal(result, samples)
+        args = mock_run.call_args[0][0].get_args()
+        assert args[args.index("-ss") + 1] == "60.0"
+        assert args[args.index("-t") + 1] == "2.0"
+        assert args.index("-ss") < args.index("-i")  # Input seeking
+
+    @patch("ffmpeg.run")
+    def test_decode_pcm_failure(self, mock_run, tmp_path):
+        """Test that ffmpeg errors are converted."""
+        mock_run.side_effect = ffmpeg.Error("ffmpeg", b"", b"Invalid data")
+
+        with pytest.raises(FFmpegError):
+            decode_pcm(tmp_path / "broken.mp4", start_time=0.0, duration=1.0)
+
+
+class TestInMemoryExtraction:
+    """Test decoding audio straight into memory for Whisper."""
+
+    @pytest.fixture
+    def in_memory_extractor(self, mock_config):
+        mock_config.audio.in_memory = True
+        return AudioExtractor(config=mock_config)
+
+    @pytest.fixture
+    def samples(self):
+        return np.linspace(-0.5, 0.5, 32000, dtype=np.float32)
+
+    @patch("ffmpeg.run")
+    @patch("ffmpeg.probe")
+    def test_samples_without_wav(
+        self,
+        mock_probe,
+        mock_run,
+        in_memory_extractor,
+        mock_video_info,
+        mock_probe_data,
+        samples,
+    ):
+        """Test that PCM is piped into AudioInfo and no WAV is written."""
+        mock_probe.return_value = mock_probe_data
+        mock_run.return_value = (samples.astype("<f4").tobytes(), b"")
+
+        audio_info = in_memory_extractor.extract_audio(mock_video_info)
+
+        args = mock_run.call_args[0][0].get_args()
+        assert args[args.index("-f") + 1] == "f32le"
+        assert args[args.index("-ar") + 1] == "16000"
+        assert args[args.index("-ac") + 1] == "1"
+        assert args[-1] == "pipe:"
+
+        np.testing.assert_array_equal(audio_info.samples, samples)
+        assert audio_info.samples.flags.writeable
+        assert audio_info.duration == 2.0
+        assert audio_info.sample_rate == 16000
+        assert audio_info.file_path == mock_video_info.file_path
+        assert not list(in_memory_extractor.temp_dir.glob("*.wav"))
+        assert "samples" not in audio_info.model_dump()
+
+    @patch("ffmpeg.run")
+    @patch("ffmpeg.probe")
+    def test_wav_copy_with_output_path(
+        self,
+        mock_probe,
+        mock_run,
+        in_memory_extractor,
+        mock_video_info,
+        mock_probe_data,
+        samples,
+        tmp_path,
+    ):
+        """Test that a WAV copy is saved only when an output path is given."""
+        mock_probe.return_value = mock_probe_data
+        mock_run.return_value = (samples.astype("<f4").tobytes(), b"")
+        output_path = tmp_path / "out" / "audio.wav"
+
+        audio_info = in_memory_extractor.extract_audio(mock_video_info, output_path)
+
+        mock_run.assert_called_once()
+        assert audio_info.file_path == output_path
+        assert audio_info.format == "wav"
+        with wave.open(str(output_path), "rb") as wav_file:
+            assert wav_file.getframerate() == 16000
+            assert wav_file.getnchannels() == 1
+            assert wav_file.getnframes() == len(samples)
+
+    @patch("ffmpeg.run")
+    @patch("ffmpeg.probe")
+    def test_no_samples(
+        self, mock_probe, mock_run, in_memory_extractor, mock_video_info, mock_probe_data
+    ):
+        """Test that empty decoder output is an extraction error."""
+        mock_probe.return_value = mock_probe_data
+        mock_run.return_value = (b"", b"")
+
+        with pytest.raises(AudioProcessingError, match="no samples"):
+            in_memory_extractor.extract_audio(mock_video_info)
+
+    @patch("ffmpeg.run_async")
+    @patch("ffmpeg.probe")
+    def test_progress_while_piping(
+        self,
+        mock_probe,
+        mock_run_async,
+        in_memory_extractor,
+        mock_video_info,
+        mock_probe_data,
+        samples,
+    ):
+        """Test that stdout is collected while progress is read from stderr."""
+        mock_probe.return_value = mock_probe_data
+        process = MagicMock()
+        process.stdout = io.BytesIO(samples.astype("<f4").tobytes())
+        process.stderr = io.BufferedReader(
+            io.BytesIO(b"size=N/A time=00:01:00.00 bitrate=N/A\r")
+        )
+        process.returncode = 0
+        mock_run_async.return_value = process
+        progress_callback = MagicMock()
+
+        audio_info = in_memory_extractor.extract_audio(
+            mock_video_info, progress_callback=progress_callback
+        )
+
+        np.testing.assert_array_equal(audio_info.samples, samples)
+        assert [c[0][0] for c in progress_callback.call_args_list] == [0.5, 1.0]
+
+
+    @pytest.mark.asyncio
+    @patch("ffmpeg.probe")
+    async def test_extract_audio_async(
+        self,
+        mock_probe,
+        in_memory_extractor,
+        mock_video_info,
+        mock_probe_data,
+        samples,
+    ):
+        """Test that the async variant pipes PCM through async ffmpeg."""
+        mock_probe.return_value = mock_probe_data
+        with patch(
+            "deep_brief.core.audio_extractor.async_run_and_collect_output",
+            AsyncMock(return_value=(samples.astype("<f4").tobytes(), "")),
+        ) as run:
+            audio_info = await in_memory_extractor.extract_audio_async(mock_video_info)
+
+        args = run.call_args[0][0].get_args()
+        assert args[-1] == "pipe:"
+        np.testing.assert_array_equal(audio_info.samples, samples)
+        assert audio_info.duration == 2.0
+
+    @pytest.mark.asyncio
+    @patch("ffmpeg.probe")
+    async def test_extract_audio_async_ffmpeg_error(
+        self, mock_probe, in_memory_extractor, mock_video_info, mock_probe_data
+    ):
+        """Test that async ffmpeg failures map to the usual errors."""
+        mock_probe.return_value = mock_probe_data
+        with (
+            patch(
+                "deep_brief.core.audio_extractor.async_run_and_collect_output",
+                AsyncMock(side_effect=ffmpeg.Error("ffmpeg", b"", b"Invalid data")),
+            ),
+            pytest.raises(FFmpegError),
+        ):
+            await in_memory_extractor.extract_audio_async(mock_video_info)
+
 
 class TestAudioInfo:
     """Test AudioInfo extraction and metadata."""
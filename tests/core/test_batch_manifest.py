@@ -0,0 +1,135 @@
+"""Tests for the checkpointed batch job manifest."""
+
+import json
+import pickle
+from types import SimpleNamespace
+
+import pytest
+
+from deep_brief.core.batch_manifest import BatchManifest, VideoStatus
+from deep_brief.core.stage_scheduler import StageResult, StageStatus
+
+
+def make_result(success=True):
+    """Picklable stand-in for a VideoAnalysisResult."""
+    return SimpleNamespace(
+        success=success,
+        error_message=None if success else "Scene detection failed",
+        audio_info=None,
+        frame_infos=None,
+        video_info=None,
+        report=None,
+        stage_results={
+            "audio": StageResult(
+                name="audio", status=StageStatus.COMPLETED, duration=1.5, from_cache=True
+            )
+        },
+    )
+
+
+@pytest.fixture
+def manifest(tmp_path):
+    return BatchManifest.create(
+        tmp_path / "job",
+        [tmp_path / "a.mp4", tmp_path / "b.mp4", tmp_path / "c.mp4"],
+        options={"transcribe": True},
+    )
+
+
+class TestBatchManifest:
+    """Test BatchManifest."""
+
+    def test_create_and_load(self, manifest, tmp_path):
+        """Test that a new job is written and read back."""
+        assert BatchManifest.exists(tmp_path / "job")
+
+        loaded = BatchManifest.load(tmp_path / "job")
+
+        assert loaded.job_id == manifest.job_id
+        assert loaded.options == {"transcribe": True}
+        assert loaded.video_paths[1] == (tmp_path / "b.mp4").resolve()
+        assert loaded.remaining_indices() == [0, 1, 2]
+
+    def test_create_rejects_existing_job(self, manifest, tmp_path):  # noqa: ARG002
+        """Test that a job directory cannot be reused."""
+        with pytest.raises(FileExistsError):
+            BatchManifest.create(tmp_path / "job", [], options={})
+
+    def test_record_result(self, manifest, tmp_path):
+        """Test that finished videos are recorded with their stages."""
+        manifest.record_result(0, make_result())
+        manifest.record_result(1, make_result(success=False))
+
+        loaded = BatchManifest.load(tmp_path / "job")
+        video = loaded.data["videos"][0]
+        assert loaded.get_status(0) == VideoStatus.COMPLETED
+        assert loaded.get_status(1) == VideoStatus.FAILED
+        assert video["stages"]["audio"] == {
+            "status": "completed",
+            "duration": 1.5,
+            "from_cache": True,
+        }
+        assert loaded.load_result(0).success
+        assert loaded.remaining_indices() == [1, 2]
+        assert loaded.remaining_indices(retry_failed=False) == [2]
+        assert loaded.get_summary()["completed"] == 1
+
+    def test_audio_artifact_only_for_extracted_audio(self, manifest, tmp_path):
+        """Test that audio pointing at the source video is not an artifact."""
+        video_info = SimpleNamespace(file_path=tmp_path / "a.mp4")
+        extracted = make_result()
+        extracted.video_info = video_info
+        extracted.audio_info = SimpleNamespace(file_path=tmp_path / "a_audio.wav")
+        in_memory = make_result()
+        in_memory.video_info = video_info
+        in_memory.audio_info = SimpleNamespace(file_path=video_info.file_path)
+
+        manifest.record_result(0, extracted)
+        manifest.record_result(1, in_memory)
+
+        videos = manifest.data["videos"]
+        assert videos[0]["artifacts"]["audio"] == str(tmp_path / "a_audio.wav")
+        assert "audio" not in videos[1]["artifacts"]
+
+    def test_stages_recorded_as_they_finish(self, manifest, tmp_path):
+        """Test that a picklable recorder writes each finished stage."""
+        recorder = pickle.loads(pickle.dumps(manifest.stage_recorder(1)))
+
+        recorder(StageResult(name="audio", status=StageStatus.COMPLETED, duration=2.0))
+        recorder(StageResult(name="scenes", status=StageStatus.FAILED))
+
+        loaded = BatchManifest.load(tmp_path / "job")
+        assert loaded.get_stages(1)["audio"] == {
+            "status": "completed",
+            "duration": 2.0,
+            "from_cache": False,
+        }
+        assert loaded.get_stages(1)["scenes"]["status"] == "failed"
+        assert loaded.get_status(1) == VideoStatus.PENDING
+
+        loaded.record_result(1, make_result())
+
+        assert list(loaded.get_stages(1)) == ["audio"]
+        assert loaded.get_stages(1)["audio"]["from_cache"]
+
+    def test_missing_result_loads_as_none(self, manifest):
+        """Test that a lost result file is reported as missing."""
+        manifest.record_result(0, make_result())
+        (manifest.job_dir / "results" / "00000.pkl").unlink()
+
+        assert manifest.load_result(0) is None
+
+    def test_load_errors(self, tmp_path):
+        """Test loading missing, corrupt and unknown-format manifests."""
+        with pytest.raises(FileNotFoundError):
+            BatchManifest.load(tmp_path / "missing")
+
+        job_dir = tmp_path / "job"
+        job_dir.mkdir()
+        (job_dir / BatchManifest.FILE_NAME).write_text("{not json")
+        with pytest.raises(ValueError, match="Corrupt"):
+            BatchManifest.load(job_dir)
+
+        (job_dir / BatchManifest.FILE_NAME).write_text(json.dumps({"format": 99}))
+        with pytest.raises(ValueError, match="format"):
+            BatchManifest.load(job_dir)
@@ -0,0 +1,106 @@
+"""Tests for cooperative cancellation."""
+
+import threading
+
+import pytest
+
+from deep_brief.core.cancellation import (
+    CancellationToken,
+    cancellation_scope,
+    get_current_token,
+    raise_if_cancelled,
+)
+from deep_brief.core.exceptions import ErrorCode, OperationCancelledError
+from deep_brief.core.progress_tracker import OperationStatus, ProgressTracker
+
+
+class TestCancellationToken:
+    """Test CancellationToken."""
+
+    def test_callbacks_run_once_on_cancel(self):
+        """Test that registered callbacks run once and are dropped after the block."""
+        token = CancellationToken()
+        calls = []
+
+        with token.on_cancel(lambda: calls.append("inside")):
+            token.cancel("stop")
+            token.cancel("again")
+        with token.on_cancel(lambda: calls.append("late")):
+            pass
+
+        # Registering on a cancelled token runs the callback immediately
+        assert calls == ["inside", "late"]
+        assert token.reason == "stop"
+
+    def test_callback_not_run_after_block(self):
+        """Test that a callback whose block has ended is not run."""
+        token = CancellationToken()
+        calls = []
+
+        with token.on_cancel(lambda: calls.append(True)):
+            pass
+        token.cancel()
+
+        assert calls == []
+
+    def test_raise_if_cancelled(self):
+        """Test the error raised for a cancelled token."""
+        token = CancellationToken()
+        token.raise_if_cancelled()
+
+        token.cancel("user request")
+        with pytest.raises(OperationCancelledError) as exc_info:
+            token.raise_if_cancelled("frame extraction")
+
+        assert exc_info.value.error_code == ErrorCode.OPERATION_CANCELLED
+        assert exc_info.value.message == "user request"
+        assert exc_info.value.details == {"operation": "frame extraction"}
+
+    def test_scope_sets_current_token(self):
+        """Test that the current token is scoped and not shared with new threads."""
+        token = CancellationToken()
+        token.cancel()
+        seen_in_thread = []
+
+        raise_if_cancelled()  # No token in scope
+        with cancellation_scope(token):
+            assert get_current_token() is token
+            with pytest.raises(OperationCancelledError):
+                raise_if_cancelled()
+
+            thread = threading.Thread(
+                target=lambda: seen_in_thread.append(get_current_token())
+            )
+            thread.start()
+            thread.join()
+
+        assert get_current_token() is None
+        assert seen_in_thread == [None]
+
+
+class TestProgressTrackerCancellation:
+    """Test cancelling operations through the progress tracker."""
+
+    def test_cancel_operation_cancels_token(self):
+        """Test that cancel_operation cancels the operation's token."""
+        tracker = ProgressTracker()
+        token = CancellationToken()
+        tracker.start_operation("job", "Analyzing talk.mp4", cancel_token=token)
+
+        tracker.cancel_operation("job")
+
+        assert token.cancelled
+        assert token.reason == "Analyzing talk.mp4 cancelled"
+        assert tracker.get_operation_status("job").status == OperationStatus.CANCELLED
+
+    def test_finished_operation_releases_token(self):
+        """Test that completed operations no longer hold their token."""
+        tracker = ProgressTracker()
+        token = CancellationToken()
+        tracker.start_operation("job", "Job", cancel_token=token)
+
+        tracker.complete_operation("job")
+        tracker.cancel_operation("job")
+
+        assert not token.cancelled
+        assert tracker.cancel_tokens == {}
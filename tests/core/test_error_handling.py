@@ -1,8 +1,10 @@
 """Tests for comprehensive error handling system."""
 
+import pickle
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
+import ffmpeg
 import pytest
 
 from deep_brief.core.exceptions import (
@@ -120,6 +122,22 @@ class TestCustomExceptions:
         assert error.details["timestamp"] == 15.5
         assert error.details["scene_number"] == 2
 
+    def test_errors_survive_pickling(self):
+        """Test that errors can be sent back from worker processes."""
+        error = FileValidationError(
+            message="Corrupted video",
+            file_path="/test/video.mp4",
+            cause=ffmpeg.Error("ffprobe", b"", b"moov atom not found"),
+        )
+
+        restored = pickle.loads(pickle.dumps(error))
+
+        assert isinstance(restored, FileValidationError)
+        assert restored.message == "Corrupted video"
+        assert restored.error_code == ErrorCode.FILE_CORRUPTED
+        assert restored.file_path == Path("/test/video.mp4")
+        assert "ffprobe error" in str(restored.cause)
+
 
 class TestErrorHandleUtilities:
     """Test error handling utility functions."""
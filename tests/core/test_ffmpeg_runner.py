@@ -0,0 +1,186 @@
+"""Tests for running ffmpeg on the event loop."""
+
+import asyncio
+import os
+import subprocess
+import sys
+import threading
+import time
+from unittest.mock import patch
+
+import ffmpeg
+import pytest
+
+from deep_brief.core.cancellation import CancellationToken, cancellation_scope
+from deep_brief.core.exceptions import OperationCancelledError
+from deep_brief.core.ffmpeg_runner import (
+    async_run_and_collect_log,
+    async_run_and_collect_output,
+    run_and_collect_log,
+    run_and_collect_output,
+)
+
+# Stand-in for ffmpeg: progress on stderr (carriage-return separated), data
+# on stdout, then an exit code
+FAKE_FFMPEG = """
+import sys, time
+for t in ("00:00:02.50", "00:00:05.00"):
+    sys.stderr.write(f"frame=1 time={t} bitrate=1\\r")
+    sys.stderr.flush()
+sys.stderr.write("[scdet] lavfi.scd.time: 4.2\\n")
+sys.stdout.buffer.write(b"pcm" * 100000)
+sys.exit(int(sys.argv[1]))
+"""
+
+
+def fake_ffmpeg(*args):
+    """Patch ffmpeg.compile to run a Python script instead."""
+    return patch(
+        "deep_brief.core.ffmpeg_runner.ffmpeg.compile",
+        return_value=[sys.executable, "-c", *args],
+    )
+
+
+class TestAsyncFFmpegRunner:
+    """Test async_run_and_collect_output and async_run_and_collect_log."""
+
+    @pytest.mark.asyncio
+    async def test_output_log_and_progress(self):
+        """Test that stdout, the log and progress are all collected."""
+        progress = []
+
+        with fake_ffmpeg(FAKE_FFMPEG, "0"):
+            stdout, log = await async_run_and_collect_output(
+                object(), 10.0, 30, progress.append
+            )
+
+        assert stdout == b"pcm" * 100000
+        assert "lavfi.scd.time: 4.2" in log
+        assert progress == [0.25, 0.5, 1.0]
+
+    @pytest.mark.asyncio
+    async def test_error_exit_raises(self):
+        """Test that a failing run raises ffmpeg.Error with the log."""
+        with fake_ffmpeg(FAKE_FFMPEG, "1"), pytest.raises(ffmpeg.Error) as exc_info:
+            await async_run_and_collect_log(object(), 10.0, 30, None)
+
+        assert b"lavfi.scd.time" in exc_info.value.stderr
+
+    @pytest.mark.asyncio
+    async def test_timeout_kills_process(self):
+        """Test that a run past its timeout is killed."""
+        with (
+            fake_ffmpeg("import time; time.sleep(30)"),
+            pytest.raises(subprocess.TimeoutExpired),
+        ):
+            await async_run_and_collect_log(object(), 10.0, 0.2, None)
+
+    @pytest.mark.asyncio
+    async def test_cancel_kills_process(self, tmp_path):
+        """Test that cancelling the awaiting task kills ffmpeg."""
+        pid_file = tmp_path / "pid"
+        script = (
+            f"import os, time; open({str(pid_file)!r}, 'w').write(str(os.getpid())); "
+            "time.sleep(30)"
+        )
+        with fake_ffmpeg(script):
+            task = asyncio.ensure_future(
+                async_run_and_collect_log(object(), 10.0, 60, None)
+            )
+            while not pid_file.exists() or not pid_file.read_text():
+                await asyncio.sleep(0.01)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        pid = int(pid_file.read_text())
+        with pytest.raises(ProcessLookupError):
+            os.kill(pid, 0)
+
+
+class TestProgressRunner:
+    """Test run_and_collect_log and run_and_collect_output with progress."""
+
+    @pytest.mark.parametrize("collect", [run_and_collect_log, run_and_collect_output])
+    def test_timeout_kills_process(self, tmp_path, collect):
+        """Test that a run reporting progress is killed at its timeout."""
+        pid_file = tmp_path / "pid"
+
+        with patch(
+            "ffmpeg._run.compile",
+            return_value=[sys.executable, "-c", write_pid_script(pid_file)],
+        ):
+            start = time.monotonic()
+            with pytest.raises(subprocess.TimeoutExpired):
+                collect(object(), 10.0, 0.5, lambda _: None)
+
+        assert time.monotonic() - start < 10
+        pid = int(pid_file.read_text())
+        with pytest.raises(ProcessLookupError):
+            os.kill(pid, 0)
+
+
+def write_pid_script(pid_file):
+    """Script that records its pid and then hangs like a long ffmpeg run."""
+    return (
+        f"import os, time; open({str(pid_file)!r}, 'w').write(str(os.getpid())); "
+        "time.sleep(30)"
+    )
+
+
+def cancel_when_started(token, pid_file):
+    """Cancel the token from another thread once the process has started."""
+
+    def wait_and_cancel():
+        while not pid_file.exists() or not pid_file.read_text():
+            time.sleep(0.01)
+        token.cancel("test")
+
+    thread = threading.Thread(target=wait_and_cancel)
+    thread.start()
+    return thread
+
+
+class TestCancellationToken:
+    """Test that cancelling the current token kills ffmpeg."""
+
+    @pytest.mark.parametrize("with_progress", [False, True])
+    def test_token_kills_process(self, tmp_path, with_progress):
+        """Test that both the blocking and the progress paths are killed."""
+        pid_file = tmp_path / "pid"
+        token = CancellationToken()
+        progress_callback = (lambda _: None) if with_progress else None
+
+        with (
+            patch(
+                "ffmpeg._run.compile",
+                return_value=[sys.executable, "-c", write_pid_script(pid_file)],
+            ),
+            cancellation_scope(token),
+        ):
+            canceller = cancel_when_started(token, pid_file)
+            start = time.monotonic()
+            with pytest.raises(OperationCancelledError):
+                run_and_collect_log(object(), 10.0, 60, progress_callback)
+            canceller.join()
+
+        assert time.monotonic() - start < 10
+        pid = int(pid_file.read_text())
+        with pytest.raises(ProcessLookupError):
+            os.kill(pid, 0)
+
+    @pytest.mark.asyncio
+    async def test_token_kills_async_process(self, tmp_path):
+        """Test that cancelling the token kills a process started on the loop."""
+        pid_file = tmp_path / "pid"
+        token = CancellationToken()
+
+        with fake_ffmpeg(write_pid_script(pid_file)), cancellation_scope(token):
+            canceller = cancel_when_started(token, pid_file)
+            with pytest.raises(OperationCancelledError):
+                await async_run_and_collect_log(object(), 10.0, 60, None)
+            canceller.join()
+
+        pid = int(pid_file.read_text())
+        with pytest.raises(ProcessLookupError):
+            os.kill(pid, 0)
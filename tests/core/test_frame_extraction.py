@@ -1,5 +1,6 @@
 """Tests for frame extraction functionality."""
 
+from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import ffmpeg
@@ -238,6 +239,153 @@ class TestFrameExtraction:
         assert result[1].scene_number == 3
 
 
+class TestBatchedFrameExtraction:
+    """Test single-pass extraction of all scene frames."""
+
+    @staticmethod
+    def _fake_ffmpeg_run(written_frames):
+        """Create an ffmpeg.run replacement that writes the first N outputs."""
+
+        def run(stream, **kwargs):  # noqa: ARG001
+            output_pattern = next(
+                arg for arg in stream.get_args() if arg.endswith(".jpg")
+            )
+            for i in range(1, written_frames + 1):
+                Path(output_pattern % i).write_bytes(b"mock jpeg content")
+            return None
+
+        return run
+
+    @patch("deep_brief.core.video_processor.VideoProcessor._check_ffmpeg_available")
+    @patch("ffmpeg.run")
+    def test_single_ffmpeg_invocation(
+        self, mock_run, mock_ffmpeg_available, video_processor, mock_video_info, tmp_path
+    ):
+        """Test that all frames come from one ffmpeg run with one select filter."""
+        mock_ffmpeg_available.return_value = True
+        mock_run.side_effect = self._fake_ffmpeg_run(3)
+        progress_callback = MagicMock()
+
+        scenes = [(0.0, 30.0, 1), (30.0, 60.0, 2), (60.0, 90.0, 3)]
+        result = video_processor.extract_frames_from_scenes(
+            mock_video_info, scenes, tmp_path, progress_callback, batched=True
+        )
+
+        mock_run.assert_called_once()
+        mock_ffmpeg_available.assert_called_once()
+
+        args = mock_run.call_args[0][0].get_args()
+        filter_graph = args[args.index("-filter_complex") + 1]
+        assert "eq(n\\,450)+eq(n\\,1350)+eq(n\\,2250)" in filter_graph
+
+        assert [frame.scene_number for frame in result] == [1, 2, 3]
+        assert [frame.timestamp for frame in result] == [15.0, 45.0, 75.0]
+        for frame in result:
+            assert frame.frame_path.exists()
+            assert frame.frame_path.name.startswith(f"scene_{frame.scene_number:03d}")
+
+        # No intermediate batch files are left behind
+        assert not list(tmp_path.glob(".batch_*"))
+        assert progress_callback.call_args_list[-1] == ((1.0,),)
+
+    @patch("deep_brief.core.video_processor.VideoProcessor._check_ffmpeg_available")
+    @patch("ffmpeg.run")
+    def test_missing_frame_reported_per_scene(
+        self, mock_run, mock_ffmpeg_available, video_processor, mock_video_info, tmp_path
+    ):
+        """Test that a frame missing from the output only drops its scene."""
+        mock_ffmpeg_available.return_value = True
+        mock_run.side_effect = self._fake_ffmpeg_run(2)
+
+        scenes = [(0.0, 30.0, 1), (30.0, 60.0, 2), (60.0, 90.0, 3)]
+        result = video_processor.extract_frames_from_scenes(
+            mock_video_info, scenes, tmp_path, batched=True
+        )
+
+        assert [frame.scene_number for frame in result] == [1, 2]
+
+    @patch("deep_brief.core.video_processor.VideoProcessor._check_ffmpeg_available")
+    @patch("ffmpeg.run")
+    def test_invalid_scene_skipped(
+        self, mock_run, mock_ffmpeg_available, video_processor, mock_video_info, tmp_path
+    ):
+        """Test that invalid scene times are skipped without failing the batch."""
+        mock_ffmpeg_available.return_value = True
+        mock_run.side_effect = self._fake_ffmpeg_run(1)
+
+        scenes = [(20.0, 10.0, 1), (30.0, 60.0, 2)]
+        result = video_processor.extract_frames_from_scenes(
+            mock_video_info, scenes, tmp_path, batched=True
+        )
+
+        assert len(result) == 1
+        assert result[0].scene_number == 2
+
+    @patch("deep_brief.core.video_processor.VideoProcessor.extract_frame_from_scene")
+    @patch("deep_brief.core.video_processor.VideoProcessor._check_ffmpeg_available")
+    @patch("ffmpeg.run")
+    def test_falls_back_to_per_scene_on_ffmpeg_error(
+        self,
+        mock_run,
+        mock_ffmpeg_available,
+        mock_extract_frame,
+        video_processor,
+        mock_video_info,
+        tmp_path,
+    ):
+        """Test fallback to per-scene extraction when the batch run fails."""
+        mock_ffmpeg_available.return_value = True
+        mock_run.side_effect = ffmpeg.Error("ffmpeg", b"", b"decode error")
+        mock_extract_frame.return_value = FrameInfo(
+            frame_path=tmp_path / "frame.jpg",
+            timestamp=15.0,
+            scene_number=1,
+            width=1920,
+            height=1080,
+            size_kb=100.0,
+        )
+
+        scenes = [(0.0, 30.0, 1), (30.0, 60.0, 2)]
+        result = video_processor.extract_frames_from_scenes(
+            mock_video_info, scenes, tmp_path, batched=True
+        )
+
+        assert len(result) == 2
+        assert mock_extract_frame.call_count == 2
+
+
+    @pytest.mark.asyncio
+    @patch("deep_brief.core.video_processor.VideoProcessor._check_ffmpeg_available")
+    async def test_async_batched_extraction(
+        self, mock_ffmpeg_available, video_processor, mock_video_info, tmp_path
+    ):
+        """Test that the async variant runs the same single pass through asyncio."""
+        mock_ffmpeg_available.return_value = True
+        write_frames = self._fake_ffmpeg_run(2)
+
+        async def run(stream, *args):  # noqa: ARG001
+            write_frames(stream)
+            return ""
+
+        scenes = [(0.0, 30.0, 1), (30.0, 60.0, 2)]
+        with (
+            patch(
+                "deep_brief.core.video_processor.async_run_and_collect_log",
+                side_effect=run,
+            ) as mock_run,
+            patch("ffmpeg.run") as mock_sync_run,
+        ):
+            result = await video_processor.extract_frames_from_scenes_async(
+                mock_video_info, scenes, tmp_path, batched=True
+            )
+
+        assert mock_run.call_count == 1
+        mock_sync_run.assert_not_called()
+        assert [frame.scene_number for frame in result] == [1, 2]
+        assert all(frame.frame_path.exists() for frame in result)
+        assert not list(tmp_path.glob(".batch_*"))
+
+
 class TestQualityConversion:
     """Test quality value conversion."""
 
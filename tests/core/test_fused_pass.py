@@ -0,0 +1,327 @@
+"""Tests for the combined audio extraction and scene detection pass."""
+
+import io
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import ffmpeg
+import numpy as np
+import pytest
+
+from deep_brief.core.audio_extractor import AudioExtractor, AudioInfo
+from deep_brief.core.exceptions import (
+    AudioProcessingError,
+    ErrorCode,
+    FFmpegError,
+)
+from deep_brief.core.fused_pass import extract_audio_and_detect_scenes
+from deep_brief.core.pipeline_coordinator import PipelineCoordinator
+from deep_brief.core.scene_detector import SceneDetectionResult, SceneDetector
+from deep_brief.core.video_processor import VideoInfo
+from deep_brief.utils.config import (
+    AudioConfig,
+    DeepBriefConfig,
+    ProcessingConfig,
+    SceneDetectionConfig,
+)
+
+SCDET_LOG = (
+    "[scdet @ 0x55d0] lavfi.scd.score: 45.120, lavfi.scd.time: 30.5\n"
+    "size=N/A time=00:01:00.00 bitrate=N/A speed=20x\n"
+    "[scdet @ 0x55d0] lavfi.scd.score: 38.700, lavfi.scd.time: 75.2\n"
+)
+
+
+@pytest.fixture
+def config(tmp_path):
+    """Create a configuration using threshold scene detection."""
+    return DeepBriefConfig(
+        processing=ProcessingConfig(temp_dir=tmp_path / "temp"),
+        audio=AudioConfig(sample_rate=16000, channels=1, normalize_audio=True),
+        scene_detection=SceneDetectionConfig(
+            method="threshold", threshold=0.4, min_scene_duration=2.0
+        ),
+    )
+
+
+@pytest.fixture
+def video_info(tmp_path):
+    """Create VideoInfo for a fake video with audio."""
+    video_file = tmp_path / "lecture.mp4"
+    video_file.write_text("fake video content")
+    return VideoInfo(
+        file_path=video_file,
+        duration=120.0,
+        width=1920,
+        height=1080,
+        fps=30.0,
+        format="mp4",
+        size_mb=50.0,
+        codec="h264",
+    )
+
+
+@pytest.fixture
+def probe_data():
+    """Probe data for a video with one audio stream."""
+    return {
+        "streams": [
+            {"codec_type": "video", "codec_name": "h264"},
+            {
+                "codec_type": "audio",
+                "codec_name": "aac",
+                "sample_rate": "44100",
+                "channels": 2,
+            },
+        ],
+        "format": {"duration": "120.0"},
+    }
+
+
+def fake_audio_info(output_path: Path) -> AudioInfo:
+    """AudioInfo matching the configured WAV output."""
+    return AudioInfo(
+        file_path=output_path,
+        duration=120.0,
+        sample_rate=16000,
+        channels=1,
+        size_mb=3.7,
+        format="wav",
+    )
+
+
+def fake_ffmpeg_run(stream, **kwargs):  # noqa: ARG001
+    """Write the WAV output and return the scdet log."""
+    wav_path = next(arg for arg in stream.get_args() if arg.endswith(".wav"))
+    Path(wav_path).write_bytes(b"RIFF fake wav")
+    return b"", SCDET_LOG.encode()
+
+
+class TestFusedPass:
+    """Test extract_audio_and_detect_scenes."""
+
+    @patch.object(AudioExtractor, "_get_audio_info", side_effect=fake_audio_info)
+    @patch("ffmpeg.run", side_effect=fake_ffmpeg_run)
+    @patch("ffmpeg.probe")
+    def test_single_ffmpeg_run(
+        self, mock_probe, mock_run, mock_audio_info, config, video_info, probe_data
+    ):
+        """Test that one ffmpeg run produces both the WAV and the scenes."""
+        mock_probe.return_value = probe_data
+
+        audio_info, scene_result = extract_audio_and_detect_scenes(
+            video_info, AudioExtractor(config), SceneDetector(config)
+        )
+
+        mock_run.assert_called_once()
+        args = mock_run.call_args[0][0].get_args()
+        assert args.count("-i") == 1
+        filter_graph = args[args.index("-filter_complex") + 1]
+        assert "loudnorm" in filter_graph
+        assert "scdet=threshold=0.4" in filter_graph
+        assert args[args.index("-ar") + 1] == "16000"
+        assert "null" in args
+
+        assert audio_info.sample_rate == 16000
+        assert audio_info.file_path.exists()
+        assert scene_result.detection_method == "threshold"
+        assert [scene.start_time for scene in scene_result.scenes] == [0.0, 30.5, 75.2]
+
+    @patch("ffmpeg.run")
+    @patch("ffmpeg.probe")
+    def test_no_audio_stream(self, mock_probe, mock_run, config, video_info):
+        """Test that videos without audio are rejected before decoding."""
+        mock_probe.return_value = {
+            "streams": [{"codec_type": "video", "codec_name": "h264"}],
+            "format": {"duration": "120.0"},
+        }
+
+        with pytest.raises(AudioProcessingError) as exc_info:
+            extract_audio_and_detect_scenes(
+                video_info, AudioExtractor(config), SceneDetector(config)
+            )
+
+        assert exc_info.value.error_code == ErrorCode.NO_AUDIO_STREAM
+        mock_run.assert_not_called()
+
+    @patch("ffmpeg.run")
+    @patch("ffmpeg.probe")
+    def test_ffmpeg_error(self, mock_probe, mock_run, config, video_info, probe_data):
+        """Test that ffmpeg failures become FFmpegError."""
+        mock_probe.return_value = probe_data
+        mock_run.side_effect = ffmpeg.Error("ffmpeg", b"", b"decode failed")
+
+        with pytest.raises(FFmpegError):
+            extract_audio_and_detect_scenes(
+                video_info, AudioExtractor(config), SceneDetector(config)
+            )
+
+    @patch.object(AudioExtractor, "_get_audio_info", side_effect=fake_audio_info)
+    @patch("ffmpeg.run_async")
+    @patch("ffmpeg.probe")
+    def test_progress_reported_from_shared_log(
+        self, mock_probe, mock_run_async, mock_audio_info, config, video_info, probe_data
+    ):
+        """Test progress parsing while still collecting the scdet log."""
+        mock_probe.return_value = probe_data
+
+        def run_async(stream, **kwargs):  # noqa: ARG001
+            fake_ffmpeg_run(stream)
+            process = MagicMock()
+            process.stderr = io.BufferedReader(io.BytesIO(SCDET_LOG.encode()))
+            process.returncode = 0
+            return process
+
+        mock_run_async.side_effect = run_async
+        progress_callback = MagicMock()
+
+        _, scene_result = extract_audio_and_detect_scenes(
+            video_info,
+            AudioExtractor(config),
+            SceneDetector(config),
+            progress_callback=progress_callback,
+        )
+
+        progress_values = [c[0][0] for c in progress_callback.call_args_list]
+        assert progress_values == [0.5, 1.0]
+        assert scene_result.total_scenes == 3
+
+
+    @patch("ffmpeg.run")
+    @patch("ffmpeg.probe")
+    def test_in_memory_audio(self, mock_probe, mock_run, config, video_info, probe_data):
+        """Test that the combined pass can pipe PCM instead of writing a WAV."""
+        config.audio.in_memory = True
+        mock_probe.return_value = probe_data
+        samples = np.zeros(16000 * 3, dtype="<f4")
+        mock_run.return_value = (samples.tobytes(), SCDET_LOG.encode())
+        audio_extractor = AudioExtractor(config)
+
+        audio_info, scene_result = extract_audio_and_detect_scenes(
+            video_info, audio_extractor, SceneDetector(config)
+        )
+
+        args = mock_run.call_args[0][0].get_args()
+        assert "pipe:" in args
+        assert args[args.index("-f") + 1] == "f32le"
+        assert not any(arg.endswith(".wav") for arg in args)
+        assert audio_info.duration == 3.0
+        assert len(audio_info.samples) == len(samples)
+        assert not list(audio_extractor.temp_dir.glob("*.wav"))
+        assert scene_result.total_scenes == 3
+
+
+class TestCoordinatorSinglePass:
+    """Test that the coordinator uses the combined pass automatically."""
+
+    @pytest.fixture
+    def scene_result(self):
+        return SceneDetectionResult(
+            scenes=[],
+            total_scenes=0,
+            detection_method="threshold",
+            threshold_used=0.4,
+            video_duration=120.0,
+            average_scene_duration=0.0,
+        )
+
+    @patch("deep_brief.core.pipeline_coordinator.extract_audio_and_detect_scenes")
+    @patch.object(SceneDetector, "detect_scenes")
+    @patch.object(AudioExtractor, "extract_audio")
+    @patch("deep_brief.core.video_processor.VideoProcessor.validate_file")
+    def test_combined_pass_used(
+        self,
+        mock_validate,
+        mock_extract_audio,
+        mock_detect_scenes,
+        mock_fused,
+        config,
+        video_info,
+        scene_result,
+    ):
+        """Test that audio + scenes come from one pass when both are requested."""
+        mock_validate.return_value = video_info
+        audio_info = fake_audio_info(Path("audio.wav"))
+        mock_fused.return_value = (audio_info, scene_result)
+
+        result = PipelineCoordinator(config).analyze_video(
+            video_info.file_path, extract_frames=False
+        )
+
+        assert result.success
+        assert result.audio_info == audio_info
+        assert result.scene_result == scene_result
+        mock_fused.assert_called_once()
+        mock_extract_audio.assert_not_called()
+        mock_detect_scenes.assert_not_called()
+
+    @patch("deep_brief.core.pipeline_coordinator.extract_audio_and_detect_scenes")
+    @patch.object(SceneDetector, "detect_scenes")
+    @patch.object(AudioExtractor, "extract_audio")
+    @patch("deep_brief.core.video_processor.VideoProcessor.validate_file")
+    def test_falls_back_to_separate_passes(
+        self,
+        mock_validate,
+        mock_extract_audio,
+        mock_detect_scenes,
+        mock_fused,
+        config,
+        video_info,
+        scene_result,
+    ):
+        """Test separate decoding when the combined pass fails."""
+        mock_validate.return_value = video_info
+        mock_fused.side_effect = FFmpegError(message="graph failed")
+        mock_extract_audio.return_value = fake_audio_info(Path("audio.wav"))
+        mock_detect_scenes.return_value = scene_result
+
+        result = PipelineCoordinator(config).analyze_video(
+            video_info.file_path, extract_frames=False
+        )
+
+        assert result.success
+        assert not result.errors
+        mock_extract_audio.assert_called_once()
+        mock_detect_scenes.assert_called_once()
+
+    @patch("deep_brief.core.pipeline_coordinator.extract_audio_and_detect_scenes")
+    @patch.object(SceneDetector, "detect_scenes")
+    @patch("deep_brief.core.video_processor.VideoProcessor.validate_file")
+    def test_no_audio_still_detects_scenes(
+        self, mock_validate, mock_detect_scenes, mock_fused, config, video_info, scene_result
+    ):
+        """Test that a video without audio still gets its own scene pass."""
+        mock_validate.return_value = video_info
+        mock_fused.side_effect = AudioProcessingError(
+            message="no audio", error_code=ErrorCode.NO_AUDIO_STREAM
+        )
+        mock_detect_scenes.return_value = scene_result
+
+        result = PipelineCoordinator(config).analyze_video(
+            video_info.file_path, extract_frames=False
+        )
+
+        assert result.success
+        assert result.audio_info is None
+        assert not result.errors
+        mock_detect_scenes.assert_called_once()
+
+    @patch.object(AudioExtractor, "_get_audio_info", side_effect=fake_audio_info)
+    @patch("ffmpeg.run", side_effect=fake_ffmpeg_run)
+    @patch("ffmpeg.probe")
+    def test_adaptive_method_scores_in_same_pass(
+        self, mock_probe, mock_run, mock_audio_info, config, video_info, probe_data
+    ):
+        """Test that adaptive detection scores every frame in the combined pass."""
+        config.scene_detection.method = "adaptive"
+        mock_probe.return_value = probe_data
+
+        _, scene_result = extract_audio_and_detect_scenes(
+            video_info, AudioExtractor(config), SceneDetector(config)
+        )
+
+        mock_run.assert_called_once()
+        args = mock_run.call_args[0][0].get_args()
+        assert "scdet=threshold=0" in args[args.index("-filter_complex") + 1]
+        assert scene_result.detection_method == "adaptive"
+        assert scene_result.total_scenes == 3
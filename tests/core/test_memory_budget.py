@@ -0,0 +1,155 @@
+"""Tests for the process-wide memory budget and frame buffer."""
+
+import threading
+import time
+
+from deep_brief.core.memory_budget import FrameBuffer, MemoryBudget
+
+
+class FakeModel:
+    """Owner of a model that records loads and unloads."""
+
+    def __init__(self, budget, key, size_mb, events):
+        self.budget = budget
+        self.key = key
+        self.size_mb = size_mb
+        self.events = events
+        self.model = None
+
+    def load(self):
+        """Load through the budget."""
+        return self.budget.load_model(self.key, self.size_mb, self._load, self.unload)
+
+    def _load(self):
+        self.events.append(("load", self.key))
+        self.model = object()
+        return self.model
+
+    def unload(self):
+        self.events.append(("unload", self.key))
+        self.model = None
+
+
+class TestMemoryBudget:
+    """Test MemoryBudget."""
+
+    def test_idle_models_unloaded_lru_first(self):
+        """Test that loading past the limit unloads the least recently used model."""
+        budget = MemoryBudget(limit_mb=1000)
+        events = []
+        whisper = FakeModel(budget, "whisper", 400, events)
+        caption = FakeModel(budget, "caption", 400, events)
+        ocr = FakeModel(budget, "ocr", 400, events)
+
+        whisper.load()
+        caption.load()
+        budget.touch("whisper")  # caption is now least recently used
+        ocr.load()
+
+        assert events[-2:] == [("unload", "caption"), ("load", "ocr")]
+        assert caption.model is None
+        assert whisper.model is not None
+        stats = budget.get_stats()
+        assert stats["resident_models"] == ["whisper", "ocr"]
+        assert stats["model_mb"] == 800
+        assert stats["unloads"] == 1
+
+    def test_models_in_use_are_kept(self):
+        """Test that a model running inference is not unloaded."""
+        budget = MemoryBudget(limit_mb=1000)
+        events = []
+        whisper = FakeModel(budget, "whisper", 600, events)
+        caption = FakeModel(budget, "caption", 600, events)
+
+        whisper.load()
+        with budget.using("whisper"):
+            caption.load()
+
+        assert ("unload", "whisper") not in events
+        assert budget.get_stats()["model_mb"] == 1200
+
+    def test_model_loads_are_serialized(self):
+        """Test that two threads never load models at the same time."""
+        budget = MemoryBudget()
+        active = []
+        overlap = []
+
+        def slow_load():
+            active.append(1)
+            overlap.append(len(active))
+            time.sleep(0.05)
+            active.pop()
+
+        threads = [
+            threading.Thread(
+                target=budget.load_model, args=(f"m{i}", 100, slow_load, lambda: None)
+            )
+            for i in range(3)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert max(overlap) == 1
+        assert budget.loads == 3
+
+    def test_buffered_frames_unload_idle_models(self):
+        """Test that frames pushing usage over the limit unload idle models."""
+        budget = MemoryBudget(limit_mb=1000)
+        events = []
+        caption = FakeModel(budget, "caption", 900, events)
+        caption.load()
+
+        buffer = FrameBuffer(max_bytes=512 * 1024 * 1024, budget=budget)
+        buffer.put("frame", 200 * 1024 * 1024)
+
+        assert caption.model is None
+        assert budget.get_stats()["frame_mb"] == 200
+
+        buffer.get()
+        assert budget.get_stats()["frame_mb"] == 0
+
+
+class TestFrameBuffer:
+    """Test FrameBuffer."""
+
+    def test_producer_blocks_when_full(self):
+        """Test that put waits until the consumer frees room."""
+        buffer = FrameBuffer(max_bytes=100)
+        buffer.put("a", 60)
+        done = threading.Event()
+
+        def produce():
+            buffer.put("b", 60)
+            done.set()
+
+        producer = threading.Thread(target=produce)
+        producer.start()
+        assert not done.wait(0.1)
+
+        assert buffer.get() == "a"
+        assert done.wait(1.0)
+        producer.join()
+        assert buffer.get() == "b"
+        assert buffer.get_stats()["producer_waits"] == 1
+
+    def test_oversized_frame_admitted_when_empty(self):
+        """Test that a frame larger than the buffer does not deadlock."""
+        buffer = FrameBuffer(max_bytes=10)
+
+        assert buffer.put("big", 50)
+        assert buffer.get() == "big"
+
+    def test_close_releases_blocked_producer(self):
+        """Test that closing wakes a producer, which then stops."""
+        buffer = FrameBuffer(max_bytes=10)
+        buffer.put("a", 10)
+        results = []
+        producer = threading.Thread(target=lambda: results.append(buffer.put("b", 10)))
+        producer.start()
+
+        buffer.close()
+        producer.join(1.0)
+
+        assert results == [False]
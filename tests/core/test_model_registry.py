@@ -0,0 +1,137 @@
+"""Tests for the shared model registry."""
+
+import pytest
+
+from deep_brief.core.memory_budget import MemoryBudget
+from deep_brief.core.model_registry import ModelKey, ModelRegistry
+
+WHISPER = ModelKey("whisper-base", "cpu")
+CAPTION = ModelKey("Salesforce/blip-image-captioning-base", "cpu")
+OCR = ModelKey("easyocr:en", "cpu")
+
+
+class Loader:
+    """Loads fake models and records the loads."""
+
+    def __init__(self):
+        self.loads = []
+
+    def __call__(self, name):
+        def load():
+            self.loads.append(name)
+            return object()
+
+        return load
+
+
+class TestModelRegistry:
+    """Test ModelRegistry."""
+
+    def test_handles_share_one_model(self):
+        """Test that handles with the same key get the same loaded model."""
+        registry = ModelRegistry(budget=MemoryBudget())
+        loader = Loader()
+
+        first = registry.acquire(WHISPER, 500, loader("whisper"))
+        second = registry.acquire(WHISPER, 500, loader("whisper"))
+
+        assert first.get() is second.get()
+        assert loader.loads == ["whisper"]
+        stats = registry.get_stats()
+        assert stats["loads"] == 1
+        assert stats["hits"] == 1
+        assert stats["loaded_models"] == {"whisper-base:cpu:float32": 2}
+
+    def test_dtype_is_part_of_the_key(self):
+        """Test that the same model in another precision is loaded separately."""
+        registry = ModelRegistry(budget=MemoryBudget())
+        loader = Loader()
+
+        full = registry.acquire(CAPTION, 1000, loader("fp32"))
+        half = registry.acquire(
+            ModelKey(CAPTION.name, "cpu", "float16"), 500, loader("fp16")
+        )
+
+        assert full.get() is not half.get()
+        assert loader.loads == ["fp32", "fp16"]
+
+    def test_released_model_reused(self):
+        """Test that a released model stays loaded for the next handle."""
+        registry = ModelRegistry(budget=MemoryBudget())
+        loader = Loader()
+
+        handle = registry.acquire(WHISPER, 500, loader("whisper"))
+        model = handle.get()
+        handle.release()
+        assert registry.get_stats()["idle_models"] == ["whisper-base:cpu:float32"]
+
+        again = registry.acquire(WHISPER, 500, loader("whisper"))
+
+        assert again.get() is model
+        assert loader.loads == ["whisper"]
+        assert registry.get_stats()["idle_models"] == []
+
+    def test_idle_models_unloaded_beyond_limit(self):
+        """Test that the least recently released models unload over the idle limit."""
+        budget = MemoryBudget()
+        registry = ModelRegistry(budget=budget, idle_limit_mb=1000)
+        loader = Loader()
+        handles = [
+            registry.acquire(key, 600, loader(str(key)))
+            for key in (WHISPER, CAPTION, OCR)
+        ]
+        for handle in handles:
+            handle.get()
+
+        handles[0].release()
+        handles[1].release()  # Idle 1200MB > 1000MB: whisper goes
+
+        stats = registry.get_stats()
+        assert stats["idle_models"] == [str(CAPTION)]
+        assert str(WHISPER) not in stats["loaded_models"]
+        assert stats["unloads"] == 1
+        assert str(WHISPER) not in budget.get_stats()["resident_models"]
+
+    def test_budget_pressure_unloads_and_reloads(self):
+        """Test that a model unloaded by the budget is reloaded on next use."""
+        budget = MemoryBudget(limit_mb=1000)
+        registry = ModelRegistry(budget=budget)
+        loader = Loader()
+        unloaded = []
+
+        whisper = registry.acquire(
+            WHISPER, 600, loader("whisper"), lambda: unloaded.append("whisper")
+        )
+        caption = registry.acquire(CAPTION, 600, loader("caption"))
+        whisper.get()
+        caption.get()  # Needs whisper's memory
+
+        assert unloaded == ["whisper"]
+        whisper.get()
+        assert loader.loads == ["whisper", "caption", "whisper"]
+
+    def test_released_models_unload_first(self):
+        """Test that budget pressure takes unreferenced models before held ones."""
+        budget = MemoryBudget(limit_mb=1500)
+        registry = ModelRegistry(budget=budget)
+        loader = Loader()
+        whisper = registry.acquire(WHISPER, 600, loader("whisper"))
+        caption = registry.acquire(CAPTION, 600, loader("caption"))
+        whisper.get()
+        caption.get()
+        caption.release()  # Caption was used last, but nobody holds it
+
+        registry.acquire(OCR, 600, loader("ocr")).get()
+
+        loaded = registry.get_stats()["loaded_models"]
+        assert str(WHISPER) in loaded
+        assert str(CAPTION) not in loaded
+
+    def test_released_handle_cannot_be_used(self):
+        """Test that getting a model through a released handle fails."""
+        registry = ModelRegistry(budget=MemoryBudget())
+        handle = registry.acquire(WHISPER, 500, Loader()("whisper"))
+        handle.release()
+
+        with pytest.raises(RuntimeError, match="released"):
+            handle.get()
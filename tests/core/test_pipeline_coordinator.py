@@ -1,26 +1,57 @@
 """Tests for pipeline coordinator functionality."""
 
+import asyncio
+import json
+import multiprocessing
+import pickle
+import threading
+import time
+from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
+import numpy as np
 import pytest
 
-from deep_brief.core.audio_extractor import AudioInfo
+from deep_brief.analysis.transcriber import (
+    LanguageDetectionResult,
+    Segment,
+    TranscriptionResult,
+)
+from deep_brief.core.audio_extractor import AudioExtractor, AudioInfo
+from deep_brief.core.batch_manifest import BatchManifest, VideoStatus
+from deep_brief.core.cancellation import raise_if_cancelled
+from deep_brief.core.exceptions import AudioProcessingError, ErrorCode
+from deep_brief.core.memory_budget import get_memory_budget
 from deep_brief.core.pipeline_coordinator import (
+    _analyze_in_batch_worker,
+    _init_batch_worker,
     PipelineCoordinator,
     VideoAnalysisResult,
     create_pipeline_coordinator,
 )
-from deep_brief.core.progress_tracker import ProgressTracker
-from deep_brief.core.scene_detector import Scene, SceneDetectionResult
-from deep_brief.core.video_processor import FrameInfo, VideoInfo
+from deep_brief.core.progress_tracker import OperationStatus, ProgressTracker
+from deep_brief.core.scene_detector import Scene, SceneDetectionResult, SceneDetector
+from deep_brief.core.stage_scheduler import (
+    RESOURCE_MODEL_MEMORY,
+    StageGraph,
+    StageStatus,
+)
+from deep_brief.core.video_processor import FrameInfo, VideoInfo, VideoProcessor
+from deep_brief.utils.config import DeepBriefConfig, ProcessingConfig
 
 
 @pytest.fixture
-def mock_config():
-    """Create mock configuration."""
-    config = MagicMock()
-    config.processing.max_video_size_mb = 100
-    return config
+def mock_config(tmp_path):
+    """Create test configuration."""
+    return DeepBriefConfig(
+        processing=ProcessingConfig(
+            max_video_size_mb=100,
+            temp_dir=tmp_path / "temp",
+            result_cache=False,
+            stage_cache=False,
+        )
+    )
 
 
 @pytest.fixture
@@ -254,7 +285,7 @@ class TestPipelineCoordinator:
     @patch("deep_brief.core.pipeline_coordinator.get_config")
     def test_pipeline_coordinator_default_config(self, mock_get_config):
         """Test pipeline coordinator with default config."""
-        mock_config = MagicMock()
+        mock_config = DeepBriefConfig()
         mock_get_config.return_value = mock_config
 
         coordinator = PipelineCoordinator()
@@ -545,6 +576,1068 @@ class TestPipelineCoordinator:
             assert results == []
 
 
+class TestConcurrentBranches:
+    """Test running the audio and scene/frame branches side by side."""
+
+    @pytest.fixture
+    def config(self, tmp_path):
+        return DeepBriefConfig(processing=ProcessingConfig(temp_dir=tmp_path / "temp"))
+
+    @pytest.fixture(autouse=True)
+    def separate_passes(self):
+        with patch.object(SceneDetector, "supports_single_pass", return_value=False):
+            yield
+
+    @patch.object(VideoProcessor, "extract_frames_from_scenes")
+    @patch.object(SceneDetector, "detect_scenes")
+    @patch.object(AudioExtractor, "extract_audio")
+    @patch.object(VideoProcessor, "validate_file")
+    def test_branches_overlap(
+        self,
+        mock_validate,
+        mock_extract_audio,
+        mock_detect_scenes,
+        mock_extract_frames,
+        config,
+        mock_video_info,
+        mock_audio_info,
+        mock_scene_result,
+        mock_frame_infos,
+    ):
+        """Test that frames are extracted while audio extraction is running."""
+        mock_validate.return_value = mock_video_info
+        frames_done = threading.Event()
+
+        def extract_audio(**kwargs):  # noqa: ARG001
+            # Only finishes once the visual branch has extracted its frames
+            assert frames_done.wait(timeout=5)
+            return mock_audio_info
+
+        def extract_frames(**kwargs):  # noqa: ARG001
+            frames_done.set()
+            return mock_frame_infos
+
+        mock_extract_audio.side_effect = extract_audio
+        mock_detect_scenes.return_value = mock_scene_result
+        mock_extract_frames.side_effect = extract_frames
+
+        result = PipelineCoordinator(config).analyze_video(mock_video_info.file_path)
+
+        assert result.success
+        assert result.audio_info == mock_audio_info
+        assert result.scene_result == mock_scene_result
+        assert result.frame_infos == mock_frame_infos
+
+    @pytest.fixture
+    def single_pass_mocks(
+        self, mock_video_info, mock_audio_info, mock_scene_result, mock_frame_infos
+    ):
+        """Patch the shared audio and scene pass and both branches after it."""
+        with (
+            patch.object(SceneDetector, "supports_single_pass", return_value=True),
+            patch.object(VideoProcessor, "validate_file") as validate,
+            patch.object(
+                PipelineCoordinator, "_extract_audio_and_scenes"
+            ) as extract_audio_and_scenes,
+            patch(
+                "deep_brief.analysis.transcriber.WhisperTranscriber.transcribe_audio"
+            ) as transcribe,
+            patch.object(
+                VideoProcessor, "extract_frames_from_scenes"
+            ) as extract_frames,
+        ):
+            validate.return_value = mock_video_info
+            extract_audio_and_scenes.return_value = (mock_audio_info, mock_scene_result)
+            yield SimpleNamespace(transcribe=transcribe, extract_frames=extract_frames)
+
+    def test_branches_overlap_after_single_pass(
+        self, config, single_pass_mocks, mock_video_info, mock_frame_infos
+    ):
+        """Test that transcription runs alongside frame extraction."""
+        config.transcription.language = "en"
+        frames_done = threading.Event()
+
+        def transcribe(*args, **kwargs):  # noqa: ARG001
+            # Only finishes once the visual branch has extracted its frames
+            assert frames_done.wait(timeout=5)
+            return SimpleNamespace(word_count=2, language="en")
+
+        def extract_frames(**kwargs):  # noqa: ARG001
+            frames_done.set()
+            return mock_frame_infos
+
+        single_pass_mocks.transcribe.side_effect = transcribe
+        single_pass_mocks.extract_frames.side_effect = extract_frames
+
+        result = PipelineCoordinator(config).analyze_video(
+            mock_video_info.file_path, transcribe=True
+        )
+
+        assert result.success
+        assert result.transcription.word_count == 2
+        assert result.frame_infos == mock_frame_infos
+
+    def test_branches_sequential_when_disabled(
+        self, config, single_pass_mocks, mock_video_info, mock_frame_infos
+    ):
+        """Test that stages run one at a time without concurrent branches."""
+        config.transcription.language = "en"
+        config.processing.concurrent_branches = False
+        running = []
+        overlapped = []
+
+        def track(value):
+            def run(*args, **kwargs):  # noqa: ARG001
+                overlapped.append(bool(running))
+                running.append(True)
+                time.sleep(0.05)
+                running.pop()
+                return value
+
+            return run
+
+        single_pass_mocks.transcribe.side_effect = track(
+            SimpleNamespace(word_count=2, language="en")
+        )
+        single_pass_mocks.extract_frames.side_effect = track(mock_frame_infos)
+
+        result = PipelineCoordinator(config).analyze_video(
+            mock_video_info.file_path, transcribe=True
+        )
+
+        assert result.success
+        assert overlapped == [False, False]
+
+    @pytest.mark.parametrize(
+        ("error_code", "recorded"),
+        [(ErrorCode.NO_AUDIO_STREAM, False), (ErrorCode.AUDIO_CODEC_ERROR, True)],
+    )
+    @patch.object(VideoProcessor, "extract_frames_from_scenes")
+    @patch.object(SceneDetector, "detect_scenes")
+    @patch.object(AudioExtractor, "extract_audio")
+    @patch.object(VideoProcessor, "validate_file")
+    def test_audio_errors_do_not_abort(
+        self,
+        mock_validate,
+        mock_extract_audio,
+        mock_detect_scenes,
+        mock_extract_frames,
+        error_code,
+        recorded,
+        config,
+        mock_video_info,
+        mock_scene_result,
+        mock_frame_infos,
+    ):
+        """Test that audio errors keep their sequential semantics."""
+        mock_validate.return_value = mock_video_info
+        mock_extract_audio.side_effect = AudioProcessingError(
+            message="audio failed", error_code=error_code
+        )
+        mock_detect_scenes.return_value = mock_scene_result
+        mock_extract_frames.return_value = mock_frame_infos
+
+        result = PipelineCoordinator(config).analyze_video(mock_video_info.file_path)
+
+        assert result.success
+        assert result.audio_info is None
+        assert result.frame_infos == mock_frame_infos
+        assert bool(result.errors) is recorded
+
+    @patch.object(SceneDetector, "detect_scenes")
+    @patch.object(AudioExtractor, "extract_audio")
+    @patch.object(VideoProcessor, "validate_file")
+    def test_progress_completes_workflow(
+        self,
+        mock_validate,
+        mock_extract_audio,
+        mock_detect_scenes,
+        config,
+        progress_tracker,
+        mock_video_info,
+        mock_audio_info,
+        mock_scene_result,
+    ):
+        """Test that overlapping operations still drive the workflow to 100%."""
+        mock_validate.return_value = mock_video_info
+
+        def extract_audio(progress_callback=None, **kwargs):  # noqa: ARG001
+            progress_callback(0.5)
+            return mock_audio_info
+
+        def detect_scenes(progress_callback=None, **kwargs):  # noqa: ARG001
+            progress_callback(0.5)
+            return mock_scene_result
+
+        mock_extract_audio.side_effect = extract_audio
+        mock_detect_scenes.side_effect = detect_scenes
+        updates = []
+        progress_tracker.add_callback(lambda update: updates.append(update.progress))
+
+        result = PipelineCoordinator(config, progress_tracker).analyze_video(
+            mock_video_info.file_path, extract_frames=False
+        )
+
+        assert result.success
+        assert updates[-1] == 1.0
+        assert all(0.0 <= progress <= 1.0 for progress in updates)
+
+
+class TestStageGraph:
+    """Test the analysis stage graph built by the coordinator."""
+
+    @pytest.fixture
+    def config(self, tmp_path):
+        return DeepBriefConfig(processing=ProcessingConfig(temp_dir=tmp_path / "temp"))
+
+    @pytest.fixture(autouse=True)
+    def separate_passes(self):
+        with patch.object(SceneDetector, "supports_single_pass", return_value=False):
+            yield
+
+    def test_default_stages(self, config):
+        """Test that only the requested stages are added."""
+        coordinator = PipelineCoordinator(config)
+
+        graph = coordinator.build_stage_graph(VideoAnalysisResult(video_info=None))
+
+        assert [stage.name for stage in graph.stages] == [
+            "validate",
+            "probe",
+            "audio",
+            "scenes",
+            "frames",
+        ]
+
+    def test_full_analysis_stages(self, config):
+        """Test that speech, frame analysis and the report pull in their inputs."""
+        coordinator = PipelineCoordinator(config)
+
+        graph = coordinator.build_stage_graph(
+            VideoAnalysisResult(video_info=None),
+            extract_audio=False,
+            detect_scenes=False,
+            extract_frames=False,
+            analyze_speech=True,
+            analyze_frames=True,
+            generate_report=True,
+        )
+        names = [stage.name for stage in graph.validate(["video_path"])]
+
+        for name in (
+            "audio",
+            "language",
+            "transcribe",
+            "scenes",
+            "quality",
+            "caption",
+            "ocr",
+            "objects",
+            "speech_analysis",
+        ):
+            assert name in names
+        assert names[-1] == "report"
+        assert "frames" not in names
+
+    @patch("deep_brief.analysis.speech_analyzer.SpeechAnalyzer.analyze_speech")
+    @patch("deep_brief.analysis.transcriber.WhisperTranscriber.transcribe_audio")
+    @patch("deep_brief.analysis.transcriber.WhisperTranscriber.detect_language")
+    @patch.object(SceneDetector, "detect_scenes")
+    @patch.object(AudioExtractor, "extract_audio")
+    @patch.object(VideoProcessor, "validate_file")
+    def test_transcription_and_report(
+        self,
+        mock_validate,
+        mock_extract_audio,
+        mock_detect_scenes,
+        mock_detect_language,
+        mock_transcribe,
+        mock_analyze_speech,
+        config,
+        tmp_path,
+        mock_video_info,
+        mock_audio_info,
+        mock_scene_result,
+    ):
+        """Test that detected language feeds transcription and the report is written."""
+        mock_validate.return_value = mock_video_info
+        mock_extract_audio.return_value = mock_audio_info
+        mock_detect_scenes.return_value = mock_scene_result
+        mock_detect_language.return_value = LanguageDetectionResult(
+            detected_language="en", confidence=0.9, detection_method="whisper"
+        )
+        transcription = MagicMock()
+        transcription.to_dict.return_value = {"text": "hello"}
+        mock_transcribe.return_value = transcription
+        speech_analysis = MagicMock()
+        speech_analysis.to_dict.return_value = {"total_scenes": 3}
+        mock_analyze_speech.return_value = speech_analysis
+
+        result = PipelineCoordinator(config).analyze_video(
+            mock_video_info.file_path,
+            extract_frames=False,
+            output_dir=tmp_path / "output",
+            analyze_speech=True,
+            generate_report=True,
+        )
+
+        assert result.success
+        assert result.transcription is transcription
+        assert result.speech_analysis is speech_analysis
+        assert mock_transcribe.call_args[1]["language"] == "en"
+        mock_analyze_speech.assert_called_once_with(transcription, mock_scene_result)
+        report_file = tmp_path / "output" / f"{mock_video_info.file_path.stem}_report.json"
+        assert json.loads(report_file.read_text())["transcription"] == {"text": "hello"}
+        assert result.report["speech_analysis"] == {"total_scenes": 3}
+
+    @patch("deep_brief.analysis.transcriber.WhisperTranscriber.transcribe_audio")
+    @patch("deep_brief.analysis.transcriber.WhisperTranscriber.detect_language")
+    @patch.object(SceneDetector, "detect_scenes")
+    @patch.object(AudioExtractor, "extract_audio")
+    @patch.object(VideoProcessor, "validate_file")
+    def test_optional_stage_failure_recorded(
+        self,
+        mock_validate,
+        mock_extract_audio,
+        mock_detect_scenes,
+        mock_detect_language,
+        mock_transcribe,
+        config,
+        mock_video_info,
+        mock_audio_info,
+        mock_scene_result,
+    ):
+        """Test that a failed transcription is recorded without failing the analysis."""
+        mock_validate.return_value = mock_video_info
+        mock_extract_audio.return_value = mock_audio_info
+        mock_detect_scenes.return_value = mock_scene_result
+        mock_detect_language.side_effect = RuntimeError("no model")
+        mock_transcribe.side_effect = RuntimeError("no model")
+
+        result = PipelineCoordinator(config).analyze_video(
+            mock_video_info.file_path, extract_frames=False, transcribe=True
+        )
+
+        assert result.success
+        assert result.scene_result == mock_scene_result
+        assert result.transcription is None
+        assert [error.details["stage"] for error in result.errors] == [
+            "language",
+            "transcribe",
+        ]
+        assert result.stage_results["transcribe"].status == StageStatus.FAILED
+
+    @patch.object(AudioExtractor, "extract_audio")
+    @patch.object(VideoProcessor, "validate_file")
+    def test_no_audio_skips_transcription(
+        self, mock_validate, mock_extract_audio, config, mock_video_info
+    ):
+        """Test that a video without audio skips the speech stages."""
+        mock_validate.return_value = mock_video_info
+        mock_extract_audio.side_effect = AudioProcessingError(
+            message="no audio", error_code=ErrorCode.NO_AUDIO_STREAM
+        )
+
+        result = PipelineCoordinator(config).analyze_video(
+            mock_video_info.file_path,
+            detect_scenes=False,
+            extract_frames=False,
+            transcribe=True,
+        )
+
+        assert result.success
+        assert not result.errors
+        assert result.stage_results["transcribe"].status == StageStatus.SKIPPED
+
+
+    @patch.object(VideoProcessor, "extract_frames_from_scenes")
+    @patch.object(SceneDetector, "detect_scenes")
+    @patch.object(AudioExtractor, "extract_audio")
+    @patch.object(VideoProcessor, "validate_file")
+    def test_cancel_from_tracker(
+        self,
+        mock_validate,
+        mock_extract_audio,
+        mock_detect_scenes,
+        mock_extract_frames,
+        tmp_path,
+        progress_tracker,
+        mock_video_info,
+        mock_audio_info,
+        mock_scene_result,
+    ):
+        """Test that cancelling the workflow stops the analysis and its files."""
+        config = DeepBriefConfig(
+            processing=ProcessingConfig(
+                temp_dir=tmp_path / "temp", concurrent_branches=False
+            )
+        )
+        mock_validate.return_value = mock_video_info
+        mock_extract_audio.return_value = mock_audio_info
+        mock_detect_scenes.return_value = mock_scene_result
+
+        def cancel_during_frames(*args, **kwargs):  # noqa: ARG001
+            (workflow_id,) = progress_tracker.operations
+            progress_tracker.cancel_operation(workflow_id)
+            raise_if_cancelled("frame extraction")
+
+        mock_extract_frames.side_effect = cancel_during_frames
+
+        coordinator = PipelineCoordinator(config, progress_tracker)
+        result = coordinator.analyze_video(mock_video_info.file_path)
+
+        assert not result.success
+        assert result.errors[0].error_code == ErrorCode.OPERATION_CANCELLED
+        assert not mock_audio_info.file_path.exists()
+        assert mock_video_info.file_path.exists()
+        (workflow,) = progress_tracker.operations.values()
+        assert workflow.status == OperationStatus.CANCELLED
+
+    def test_memory_budget_caps_model_memory(self, tmp_path):
+        """Test that the scheduler leaves room for the frame buffer in the budget."""
+        config = DeepBriefConfig(
+            processing=ProcessingConfig(
+                temp_dir=tmp_path / "temp",
+                max_model_memory_mb=16384,
+                memory_budget_mb=12288,
+                frame_buffer_mb=512,
+            )
+        )
+        try:
+            coordinator = PipelineCoordinator(config)
+            scheduler = coordinator.create_stage_scheduler(StageGraph())
+
+            assert scheduler.resource_limits[RESOURCE_MODEL_MEMORY] == 12288 - 512
+            assert get_memory_budget().limit_bytes == 12288 * 1024 * 1024
+        finally:
+            get_memory_budget().set_limit(None)
+
+
+class TestStageCache:
+    """Test reusing stage outputs when only some settings change."""
+
+    @pytest.fixture
+    def config(self, tmp_path):
+        return DeepBriefConfig(
+            processing=ProcessingConfig(temp_dir=tmp_path / "temp", result_cache=False)
+        )
+
+    @pytest.fixture(autouse=True)
+    def separate_passes(self):
+        with patch.object(SceneDetector, "supports_single_pass", return_value=False):
+            yield
+
+    @pytest.fixture
+    def mocks(self, mock_video_info, mock_audio_info, mock_scene_result):
+        """Patch every stage's work with picklable results."""
+        with (
+            patch.object(VideoProcessor, "validate_file") as validate,
+            patch.object(AudioExtractor, "extract_audio") as extract_audio,
+            patch.object(SceneDetector, "detect_scenes") as detect_scenes,
+            patch(
+                "deep_brief.analysis.transcriber.WhisperTranscriber.detect_language"
+            ) as detect_language,
+            patch(
+                "deep_brief.analysis.transcriber.WhisperTranscriber.transcribe_audio"
+            ) as transcribe,
+            patch(
+                "deep_brief.analysis.speech_analyzer.SpeechAnalyzer.analyze_speech"
+            ) as analyze_speech,
+        ):
+            validate.return_value = mock_video_info
+            extract_audio.return_value = mock_audio_info
+            detect_scenes.return_value = mock_scene_result
+            detect_language.return_value = LanguageDetectionResult(
+                detected_language="en", confidence=0.9, detection_method="whisper"
+            )
+            transcribe.side_effect = lambda *a, **k: SimpleNamespace(  # noqa: ARG005
+                word_count=2, language="en", language_detection=None
+            )
+            analyze_speech.side_effect = lambda *a: SimpleNamespace(  # noqa: ARG005
+                total_scenes=3
+            )
+            yield SimpleNamespace(
+                validate=validate,
+                extract_audio=extract_audio,
+                detect_scenes=detect_scenes,
+                transcribe=transcribe,
+                analyze_speech=analyze_speech,
+            )
+
+    def test_setting_change_reruns_dependent_stages(
+        self, config, mocks, mock_video_info, mock_audio_info
+    ):
+        """Test that changing filler words re-runs only speech analysis."""
+        coordinator = PipelineCoordinator(config)
+
+        def analyze():
+            return coordinator.analyze_video(
+                mock_video_info.file_path, extract_frames=False, analyze_speech=True
+            )
+
+        analyze()
+        mock_audio_info.file_path.write_bytes(b"overwritten")
+        config.analysis.filler_words = ["um", "like"]
+        result = analyze()
+
+        assert result.success
+        assert mocks.validate.call_count == 2
+        assert mocks.extract_audio.call_count == 1
+        assert mocks.detect_scenes.call_count == 1
+        assert mocks.transcribe.call_count == 1
+        assert mocks.analyze_speech.call_count == 2
+        assert result.stage_results["transcribe"].from_cache
+        assert not result.stage_results["speech_analysis"].from_cache
+        assert result.transcription.word_count == 2
+        # The cached WAV is restored for the stages reading it
+        assert mock_audio_info.file_path.read_bytes() == b"mock audio content"
+
+    def test_model_setting_change_misses_cache(self, config, mocks, mock_video_info):
+        """Test that changing a setting the transcriber reads re-runs transcription."""
+        coordinator = PipelineCoordinator(config)
+
+        def analyze():
+            return coordinator.analyze_video(
+                mock_video_info.file_path, extract_frames=False, transcribe=True
+            )
+
+        analyze()
+        config.transcription.device = "cuda"
+        result = analyze()
+        config.transcription.skip_silence = True
+        skipped = analyze()
+        config.transcription.quantize = True
+        quantized = analyze()
+
+        assert mocks.transcribe.call_count == 4
+        assert not result.stage_results["transcribe"].from_cache
+        assert not result.stage_results["language"].from_cache
+        assert not skipped.stage_results["transcribe"].from_cache
+        assert skipped.stage_results["language"].from_cache
+        assert not quantized.stage_results["language"].from_cache
+        assert not quantized.stage_results["transcribe"].from_cache
+        assert mocks.detect_scenes.call_count == 1
+
+    def test_use_cache_false_reruns_all(self, config, mocks, mock_video_info):
+        """Test that use_cache=False bypasses the stage cache."""
+        coordinator = PipelineCoordinator(config)
+
+        for use_cache in (True, False):
+            result = coordinator.analyze_video(
+                mock_video_info.file_path,
+                extract_frames=False,
+                analyze_speech=True,
+                use_cache=use_cache,
+            )
+
+        assert not result.stage_results["transcribe"].from_cache
+        assert mocks.transcribe.call_count == 2
+        assert mocks.detect_scenes.call_count == 2
+
+
+class TestWindowedProcessing:
+    """Test analyzing long videos in fixed time windows."""
+
+    @pytest.fixture
+    def config(self, tmp_path):
+        return DeepBriefConfig(
+            processing=ProcessingConfig(
+                temp_dir=tmp_path / "temp",
+                result_cache=False,
+                windowed_processing=True,
+                window_seconds=600.0,
+            )
+        )
+
+    @pytest.fixture
+    def long_video_info(self, mock_video_info):
+        return mock_video_info.model_copy(update={"duration": 1500.0})
+
+    @pytest.fixture
+    def mocks(self, tmp_path, long_video_info):
+        """Patch each window's work; windows are 0-500s, 500-1000s and 1000-1500s."""
+        scene_changes = {0.0: [200.0], 500.0: [700.0], 1000.0: [1100.0]}
+
+        def extract_segment(video_info, start, duration, output_path):  # noqa: ARG001
+            chunk = tmp_path / "temp" / f"chunk_{start:.0f}.wav"
+            chunk.write_bytes(b"chunk")
+            return AudioInfo(
+                file_path=chunk,
+                duration=duration,
+                sample_rate=16000,
+                channels=1,
+                size_mb=1.0,
+                format="wav",
+            )
+
+        def extract_frames(video_info, scenes, **kwargs):  # noqa: ARG001
+            frames = []
+            for start, _end, number in scenes:
+                frame_path = tmp_path / f"scene_{number:03d}.jpg"
+                frame_path.write_bytes(b"jpeg")
+                frames.append(
+                    FrameInfo(
+                        frame_path=frame_path,
+                        timestamp=start,
+                        scene_number=number,
+                        width=1920,
+                        height=1080,
+                        size_kb=1.0,
+                        format="jpg",
+                    )
+                )
+            return frames
+
+        def transcribe(audio_info, language=None):  # noqa: ARG001
+            return TranscriptionResult(
+                text="hello",
+                segments=[
+                    Segment(
+                        id=0,
+                        text="hello",
+                        start=10.0,
+                        end=12.0,
+                        avg_logprob=-0.2,
+                        no_speech_prob=0.01,
+                    )
+                ],
+                language="en",
+                language_probability=0.9,
+                duration=audio_info.duration,
+                model_used="whisper-base",
+                word_count=1,
+                processing_time=1.0,
+            )
+
+        with (
+            patch.object(VideoProcessor, "validate_file") as validate,
+            patch(
+                "deep_brief.core.pipeline_coordinator.probe_media",
+                return_value={"streams": [{"codec_type": "audio"}]},
+            ),
+            patch.object(
+                AudioExtractor, "extract_audio_segment", side_effect=extract_segment
+            ) as extract_audio_segment,
+            patch.object(
+                SceneDetector,
+                "detect_scene_changes",
+                side_effect=lambda _video_info, start, _end: scene_changes[start],
+            ),
+            patch.object(
+                VideoProcessor, "extract_frames_from_scenes", side_effect=extract_frames
+            ) as extract_frames_from_scenes,
+            patch(
+                "deep_brief.analysis.transcriber.WhisperTranscriber.transcribe_audio",
+                side_effect=transcribe,
+            ) as transcribe_audio,
+        ):
+            validate.return_value = long_video_info
+            yield SimpleNamespace(
+                extract_audio_segment=extract_audio_segment,
+                extract_frames_from_scenes=extract_frames_from_scenes,
+                transcribe_audio=transcribe_audio,
+            )
+
+    def test_windows_merged_on_full_timeline(
+        self, config, mocks, tmp_path, long_video_info
+    ):
+        """Test that window outputs merge into one result on the video's timeline."""
+        result = PipelineCoordinator(config).analyze_video(
+            long_video_info.file_path, transcribe=True
+        )
+
+        assert result.success, result.error_message
+        assert [name for name in result.stage_results if name.startswith("w")] == [
+            "window_1",
+            "window_2",
+            "window_3",
+        ]
+        # Scenes continue across window boundaries
+        assert [(s.start_time, s.end_time) for s in result.scene_result.scenes] == [
+            (0.0, 200.0),
+            (200.0, 700.0),
+            (700.0, 1100.0),
+            (1100.0, 1500.0),
+        ]
+        assert [f.scene_number for f in result.frame_infos] == [1, 2, 3, 4]
+        assert [s.start for s in result.transcription.segments] == [10.0, 510.0, 1010.0]
+        assert [s.id for s in result.transcription.segments] == [0, 1, 2]
+        # Later windows reuse the language of the first
+        assert mocks.transcribe_audio.call_args_list[-1][1]["language"] == "en"
+        assert result.audio_info.duration == pytest.approx(1500.0)
+        assert result.audio_info.file_path == long_video_info.file_path
+        # Chunks only extracted for transcription are removed
+        assert not list((tmp_path / "temp").glob("chunk_*.wav"))
+
+    def test_windows_resumed_from_stage_cache(self, config, mocks, long_video_info):
+        """Test that cached windows are restored and failed ones are retried."""
+        transcribe = mocks.transcribe_audio.side_effect
+
+        def fail_second_window(audio_info, language=None):
+            if mocks.transcribe_audio.call_count == 2:
+                raise RuntimeError("Transcription crashed")
+            return transcribe(audio_info, language)
+
+        mocks.transcribe_audio.side_effect = fail_second_window
+        failed = PipelineCoordinator(config).analyze_video(
+            long_video_info.file_path, transcribe=True
+        )
+        mocks.transcribe_audio.side_effect = transcribe
+        retried = PipelineCoordinator(config).analyze_video(
+            long_video_info.file_path, transcribe=True
+        )
+        cached = PipelineCoordinator(config).analyze_video(
+            long_video_info.file_path, transcribe=True
+        )
+
+        assert failed.errors
+        # Windows after the failed one carry its error, so none are stored
+        assert [
+            retried.stage_results[f"window_{n}"].from_cache for n in (1, 2, 3)
+        ] == [True, False, False]
+        assert all(cached.stage_results[f"window_{n}"].from_cache for n in (1, 2, 3))
+        assert mocks.transcribe_audio.call_count == 5
+        for result in (retried, cached):
+            assert not result.errors
+            assert [s.start for s in result.transcription.segments] == [
+                10.0,
+                510.0,
+                1010.0,
+            ]
+            assert [s.end_time for s in result.scene_result.scenes] == [
+                200.0,
+                700.0,
+                1100.0,
+                1500.0,
+            ]
+            assert [f.scene_number for f in result.frame_infos] == [1, 2, 3, 4]
+            assert all(f.frame_path.is_file() for f in result.frame_infos)
+
+    def test_short_video_uses_stage_graph(
+        self, config, mocks, mock_video_info, mock_audio_info
+    ):
+        """Test that a video fitting in one window is analyzed as a whole."""
+        with (
+            patch.object(VideoProcessor, "validate_file", return_value=mock_video_info),
+            patch.object(SceneDetector, "supports_single_pass", return_value=False),
+            patch.object(
+                AudioExtractor, "extract_audio", return_value=mock_audio_info
+            ) as extract_audio,
+            patch.object(SceneDetector, "detect_scenes") as detect_scenes,
+        ):
+            detect_scenes.return_value = SceneDetectionResult(
+                scenes=[],
+                total_scenes=0,
+                detection_method="threshold",
+                threshold_used=0.4,
+                video_duration=120.0,
+                average_scene_duration=0.0,
+            )
+            result = PipelineCoordinator(config).analyze_video(
+                mock_video_info.file_path
+            )
+
+        assert result.success
+        assert "scenes" in result.stage_results
+        extract_audio.assert_called_once()
+        mocks.extract_audio_segment.assert_not_called()
+
+
+class Crash(BaseException):
+    """Stands in for the process being killed mid-batch."""
+
+
+class TestBatchResume:
+    """Test checkpointed batch jobs and resuming them."""
+
+    @pytest.fixture
+    def config(self, tmp_path):
+        return DeepBriefConfig(
+            processing=ProcessingConfig(
+                temp_dir=tmp_path / "temp",
+                result_cache=False,
+                stage_cache=False,
+                batch_max_workers=1,
+            )
+        )
+
+    @pytest.fixture
+    def videos(self, tmp_path):
+        paths = []
+        for name in ("first", "second", "third"):
+            path = tmp_path / f"{name}.mp4"
+            path.write_text(f"{name} video content")
+            paths.append(path)
+        return paths
+
+    @pytest.fixture
+    def mocks(self, mock_video_info, mock_audio_info, mock_scene_result):
+        with (
+            patch.object(SceneDetector, "supports_single_pass", return_value=False),
+            patch.object(VideoProcessor, "validate_file") as validate,
+            patch.object(AudioExtractor, "extract_audio") as extract_audio,
+            patch.object(SceneDetector, "detect_scenes") as detect_scenes,
+        ):
+            validate.side_effect = lambda path: mock_video_info.model_copy(
+                update={"file_path": Path(path)}
+            )
+            extract_audio.return_value = mock_audio_info
+            detect_scenes.return_value = mock_scene_result
+            yield SimpleNamespace(
+                validate=validate,
+                extract_audio=extract_audio,
+                detect_scenes=detect_scenes,
+            )
+
+    def test_resume_skips_finished_videos_and_stages(
+        self, config, mocks, videos, mock_scene_result, tmp_path
+    ):
+        """Test that a resumed job re-runs only unfinished work."""
+        job_dir = tmp_path / "job"
+        scene_calls = []
+
+        def crash_on_second_video(video_info, **kwargs):  # noqa: ARG001
+            scene_calls.append(video_info.file_path.name)
+            if video_info.file_path.name == "second.mp4" and len(scene_calls) == 2:
+                # Let the audio stage finish and checkpoint before the crash
+                deadline = time.time() + 5
+                while mocks.extract_audio.call_count < 2 and time.time() < deadline:
+                    time.sleep(0.01)
+                raise Crash()
+            return mock_scene_result
+
+        mocks.detect_scenes.side_effect = crash_on_second_video
+
+        with pytest.raises(Crash):
+            PipelineCoordinator(config).analyze_video_batch(
+                videos, extract_frames=False, job_dir=job_dir
+            )
+
+        manifest = BatchManifest.load(job_dir)
+        assert manifest.get_status(0) == VideoStatus.COMPLETED
+        assert manifest.remaining_indices() == [1, 2]
+        assert mocks.extract_audio.call_count == 2
+        # The interrupted video's stages are recorded as they finished
+        assert manifest.get_stages(1)["audio"]["status"] == "completed"
+        assert manifest.get_stages(1)["scenes"]["status"] == "failed"
+
+        results = PipelineCoordinator(config).resume_batch(job_dir)
+
+        assert [r.video_info.file_path for r in results] == videos
+        assert all(r.success for r in results)
+        # The first video is not analyzed again
+        assert [Path(c[0][0]).name for c in mocks.validate.call_args_list].count(
+            "first.mp4"
+        ) == 1
+        # The second video's audio comes from its checkpoint
+        assert mocks.extract_audio.call_count == 3
+        assert results[1].stage_results["audio"].from_cache
+        assert not results[1].stage_results["scenes"].from_cache
+        manifest = BatchManifest.load(job_dir)
+        assert manifest.remaining_indices() == []
+        assert manifest.get_stages(1)["scenes"]["status"] == "completed"
+        # Stage files are dropped once the result is recorded
+        assert not list((job_dir / "stages").glob("*.json"))
+
+    def test_existing_job_dir_rejected(self, config, mocks, videos, tmp_path):
+        """Test that starting a job in a used directory fails."""
+        coordinator = PipelineCoordinator(config)
+        coordinator.analyze_video_batch(
+            videos[:1], extract_frames=False, job_dir=tmp_path / "job"
+        )
+
+        with pytest.raises(FileExistsError):
+            coordinator.analyze_video_batch(
+                videos[:1], extract_frames=False, job_dir=tmp_path / "job"
+            )
+
+
+class TestAsyncAnalysis:
+    """Test analyzing videos on an event loop."""
+
+    @pytest.fixture
+    def config(self, tmp_path):
+        return DeepBriefConfig(
+            processing=ProcessingConfig(
+                temp_dir=tmp_path / "temp", result_cache=False, stage_cache=False
+            )
+        )
+
+    @pytest.fixture
+    def mocks(self, mock_video_info, mock_audio_info, mock_scene_result):
+        in_flight = []
+        peak = []
+
+        async def detect_scenes(video_info, progress_callback=None):  # noqa: ARG001
+            in_flight.append(video_info.file_path)
+            peak.append(len(in_flight))
+            await asyncio.sleep(0.05)
+            in_flight.remove(video_info.file_path)
+            return mock_scene_result
+
+        with (
+            patch.object(SceneDetector, "supports_single_pass", return_value=False),
+            patch.object(VideoProcessor, "validate_file") as validate,
+            patch.object(
+                AudioExtractor, "extract_audio_async", return_value=mock_audio_info
+            ) as extract_audio,
+            patch.object(
+                SceneDetector, "detect_scenes_async", side_effect=detect_scenes
+            ),
+            patch.object(
+                VideoProcessor, "extract_frames_from_scenes_async", return_value=[]
+            ) as extract_frames,
+            patch.object(AudioExtractor, "extract_audio") as sync_extract_audio,
+        ):
+            validate.side_effect = lambda path: mock_video_info.model_copy(
+                update={"file_path": Path(path)}
+            )
+            yield SimpleNamespace(
+                extract_audio=extract_audio,
+                extract_frames=extract_frames,
+                sync_extract_audio=sync_extract_audio,
+                peak=peak,
+            )
+
+    @pytest.mark.asyncio
+    async def test_analyze_video_async(self, config, mocks, mock_video_info):
+        """Test that the async stage variants produce a complete result."""
+        result = await PipelineCoordinator(config).analyze_video_async(
+            mock_video_info.file_path
+        )
+
+        assert result.success
+        assert result.audio_info is not None
+        assert result.scene_result.total_scenes == 3
+        assert mocks.extract_audio.await_count == 1
+        assert mocks.extract_frames.await_count == 1
+        assert mocks.sync_extract_audio.call_count == 0
+
+    @pytest.mark.asyncio
+    async def test_batch_keeps_videos_in_flight(self, config, mocks, tmp_path):
+        """Test that several videos are analyzed at once from one loop."""
+        videos = []
+        for i in range(4):
+            video = tmp_path / f"video{i}.mp4"
+            video.write_text(f"video {i}")
+            videos.append(video)
+
+        results = await PipelineCoordinator(config).analyze_video_batch_async(
+            videos, max_concurrent=3, extract_frames=False
+        )
+
+        assert [r.video_info.file_path for r in results] == videos
+        assert all(r.success for r in results)
+        assert max(mocks.peak) == 3
+
+    @pytest.mark.asyncio
+    async def test_failure_returns_failed_result(self, config, mocks, tmp_path):  # noqa: ARG002
+        """Test that a validation error becomes a failed result."""
+        with patch.object(
+            VideoProcessor, "validate_file", side_effect=RuntimeError("bad file")
+        ):
+            result = await PipelineCoordinator(config).analyze_video_async(
+                tmp_path / "missing.mp4"
+            )
+
+        assert not result.success
+        assert "bad file" in result.error_message
+
+
+def timed_analysis(self, video_path, output_dir=None, **options):  # noqa: ARG001
+    """Stand-in for analyze_video where "slow" videos take longer."""
+    if "slow" in Path(video_path).name:
+        time.sleep(0.5)
+    return VideoAnalysisResult(
+        video_info=None, success="bad" not in Path(video_path).name
+    )
+
+
+class TestBatchWorkers:
+    """Test batch analysis on worker processes."""
+
+    @pytest.fixture
+    def config(self, tmp_path):
+        return DeepBriefConfig(processing=ProcessingConfig(temp_dir=tmp_path / "temp"))
+
+    @pytest.mark.skipif(
+        multiprocessing.get_start_method() != "fork",
+        reason="workers must inherit the patched analyze_video",
+    )
+    @patch.object(PipelineCoordinator, "analyze_video", timed_analysis)
+    def test_results_stream_in_completion_order(self, config, progress_tracker):
+        """Test that a fast video is yielded before a slow one started earlier."""
+        updates = []
+        progress_tracker.add_callback(updates.append)
+        coordinator = PipelineCoordinator(config, progress_tracker)
+
+        streamed = list(
+            coordinator.iter_video_batch(
+                ["slow.mp4", "fast.mp4", "bad.mp4"], max_workers=2
+            )
+        )
+
+        assert len(streamed) == 3
+        assert streamed[-1][0] == 0  # slow.mp4 finishes last
+        assert [result.success for _, result in sorted(streamed)] == [
+            True,
+            True,
+            False,
+        ]
+
+        progress = [u.progress for u in updates if u.status.value == "running"]
+        assert progress == sorted(progress)
+        assert updates[-1].status.value == "completed"
+        assert updates[-1].details["successful"] == 2
+
+    @pytest.mark.skipif(
+        multiprocessing.get_start_method() != "fork",
+        reason="workers must inherit the patched analyze_video",
+    )
+    @patch.object(PipelineCoordinator, "analyze_video", timed_analysis)
+    def test_batch_returns_input_order(self, config):
+        """Test that analyze_video_batch keeps results in input order."""
+        coordinator = PipelineCoordinator(config)
+
+        results = coordinator.analyze_video_batch(
+            ["slow.mp4", "bad.mp4"], max_workers=2
+        )
+
+        assert [result.success for result in results] == [True, False]
+
+    def test_worker_reuses_coordinator(self, config, mock_video_info):
+        """Test that a worker builds its coordinator once for all its videos."""
+        audio_info = AudioInfo(
+            file_path=mock_video_info.file_path,
+            duration=1.0,
+            sample_rate=16000,
+            channels=1,
+            size_mb=0.1,
+            format="f32le",
+            samples=np.zeros(16000, dtype=np.float32),
+        )
+        coordinators = []
+
+        def analyze(coordinator, video_path, output_dir=None, **options):  # noqa: ARG001
+            coordinators.append(coordinator)
+            return VideoAnalysisResult(video_info=mock_video_info, audio_info=audio_info)
+
+        with patch.object(PipelineCoordinator, "analyze_video", analyze):
+            _init_batch_worker(config, False, False)
+            results = [
+                _analyze_in_batch_worker(
+                    mock_video_info.file_path, None, {}
+                )
+                for _ in range(2)
+            ]
+
+        assert coordinators[0] is coordinators[1]
+        assert all(result.audio_info.samples is None for result in results)
+        assert audio_info.samples is not None  # The worker's copy is untouched
+        restored = pickle.loads(pickle.dumps(results[0]))
+        assert restored.video_info == mock_video_info
+
+
 class TestPipelineCoordinatorFactories:
     """Test factory functions for pipeline coordinator."""
 
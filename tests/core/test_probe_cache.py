@@ -0,0 +1,181 @@
+"""Tests for the shared ffprobe cache."""
+
+import copy
+import json
+import os
+from unittest.mock import patch
+
+import ffmpeg
+import pytest
+
+from deep_brief.core.audio_extractor import AudioExtractor
+from deep_brief.core.exceptions import AudioProcessingError
+from deep_brief.core.probe_cache import ProbeCache, get_probe_cache, probe_media
+from deep_brief.core.video_processor import VideoProcessor
+
+PROBE_DATA = {
+    "streams": [{"codec_type": "video", "width": 1920, "height": 1080}],
+    "format": {"duration": "60.0", "format_name": "mov,mp4,m4a,3gp,3g2,mj2"},
+}
+
+
+@pytest.fixture
+def media_file(tmp_path):
+    """Create a small file to stand in for a video."""
+    path = tmp_path / "video.mp4"
+    path.write_bytes(b"fake video content")
+    return path
+
+
+class TestProbeCache:
+    """Test ProbeCache."""
+
+    @patch("ffmpeg.probe")
+    def test_unchanged_file_probed_once(self, mock_probe, media_file):
+        """Test that repeated probes of the same file hit the cache."""
+        mock_probe.return_value = PROBE_DATA
+        cache = ProbeCache()
+
+        first = cache.probe(media_file)
+        second = cache.probe(str(media_file))
+
+        assert first == PROBE_DATA
+        assert second == PROBE_DATA
+        mock_probe.assert_called_once_with(str(media_file))
+        assert cache.get_stats()["hits"] == 1
+        assert cache.get_stats()["misses"] == 1
+
+    @patch("ffmpeg.probe")
+    def test_returned_data_is_isolated(self, mock_probe, media_file):
+        """Test that callers cannot corrupt cached entries."""
+        mock_probe.return_value = copy.deepcopy(PROBE_DATA)
+        cache = ProbeCache()
+
+        cache.probe(media_file)["streams"].clear()
+
+        assert cache.probe(media_file)["streams"] == PROBE_DATA["streams"]
+
+    @patch("ffmpeg.probe")
+    def test_modified_file_probed_again(self, mock_probe, media_file):
+        """Test that a change in size or mtime invalidates the entry."""
+        mock_probe.return_value = PROBE_DATA
+        cache = ProbeCache()
+
+        cache.probe(media_file)
+        media_file.write_bytes(b"rewritten with different content")
+        stat = media_file.stat()
+        os.utime(media_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        cache.probe(media_file)
+
+        assert mock_probe.call_count == 2
+
+    @patch("ffmpeg.probe")
+    def test_missing_file_not_cached(self, mock_probe, tmp_path):
+        """Test that files that cannot be stat'ed are probed directly."""
+        mock_probe.return_value = PROBE_DATA
+        cache = ProbeCache()
+        missing = tmp_path / "missing.mp4"
+
+        cache.probe(missing)
+        cache.probe(missing)
+
+        assert mock_probe.call_count == 2
+        assert cache.get_stats()["entries"] == 0
+
+    @patch("ffmpeg.probe")
+    def test_errors_not_cached(self, mock_probe, media_file):
+        """Test that a failed probe is retried on the next call."""
+        mock_probe.side_effect = [
+            ffmpeg.Error("ffprobe", b"", b"temporary failure"),
+            PROBE_DATA,
+        ]
+        cache = ProbeCache()
+
+        with pytest.raises(ffmpeg.Error):
+            cache.probe(media_file)
+
+        assert cache.probe(media_file) == PROBE_DATA
+
+    @patch("ffmpeg.probe")
+    def test_lru_eviction(self, mock_probe, tmp_path):
+        """Test that the least recently used entry is evicted."""
+        mock_probe.return_value = PROBE_DATA
+        cache = ProbeCache(max_entries=2)
+        files = []
+        for name in ["a.mp4", "b.mp4", "c.mp4"]:
+            path = tmp_path / name
+            path.write_bytes(name.encode())
+            files.append(path)
+
+        cache.probe(files[0])
+        cache.probe(files[1])
+        cache.probe(files[0])  # a is now most recently used
+        cache.probe(files[2])  # evicts b
+
+        assert cache.get_stats()["entries"] == 2
+        cache.probe(files[0])
+        assert mock_probe.call_count == 3
+        cache.probe(files[1])
+        assert mock_probe.call_count == 4
+
+    @patch("ffmpeg.probe")
+    def test_persistence(self, mock_probe, media_file, tmp_path):
+        """Test that a new cache loaded from disk skips probing."""
+        mock_probe.return_value = PROBE_DATA
+        cache_file = tmp_path / "cache" / "probe_cache.json"
+
+        ProbeCache(cache_file=cache_file).probe(media_file)
+        assert cache_file.exists()
+        assert len(json.loads(cache_file.read_text())["entries"]) == 1
+
+        reloaded = ProbeCache(cache_file=cache_file)
+        assert reloaded.probe(media_file) == PROBE_DATA
+        mock_probe.assert_called_once()
+
+    def test_unreadable_cache_file_ignored(self, tmp_path):
+        """Test that a corrupt cache file does not break startup."""
+        cache_file = tmp_path / "probe_cache.json"
+        cache_file.write_text("{not json")
+
+        cache = ProbeCache(cache_file=cache_file)
+
+        assert cache.get_stats()["entries"] == 0
+
+
+class TestSharedProbeCache:
+    """Test that pipeline components share one probe per file."""
+
+    @patch("ffmpeg.probe")
+    def test_probe_media_uses_global_cache(self, mock_probe, media_file):
+        """Test the module-level helper."""
+        mock_probe.return_value = PROBE_DATA
+
+        probe_media(media_file)
+        probe_media(media_file)
+
+        mock_probe.assert_called_once()
+        assert get_probe_cache().get_stats()["hits"] == 1
+
+    @patch("ffmpeg.probe")
+    def test_validate_and_audio_probe_share_entry(self, mock_probe, media_file):
+        """Test that AudioExtractor reuses the probe made by VideoProcessor."""
+        mock_probe.return_value = {
+            "streams": [
+                {
+                    "codec_type": "video",
+                    "width": 1920,
+                    "height": 1080,
+                    "r_frame_rate": "30/1",
+                    "codec_name": "h264",
+                }
+            ],
+            "format": {"duration": "60.0", "format_name": "mov,mp4,m4a,3gp,3g2,mj2"},
+        }
+
+        video_info = VideoProcessor().validate_file(media_file)
+
+        # No audio stream in the cached probe, so extraction stops right after probing
+        with pytest.raises(AudioProcessingError):
+            AudioExtractor().extract_audio(video_info)
+
+        mock_probe.assert_called_once()
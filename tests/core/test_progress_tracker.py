@@ -3,6 +3,8 @@
 import time
 from unittest.mock import MagicMock
 
+import pytest
+
 from deep_brief.core.progress_tracker import (
     CompositeProgressTracker,
     OperationStatus,
@@ -410,6 +412,49 @@ class TestCompositeProgressTracker:
 
         assert composite.workflow_id == "workflow_1"
 
+    def test_concurrent_operations(self):
+        """Test weighted workflow progress while operations overlap."""
+        base_tracker = ProgressTracker()
+        composite = CompositeProgressTracker(base_tracker)
+        composite.start_workflow(
+            "workflow_1",
+            "Test Workflow",
+            [
+                ("audio", "Extract audio", 0.5),
+                ("scenes", "Detect scenes", 0.25),
+                ("frames", "Extract frames", 0.25),
+            ],
+        )
+
+        audio_callback = composite.start_operation("audio")
+        scenes_callback = composite.start_operation("scenes")
+        audio_callback(0.5)
+        scenes_callback(1.0)
+
+        workflow_op = base_tracker.operations["workflow_1"]
+        assert workflow_op.progress == pytest.approx(0.5)
+        assert workflow_op.current_step == "Extract audio + Detect scenes"
+
+        assert composite.complete_operation("scenes") is True
+        assert workflow_op.current_step == "Extract audio"
+
+        # Late updates after completion are ignored
+        scenes_callback(0.1)
+        assert workflow_op.progress == pytest.approx(0.5)
+
+        assert composite.complete_operation("audio") is True
+        assert workflow_op.progress == pytest.approx(0.75)
+        assert composite.complete_operation("frames") is False
+        assert workflow_op.status == OperationStatus.COMPLETED
+
+    def test_start_unknown_operation(self):
+        """Test that operations outside the workflow get no callback."""
+        composite = CompositeProgressTracker(ProgressTracker())
+        composite.start_workflow("workflow_1", "Test", [("audio", "Audio", 1.0)])
+
+        assert composite.start_operation("frames") is None
+        assert composite.complete_operation("frames") is False
+
     def test_start_next_operation_no_workflow(self):
         """Test starting next operation without workflow."""
         base_tracker = ProgressTracker()
@@ -0,0 +1,156 @@
+"""Tests for int8 dynamic quantization of models."""
+
+import torch
+
+from deep_brief.core.quantization import (
+    QuantizedModelCache,
+    benchmark_quantization,
+    quantize_linear_layers,
+    word_agreement,
+)
+
+
+class CastingLinear(torch.nn.Linear):
+    """Linear layer that only changes forward(), like Whisper's."""
+
+    def forward(self, x):
+        return torch.nn.functional.linear(
+            x, self.weight.to(x.dtype), self.bias.to(x.dtype)
+        )
+
+
+def make_model():
+    """Small fp32 model with Linear layers to quantize."""
+    torch.manual_seed(0)
+    return torch.nn.Sequential(
+        torch.nn.Linear(64, 128), torch.nn.ReLU(), CastingLinear(128, 16)
+    ).eval()
+
+
+class TestQuantizeLinearLayers:
+    """Test quantizing Linear layers."""
+
+    def test_linear_layers_quantized(self):
+        """Test that Linear layers and subclasses become int8 with close outputs."""
+        model = make_model()
+        inputs = torch.randn(4, 64)
+        expected = model(inputs)
+
+        quantized = quantize_linear_layers(model)
+
+        assert isinstance(quantized[0], torch.ao.nn.quantized.dynamic.Linear)
+        assert isinstance(quantized[2], torch.ao.nn.quantized.dynamic.Linear)
+        assert torch.allclose(quantized(inputs), expected, atol=0.05)
+
+
+def describe(model):
+    """Architecture of a model made by make_model()."""
+    return {"in_features": model[0].in_features}
+
+
+def build(architecture):
+    """Untrained model with a described architecture."""
+    return torch.nn.Sequential(
+        torch.nn.Linear(architecture["in_features"], 128),
+        torch.nn.ReLU(),
+        CastingLinear(128, 16),
+    )
+
+
+class Exploit:
+    """Pickled object that records being unpickled."""
+
+    ran = False
+
+    def __reduce__(self):
+        return (setattr, (Exploit, "ran", True))
+
+
+class TestQuantizedModelCache:
+    """Test the on-disk cache of quantized models."""
+
+    def test_quantized_once_then_loaded(self, tmp_path):
+        """Test that a cached model is loaded without loading the fp32 model."""
+        cache = QuantizedModelCache(tmp_path)
+        loads = []
+
+        def load_float():
+            loads.append(1)
+            return make_model()
+
+        first = cache.load_or_quantize(
+            "tiny:cpu:qint8", "lib1", load_float, describe, build
+        )
+        second = cache.load_or_quantize(
+            "tiny:cpu:qint8", "lib1", load_float, describe, build
+        )
+
+        assert len(loads) == 1
+        assert cache.model_path("tiny:cpu:qint8", "lib1").is_file()
+        assert isinstance(second[2], torch.ao.nn.quantized.dynamic.Linear)
+        inputs = torch.randn(2, 64)
+        assert torch.equal(first(inputs), second(inputs))
+
+    def test_library_version_in_path(self, tmp_path):
+        """Test that models built by another library version are not reused."""
+        cache = QuantizedModelCache(tmp_path)
+
+        assert cache.model_path("tiny", "lib1") != cache.model_path("tiny", "lib2")
+
+    def test_planted_pickle_not_executed(self, tmp_path):
+        """Test that a cache file with arbitrary objects is not unpickled."""
+        cache = QuantizedModelCache(tmp_path)
+        path = cache.model_path("tiny:cpu:qint8", "lib1")
+        torch.save({"architecture": Exploit(), "state_dict": {}}, path)
+
+        model = cache.load_or_quantize(
+            "tiny:cpu:qint8", "lib1", make_model, describe, build
+        )
+
+        assert not Exploit.ran
+        assert isinstance(model[0], torch.ao.nn.quantized.dynamic.Linear)
+
+    def test_unreadable_cache_file_rebuilt(self, tmp_path):
+        """Test that a corrupt cache file is replaced by quantizing again."""
+        cache = QuantizedModelCache(tmp_path)
+        cache.model_path("tiny:cpu:qint8", "lib1").write_bytes(b"not a model")
+
+        model = cache.load_or_quantize(
+            "tiny:cpu:qint8", "lib1", make_model, describe, build
+        )
+
+        assert isinstance(model[0], torch.ao.nn.quantized.dynamic.Linear)
+        cached = cache.load_or_quantize(
+            "tiny:cpu:qint8", "lib1", lambda: None, describe, build
+        )
+        assert isinstance(cached[0], torch.ao.nn.quantized.dynamic.Linear)
+
+
+class TestBenchmark:
+    """Test benchmarking quantized models."""
+
+    def test_benchmark_reports_size_and_accuracy(self):
+        """Test that the benchmark compares quantized outputs with fp32 ones."""
+        float_model = make_model()
+        quantized = quantize_linear_layers(make_model())
+        samples = [torch.randn(1, 64) for _ in range(3)]
+
+        benchmark = benchmark_quantization(
+            float_model,
+            quantized,
+            samples,
+            lambda model, x: model(x).argmax().item(),
+            lambda expected, actual: float(expected == actual),
+        )
+
+        assert benchmark.samples == 3
+        assert benchmark.size_ratio < 0.5
+        assert 0.0 <= benchmark.accuracy_delta <= 1.0
+        assert benchmark.to_dict()["speedup"] == benchmark.speedup
+
+    def test_word_agreement(self):
+        """Test that text agreement is one minus the word error rate."""
+        assert word_agreement("a cat on a mat", "A cat on a mat") == 1.0
+        assert word_agreement("a cat on a mat", "a cat in a mat") == 0.8
+        assert word_agreement("a cat", "") == 0.0
+        assert word_agreement("", "") == 1.0
@@ -0,0 +1,281 @@
+"""Tests for the whole-analysis result cache."""
+
+import os
+import time
+from unittest.mock import patch
+
+import pytest
+
+from deep_brief.core.audio_extractor import AudioExtractor, AudioInfo
+from deep_brief.core.pipeline_coordinator import PipelineCoordinator
+from deep_brief.core.result_cache import (
+    ResultCache,
+    fingerprint_config,
+    fingerprint_file,
+)
+from deep_brief.core.scene_detector import SceneDetectionResult, SceneDetector
+from deep_brief.core.video_processor import VideoInfo, VideoProcessor
+from deep_brief.utils.config import DeepBriefConfig, ProcessingConfig
+
+
+@pytest.fixture
+def config(tmp_path):
+    """Create a configuration with the cache under a temporary directory."""
+    return DeepBriefConfig(processing=ProcessingConfig(temp_dir=tmp_path / "temp"))
+
+
+@pytest.fixture
+def video_file(tmp_path):
+    """Create a file standing in for a video."""
+    path = tmp_path / "lecture.mp4"
+    path.write_bytes(os.urandom(4096))
+    return path
+
+
+class TestFingerprints:
+    """Test content and configuration fingerprints."""
+
+    def test_same_content_same_fingerprint(self, tmp_path, video_file):
+        """Test that a renamed copy keeps its fingerprint."""
+        copy = tmp_path / "renamed.mp4"
+        copy.write_bytes(video_file.read_bytes())
+
+        assert fingerprint_file(copy) == fingerprint_file(video_file)
+
+    def test_changed_content_changes_fingerprint(self, video_file):
+        """Test that editing the file changes the fingerprint."""
+        before = fingerprint_file(video_file)
+        data = bytearray(video_file.read_bytes())
+        data[0] ^= 0xFF
+        video_file.write_bytes(bytes(data))
+
+        assert fingerprint_file(video_file) != before
+
+    def test_large_file_sampled(self, tmp_path):
+        """Test that only sampled blocks of large files are hashed."""
+        path = tmp_path / "large.mp4"
+        data = bytearray(os.urandom(1024 * 1024))
+        path.write_bytes(bytes(data))
+        before = fingerprint_file(path, block_size=1024, sample_blocks=4)
+
+        # A byte between the sampled blocks does not change the fingerprint
+        data[300_000] ^= 0xFF
+        path.write_bytes(bytes(data))
+        assert fingerprint_file(path, block_size=1024, sample_blocks=4) == before
+
+        # The last block is always sampled
+        data[-1] ^= 0xFF
+        path.write_bytes(bytes(data))
+        assert fingerprint_file(path, block_size=1024, sample_blocks=4) != before
+
+    def test_config_fingerprint_ignores_processing(self, config):
+        """Test that only result-affecting sections are hashed."""
+        before = fingerprint_config(config)
+
+        config.processing.batch_max_workers = 8
+        assert fingerprint_config(config) == before
+
+        config.scene_detection.threshold = 0.6
+        assert fingerprint_config(config) != before
+
+    def test_config_fingerprint_includes_result_settings(self, config):
+        """Test that output and processing settings changing results are hashed."""
+        fingerprints = {fingerprint_config(config)}
+
+        config.output.frame_quality = 60
+        fingerprints.add(fingerprint_config(config))
+        config.processing.batch_frame_extraction = False
+        fingerprints.add(fingerprint_config(config))
+        config.processing.windowed_processing = True
+        fingerprints.add(fingerprint_config(config))
+
+        assert len(fingerprints) == 4
+
+
+class TestResultCache:
+    """Test ResultCache storage and eviction."""
+
+    def test_put_and_get(self, tmp_path):
+        """Test that stored results are returned on the next lookup."""
+        cache = ResultCache(tmp_path / "cache")
+
+        assert cache.get("abc") is None
+        cache.put("abc", {"scenes": 3})
+
+        assert cache.get("abc") == {"scenes": 3}
+        assert cache.get_stats()["hits"] == 1
+        assert cache.get_stats()["misses"] == 1
+
+    def test_lru_eviction(self, tmp_path):
+        """Test that the least recently used entry is evicted first."""
+        payload = b"x" * 400 * 1024
+        cache = ResultCache(tmp_path / "cache", max_size_mb=1)
+
+        cache.put("a", payload)
+        time.sleep(0.01)
+        cache.put("b", payload)
+        time.sleep(0.01)
+        cache.get("a")  # a is now most recently used
+        time.sleep(0.01)
+        cache.put("c", payload)  # evicts b
+
+        assert cache.get("a") == payload
+        assert cache.get("b") is None
+        assert cache.get("c") == payload
+        assert cache.get_stats()["evictions"] == 1
+
+    def test_unreadable_entry_discarded(self, tmp_path):
+        """Test that a corrupt entry counts as a miss and is removed."""
+        cache = ResultCache(tmp_path / "cache")
+        cache.put("abc", {"scenes": 3})
+        (tmp_path / "cache" / "abc.pkl").write_bytes(b"not a pickle")
+
+        assert cache.get("abc") is None
+        assert not (tmp_path / "cache" / "abc.pkl").exists()
+
+
+class TestCoordinatorResultCache:
+    """Test that the coordinator reuses stored results."""
+
+    @pytest.fixture
+    def video_info(self, video_file):
+        return VideoInfo(
+            file_path=video_file,
+            duration=60.0,
+            width=1280,
+            height=720,
+            fps=30.0,
+            format="mp4",
+            size_mb=0.1,
+            codec="h264",
+        )
+
+    @pytest.fixture
+    def scene_result(self):
+        return SceneDetectionResult(
+            scenes=[],
+            total_scenes=0,
+            detection_method="threshold",
+            threshold_used=0.4,
+            video_duration=60.0,
+            average_scene_duration=0.0,
+        )
+
+    @patch.object(SceneDetector, "detect_scenes")
+    @patch.object(VideoProcessor, "validate_file")
+    def test_unchanged_video_served_from_cache(
+        self, mock_validate, mock_detect_scenes, config, video_file, video_info, scene_result
+    ):
+        """Test that a resubmitted video runs no stages."""
+        mock_validate.return_value = video_info
+        mock_detect_scenes.return_value = scene_result
+
+        first = PipelineCoordinator(config).analyze_video(
+            video_file, extract_audio=False, extract_frames=False
+        )
+        second = PipelineCoordinator(config).analyze_video(
+            video_file, extract_audio=False, extract_frames=False
+        )
+
+        assert first.success and not first.from_cache
+        assert second.success and second.from_cache
+        assert second.scene_result == scene_result
+        assert second.video_info.file_path == video_file
+        mock_validate.assert_called_once()
+        mock_detect_scenes.assert_called_once()
+
+    @patch.object(SceneDetector, "detect_scenes")
+    @patch.object(VideoProcessor, "validate_file")
+    def test_cache_bypassed_or_invalidated(
+        self, mock_validate, mock_detect_scenes, config, video_file, video_info, scene_result
+    ):
+        """Test use_cache=False and config changes both re-run the analysis."""
+        mock_validate.return_value = video_info
+        mock_detect_scenes.return_value = scene_result
+        coordinator = PipelineCoordinator(config)
+
+        coordinator.analyze_video(video_file, extract_audio=False, extract_frames=False)
+        coordinator.analyze_video(
+            video_file, extract_audio=False, extract_frames=False, use_cache=False
+        )
+        config.scene_detection.threshold = 0.6
+        result = coordinator.analyze_video(
+            video_file, extract_audio=False, extract_frames=False
+        )
+
+        assert not result.from_cache
+        assert mock_detect_scenes.call_count == 3
+
+    @patch.object(SceneDetector, "detect_scenes")
+    @patch.object(AudioExtractor, "extract_audio")
+    @patch.object(VideoProcessor, "validate_file")
+    def test_results_with_errors_not_cached(
+        self,
+        mock_validate,
+        mock_extract_audio,
+        mock_detect_scenes,
+        config,
+        video_file,
+        video_info,
+        scene_result,
+    ):
+        """Test that partially failed analyses are retried."""
+        from deep_brief.core.exceptions import AudioProcessingError, ErrorCode
+
+        mock_validate.return_value = video_info
+        mock_extract_audio.side_effect = AudioProcessingError(
+            message="codec", error_code=ErrorCode.AUDIO_CODEC_ERROR
+        )
+        mock_detect_scenes.return_value = scene_result
+        coordinator = PipelineCoordinator(config)
+
+        coordinator.analyze_video(video_file, extract_frames=False)
+        result = coordinator.analyze_video(video_file, extract_frames=False)
+
+        assert not result.from_cache
+        assert mock_extract_audio.call_count == 2
+
+    @patch.object(SceneDetector, "detect_scenes")
+    @patch.object(AudioExtractor, "extract_audio")
+    @patch.object(VideoProcessor, "validate_file")
+    def test_result_with_missing_files_not_used(
+        self,
+        mock_validate,
+        mock_extract_audio,
+        mock_detect_scenes,
+        config,
+        tmp_path,
+        video_file,
+        video_info,
+        scene_result,
+    ):
+        """Test that a stored result whose audio file was removed is re-run."""
+        audio_file = tmp_path / "lecture_audio.wav"
+        audio_file.write_bytes(b"RIFF")
+        mock_validate.return_value = video_info
+        mock_extract_audio.return_value = AudioInfo(
+            file_path=audio_file,
+            duration=60.0,
+            sample_rate=16000,
+            channels=1,
+            size_mb=0.1,
+            format="wav",
+        )
+        mock_detect_scenes.return_value = scene_result
+        config.processing.stage_cache = False
+        coordinator = PipelineCoordinator(config)
+
+        coordinator.analyze_video(video_file, extract_frames=False)
+        cached = coordinator.analyze_video(video_file, extract_frames=False)
+        audio_file.unlink()
+        result = coordinator.analyze_video(video_file, extract_frames=False)
+
+        assert cached.from_cache
+        assert not result.from_cache
+        assert mock_extract_audio.call_count == 2
+
+    def test_cache_disabled_in_config(self, config):
+        """Test that the cache can be switched off."""
+        config.processing.result_cache = False
+
+        assert PipelineCoordinator(config).result_cache is None
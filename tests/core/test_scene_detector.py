@@ -2,7 +2,7 @@
 
 import tempfile
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import ffmpeg
 import pytest
@@ -239,6 +239,40 @@ class TestThresholdSceneDetection:
         )
 
 
+class TestAsyncSceneDetection:
+    """Test scene detection on an event loop."""
+
+    @pytest.mark.asyncio
+    async def test_threshold_pass_parses_async_log(
+        self, scene_detector, mock_video_info
+    ):
+        """Test that the threshold pass reads scene changes from async ffmpeg."""
+        log = (
+            "[scdet @ 0x1] lavfi.scd.score: 45.0, lavfi.scd.time: 30.5\n"
+            "[scdet @ 0x1] lavfi.scd.score: 52.0, lavfi.scd.time: 65.2\n"
+        )
+        with patch(
+            "deep_brief.core.scene_detector.async_run_and_collect_log",
+            AsyncMock(return_value=log),
+        ) as run:
+            result = await scene_detector.detect_scenes_async(mock_video_info)
+
+        run.assert_awaited_once()
+        assert result.detection_method == "threshold"
+        assert [scene.start_time for scene in result.scenes] == [0.0, 30.5, 65.2]
+
+    @pytest.mark.asyncio
+    async def test_ffmpeg_error_uses_fallback(self, scene_detector, mock_video_info):
+        """Test that a failed async pass falls back to fixed intervals."""
+        with patch(
+            "deep_brief.core.scene_detector.async_run_and_collect_log",
+            AsyncMock(side_effect=ffmpeg.Error("ffmpeg", b"", b"bad input")),
+        ):
+            result = await scene_detector.detect_scenes_async(mock_video_info)
+
+        assert result.detection_method == "fallback"
+
+
 class TestAdaptiveSceneDetection:
     """Test adaptive scene detection."""
 
@@ -261,27 +295,297 @@ class TestAdaptiveSceneDetection:
             mock_adaptive.assert_called_once_with(mock_video_info, None)
 
     @patch("deep_brief.core.scene_detector.SceneDetector._run_scene_detection")
+    @patch("deep_brief.core.scene_detector.SceneDetector._run_scene_scoring")
     def test_adaptive_tries_multiple_thresholds(
-        self, mock_run_detection, mock_config, mock_video_info
+        self, mock_run_scoring, mock_run_detection, mock_config, mock_video_info
     ):
-        """Test that adaptive method tries multiple thresholds."""
+        """Test that adaptive method tries multiple thresholds on one scoring pass."""
         mock_config.scene_detection.method = "adaptive"
+        mock_config.scene_detection.adaptive_sweep_steps = 4
         detector = SceneDetector(config=mock_config)
 
-        # Mock different results for different thresholds
-        mock_run_detection.side_effect = [
-            [0.0, 10.0, 20.0, 30.0, 40.0, 50.0],  # Too many scenes (0.2 threshold)
-            [0.0, 30.0, 60.0, 90.0],  # Good result (0.4 threshold)
-            [0.0, 60.0],  # Too few scenes (0.6 threshold)
-            [0.0],  # No scenes (0.8 threshold)
+        # Thresholds tried: 0.2, 0.4, 0.6, 0.8
+        mock_run_scoring.return_value = [
+            (10.0, 0.25),
+            (20.0, 0.3),
+            (30.0, 0.7),  # Survives up to 0.6
+            (40.0, 0.21),
+            (50.0, 0.22),
+            (60.0, 0.5),
+            (90.0, 0.45),
         ]
+        # 0.2 -> 8 scenes, 0.4 -> 4 scenes, 0.6 -> 2 scenes, 0.8 -> 1 scene
 
         result = detector._detect_scenes_adaptive(mock_video_info)
 
-        # Should have called _run_scene_detection multiple times
-        assert mock_run_detection.call_count >= 2
+        # One decode, thresholds applied in memory
+        mock_run_scoring.assert_called_once()
+        mock_run_detection.assert_not_called()
         assert result.detection_method == "adaptive"
-        assert result.total_scenes == 4  # Should pick the good result
+        assert result.total_scenes == 8  # Most scenes within the 2-20 range
+        assert result.threshold_used == pytest.approx(0.2)
+
+    @patch("deep_brief.core.scene_detector.SceneDetector._run_scene_scoring")
+    def test_adaptive_excludes_too_many_scenes(
+        self, mock_run_scoring, mock_config, mock_video_info
+    ):
+        """Test that thresholds producing more than 20 scenes are skipped."""
+        mock_config.scene_detection.method = "adaptive"
+        mock_config.scene_detection.min_scene_duration = 0.5
+        mock_config.scene_detection.adaptive_sweep_steps = 4
+        detector = SceneDetector(config=mock_config)
+
+        # 30 weak cuts every 4s plus 3 strong ones
+        scores = [(4.0 * i, 0.25) for i in range(1, 30)]
+        scores += [(30.0 + 0.5, 0.9), (60.0 + 0.5, 0.9), (90.0 + 0.5, 0.9)]
+        mock_run_scoring.return_value = scores
+
+        result = detector._detect_scenes_adaptive(mock_video_info)
+
+        assert result.total_scenes == 4
+        assert result.threshold_used == pytest.approx(0.4)
+
+    @patch("deep_brief.core.scene_detector.SceneDetector._run_scene_scoring")
+    def test_adaptive_target_scene_count_bisection(
+        self, mock_run_scoring, mock_config, mock_video_info
+    ):
+        """Test that bisection finds a threshold giving the target scene count."""
+        mock_config.scene_detection.method = "adaptive"
+        mock_config.scene_detection.target_scene_count = 5
+        detector = SceneDetector(config=mock_config)
+
+        mock_run_scoring.return_value = [
+            (10.0 * i, score)
+            for i, score in enumerate([5.0, 40.0, 12.0, 33.0, 8.0, 21.0, 27.0], 1)
+        ]
+
+        result = detector._detect_scenes_adaptive(mock_video_info)
+
+        assert result.total_scenes == 5
+        # Cuts kept are the four strongest: 40, 33, 27, 21
+        assert [s.start_time for s in result.scenes] == [0.0, 20.0, 40.0, 60.0, 70.0]
+        assert 12.0 < result.threshold_used <= 21.0
+
+    @patch("deep_brief.core.scene_detector.SceneDetector._run_scene_scoring")
+    def test_adaptive_scoring_failure_uses_fallback(
+        self, mock_run_scoring, mock_config, mock_video_info
+    ):
+        """Test fallback when the scoring pass fails."""
+        mock_config.scene_detection.method = "adaptive"
+        detector = SceneDetector(config=mock_config)
+        mock_run_scoring.side_effect = RuntimeError("Scene scoring failed")
+        progress_callback = MagicMock()
+
+        result = detector._detect_scenes_adaptive(mock_video_info, progress_callback)
+
+        assert result.detection_method == "fallback"
+        progress_callback.assert_called_with(1.0)
+
+    @patch("ffmpeg.run")
+    def test_run_scene_scoring(self, mock_run, scene_detector, mock_video_info):
+        """Test the single scdet pass at threshold 0."""
+        mock_run.return_value = (
+            b"",
+            b"[scdet @ 0x1] lavfi.scd.score: 0.412, lavfi.scd.time: 0.2\n"
+            b"[scdet @ 0x1] lavfi.scd.score: 38.900, lavfi.scd.time: 12.5\n",
+        )
+
+        scores = scene_detector._run_scene_scoring(mock_video_info)
+
+        assert scores == [(0.2, 0.412), (12.5, 38.9)]
+        args = mock_run.call_args[0][0].get_args()
+        assert "scdet=threshold=0" in args[args.index("-filter_complex") + 1]
+
+
+class TestDetectionProxy:
+    """Test the reduced resolution/frame rate detection proxy."""
+
+    @patch("ffmpeg.run")
+    def test_proxy_filters_prepended(self, mock_run, scene_detector, mock_video_info):
+        """Test that fps and scale filters run before scdet."""
+        mock_run.return_value = (b"", b"")
+
+        scene_detector._run_scene_scoring(mock_video_info)
+
+        args = mock_run.call_args[0][0].get_args()
+        filter_graph = args[args.index("-filter_complex") + 1]
+        assert "fps=fps=5.0" in filter_graph
+        assert "scale=320:-2" in filter_graph
+        assert (
+            filter_graph.index("fps=")
+            < filter_graph.index("scale=")
+            < filter_graph.index("scdet=")
+        )
+        assert "-skip_frame" not in args
+
+    @patch("ffmpeg.run")
+    def test_keyframes_only(self, mock_run, mock_config, mock_video_info):
+        """Test keyframe-only decoding is passed as an input option."""
+        mock_config.scene_detection.proxy_keyframes_only = True
+        detector = SceneDetector(config=mock_config)
+        mock_run.return_value = (b"", b"")
+
+        detector._run_scene_scoring(mock_video_info)
+
+        args = mock_run.call_args[0][0].get_args()
+        assert args[args.index("-skip_frame") + 1] == "nokey"
+        assert args.index("-skip_frame") < args.index("-i")
+
+    @patch("ffmpeg.run")
+    def test_proxy_disabled(self, mock_run, mock_config, mock_video_info):
+        """Test full-resolution detection when the proxy is turned off."""
+        mock_config.scene_detection.proxy_width = 0
+        mock_config.scene_detection.proxy_fps = 0.0
+        detector = SceneDetector(config=mock_config)
+        mock_run.return_value = (
+            b"",
+            b"[scdet @ 0x1] lavfi.scd.score: 20.0, lavfi.scd.time: 12.345\n",
+        )
+
+        scores = detector._run_scene_scoring(mock_video_info)
+
+        filter_graph = mock_run.call_args[0][0].get_args()
+        filter_graph = filter_graph[filter_graph.index("-filter_complex") + 1]
+        assert "fps=" not in filter_graph
+        assert "scale=" not in filter_graph
+        assert scores == [(12.345, 20.0)]
+
+    def test_map_to_source_time(self, mock_config, mock_video_info):
+        """Test that proxy times snap onto the source frame grid."""
+        mock_video_info.fps = 25.0
+        detector = SceneDetector(config=mock_config)
+
+        assert detector._map_to_source_time(12.4, mock_video_info) == 12.4
+        assert detector._map_to_source_time(12.41, mock_video_info) == 12.4
+        assert detector._map_to_source_time(12.43, mock_video_info) == 12.44
+        assert detector._map_to_source_time(500.0, mock_video_info) == 120.0
+
+
+def fake_shard_run(window_logs):
+    """Build an ffmpeg.run side effect returning a log per window start."""
+
+    def run(stream, **kwargs):  # noqa: ARG001
+        args = stream.get_args()
+        window_start = float(args[args.index("-ss") + 1])
+        return b"", window_logs[window_start].encode()
+
+    return run
+
+
+class TestShardedDetection:
+    """Test parallel time-sharded scene detection."""
+
+    @pytest.fixture
+    def sharded_config(self, mock_config):
+        mock_config.scene_detection.parallel_shards = 2
+        mock_config.scene_detection.min_shard_duration = 60.0
+        mock_config.scene_detection.shard_overlap_seconds = 2.0
+        return mock_config
+
+    def test_plan_shards(self, mock_config):
+        """Test window layout, overlap and the minimum window length."""
+        mock_config.scene_detection.parallel_shards = 4
+        mock_config.scene_detection.min_shard_duration = 30.0
+        detector = SceneDetector(config=mock_config)
+
+        assert detector._plan_shards(120.0) == [
+            (0.0, 0.0, 30.0),
+            (28.0, 30.0, 60.0),
+            (58.0, 60.0, 90.0),
+            (88.0, 90.0, 120.0),
+        ]
+        # Too short for four 30s windows
+        assert len(detector._plan_shards(70.0)) == 2
+        assert detector._plan_shards(50.0) == []
+
+        mock_config.scene_detection.parallel_shards = 1
+        assert detector._plan_shards(120.0) == []
+
+    @patch("ffmpeg.run")
+    def test_threshold_detection_stitches_windows(
+        self, mock_run, sharded_config, mock_video_info
+    ):
+        """Test that window results are offset, deduplicated and merged."""
+        mock_run.side_effect = fake_shard_run(
+            {
+                0.0: (
+                    "[scdet @ 0x1] lavfi.scd.score: 41.0, lavfi.scd.time: 30.4\n"
+                    "[scdet @ 0x1] lavfi.scd.score: 20.0, lavfi.scd.time: 59.8\n"
+                ),
+                58.0: (
+                    # Lead-in frames belong to the previous window
+                    "[scdet @ 0x2] lavfi.scd.score: 15.0, lavfi.scd.time: 1.2\n"
+                    # Same cut as 59.8 seen one proxy frame later
+                    "[scdet @ 0x2] lavfi.scd.score: 35.0, lavfi.scd.time: 2.0\n"
+                    "[scdet @ 0x2] lavfi.scd.score: 44.0, lavfi.scd.time: 17.2\n"
+                ),
+            }
+        )
+        detector = SceneDetector(config=sharded_config)
+        progress_callback = MagicMock()
+
+        result = detector.detect_scenes(mock_video_info, progress_callback)
+
+        assert mock_run.call_count == 2
+        assert result.detection_method == "threshold"
+        assert [scene.start_time for scene in result.scenes] == [
+            0.0,
+            30.4,
+            60.0,
+            75.2,
+        ]
+        assert result.scenes[-1].end_time == 120.0
+        assert progress_callback.call_args_list[-1][0][0] == 1.0
+
+        args = mock_run.call_args_list[0][0][0].get_args()
+        assert "scdet=threshold=0.4" in args[args.index("-filter_complex") + 1]
+        assert args.index("-ss") < args.index("-i")
+
+    @patch("ffmpeg.run")
+    def test_scoring_keeps_every_frame(
+        self, mock_run, sharded_config, mock_video_info
+    ):
+        """Test that per-frame scores are not merged like duplicate cuts."""
+        mock_run.side_effect = fake_shard_run(
+            {
+                0.0: (
+                    "[scdet @ 0x1] lavfi.scd.score: 1.0, lavfi.scd.time: 59.6\n"
+                    "[scdet @ 0x1] lavfi.scd.score: 2.0, lavfi.scd.time: 59.8\n"
+                ),
+                58.0: (
+                    "[scdet @ 0x2] lavfi.scd.score: 2.5, lavfi.scd.time: 1.8\n"
+                    "[scdet @ 0x2] lavfi.scd.score: 3.0, lavfi.scd.time: 2.0\n"
+                    "[scdet @ 0x2] lavfi.scd.score: 4.0, lavfi.scd.time: 2.2\n"
+                ),
+            }
+        )
+        detector = SceneDetector(config=sharded_config)
+
+        scores = detector._run_sharded_scoring(mock_video_info, 0)
+
+        assert scores == [(59.6, 1.0), (59.8, 2.0), (60.0, 3.0), (60.2, 4.0)]
+
+    @patch("ffmpeg.run")
+    def test_window_failure_uses_fallback(
+        self, mock_run, sharded_config, mock_video_info
+    ):
+        """Test that a failed window falls back like a failed single pass."""
+        mock_run.side_effect = ffmpeg.Error("ffmpeg", b"", b"decode failed")
+        detector = SceneDetector(config=sharded_config)
+
+        result = detector.detect_scenes(mock_video_info)
+
+        assert result.detection_method == "fallback"
+
+    def test_sharded_videos_skip_single_pass(self, sharded_config, mock_video_info):
+        """Test that long videos are not routed through the shared pass."""
+        detector = SceneDetector(config=sharded_config)
+
+        assert detector.supports_single_pass()
+        assert not detector.supports_single_pass(mock_video_info)
+
+        mock_video_info.duration = 90.0
+        assert detector.supports_single_pass(mock_video_info)
 
 
 class TestSceneDetectionExecution:
@@ -0,0 +1,619 @@
+"""Tests for the stage graph scheduler."""
+
+import asyncio
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from deep_brief.core.cancellation import CancellationToken, raise_if_cancelled
+from deep_brief.core.progress_tracker import CompositeProgressTracker, ProgressTracker
+from deep_brief.core.stage_scheduler import (
+    RESOURCE_FFMPEG,
+    RESOURCE_MODEL_MEMORY,
+    Stage,
+    StageCachePolicy,
+    StageGraph,
+    StageRunCancelledError,
+    StageScheduler,
+    StageStatus,
+)
+
+
+def make_stage(name, inputs=(), outputs=None, run=None, **kwargs):
+    """Create a stage whose outputs are derived from its inputs."""
+    outputs = outputs if outputs is not None else (name,)
+
+    def default_run(stage_inputs, progress_callback):  # noqa: ARG001
+        return {output: f"{name}({','.join(sorted(stage_inputs))})" for output in outputs}
+
+    return Stage(
+        name=name,
+        run=run or default_run,
+        inputs=tuple(inputs),
+        outputs=tuple(outputs),
+        **kwargs,
+    )
+
+
+class ConcurrencyProbe:
+    """Stage function that records how many stages overlap."""
+
+    def __init__(self, duration=0.05):
+        self.duration = duration
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, stage_inputs, progress_callback):  # noqa: ARG002
+        with self._lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        time.sleep(self.duration)
+        with self._lock:
+            self.active -= 1
+        return {}
+
+
+class TestStageGraph:
+    """Test StageGraph validation."""
+
+    def test_topological_order(self):
+        """Test that stages are ordered after their producers."""
+        graph = StageGraph(
+            [
+                make_stage("frames", inputs=["scenes"]),
+                make_stage("scenes", inputs=["video"]),
+                make_stage("video", inputs=["path"]),
+            ]
+        )
+
+        order = [stage.name for stage in graph.validate(["path"])]
+
+        assert order == ["video", "scenes", "frames"]
+
+    def test_missing_producer(self):
+        """Test that an input nobody produces is rejected."""
+        graph = StageGraph([make_stage("audio", inputs=["video_info"])])
+
+        with pytest.raises(ValueError, match="video_info"):
+            graph.validate()
+
+    def test_cycle_detected(self):
+        """Test that cyclic dependencies are rejected."""
+        graph = StageGraph(
+            [make_stage("a", inputs=["b"]), make_stage("b", inputs=["a"])]
+        )
+
+        with pytest.raises(ValueError, match="cycle"):
+            graph.validate()
+
+    def test_duplicate_output(self):
+        """Test that two producers of one artifact are rejected."""
+        graph = StageGraph([make_stage("a", outputs=["x"])])
+
+        with pytest.raises(ValueError, match="'x'"):
+            graph.add_stage(make_stage("b", outputs=["x"]))
+
+
+class TestStageScheduler:
+    """Test StageScheduler."""
+
+    def test_artifacts_flow_between_stages(self):
+        """Test that outputs are passed to dependent stages."""
+        graph = StageGraph(
+            [
+                make_stage("video", inputs=["path"]),
+                make_stage("audio", inputs=["video"]),
+                make_stage("report", inputs=["video", "audio"]),
+            ]
+        )
+
+        run = StageScheduler(graph).run({"path": "in.mp4"})
+
+        assert run.artifacts["report"] == "report(audio,video)"
+        assert all(
+            result.status == StageStatus.COMPLETED for result in run.results.values()
+        )
+
+    def test_independent_stages_run_concurrently(self):
+        """Test that stages with no dependency between them overlap."""
+        probe = ConcurrencyProbe()
+        graph = StageGraph(
+            [make_stage(name, run=probe, outputs=[]) for name in ("a", "b", "c")]
+        )
+
+        StageScheduler(graph).run()
+
+        assert probe.max_active == 3
+
+    def test_resource_limit_respected(self):
+        """Test that stages never hold more of a resource than the limit."""
+        probe = ConcurrencyProbe()
+        graph = StageGraph(
+            [
+                make_stage(name, run=probe, outputs=[], resources={RESOURCE_FFMPEG: 1})
+                for name in ("a", "b", "c", "d")
+            ]
+        )
+
+        StageScheduler(graph, resource_limits={RESOURCE_FFMPEG: 2}).run()
+
+        assert probe.max_active == 2
+
+    def test_oversized_request_runs_alone(self):
+        """Test that a request above the limit is clamped instead of blocking."""
+        probe = ConcurrencyProbe()
+        graph = StageGraph(
+            [
+                make_stage(
+                    "large", run=probe, outputs=[], resources={RESOURCE_MODEL_MEMORY: 8000}
+                ),
+                make_stage(
+                    "small", run=probe, outputs=[], resources={RESOURCE_MODEL_MEMORY: 500}
+                ),
+            ]
+        )
+
+        run = StageScheduler(graph, resource_limits={RESOURCE_MODEL_MEMORY: 4096}).run()
+
+        assert probe.max_active == 1
+        assert run.results["large"].status == StageStatus.COMPLETED
+
+    def test_max_workers_one_runs_in_order(self):
+        """Test sequential execution in graph order."""
+        order = []
+
+        def record(name):
+            def run(stage_inputs, progress_callback):  # noqa: ARG001
+                order.append(name)
+                return {}
+
+            return run
+
+        graph = StageGraph(
+            [make_stage(name, run=record(name), outputs=[]) for name in ("a", "b", "c")]
+        )
+
+        StageScheduler(graph, max_workers=1).run()
+
+        assert order == ["a", "b", "c"]
+
+    def test_none_input_skips_dependents(self):
+        """Test that a missing required input skips the whole chain."""
+        graph = StageGraph(
+            [
+                make_stage("audio", run=lambda i, p: {"audio": None}),  # noqa: ARG005
+                make_stage("transcribe", inputs=["audio"]),
+                make_stage("speech", inputs=["transcribe"]),
+                make_stage(
+                    "report",
+                    outputs=["report"],
+                    run=lambda i, p: {"report": dict(i)},  # noqa: ARG005
+                    optional_inputs=("speech",),
+                ),
+            ]
+        )
+
+        run = StageScheduler(graph).run()
+
+        assert run.results["transcribe"].status == StageStatus.SKIPPED
+        assert run.results["speech"].status == StageStatus.SKIPPED
+        assert "audio" in run.results["transcribe"].skipped_reason
+        assert run.artifacts["report"] == {"speech": None}
+
+    def test_optional_stage_failure_recorded(self):
+        """Test that an optional failure does not stop other stages."""
+
+        def fail(stage_inputs, progress_callback):  # noqa: ARG001
+            raise RuntimeError("model unavailable")
+
+        graph = StageGraph(
+            [
+                make_stage("caption", run=fail, required=False),
+                make_stage("after_caption", inputs=["caption"]),
+                make_stage("ocr"),
+            ]
+        )
+
+        run = StageScheduler(graph).run()
+
+        assert run.results["caption"].status == StageStatus.FAILED
+        assert str(run.results["caption"].error) == "model unavailable"
+        assert run.results["after_caption"].status == StageStatus.SKIPPED
+        assert run.results["ocr"].status == StageStatus.COMPLETED
+        assert [r.name for r in run.failed_stages()] == ["caption"]
+
+    def test_required_stage_failure_raises(self):
+        """Test that a required failure stops new stages and re-raises."""
+        later = MagicMock(return_value={})
+
+        def fail(stage_inputs, progress_callback):  # noqa: ARG001
+            raise ValueError("invalid video")
+
+        graph = StageGraph(
+            [
+                make_stage("validate", run=fail),
+                make_stage("audio", inputs=["validate"], run=later),
+            ]
+        )
+
+        with pytest.raises(ValueError, match="invalid video"):
+            StageScheduler(graph).run()
+
+        later.assert_not_called()
+
+    def test_cancel_returns_without_waiting(self):
+        """Test that a cancelled run stops scheduling and does not wait for stages."""
+        token = CancellationToken()
+        release = threading.Event()
+        later = MagicMock(return_value={})
+
+        def uninterruptible(stage_inputs, progress_callback):  # noqa: ARG001
+            token.cancel("user request")
+            release.wait(5)  # Like a model call that cannot check the token
+            return {"slow": 1}
+
+        def checks_token(stage_inputs, progress_callback):  # noqa: ARG001
+            raise_if_cancelled()
+            return {"fast": 1}
+
+        graph = StageGraph(
+            [
+                make_stage("first"),
+                make_stage("slow", inputs=["first"], run=uninterruptible),
+                make_stage("fast", inputs=["first"], run=checks_token),
+                make_stage("later", inputs=["slow", "fast"], run=later),
+            ]
+        )
+
+        start = time.monotonic()
+        try:
+            with pytest.raises(StageRunCancelledError, match="user") as exc_info:
+                StageScheduler(graph).run(cancel_token=token)
+        finally:
+            release.set()
+
+        assert time.monotonic() - start < 4
+        assert exc_info.value.artifacts["first"] == "first()"
+        later.assert_not_called()
+
+    def test_progress_tracked_per_stage(self):
+        """Test that stage progress drives the workflow to completion."""
+        tracker = ProgressTracker()
+        updates = []
+        tracker.add_callback(lambda update: updates.append(update.progress))
+        composite = CompositeProgressTracker(tracker)
+        composite.start_workflow(
+            "workflow", "Test", [("a", "A", 0.5), ("b", "B", 0.3), ("c", "C", 0.2)]
+        )
+
+        def report_half(stage_inputs, progress_callback):  # noqa: ARG001
+            progress_callback(0.5)
+            return {"a": None}
+
+        graph = StageGraph(
+            [
+                make_stage("a", run=report_half),
+                make_stage("b", inputs=["a"]),  # skipped: a produced None
+                make_stage("c"),
+            ]
+        )
+
+        StageScheduler(graph).run(progress_tracker=composite)
+
+        assert updates[-1] == pytest.approx(1.0)
+        assert all(0.0 <= progress <= 1.0 for progress in updates)
+
+
+class MemoryStageCache:
+    """In-memory stage cache."""
+
+    def __init__(self):
+        self.entries = {}
+
+    def contains(self, key):
+        return key in self.entries
+
+    def get(self, key):
+        return self.entries.get(key)
+
+    def put(self, key, outputs):
+        self.entries[key] = outputs
+
+
+class TestStageCaching:
+    """Test loading stage outputs from a stage cache."""
+
+    @staticmethod
+    def counting_stage(name, calls, inputs=(), settings=None, **policy):
+        """Create a cached stage that counts its runs."""
+
+        def run(stage_inputs, progress_callback):  # noqa: ARG001
+            calls[name] = calls.get(name, 0) + 1
+            return {name: f"{name}({','.join(sorted(stage_inputs))})"}
+
+        return make_stage(
+            name,
+            inputs=inputs,
+            run=run,
+            cache=StageCachePolicy(settings=settings or {}, **policy),
+        )
+
+    def build_graph(self, calls, threshold=0.4, filler_words=("um",)):
+        return StageGraph(
+            [
+                self.counting_stage("audio", calls, inputs=["path"]),
+                self.counting_stage(
+                    "scenes", calls, inputs=["path"], settings={"threshold": threshold}
+                ),
+                self.counting_stage("transcribe", calls, inputs=["audio"]),
+                self.counting_stage(
+                    "speech",
+                    calls,
+                    inputs=["transcribe", "scenes"],
+                    settings={"filler_words": list(filler_words)},
+                ),
+            ]
+        )
+
+    def test_unchanged_stages_loaded(self):
+        """Test that a second run loads every stage instead of running it."""
+        cache = MemoryStageCache()
+        calls = {}
+
+        first = StageScheduler(self.build_graph(calls), cache=cache).run(
+            {"path": "in.mp4"}, artifact_keys={"path": "abc"}
+        )
+        second = StageScheduler(self.build_graph(calls), cache=cache).run(
+            {"path": "in.mp4"}, artifact_keys={"path": "abc"}
+        )
+
+        assert calls == {"audio": 1, "scenes": 1, "transcribe": 1, "speech": 1}
+        assert second.artifacts == first.artifacts
+        assert len(second.cached_stages()) == 4
+        assert not first.cached_stages()
+
+    def test_setting_change_reruns_downstream_only(self):
+        """Test that a changed setting invalidates its stage and dependents."""
+        cache = MemoryStageCache()
+        calls = {}
+
+        StageScheduler(self.build_graph(calls), cache=cache).run(
+            {"path": "in.mp4"}, artifact_keys={"path": "abc"}
+        )
+        StageScheduler(
+            self.build_graph(calls, filler_words=("um", "like")), cache=cache
+        ).run({"path": "in.mp4"}, artifact_keys={"path": "abc"})
+        StageScheduler(self.build_graph(calls, threshold=0.6), cache=cache).run(
+            {"path": "in.mp4"}, artifact_keys={"path": "abc"}
+        )
+
+        assert calls == {"audio": 1, "scenes": 2, "transcribe": 1, "speech": 3}
+
+    def test_new_input_misses(self):
+        """Test that a different input key re-runs everything."""
+        cache = MemoryStageCache()
+        calls = {}
+
+        for key in ("abc", "def"):
+            StageScheduler(self.build_graph(calls), cache=cache).run(
+                {"path": "in.mp4"}, artifact_keys={"path": key}
+            )
+
+        assert set(calls.values()) == {2}
+
+    def test_unkeyed_input_not_cached(self):
+        """Test that stages are not cached without a key for their inputs."""
+        cache = MemoryStageCache()
+        calls = {}
+
+        StageScheduler(self.build_graph(calls), cache=cache).run({"path": "in.mp4"})
+
+        assert not cache.entries
+
+    def test_unstored_required_output_forces_run(self):
+        """Test that a stage is re-run when a dependent needs an unstored output."""
+        cache = MemoryStageCache()
+        calls = {}
+
+        def build():
+            return StageGraph(
+                [
+                    self.counting_stage("quality", calls, stored_outputs=()),
+                    make_stage("caption", inputs=["quality"]),
+                ]
+            )
+
+        for _ in range(2):
+            StageScheduler(build(), cache=cache, max_workers=1).run(
+                artifact_keys={}
+            )
+
+        assert calls["quality"] == 2
+
+    def test_outputs_stored_only_if_policy_allows(self):
+        """Test that store_if keeps outputs out of the cache."""
+        cache = MemoryStageCache()
+        calls = {}
+
+        for _ in range(2):
+            StageScheduler(
+                StageGraph(
+                    [
+                        self.counting_stage(
+                            "audio", calls, inputs=["path"], store_if=lambda _: False
+                        )
+                    ]
+                ),
+                cache=cache,
+            ).run({"path": "in.mp4"}, artifact_keys={"path": "abc"})
+
+        assert calls["audio"] == 2
+        assert not cache.entries
+
+    def test_cached_stage_reserves_no_resources(self):
+        """Test that loading from the cache does not wait for resources."""
+        loaded = threading.Event()
+        overlapped = []
+
+        class SignallingCache(MemoryStageCache):
+            def get(self, key):
+                loaded.set()
+                return super().get(key)
+
+        def blip(stage_inputs, progress_callback):  # noqa: ARG001
+            overlapped.append(loaded.wait(timeout=2.0))
+            return {}
+
+        whisper = make_stage(
+            "whisper",
+            run=lambda i, p: {"whisper": "text"},  # noqa: ARG005
+            resources={RESOURCE_MODEL_MEMORY: 4000},
+            cache=StageCachePolicy(),
+        )
+        limits = {RESOURCE_MODEL_MEMORY: 4096}
+        cache = SignallingCache()
+        StageScheduler(StageGraph([whisper]), resource_limits=limits, cache=cache).run()
+        loaded.clear()
+
+        graph = StageGraph(
+            [
+                make_stage(
+                    "blip", run=blip, outputs=[], resources={RESOURCE_MODEL_MEMORY: 4000}
+                ),
+                whisper,
+            ]
+        )
+        run = StageScheduler(graph, resource_limits=limits, cache=cache).run()
+
+        # The cached stage loaded while the other stage held the memory
+        assert overlapped == [True]
+        assert run.results["whisper"].from_cache
+        assert run.artifacts["whisper"] == "text"
+
+
+class TestRunAsync:
+    """Test running stage graphs on an event loop."""
+
+    @pytest.mark.asyncio
+    async def test_async_and_sync_stages(self):
+        """Test that coroutine stages are awaited and others run on threads."""
+        loop_thread = threading.get_ident()
+        threads = {}
+
+        async def fetch(stage_inputs, progress_callback):  # noqa: ARG001
+            threads["fetch"] = threading.get_ident()
+            await asyncio.sleep(0)
+            return {"fetch": "data"}
+
+        def parse(stage_inputs, progress_callback):  # noqa: ARG001
+            threads["parse"] = threading.get_ident()
+            return {"parse": stage_inputs["fetch"].upper()}
+
+        graph = StageGraph(
+            [
+                Stage(
+                    name="fetch",
+                    run=MagicMock(),
+                    run_async=fetch,
+                    inputs=("source",),
+                    outputs=("fetch",),
+                ),
+                make_stage("parse", inputs=["fetch"], run=parse),
+            ]
+        )
+
+        run = await StageScheduler(graph).run_async({"source": "path"})
+
+        assert run.artifacts["parse"] == "DATA"
+        assert graph.stages[0].run.call_count == 0
+        assert threads["fetch"] == loop_thread
+        assert threads["parse"] != loop_thread
+
+    @pytest.mark.asyncio
+    async def test_async_stages_overlap(self):
+        """Test that independent coroutine stages run at the same time."""
+        active = []
+        peak = []
+
+        async def wait_stage(stage_inputs, progress_callback):  # noqa: ARG001
+            active.append(1)
+            peak.append(len(active))
+            await asyncio.sleep(0.05)
+            active.pop()
+            return {}
+
+        graph = StageGraph(
+            [
+                Stage(name=name, run=MagicMock(), run_async=wait_stage)
+                for name in ("a", "b", "c")
+            ]
+        )
+
+        await StageScheduler(graph).run_async()
+
+        assert max(peak) == 3
+
+    @pytest.mark.asyncio
+    async def test_required_failure_raises(self):
+        """Test that a failing required stage aborts the async run."""
+
+        async def fail(stage_inputs, progress_callback):  # noqa: ARG001
+            raise ValueError("boom")
+
+        graph = StageGraph(
+            [
+                Stage(name="a", run=MagicMock(), run_async=fail, outputs=("a",)),
+                make_stage("b", inputs=["a"]),
+            ]
+        )
+
+        with pytest.raises(ValueError, match="boom"):
+            await StageScheduler(graph).run_async()
+
+    @pytest.mark.asyncio
+    async def test_cancel_cancels_running_stages(self):
+        """Test that cancelling the run cancels stage tasks."""
+        started = asyncio.Event()
+        cancelled = []
+
+        async def slow(stage_inputs, progress_callback):  # noqa: ARG001
+            started.set()
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(True)
+                raise
+            return {}
+
+        graph = StageGraph([Stage(name="slow", run=MagicMock(), run_async=slow)])
+        task = asyncio.ensure_future(StageScheduler(graph).run_async())
+        await started.wait()
+        task.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert cancelled == [True]
+
+    @pytest.mark.asyncio
+    async def test_cancel_token_cancels_running_stages(self):
+        """Test that cancelling the token cancels stage tasks and raises."""
+        token = CancellationToken()
+        cancelled = []
+
+        async def slow(stage_inputs, progress_callback):  # noqa: ARG001
+            asyncio.get_running_loop().call_soon(token.cancel)
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(True)
+                raise
+            return {}
+
+        graph = StageGraph([Stage(name="slow", run=MagicMock(), run_async=slow)])
+
+        with pytest.raises(StageRunCancelledError):
+            await StageScheduler(graph).run_async(cancel_token=token)
+        assert cancelled == [True]
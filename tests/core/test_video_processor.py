@@ -107,6 +107,21 @@ class TestVideoValidation:
         with pytest.raises(ValueError, match="File too large"):
             video_processor.validate_file(test_file)
 
+    @patch("ffmpeg.probe")
+    def test_validate_file_oversized_windowed(
+        self, mock_probe, mock_config, tmp_path, mock_probe_data
+    ):
+        """Test that windowed processing accepts files above the size limit."""
+        mock_config.processing.max_video_size_mb = 1
+        mock_config.processing.windowed_processing = True
+        test_file = tmp_path / "long.mp4"
+        test_file.write_bytes(b"x" * (2 * 1024 * 1024))
+        mock_probe.return_value = mock_probe_data
+
+        result = VideoProcessor(config=mock_config).validate_file(test_file)
+
+        assert result.size_mb == pytest.approx(2.0)
+
     @patch("ffmpeg.probe")
     def test_validate_file_success(
         self, mock_probe, video_processor, tmp_path, mock_probe_data
@@ -0,0 +1,111 @@
+"""Tests for merging window results in windowed processing."""
+
+import pytest
+
+from deep_brief.analysis.transcriber import Segment, TranscriptionResult, WordTimestamp
+from deep_brief.core.windowed import WindowedScenes, WindowedTranscript, plan_windows
+
+
+def make_transcription(text, start, end):
+    """Transcription of one chunk with a single one-word segment."""
+    return TranscriptionResult(
+        text=text,
+        segments=[
+            Segment(
+                id=0,
+                text=text,
+                start=start,
+                end=end,
+                avg_logprob=-0.2,
+                no_speech_prob=0.01,
+                words=[WordTimestamp(word=text, start=start, end=end, confidence=0.9)],
+            )
+        ],
+        language="en",
+        language_probability=0.9,
+        duration=600.0,
+        model_used="whisper-base",
+        word_count=1,
+        processing_time=2.0,
+    )
+
+
+class TestPlanWindows:
+    """Test splitting videos into windows."""
+
+    def test_equal_windows_cover_video(self):
+        """Test that windows are equal, no longer than asked and cover the video."""
+        windows = plan_windows(1500.0, 600.0)
+
+        assert windows == [(0.0, 500.0), (500.0, 1000.0), (1000.0, 1500.0)]
+
+    def test_short_video_single_window(self):
+        """Test that a video shorter than a window is one window."""
+        assert plan_windows(42.0, 600.0) == [(0.0, 42.0)]
+
+
+class TestWindowedScenes:
+    """Test building scenes from per-window scene changes."""
+
+    def test_open_scene_continues_into_next_window(self):
+        """Test that window boundaries do not cut scenes."""
+        scenes = WindowedScenes(min_scene_duration=2.0, fallback_interval=30.0)
+
+        first = scenes.add_window(100.0, [40.0, 90.0])
+        second = scenes.add_window(200.0, [130.0])
+        last = scenes.add_window(300.0, [250.0], final=True)
+
+        assert [(s.start_time, s.end_time) for s in first] == [
+            (0.0, 40.0),
+            (40.0, 90.0),
+        ]
+        assert [(s.start_time, s.end_time) for s in second] == [(90.0, 130.0)]
+        assert [(s.start_time, s.end_time) for s in last] == [
+            (130.0, 250.0),
+            (250.0, 300.0),
+        ]
+        result = scenes.to_result(300.0, "threshold", 0.4)
+        assert [s.scene_number for s in result.scenes] == [1, 2, 3, 4, 5]
+        assert result.detection_method == "threshold"
+
+    def test_window_without_changes_uses_fallback(self):
+        """Test that a window without changes is split at the fallback interval."""
+        scenes = WindowedScenes(min_scene_duration=2.0, fallback_interval=30.0)
+
+        closed = scenes.add_window(100.0, [], final=True)
+
+        assert [s.start_time for s in closed] == [0.0, 30.0, 60.0, 90.0]
+        assert all(s.confidence == pytest.approx(0.3) for s in closed)
+        assert scenes.to_result(100.0, "threshold", 0.4).detection_method == "fallback"
+
+    def test_short_scenes_dropped(self):
+        """Test that scenes under the minimum duration are dropped and not numbered."""
+        scenes = WindowedScenes(min_scene_duration=2.0, fallback_interval=30.0)
+
+        closed = scenes.add_window(20.0, [10.0, 11.0], final=True)
+
+        assert [(s.start_time, s.scene_number) for s in closed] == [(0.0, 1), (11.0, 2)]
+
+
+class TestWindowedTranscript:
+    """Test merging per-window transcripts."""
+
+    def test_segments_shifted_and_renumbered(self):
+        """Test that segment and word times move onto the full timeline."""
+        transcript = WindowedTranscript()
+
+        transcript.add_window(make_transcription("hello", 1.0, 2.0), 0.0)
+        transcript.add_window(make_transcription("again", 3.0, 4.0), 600.0)
+        result = transcript.to_result(1200.0)
+
+        assert [segment.id for segment in result.segments] == [0, 1]
+        assert result.segments[1].start == 603.0
+        assert result.segments[1].words[0].end == 604.0
+        assert result.text == "hello again"
+        assert result.word_count == 2
+        assert result.duration == 1200.0
+        assert result.processing_time == 4.0
+
+    def test_no_windows_transcribed(self):
+        """Test that nothing transcribed gives no transcription."""
+        assert WindowedTranscript().to_result(60.0) is None
@@ -1,8 +1,11 @@
 """Tests for CLI functionality."""
 
+from unittest.mock import patch
+
 from typer.testing import CliRunner
 
 from deep_brief.cli import app
+from deep_brief.utils.config import DeepBriefConfig
 
 
 def test_cli_help() -> None:
@@ -59,6 +62,25 @@ def test_cli_with_options() -> None:
     assert "Config file: config.yaml" in result.stdout
 
 
+def test_cli_no_cache() -> None:
+    """Test that --no-cache disables the result cache."""
+    config = DeepBriefConfig()
+    runner = CliRunner()
+    with patch("deep_brief.cli.get_config", return_value=config):
+        result = runner.invoke(app, ["analyze", "test.mp4", "--no-cache"])
+    assert result.exit_code == 0
+    assert "Result cache disabled" in result.stdout
+    assert config.processing.result_cache is False
+
+
+def test_cli_resume_missing_job(tmp_path) -> None:
+    """Test that resuming a directory without a job fails."""
+    runner = CliRunner()
+    result = runner.invoke(app, ["resume", str(tmp_path)])
+    assert result.exit_code == 1
+    assert "No batch job found" in result.stdout
+
+
 def test_version_command() -> None:
     """Test version command."""
     runner = CliRunner()